@@ -0,0 +1,57 @@
+"""Report of the plans of the SPARQL queries of the rules evaluated on an OntoUML model, with their measurements.
+
+Each query is evaluated on the model with a QueryProfiler and the report shows, for each operator of the query's algebra
+and for each triple pattern, how many times it was evaluated, the number of rows it produced and the time spent. The
+report can be attached to reports of models that are slow to validate.
+
+Usage:
+    ```
+    python -m validator.benchmarks.query_plan_report model.ttl
+    python -m validator.benchmarks.query_plan_report model.ttl --queries QUERY_R_CL_EDA QUERY_R_CL_GJU --json plans.json
+    ```
+"""
+import argparse
+import json
+import sys
+
+from loguru import logger
+
+from ..modules.prepared_queries import get_all_named_queries
+from ..modules.query_profiler import format_profiles_report, profile_all_queries
+from ..modules.utils_graph import load_graph_safely
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Profile the queries of the rules on a model from the command line and print the report of their plans.
+
+    :param arguments: The command line arguments. If not provided, the arguments of the script are used.
+    :type arguments: list[str] | None
+    :return: The exit code: 0.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        description="Report the plans of the SPARQL queries evaluated on an OntoUML model."
+    )
+    parser.add_argument("model_file", help="path of the OntoUML model in graph format")
+    parser.add_argument(
+        "--queries", nargs="+", choices=sorted(get_all_named_queries()), help="names of the profiled queries"
+    )
+    parser.add_argument("--json", help="path in which the plans are also stored as JSON")
+    parsed_arguments = parser.parse_args(arguments)
+
+    ontouml_model = load_graph_safely(parsed_arguments.model_file)
+    query_profiles = profile_all_queries(ontouml_model, parsed_arguments.queries)
+    print(f"Model: {parsed_arguments.model_file} ({len(ontouml_model)} triples)\n")
+    print(format_profiles_report(query_profiles))
+
+    if parsed_arguments.json:
+        with open(parsed_arguments.json, "w", encoding="utf-8") as json_file:
+            json.dump([query_profile.to_dict() for query_profile in query_profiles], json_file, indent=2)
+        logger.info(f"Query plans stored in {parsed_arguments.json}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    sys.exit(main())
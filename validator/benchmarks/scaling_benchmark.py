@@ -0,0 +1,358 @@
+"""Benchmark of how the loading of OntoUML models and the validation rules scale with the size of the model.
+
+For each size of a ladder of model sizes (in triples), a synthetic model is generated with the ModelGenerator, written
+to a temporary Turtle file and validated. The benchmark measures the time of each stage:
+    - 'load': parsing the file with load_graph_safely.
+    - 'model_index': building the index of the model, when it is used by the selected rules and backend.
+    - Each selected rule, executed alone, without sharing cached query results with other rules.
+
+For each stage, the report shows the throughput (triples per second) at each size and the scaling exponent k fitted to
+time ~ triples^k by least squares on the logarithms of the measurements. Linear stages have exponents close to 1, while
+exponents close to 2 reveal quadratic behavior.
+
+Results can be stored as a baseline and later compared with it: a stage regresses when its throughput at a size drops
+by more than the tolerance or when its scaling exponent grows by more than the exponent tolerance.
+
+Usage:
+    ```
+    python -m validator.benchmarks.scaling_benchmark --sizes 1000 10000 100000 --backend native
+    python -m validator.benchmarks.scaling_benchmark --baseline
+    python -m validator.benchmarks.scaling_benchmark --sizes 1000 10000 --save-baseline /tmp/baseline.json
+    ```
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from ..modules.model_generator import ModelGenerator, get_num_classes_for_triples
+from ..modules.utils_graph import load_graph_safely
+from ..modules.utils_validations import validate_backend
+from ..validations.rules_general import execute_rule_switch
+from ..validations.rules_registry import get_required_indexes, get_required_predicates, select_rules_codes
+from ..vocab_lib.model_index import ModelIndex
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Maximum relative drop of throughput and maximum increase of the scaling exponent that are not regressions
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_EXPONENT_TOLERANCE = 0.25
+
+# Measurements shorter than this (in seconds) are dominated by noise and are not compared with the baseline
+MIN_COMPARED_SECONDS = 0.05
+
+LOAD_STAGE = "load"
+MODEL_INDEX_STAGE = "model_index"
+
+
+def fit_scaling_exponent(sizes: list[int], seconds: list[float]) -> float | None:
+    """Fit the exponent k of time ~ size^k by least squares on the logarithms of the measurements.
+
+    :param sizes: The sizes (e.g., numbers of triples) of the measured inputs.
+    :type sizes: list[int]
+    :param seconds: The time measured for each input, in seconds. Measurements that are not positive are ignored.
+    :type seconds: list[float]
+    :return: The fitted exponent, or None if there are less than two distinct sizes with positive measurements.
+    :rtype: float | None
+    """
+    points = [(math.log(size), math.log(time)) for size, time in zip(sizes, seconds) if size > 0 and time > 0]
+    if len({log_size for log_size, _ in points}) < 2:
+        return None
+
+    mean_size = sum(log_size for log_size, _ in points) / len(points)
+    mean_time = sum(log_time for _, log_time in points) / len(points)
+    covariance = sum((log_size - mean_size) * (log_time - mean_time) for log_size, log_time in points)
+    variance = sum((log_size - mean_size) ** 2 for log_size, _ in points)
+    return covariance / variance
+
+
+def _measure(function, repetitions: int) -> tuple[float, object]:
+    """Execute a function the received number of times and return the shortest time and the last result."""
+    best_seconds = math.inf
+    result = None
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        result = function()
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+    return best_seconds, result
+
+
+def benchmark_model_size(
+    target_triples: int,
+    rules_codes: list[str],
+    backend: str = "sparql",
+    repetitions: int = 1,
+    generator_settings: dict | None = None,
+) -> dict:
+    """Generate a model with approximately the received number of triples and measure the time of each stage.
+
+    :param target_triples: The approximate number of triples of the generated model.
+    :type target_triples: int
+    :param rules_codes: Codes of the rules to be measured.
+    :type rules_codes: list[str]
+    :param backend: Implementation of the rules to be measured. Allowed values are: 'sparql' and 'native'.
+    :type backend: str
+    :param repetitions: Number of times each stage is executed. The shortest time is kept.
+    :type repetitions: int
+    :param generator_settings: Settings of the ModelGenerator, except for num_classes.
+    :type generator_settings: dict | None
+    :return: Dictionary with the sizes of the model, the time of each stage (in seconds) and the number of issues
+             found by each rule.
+    :rtype: dict
+    """
+    generator_settings = generator_settings or {}
+    num_classes = get_num_classes_for_triples(target_triples, **generator_settings)
+    model_generator = ModelGenerator(num_classes, **generator_settings)
+
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        model_file_path = os.path.join(temporary_dir, "model.ttl")
+        with open(model_file_path, "w", encoding="utf-8") as model_file:
+            num_triples = model_generator.write(model_file)
+
+        load_seconds, ontouml_model = _measure(lambda: load_graph_safely(model_file_path, "ttl"), repetitions)
+
+    seconds = {LOAD_STAGE: load_seconds}
+    model_index = None
+    if get_required_indexes(rules_codes, backend).intersection(["model_index", "hierarchy", "hierarchy_arrays"]):
+        predicates = list(get_required_predicates(rules_codes))
+        seconds[MODEL_INDEX_STAGE], model_index = _measure(lambda: ModelIndex(ontouml_model, predicates), repetitions)
+
+    issues = {}
+    for rule_code in rules_codes:
+        seconds[rule_code], (rule_w_list, rule_e_list) = _measure(
+            lambda: execute_rule_switch(ontouml_model, rule_code, model_index, None, backend), repetitions
+        )
+        issues[rule_code] = len(rule_w_list) + len(rule_e_list)
+
+    logger.debug(f"Model with {num_triples} triples measured in {sum(seconds.values()):.2f} seconds.")
+
+    return {
+        "target_triples": target_triples,
+        "num_triples": num_triples,
+        "num_classes": num_classes,
+        "seconds": seconds,
+        "issues": issues,
+    }
+
+
+def run_scaling_benchmark(
+    sizes: list[int] | None = None,
+    backend: str = "sparql",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    repetitions: int = 1,
+    generator_settings: dict | None = None,
+) -> dict:
+    """Measure the stages of the validation on generated models of increasing sizes and fit their scaling exponents.
+
+    :param sizes: The approximate numbers of triples of the generated models. If not provided, DEFAULT_SIZES is used.
+    :type sizes: list[int] | None
+    :param backend: Implementation of the rules to be measured. Allowed values are: 'sparql' and 'native'.
+    :type backend: str
+    :param include: Selectors of the rules to be measured (as in validate_ontouml_model). If not provided, all
+                    implemented rules are measured.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be measured.
+    :type exclude: list[str] | None
+    :param repetitions: Number of times each stage is executed on each model. The shortest time is kept.
+    :type repetitions: int
+    :param generator_settings: Settings of the ModelGenerator, except for num_classes.
+    :type generator_settings: dict | None
+    :return: Dictionary with the settings of the benchmark, the measurements at each size and the scaling exponent of
+             each stage.
+    :rtype: dict
+    """
+    backend = validate_backend(backend)
+    sizes = sorted(DEFAULT_SIZES if sizes is None else sizes)
+    rules_codes = select_rules_codes(include, exclude)
+
+    sizes_results = []
+    for target_triples in sizes:
+        logger.debug(f"Measuring a generated model with approximately {target_triples} triples.")
+        sizes_results.append(
+            benchmark_model_size(target_triples, rules_codes, backend, repetitions, generator_settings)
+        )
+
+    stages = list(sizes_results[0]["seconds"]) if sizes_results else []
+    exponents = {
+        stage: fit_scaling_exponent(
+            [size_results["num_triples"] for size_results in sizes_results],
+            [size_results["seconds"][stage] for size_results in sizes_results],
+        )
+        for stage in stages
+    }
+
+    return {
+        "backend": backend,
+        "rules_codes": rules_codes,
+        "generator_settings": generator_settings or {},
+        "sizes": sizes_results,
+        "exponents": exponents,
+    }
+
+
+def get_throughput(size_results: dict, stage: str) -> float:
+    """Return the throughput (in triples per second) of a stage on a model.
+
+    :param size_results: The measurements on the model, as returned by benchmark_model_size.
+    :type size_results: dict
+    :param stage: The measured stage ('load', 'model_index' or a rule code).
+    :type stage: str
+    :return: The number of triples of the model divided by the time of the stage.
+    :rtype: float
+    """
+    stage_seconds = size_results["seconds"][stage]
+    return size_results["num_triples"] / stage_seconds if stage_seconds > 0 else math.inf
+
+
+def compare_with_baseline(
+    results: dict,
+    baseline: dict,
+    tolerance: float = DEFAULT_TOLERANCE,
+    exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+) -> list[str]:
+    """Compare the results of a benchmark with the ones of a baseline and describe the regressions found.
+
+    Only stages and sizes measured in both are compared. Throughputs are compared only when both measurements take at
+    least MIN_COMPARED_SECONDS.
+
+    :param results: The results of the benchmark, as returned by run_scaling_benchmark.
+    :type results: dict
+    :param baseline: The results of the baseline benchmark.
+    :type baseline: dict
+    :param tolerance: Maximum relative drop of the throughput of a stage at a size (e.g., 0.5 for 50%).
+    :type tolerance: float
+    :param exponent_tolerance: Maximum increase of the scaling exponent of a stage.
+    :type exponent_tolerance: float
+    :return: List with the description of each regression. Empty if there are none.
+    :rtype: list[str]
+    """
+    regressions = []
+
+    if results["backend"] != baseline["backend"]:
+        logger.warning(f"The baseline was measured with the '{baseline['backend']}' backend and is not compared.")
+        return regressions
+
+    baseline_sizes = {size_results["target_triples"]: size_results for size_results in baseline["sizes"]}
+    for size_results in results["sizes"]:
+        baseline_size_results = baseline_sizes.get(size_results["target_triples"])
+        if baseline_size_results is None:
+            continue
+        for stage, stage_seconds in size_results["seconds"].items():
+            baseline_stage_seconds = baseline_size_results["seconds"].get(stage)
+            if baseline_stage_seconds is None or min(stage_seconds, baseline_stage_seconds) < MIN_COMPARED_SECONDS:
+                continue
+            throughput = get_throughput(size_results, stage)
+            baseline_throughput = get_throughput(baseline_size_results, stage)
+            if throughput < baseline_throughput * (1 - tolerance):
+                regressions.append(
+                    f"{stage} at {size_results['target_triples']} triples: throughput of {throughput:.0f} triples/s "
+                    f"is below the baseline's {baseline_throughput:.0f} triples/s."
+                )
+
+    for stage, exponent in results["exponents"].items():
+        baseline_exponent = baseline["exponents"].get(stage)
+        if exponent is None or baseline_exponent is None:
+            continue
+        if exponent > baseline_exponent + exponent_tolerance:
+            regressions.append(
+                f"{stage}: scaling exponent of {exponent:.2f} is above the baseline's {baseline_exponent:.2f}."
+            )
+
+    return regressions
+
+
+def format_report(results: dict) -> str:
+    """Return a table with the throughput of each stage at each size and its scaling exponent.
+
+    :param results: The results of the benchmark, as returned by run_scaling_benchmark.
+    :type results: dict
+    :return: The table, with a line per stage.
+    :rtype: str
+    """
+    sizes_results = results["sizes"]
+    header = ["stage"] + [f"{size_results['num_triples']} t/s" for size_results in sizes_results] + ["exponent"]
+    rows = [header]
+    for stage, exponent in results["exponents"].items():
+        throughputs = [f"{get_throughput(size_results, stage):.0f}" for size_results in sizes_results]
+        rows.append([stage] + throughputs + ["-" if exponent is None else f"{exponent:.2f}"])
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    ]
+    return f"Backend: {results['backend']}\n" + "\n".join(lines)
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the benchmark from the command line, print its report and compare it with a baseline.
+
+    :param arguments: The command line arguments. If not provided, the arguments of the script are used.
+    :type arguments: list[str] | None
+    :return: The exit code: 1 if regressions were found in the comparison with the baseline, 0 otherwise.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Measure how loading and validating OntoUML models scale.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="approximate numbers of triples")
+    parser.add_argument("--backend", default="sparql", choices=["sparql", "native"])
+    parser.add_argument("--include", nargs="+", help="selectors of the measured rules (e.g., R_CL_GJU or CL)")
+    parser.add_argument("--exclude", nargs="+", help="selectors of the rules not measured")
+    parser.add_argument("--repetitions", type=int, default=1, help="executions of each stage; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated models")
+    parser.add_argument("--cycles", type=int, default=0, help="generalization cycles of each generated model")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE_PATH,
+        help="results to which the benchmark is compared (if no path is given, the stored baseline)",
+    )
+    parser.add_argument("--save-baseline", help="path in which the results are stored as a baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="maximum relative throughput drop")
+    parser.add_argument(
+        "--exponent-tolerance", type=float, default=DEFAULT_EXPONENT_TOLERANCE, help="maximum exponent increase"
+    )
+    parsed_arguments = parser.parse_args(arguments)
+
+    results = run_scaling_benchmark(
+        parsed_arguments.sizes,
+        parsed_arguments.backend,
+        parsed_arguments.include,
+        parsed_arguments.exclude,
+        parsed_arguments.repetitions,
+        {"seed": parsed_arguments.seed, "num_cycles": parsed_arguments.cycles},
+    )
+    print(format_report(results))
+
+    if parsed_arguments.save_baseline:
+        with open(parsed_arguments.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        logger.info(f"Baseline stored in {parsed_arguments.save_baseline}.")
+
+    if not parsed_arguments.baseline:
+        return 0
+
+    with open(parsed_arguments.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare_with_baseline(
+        results, baseline, parsed_arguments.tolerance, parsed_arguments.exponent_tolerance
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions found in the comparison with the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    sys.exit(main())
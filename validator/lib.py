@@ -12,43 +12,312 @@ The module also contains auxiliary functions for loading OntoUML models and hand
 Usage:
 1. Import the module: `from ontouml_validator import validate_ontouml_file, validate_ontouml_model`
 2. Use the provided functions to validate OntoUML models.
+3. Use validate_ontouml_files to validate a batch of files in parallel processes. Files with identical contents are
+   validated only once and results can be stored in a result cache, so that unchanged files are not validated again.
+4. Use IncrementalValidator to re-validate a model after each change, re-evaluating only the affected rules and classes.
+5. Use get_validation_report to obtain a compact ValidationReport, which creates issues and their descriptions only
+   when they are accessed and can be exported to JSON or CSV.
+6. Use stream_validation_issues to stream issues to a sink (e.g., a JSON Lines or SARIF file) as they are found,
+   optionally capping the number of issues per rule.
+7. Use is_ontouml_model_valid when only the validity of a model is needed: it stops at the first issue that makes the
+   model invalid.
+8. Use validate_ontouml_json_file to validate an OntoUML JSON file directly, without converting it to a graph.
+   validate_ontouml_file does the same for files with the .json extension.
+9. Provide a store_dir to keep the graphs of large models in SQLite triple stores instead of in memory.
+10. Provide a ValidationMetrics object to measure the loading of the model and each executed rule, and use
+    set_quiet_mode to remove logging from the validation of many models.
 """
+import inspect
+import os
+import time
+from collections.abc import Callable, Iterator
+
 from loguru import logger
 from rdflib import Graph
 
+from .modules.errors import report_error_invalid_parameter, report_error_io_read, report_error_requirement_not_met
+from .modules.json_loader import DEFAULT_BASE_URI, is_ontouml_json_file, load_model_index_from_json
+from .modules.prepared_queries import get_prepared_queries_file, initialize_prepared_queries
+from .modules.process_pool import execute_in_process_pool
+from .modules.quiet_mode import is_quiet_mode, set_quiet_mode  # noqa: F401
+from .modules.result_cache import ResultCache, get_file_content_key
+from .modules.snapshot_cache import SnapshotCache
+from .modules.triple_store import get_store_path
 from .modules.utils_graph import load_graph_safely
-from .modules.utils_validations import validate_assumption
-from .validations.rules_general import execute_all_validation_rules
+from .modules.utils_validations import validate_assumption, validate_backend, validate_executor
+from .modules.validation_metrics import ValidationMetrics
+from .validations.incremental_validation import IncrementalValidator  # noqa: F401
+from .validations.issue_sink import IssueSink
+from .validations.result_file import ResultFile
+from .validations.result_issue import ResultIssue
+from .validations.rules_general import execute_all_validation_rules, find_first_violated_rule
+from .validations.rules_registry import (
+    get_required_classes,
+    get_required_indexes,
+    get_required_predicates,
+    select_rules_codes,
+)
+from .validations.validation_report import ValidationReport
 
 
-def validate_ontouml_file(ontouml_file_path: str, world_assumption: str) -> tuple[bool, list[str], list[str]]:
+def validate_ontouml_file(
+    ontouml_file_path: str,
+    world_assumption: str,
+    backend: str | None = None,
+    workers: int = 1,
+    executor: str = "thread",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+    snapshot_cache_dir: str | None = None,
+    result_cache_path: str | None = None,
+    store_dir: str | None = None,
+    metrics: ValidationMetrics | None = None,
+) -> tuple[bool, list[str], list[str]]:
     """Validate an OntoUML model stored in a graph file using a specified world assumption ('owa' or 'cwa').
 
     This function takes the path to an OntoUML model stored in graph format (using the ontouml-vocabulary) and
     validates it with a specified world assumption using the validate_ontouml_model function.
+    Only the triples read by the selected rules are kept while the file is parsed. Files with the .json extension are
+    validated as OntoUML JSON files by validate_ontouml_json_file, which only supports the native backend and the
+    result cache: passing backend='sparql', a snapshot_cache_dir or a store_dir with a JSON file is reported as an
+    invalid parameter.
 
     :param ontouml_file_path: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
     :type ontouml_file_path: str
     :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
     :type world_assumption: str
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' (the reference implementation
+                    based on SPARQL queries) and 'native' (based on a precomputed index of the model). If None
+                    (default), 'sparql' is used for graph files and 'native' for JSON files.
+    :type backend: str | None
+    :param workers: Number of validation rules executed concurrently. If 1 (default), rules are executed sequentially.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Threads only overlap the time rules wait for I/O (e.g., reads of a triple store),
+                     so use 'process' to speed up rules evaluated in Python (see execute_all_validation_rules).
+    :type executor: str
+    :param include: Selectors of the rules to be executed: rule codes (e.g., 'R_CL_GJU'), group names (e.g., 'CL') or
+                    patterns of rule codes (e.g., 'R_CL_*'), case-insensitive. Selectors matching no implemented rule
+                    are rejected. If not provided (default), all implemented rules are executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only issues with these severities ('warning' and/or 'error') are reported and only
+                       rules that may report them are executed. Severities are considered before the world-assumption
+                       is applied.
+    :type severities: list[str] | None
+    :param snapshot_cache_dir: Optional directory of the cache of snapshots of parsed files. If provided, files whose
+                               contents did not change are read from their snapshots instead of being parsed again.
+                               Not supported for JSON files.
+    :type snapshot_cache_dir: str | None
+    :param result_cache_path: Optional path of the SQLite database of the result cache. If provided, the results of
+                              rules already executed on files with the same contents are read from the cache and the
+                              file is only loaded if some selected rule has no stored results.
+    :type result_cache_path: str | None
+    :param store_dir: Optional directory of SQLite triple stores. If provided, the graph is kept in the store of the
+                      file in this directory instead of in memory, so the memory used does not grow with the size of the
+                      model, and the store built by an earlier run is reused while the file does not change. Not
+                      supported for JSON files.
+    :type store_dir: str | None
+    :param metrics: Optional metrics of the validation, filled in with the time spent loading the file, the number of
+                    loaded triples and the measurements of each executed rule. Rules whose results are read from the
+                    result cache are not measured.
+    :type metrics: ValidationMetrics | None
     :return: A tuple with three components:
         - A boolean indicating whether the validated model is valid or not.
         - A list of warnings found during the validation process.
         - A list of errors found during the validation process.
     :rtype: tuple[bool,list[str],list[str]]
     """
-    ontouml_model = load_graph_safely(ontouml_file_path)
-    is_valid, w_list, e_list = validate_ontouml_model(ontouml_model, world_assumption)
-    return is_valid, w_list, e_list
+    if is_ontouml_json_file(ontouml_file_path):
+        # JSON files are not converted to graphs, so only the native backend and the result cache can be used
+        current_function = inspect.stack()[0][3]
+        if backend is not None and validate_backend(backend) != "native":
+            report_error_invalid_parameter(backend, ["native"], current_function)
+        for graph_option in [snapshot_cache_dir, store_dir]:
+            if graph_option is not None:
+                report_error_invalid_parameter(graph_option, [None], current_function)
+
+        return validate_ontouml_json_file(
+            ontouml_file_path,
+            world_assumption,
+            workers,
+            executor,
+            include,
+            exclude,
+            severities,
+            metrics=metrics,
+            result_cache_path=result_cache_path,
+        )
+
+    backend = backend if backend is not None else "sparql"
+    snapshot_cache = SnapshotCache(snapshot_cache_dir) if snapshot_cache_dir is not None else None
+    store_path = get_store_path(store_dir, ontouml_file_path) if store_dir is not None else None
+
+    # Only the triples read by the selected rules are loaded
+    rules_codes = select_rules_codes(include, exclude, severities)
+    predicates = get_required_predicates(rules_codes)
+    classes = get_required_classes(rules_codes)
+
+    if result_cache_path is None:
+        ontouml_model = _load_measured_graph(
+            ontouml_file_path, snapshot_cache, predicates, classes, metrics, store_path
+        )
+        is_valid, w_list, e_list = validate_ontouml_model(
+            ontouml_model, world_assumption, backend, workers, executor, include, exclude, severities, metrics
+        )
+        return is_valid, w_list, e_list
+
+    assumption = validate_assumption(world_assumption)
+    backend = validate_backend(backend)
+    executor = validate_executor(executor)
+
+    def execute_missing_rules(missing_rules_codes: list[str]) -> tuple[list[ResultIssue], list[ResultIssue]]:
+        ontouml_model = _load_measured_graph(
+            ontouml_file_path, snapshot_cache, predicates, classes, metrics, store_path
+        )
+        return execute_all_validation_rules(
+            ontouml_model,
+            backend=backend,
+            workers=workers,
+            executor=executor,
+            rules_codes=missing_rules_codes,
+            metrics=metrics,
+        )
+
+    w_list, e_list = _execute_cached_rules(
+        ontouml_file_path, result_cache_path, rules_codes, backend, execute_missing_rules
+    )
+    return _get_final_results(w_list, e_list, assumption, severities)
+
+
+def validate_ontouml_json_file(
+    json_file_path: str,
+    world_assumption: str,
+    workers: int = 1,
+    executor: str = "thread",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+    base_uri: str = DEFAULT_BASE_URI,
+    metrics: ValidationMetrics | None = None,
+    result_cache_path: str | None = None,
+) -> tuple[bool, list[str], list[str]]:
+    """Validate an OntoUML model stored in an OntoUML JSON file using a specified world assumption ('owa' or 'cwa').
+
+    The file is loaded directly into the index of the model used by the native backend, without being converted to a
+    graph. The results are the ones of the validation of the graph produced by ontouml-json2graph with the same base
+    URI.
+
+    :param json_file_path: Path of the OntoUML JSON file to be validated.
+    :type json_file_path: str
+    :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
+    :type world_assumption: str
+    :param workers: Number of validation rules executed concurrently. If 1 (default), rules are executed sequentially.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Threads only overlap the time rules wait for I/O (e.g., reads of a triple store),
+                     so use 'process' to speed up rules evaluated in Python (see execute_all_validation_rules).
+    :type executor: str
+    :param include: Selectors of the rules to be executed, as in validate_ontouml_file.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only issues with these severities ('warning' and/or 'error') are reported and only
+                       rules that may report them are executed.
+    :type severities: list[str] | None
+    :param base_uri: The base URI of the elements of the model (default: the one of ontouml-json2graph).
+    :type base_uri: str
+    :param metrics: Optional metrics of the validation, filled in with the time spent loading the file and the
+                    measurements of each executed rule.
+    :type metrics: ValidationMetrics | None
+    :param result_cache_path: Optional path of the SQLite database of the result cache, as in validate_ontouml_file.
+                              Results are stored for the native backend and the received base URI.
+    :type result_cache_path: str | None
+    :return: A tuple with three components:
+        - A boolean indicating whether the validated model is valid or not.
+        - A list of warnings found during the validation process.
+        - A list of errors found during the validation process.
+    :rtype: tuple[bool,list[str],list[str]]
+    """
+    assumption = validate_assumption(world_assumption)
+    executor = validate_executor(executor)
+
+    rules_codes = select_rules_codes(include, exclude, severities)
+
+    # Without a graph, only rules whose native implementations read only the index of the model can be executed
+    if "query_cache" in get_required_indexes(rules_codes, "native"):
+        report_error_requirement_not_met("Some of the selected rules cannot be executed on OntoUML JSON files.")
+
+    def execute_rules(executed_rules_codes: list[str]) -> tuple[list[ResultIssue], list[ResultIssue]]:
+        load_start = time.perf_counter()
+        model_index = load_model_index_from_json(
+            json_file_path, list(get_required_predicates(executed_rules_codes)), base_uri
+        )
+        if metrics is not None:
+            metrics.parse_seconds = time.perf_counter() - load_start
+
+        return execute_all_validation_rules(
+            None,
+            backend="native",
+            workers=workers,
+            executor=executor,
+            rules_codes=executed_rules_codes,
+            metrics=metrics,
+            model_index=model_index,
+        )
+
+    if result_cache_path is None:
+        w_list, e_list = execute_rules(rules_codes)
+    else:
+        # The identifiers of the reported elements depend on the base URI, which is part of the cached model's key
+        w_list, e_list = _execute_cached_rules(
+            json_file_path, result_cache_path, rules_codes, "native", execute_rules, key_suffix=base_uri
+        )
+
+    return _get_final_results(w_list, e_list, assumption, severities)
 
 
-def validate_ontouml_model(ontouml_model: Graph, world_assumption: str) -> tuple[bool, list[str], list[str]]:
+def validate_ontouml_model(
+    ontouml_model: Graph,
+    world_assumption: str,
+    backend: str = "sparql",
+    workers: int = 1,
+    executor: str = "thread",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+    metrics: ValidationMetrics | None = None,
+) -> tuple[bool, list[str], list[str]]:
     """Validate an ontouml model loaded as a graph checking its compliance to all OntoUML rules.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
     :type ontouml_model: Graph
     :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
     :type world_assumption: str
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' (default, the reference
+                    implementation based on SPARQL queries) and 'native' (based on a precomputed index of the model).
+    :type backend: str
+    :param workers: Number of validation rules executed concurrently. If 1 (default), rules are executed sequentially.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Threads only overlap the time rules wait for I/O (e.g., reads of a triple store),
+                     so use 'process' to speed up rules evaluated in Python (see execute_all_validation_rules).
+    :type executor: str
+    :param include: Selectors of the rules to be executed: rule codes (e.g., 'R_CL_GJU'), group names (e.g., 'CL') or
+                    patterns of rule codes (e.g., 'R_CL_*'), case-insensitive. Selectors matching no implemented rule
+                    are rejected. If not provided (default), all implemented rules are executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only issues with these severities ('warning' and/or 'error') are reported and only
+                       rules that may report them are executed. Severities are considered before the world-assumption
+                       is applied.
+    :type severities: list[str] | None
+    :param metrics: Optional metrics of the validation, filled in with the number of triples of the model and the
+                    measurements of each executed rule.
+    :type metrics: ValidationMetrics | None
     :return: A tuple with three components:
         - A boolean indicating whether the validated model is valid or not.
         - A list of warnings found during the validation process.
@@ -57,18 +326,476 @@ def validate_ontouml_model(ontouml_model: Graph, world_assumption: str) -> tuple
     """
     # Assures that the world_assumption received as argument is valid
     assumption = validate_assumption(world_assumption)
+    backend = validate_backend(backend)
+    executor = validate_executor(executor)
+
+    rules_codes = select_rules_codes(include, exclude, severities)
+
+    if metrics is not None:
+        metrics.num_triples = len(ontouml_model)
+
+    w_list, e_list = execute_all_validation_rules(
+        ontouml_model, backend=backend, workers=workers, executor=executor, rules_codes=rules_codes, metrics=metrics
+    )
+
+    return _get_final_results(w_list, e_list, assumption, severities)
+
+
+def get_validation_report(
+    ontouml_model: Graph,
+    world_assumption: str,
+    backend: str = "sparql",
+    workers: int = 1,
+    executor: str = "thread",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+    metrics: ValidationMetrics | None = None,
+) -> ValidationReport:
+    """Validate an ontouml model loaded as a graph and return its issues as a ValidationReport.
+
+    The model is validated as in validate_ontouml_model, but the issues are stored column-wise as the results of each
+    rule are merged, so that models with many issues do not keep one object and one formatted description per issue.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
+    :type world_assumption: str
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' (default) and 'native'.
+    :type backend: str
+    :param workers: Number of validation rules executed concurrently. If 1 (default), rules are executed sequentially.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Threads only overlap the time rules wait for I/O (e.g., reads of a triple store),
+                     so use 'process' to speed up rules evaluated in Python (see execute_all_validation_rules).
+    :type executor: str
+    :param include: Selectors of the rules to be executed. If not provided (default), all implemented rules are
+                    executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only issues with these severities ('warning' and/or 'error') are reported and only
+                       rules that may report them are executed.
+    :type severities: list[str] | None
+    :param metrics: Optional metrics of the validation, filled in as in validate_ontouml_model.
+    :type metrics: ValidationMetrics | None
+    :return: The report of the issues found during the validation process.
+    :rtype: ValidationReport
+    """
+    assumption = validate_assumption(world_assumption)
+    backend = validate_backend(backend)
+    executor = validate_executor(executor)
+
+    rules_codes = select_rules_codes(include, exclude, severities)
+
+    if metrics is not None:
+        metrics.num_triples = len(ontouml_model)
+
+    report = ValidationReport(assumption, severities)
+    execute_all_validation_rules(
+        ontouml_model,
+        backend=backend,
+        workers=workers,
+        executor=executor,
+        rules_codes=rules_codes,
+        report=report,
+        metrics=metrics,
+    )
+
+    if not is_quiet_mode():
+        logger.info("Validation report: {} warnings and {} errors found.", report.num_warnings, report.num_errors)
+
+    return report
+
+
+def stream_validation_issues(
+    ontouml_model: Graph,
+    issue_sink: IssueSink,
+    backend: str = "sparql",
+    workers: int = 1,
+    executor: str = "thread",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    metrics: ValidationMetrics | None = None,
+) -> bool:
+    """Validate an ontouml model loaded as a graph, streaming its issues to a sink as the rules find them.
+
+    The world-assumption, the severities and the caps of the validation are the ones of the sink. Rules stop their
+    enumeration when the sink does not need more of their issues, so memory does not grow with the number of issues.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param issue_sink: The sink to which the issues are streamed. It is not closed by this function.
+    :type issue_sink: IssueSink
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' (default) and 'native'.
+    :type backend: str
+    :param workers: Number of validation rules executed concurrently. If 1 (default), rules are executed sequentially
+                    and issues are streamed in the rules' order.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Threads only overlap the time rules wait for I/O (e.g., reads of a triple store),
+                     so use 'process' to speed up rules evaluated in Python (see execute_all_validation_rules).
+    :type executor: str
+    :param include: Selectors of the rules to be executed. If not provided (default), all implemented rules are
+                    executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param metrics: Optional metrics of the validation, filled in as in validate_ontouml_model. The issues emitted by
+                    each rule are the ones accepted by the sink.
+    :type metrics: ValidationMetrics | None
+    :return: A boolean indicating whether the validated model is valid or not.
+    :rtype: bool
+    """
+    backend = validate_backend(backend)
+    executor = validate_executor(executor)
+
+    rules_codes = select_rules_codes(include, exclude, issue_sink.severities)
+
+    if metrics is not None:
+        metrics.num_triples = len(ontouml_model)
+
+    execute_all_validation_rules(
+        ontouml_model,
+        backend=backend,
+        workers=workers,
+        executor=executor,
+        rules_codes=rules_codes,
+        issue_sink=issue_sink,
+        metrics=metrics,
+    )
+
+    if not is_quiet_mode():
+        logger.info(
+            "{} warnings and {} errors streamed ({} rules truncated).",
+            issue_sink.num_warnings,
+            issue_sink.num_errors,
+            len(issue_sink.truncated_rules),
+        )
+
+    return issue_sink.is_valid
+
+
+def is_ontouml_model_valid(
+    ontouml_model: Graph,
+    world_assumption: str,
+    backend: str = "sparql",
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> bool:
+    """Return whether an ontouml model loaded as a graph is valid, stopping at the first issue that invalidates it.
+
+    Rules are executed from the cheapest to the most expensive one according to their declared costs, each one only
+    until its first error (or, in CWA, its first issue). Rules that can only report warnings are not executed in OWA.
+    No issues or descriptions are kept, so rejecting an invalid model costs about as much as finding its first
+    violation. The result is always the one of validate_ontouml_model.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
+    :type world_assumption: str
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' (default) and 'native'.
+    :type backend: str
+    :param include: Selectors of the rules to be executed. If not provided (default), all implemented rules are
+                    executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :return: A boolean indicating whether the validated model is valid or not.
+    :rtype: bool
+    """
+    assumption = validate_assumption(world_assumption)
+    backend = validate_backend(backend)
+
+    rules_codes = select_rules_codes(include, exclude, None if assumption == "cwa" else ["error"])
+    violated_rule_code = find_first_violated_rule(ontouml_model, assumption, backend, rules_codes)
+
+    if violated_rule_code is not None:
+        if not is_quiet_mode():
+            logger.info("The model is invalid according to rule {}.", violated_rule_code)
+        return False
+    return True
+
 
-    w_list, e_list = execute_all_validation_rules(ontouml_model)
+def _execute_cached_rules(
+    file_path: str,
+    result_cache_path: str,
+    rules_codes: list[str],
+    backend: str,
+    execute_rules: Callable[[list[str]], tuple[list[ResultIssue], list[ResultIssue]]],
+    key_suffix: str = "",
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Return the issues found by the received rules in a file, executing only the rules without stored results.
+
+    The results of the executed rules are stored in the result cache, under the content key of the file.
+
+    :param file_path: Path of the validated file.
+    :type file_path: str
+    :param result_cache_path: Path of the SQLite database of the result cache.
+    :type result_cache_path: str
+    :param rules_codes: Codes of the selected rules.
+    :type rules_codes: list[str]
+    :param backend: The backend used for executing the rules.
+    :type backend: str
+    :param execute_rules: Function loading the file and executing the received rules on it, returning their warnings
+                          and errors. It is only called if some of the selected rules has no stored results.
+    :type execute_rules: Callable[[list[str]], tuple[list[ResultIssue], list[ResultIssue]]]
+    :param key_suffix: Optional suffix of the content key, for options other than the file's contents that change the
+                       results of the rules.
+    :type key_suffix: str
+    :return: The warnings and errors found by the selected rules, in the rules' definition order.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    try:
+        content_key = get_file_content_key(file_path)
+    except OSError as error:
+        file_description = "input ontology file"
+        report_error_io_read(file_path, file_description, error)
+    if key_suffix:
+        content_key = f"{content_key}|{key_suffix}"
+
+    result_cache = ResultCache(result_cache_path)
+    try:
+        rules_results = result_cache.get_rules_results(content_key, rules_codes, backend)
+        missing_rules_codes = [rule_code for rule_code in rules_codes if rule_code not in rules_results]
+
+        # The file is only loaded if some of the selected rules has no stored results
+        if missing_rules_codes:
+            missing_w_list, missing_e_list = execute_rules(missing_rules_codes)
+
+            missing_rules_results = {rule_code: ([], []) for rule_code in missing_rules_codes}
+            for issue in missing_w_list:
+                missing_rules_results[issue.rule_code][0].append(issue)
+            for issue in missing_e_list:
+                missing_rules_results[issue.rule_code][1].append(issue)
+
+            result_cache.store_rules_results(content_key, missing_rules_results, backend)
+            rules_results.update(missing_rules_results)
+    finally:
+        result_cache.close()
+
+    # Results are merged in the rules' definition order, as in the validation without cache
+    w_list = [issue for rule_code in rules_codes for issue in rules_results[rule_code][0]]
+    e_list = [issue for rule_code in rules_codes for issue in rules_results[rule_code][1]]
+    return w_list, e_list
+
+
+def _get_final_results(
+    w_list: list[ResultIssue], e_list: list[ResultIssue], assumption: str, severities: list[str] | None
+) -> tuple[bool, list[ResultIssue], list[ResultIssue]]:
+    """Return the validation results after discarding the issues of unselected severities and applying the \
+    world-assumption.
+
+    :param w_list: The warnings found by the executed rules.
+    :type w_list: list[ResultIssue]
+    :param e_list: The errors found by the executed rules.
+    :type e_list: list[ResultIssue]
+    :param assumption: The validated world-assumption ('owa' or 'cwa').
+    :type assumption: str
+    :param severities: If provided, only issues with these severities are kept.
+    :type severities: list[str] | None
+    :return: A tuple with three components:
+        - A boolean indicating whether the validated model is valid or not.
+        - A list of warnings found during the validation process.
+        - A list of errors found during the validation process.
+    :rtype: tuple[bool, list[ResultIssue], list[ResultIssue]]
+    """
+    # Issues of severities that were not selected are discarded
+    if severities is not None:
+        w_list = w_list if "warning" in severities else []
+        e_list = e_list if "error" in severities else []
 
     # In OWA, a model is considered valid if no errors were found, independently of the warnings.
     # In CWA, warnings also represent errors
     if assumption == "cwa":
-        e_list.append(w_list)
+        e_list.extend(w_list)
         w_list = []
 
-    logger.info(f"Final w_list: {w_list}")
-    logger.info(f"Final e_list: {e_list}")
+    # The lists of issues are only formatted if they are logged
+    if not is_quiet_mode():
+        logger.info("Validation finished: {} warnings and {} errors found.", len(w_list), len(e_list))
+        logger.opt(lazy=True).debug("Final w_list: {}", lambda: w_list)
+        logger.opt(lazy=True).debug("Final e_list: {}", lambda: e_list)
 
     is_valid = True if not e_list else False
 
     return is_valid, w_list, e_list
+
+
+def _load_measured_graph(
+    ontouml_file_path: str,
+    snapshot_cache: SnapshotCache | None,
+    predicates: set,
+    classes: set,
+    metrics: ValidationMetrics | None,
+    store_path: str | None = None,
+) -> Graph:
+    """Load the projection of an OntoUML file read by the selected rules, measuring the time spent loading it.
+
+    :param ontouml_file_path: Path of the OntoUML file in graph format (using the ontouml-vocabulary).
+    :type ontouml_file_path: str
+    :param snapshot_cache: Optional cache of snapshots of parsed files.
+    :type snapshot_cache: SnapshotCache | None
+    :param predicates: The predicates of the triples to be loaded.
+    :type predicates: set
+    :param classes: The classes of the rdf:type triples to be loaded.
+    :type classes: set
+    :param metrics: Optional metrics of the validation, in which the time spent loading the file is stored.
+    :type metrics: ValidationMetrics | None
+    :param store_path: Optional path of the SQLite triple store in which the model is kept instead of in memory.
+    :type store_path: str | None
+    :return: The loaded OntoUML model.
+    :rtype: Graph
+    """
+    load_start = time.perf_counter()
+    ontouml_model = load_graph_safely(
+        ontouml_file_path, snapshot_cache=snapshot_cache, predicates=predicates, classes=classes, store_path=store_path
+    )
+    if metrics is not None:
+        metrics.parse_seconds = time.perf_counter() - load_start
+        metrics.num_triples = len(ontouml_model)
+    return ontouml_model
+
+
+def _get_file_size(file_path: str) -> int:
+    """Return the size in bytes of a file, or zero if it cannot be accessed (the error is reported when it is loaded).
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :return: The size of the file in bytes.
+    :rtype: int
+    """
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def validate_ontouml_files(
+    ontouml_files_paths: list[str],
+    world_assumption: str,
+    workers: int | None = None,
+    backend: str | None = None,
+    max_tasks_per_worker: int | None = None,
+    max_worker_rss_mb: float | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+    snapshot_cache_dir: str | None = None,
+    result_cache_path: str | None = None,
+    store_dir: str | None = None,
+    collect_metrics: bool = False,
+) -> Iterator[ResultFile]:
+    """Validate a batch of OntoUML files in parallel processes, yielding the result of each file as soon as it is ready.
+
+    Files are started from the largest to the smallest one, so that the largest files do not delay the end of the
+    batch. A file that cannot be validated (e.g., because it cannot be loaded) does not interrupt the batch: its result
+    has is_valid set to False and an error describing the failure.
+
+    :param ontouml_files_paths: Paths of the OntoUML files in graph format (using the ontouml-vocabulary) to be
+                                validated.
+    :type ontouml_files_paths: list[str]
+    :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and 'cwa'.
+    :type world_assumption: str
+    :param workers: Number of worker processes. If None (default), the number of CPUs is used.
+    :type workers: int | None
+    :param backend: Implementation of the validation rules. Allowed values are: 'sparql' and 'native'. If None
+                    (default), 'sparql' is used for graph files and 'native' for JSON files, as in
+                    validate_ontouml_file.
+    :type backend: str | None
+    :param max_tasks_per_worker: Number of files after which a worker process is replaced by a new one. If None
+                                 (default), workers are not replaced because of the number of validated files.
+    :type max_tasks_per_worker: int | None
+    :param max_worker_rss_mb: Resident memory (in megabytes) above which a worker process is replaced by a new one after
+                              finishing its current file. If None (default), the memory of the workers is not checked.
+    :type max_worker_rss_mb: float | None
+    :param include: Selectors of the rules to be executed. If not provided (default), all implemented rules are
+                    executed.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only issues with these severities ('warning' and/or 'error') are reported.
+    :type severities: list[str] | None
+    :param snapshot_cache_dir: Optional directory of the cache of snapshots of parsed files, shared by all workers.
+    :type snapshot_cache_dir: str | None
+    :param result_cache_path: Optional path of the SQLite database of the result cache, shared by all workers.
+    :type result_cache_path: str | None
+    :param store_dir: Optional directory of SQLite triple stores in which the graphs are kept instead of in memory.
+    :type store_dir: str | None
+    :param collect_metrics: If True, the validation of each file is measured and its metrics are returned in its
+                            result. Files with identical contents share the metrics of their single validation.
+    :type collect_metrics: bool
+    :return: Iterator over the results of the validated files, in the order in which their validations finish.
+    :rtype: Iterator[ResultFile]
+    """
+    # Parameters are validated before any file is processed, as invalid values would make every validation fail
+    assumption = validate_assumption(world_assumption)
+    backend = validate_backend(backend) if backend is not None else None
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    files_paths = sorted(ontouml_files_paths, key=_get_file_size, reverse=True)
+    # Invalid selectors are also reported before any file is processed
+    select_rules_codes(include, exclude, severities)
+
+    # Files with identical contents (and formats) are validated only once, by the task of the first one of them
+    files_groups: dict[str, list[str]] = {}
+    for file_path in files_paths:
+        try:
+            content_key = get_file_content_key(file_path)
+        except OSError:
+            # The error is reported when the file is loaded by its own task
+            content_key = f"unreadable:{file_path}"
+        files_groups.setdefault(content_key, []).append(file_path)
+    groups_paths = list(files_groups.values())
+
+    tasks_args = [
+        (
+            group_paths[0],
+            assumption,
+            backend,
+            1,
+            "thread",
+            include,
+            exclude,
+            severities,
+            snapshot_cache_dir,
+            result_cache_path,
+            store_dir,
+        )
+        for group_paths in groups_paths
+    ]
+
+    task_function = _validate_measured_ontouml_file if collect_metrics else validate_ontouml_file
+
+    # Workers load the queries prepared by this process instead of parsing them again
+    for task_index, result, error in execute_in_process_pool(
+        task_function,
+        tasks_args,
+        workers,
+        max_tasks_per_worker,
+        max_worker_rss_mb,
+        initializer=initialize_prepared_queries,
+        initargs=(get_prepared_queries_file(),),
+    ):
+        for file_path in groups_paths[task_index]:
+            if error is not None:
+                logger.error(f"Validation of file {file_path} failed: {error}")
+                yield ResultFile(file_path, False, [], [], error)
+            else:
+                is_valid, w_list, e_list = result[:3]
+                metrics = result[3] if collect_metrics else None
+                yield ResultFile(file_path, is_valid, list(w_list), list(e_list), metrics=metrics)
+
+
+def _validate_measured_ontouml_file(*validation_args) -> tuple[bool, list[str], list[str], ValidationMetrics]:
+    """Validate an OntoUML file as validate_ontouml_file, returning the metrics of the validation with its results.
+
+    :param validation_args: The positional arguments of validate_ontouml_file, except for metrics.
+    :return: A tuple with the results returned by validate_ontouml_file and the metrics of the validation.
+    :rtype: tuple[bool, list[str], list[str], ValidationMetrics]
+    """
+    metrics = ValidationMetrics()
+    is_valid, w_list, e_list = validate_ontouml_file(*validation_args, metrics=metrics)
+    return is_valid, w_list, e_list, metrics
@@ -0,0 +1,305 @@
+"""Loader of OntoUML JSON files (the format exported by the OntoUML plugins) directly into a ModelIndex.
+
+RDFLib cannot parse OntoUML JSON, so models in this format used to be converted to Turtle (with ontouml-json2graph)
+before being parsed into a graph and indexed. This loader reads the JSON file once and adds the classes and
+generalizations it contains to a ModelIndex, without building a graph: the index is all the native backend needs.
+
+The index contents are the ones of the index of the graph produced by ontouml-json2graph:
+    - Element URIs are the concatenation of the base URI and the elements' ids.
+    - Stereotypes are the ontouml-vocabulary resources with the same names (e.g., 'roleMixin' is ontouml:roleMixin).
+    - restrictedTo values are the corresponding natures (e.g., 'functional-complex' is ontouml:functionalComplexNature).
+    - Attributes of a class are the properties in its 'properties' list and isAbstract is false when it is not set.
+    - The order of a class is 0 when it is '*' and 1 when it is not set and the class has a stereotype. isExtensional
+      is only indexed when it is set.
+
+Each JSON object is reduced as soon as it is decoded: only the ids and the values indexed of its elements are kept, so
+the document tree (e.g., its diagrams) is never kept in memory. Elements are indexed once the member containing them is
+known: objects in the fields of references to elements (e.g., 'general' and 'modelElement') are references, and are not
+indexed even if they are classes or generalizations.
+
+The file itself is only read incrementally if the optional ijson package (the 'json-streaming' extra) is installed.
+Without it, the whole text of the file is read into memory before being decoded, so the memory used grows with the size
+of the file.
+
+Usage:
+    ```
+    model_index = load_model_index_from_json(ontouml_json_file_path)
+    is_valid, w_list, e_list = validate_ontouml_json_file(ontouml_json_file_path, "owa")
+    ```
+"""
+import json
+from collections.abc import Callable, Iterable
+
+from loguru import logger
+from rdflib import URIRef
+
+from .errors import report_error_io_read
+from ..vocab_lib.model_index import ModelIndex
+from ..vocab_lib.ontouml import ONTOUML, ONTOUML_NAMESPACE
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Base URI used by ontouml-json2graph when none is provided
+DEFAULT_BASE_URI = "https://example.org#"
+
+ONTOUML_JSON_EXTENSION = ".json"
+
+# Fields of OntoUML JSON whose objects are references to elements (objects with their ids and types) defined elsewhere
+REFERENCE_FIELDS = {
+    "categorizer",
+    "general",
+    "generalizations",
+    "modelElement",
+    "owner",
+    "propertyType",
+    "redefinedProperties",
+    "source",
+    "specific",
+    "subsettedProperties",
+    "target",
+}
+
+# Errors raised when the contents of a file are not a valid JSON document
+JSON_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+
+def get_nature_uri(restricted_to: str) -> str:
+    """Return the URI of the nature corresponding to a restrictedTo value of OntoUML JSON.
+
+    :param restricted_to: The restrictedTo value (e.g., 'functional-complex').
+    :type restricted_to: str
+    :return: The URI of the nature (e.g., 'https://w3id.org/ontouml#functionalComplexNature').
+    :rtype: str
+    """
+    first_word, *other_words = restricted_to.split("-")
+    return ONTOUML_NAMESPACE + first_word + "".join(word.capitalize() for word in other_words) + "Nature"
+
+
+def _get_texts(text: str | dict | None) -> list[str]:
+    """Return the values of a text of OntoUML JSON, which may be a string or a multilingual object.
+
+    :param text: The text, as a string, as an object mapping languages to strings or None.
+    :type text: str | dict | None
+    :return: The strings of the text, in all its languages.
+    :rtype: list[str]
+    """
+    if text is None:
+        return []
+    if isinstance(text, dict):
+        return [value for value in text.values() if isinstance(value, str)]
+    return [text]
+
+
+def _get_orders(order: str | int | None, stereotype: str | None) -> list[int]:
+    """Return the values of the order of a class of OntoUML JSON, which may be a number, a string or null.
+
+    :param order: The order of the class (e.g., 2, '2' or '*').
+    :type order: str | int | None
+    :param stereotype: The stereotype of the class, as classes with stereotypes have order 1 when it is not set.
+    :type stereotype: str | None
+    :return: The order of the class (0 for '*') or an empty list if it has no valid order.
+    :rtype: list[int]
+    """
+    if order is None:
+        return [1] if stereotype else []
+    if order == "*":
+        return [0]
+    if isinstance(order, int) or (isinstance(order, str) and order.isdigit()):
+        return [int(order)]
+    return []
+
+
+class _JsonElement:
+    """A class to represent a reduced element of an OntoUML JSON document, indexed only if it is not a reference."""
+
+    def __init__(self, element_id: str, index_function: Callable | None = None, index_arguments: tuple = ()):
+        """Initialize a _JsonElement object.
+
+        :param element_id: The id of the element.
+        :type element_id: str
+        :param index_function: Method of the ModelIndex that indexes the element, or None if it is not indexed (e.g.,
+                               for properties, literals and diagrams).
+        :type index_function: Callable | None
+        :param index_arguments: The arguments of the index function, except for the index itself.
+        :type index_arguments: tuple
+        """
+        self.element_id = element_id
+        self.index_function = index_function
+        self.index_arguments = index_arguments
+
+    def index(self, model_index: ModelIndex) -> None:
+        """Add the element to an index, if it is a class or a generalization.
+
+        :param model_index: The index to which the element is added.
+        :type model_index: ModelIndex
+        """
+        if self.index_function is not None:
+            self.index_function(model_index, *self.index_arguments)
+
+
+class _OntoumlJsonReducer:
+    """Object pairs hook that reduces the objects of an OntoUML JSON document as they are decoded, indexing its \
+    classes and generalizations."""
+
+    def __init__(self, model_index: ModelIndex, base_uri: str):
+        """Initialize an _OntoumlJsonReducer object.
+
+        :param model_index: The index to which the classes and generalizations are added.
+        :type model_index: ModelIndex
+        :param base_uri: The base URI of the elements.
+        :type base_uri: str
+        """
+        self.model_index = model_index
+        self.base_uri = base_uri
+
+    def _get_uris(self, elements: list | None) -> list[str]:
+        """Return the URIs of reduced elements or of references to elements.
+
+        :param elements: The reduced elements (e.g., the properties of a class), which may be None.
+        :type elements: list | None
+        :return: The URIs of the elements.
+        :rtype: list[str]
+        """
+        return [self.base_uri + element.element_id for element in elements or [] if isinstance(element, _JsonElement)]
+
+    def __call__(self, pairs: list[tuple[str, object]]) -> dict | _JsonElement:
+        """Return the reduced version of a decoded JSON object, indexing the elements it contains.
+
+        Elements contained in the object are indexed, unless they are in fields of references to elements.
+
+        :param pairs: The (key, value) pairs of the decoded object, whose own objects were already reduced.
+        :type pairs: list[tuple[str, object]]
+        :return: The object itself, for untyped objects (e.g., multilingual texts), or its reduced element, with its id
+                 and, for classes and generalizations, the values to be indexed.
+        :rtype: dict | _JsonElement
+        """
+        for key, value in pairs:
+            if key not in REFERENCE_FIELDS:
+                for item in value if isinstance(value, list) else [value]:
+                    if isinstance(item, _JsonElement):
+                        item.index(self.model_index)
+
+        json_object = dict(pairs)
+        element_type = json_object.get("type")
+        if element_type is None or "id" not in json_object:
+            return json_object
+
+        element_id = json_object["id"]
+        if element_type == "Class":
+            stereotype = json_object.get("stereotype")
+            is_abstract = json_object.get("isAbstract")
+            is_extensional = json_object.get("isExtensional")
+            class_values = {
+                ONTOUML.name: _get_texts(json_object.get("name")),
+                ONTOUML.stereotype: [ONTOUML_NAMESPACE + stereotype] if stereotype else [],
+                ONTOUML.restrictedTo: [get_nature_uri(nature) for nature in json_object.get("restrictedTo") or []],
+                ONTOUML.literal: self._get_uris(json_object.get("literals")),
+                ONTOUML.attribute: self._get_uris(json_object.get("properties")),
+                ONTOUML.isAbstract: [bool(is_abstract)],
+                ONTOUML.order: _get_orders(json_object.get("order"), stereotype),
+                ONTOUML.isExtensional: [bool(is_extensional)] if is_extensional is not None else [],
+            }
+            return _JsonElement(element_id, ModelIndex.index_class, (self.base_uri + element_id, class_values))
+        if element_type == "Generalization":
+            generalization_args = (
+                self.base_uri + element_id,
+                self._get_uris([json_object.get("general")]),
+                self._get_uris([json_object.get("specific")]),
+            )
+            return _JsonElement(element_id, ModelIndex.index_generalization, generalization_args)
+        return _JsonElement(element_id)
+
+
+def _build_json_objects(
+    events: Iterable[tuple[str, object]], object_pairs_hook: Callable[[list[tuple[str, object]]], object]
+) -> object:
+    """Build the value of a JSON document from its parsing events, applying a hook to the pairs of each decoded object.
+
+    The hook is the one that json.load would receive as object_pairs_hook.
+
+    :param events: The (event, value) pairs of the document, as produced by ijson.basic_parse.
+    :type events: Iterable[tuple[str, object]]
+    :param object_pairs_hook: Function that receives the (key, value) pairs of each decoded object and returns the
+                              value replacing it.
+    :type object_pairs_hook: Callable[[list[tuple[str, object]]], object]
+    :return: The value of the document.
+    :rtype: object
+    """
+    # Stack of [container, current_key] pairs of the objects and arrays being decoded
+    stack = [[[], None]]
+    for event, value in events:
+        if event == "map_key":
+            stack[-1][1] = value
+            continue
+        if event in ("start_map", "start_array"):
+            stack.append([{} if event == "start_map" else [], None])
+            continue
+        if event == "end_map":
+            value = object_pairs_hook(list(stack.pop()[0].items()))
+        elif event == "end_array":
+            value = stack.pop()[0]
+
+        container, key = stack[-1]
+        if isinstance(container, list):
+            container.append(value)
+        else:
+            container[key] = value
+    return stack[0][0][0]
+
+
+def load_model_index_from_json(
+    json_file_path: str, predicates: list[URIRef] | None = None, base_uri: str = DEFAULT_BASE_URI
+) -> ModelIndex:
+    """Load an OntoUML JSON file into a ModelIndex, without building a graph.
+
+    The file is read incrementally if ijson is installed, and read at once otherwise.
+
+    :param json_file_path: Path of the OntoUML JSON file.
+    :type json_file_path: str
+    :param predicates: Optional list of the predicates to be indexed, as in ModelIndex.
+    :type predicates: list[URIRef] | None
+    :param base_uri: The base URI of the elements (default: the one of ontouml-json2graph).
+    :type base_uri: str
+    :return: The index of the model.
+    :rtype: ModelIndex
+    :raises OSError: If the file cannot be read or is not a valid JSON document.
+    """
+    model_index = ModelIndex(None, predicates)
+    object_pairs_hook = _OntoumlJsonReducer(model_index, base_uri)
+
+    try:
+        if ijson is not None:
+            with open(json_file_path, "rb") as json_file:
+                document = _build_json_objects(ijson.basic_parse(json_file, use_float=True), object_pairs_hook)
+        else:
+            with open(json_file_path, encoding="utf-8") as json_file:
+                document = json.load(json_file, object_pairs_hook=object_pairs_hook)
+    except (OSError, *JSON_DECODE_ERRORS) as error:
+        file_description = "input OntoUML JSON file"
+        report_error_io_read(json_file_path, file_description, error)
+
+    # The document itself is not contained in any other object
+    if isinstance(document, _JsonElement):
+        document.index(model_index)
+
+    logger.debug(
+        "OntoUML JSON file {} successfully loaded: {} classes and {} generalizations indexed.",
+        json_file_path,
+        len(model_index.classes),
+        len(model_index.generalization_generals),
+    )
+    return model_index
+
+
+def is_ontouml_json_file(file_path: str) -> bool:
+    """Return whether a file is an OntoUML JSON file, according to its extension.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :return: True if the file has the .json extension, False otherwise.
+    :rtype: bool
+    """
+    return file_path.lower().endswith(ONTOUML_JSON_EXTENSION)
@@ -0,0 +1,284 @@
+"""Deterministic generator of synthetic OntoUML models in Turtle format (using the ontouml-vocabulary).
+
+Generated models are used to measure how the loading of models and the validation rules scale with the size of the
+model (see validator.benchmarks.scaling_benchmark). The same settings and seed always produce the same file.
+
+A generated model contains:
+    - Classes organized in generalization hierarchies (trees) with a given depth and fan-out. Each class has a name, a
+      stereotype drawn from a weighted mix, an isAbstract value and the ontological nature of its stereotype.
+    - Optional generalization cycles, each one closing a path from a root of a hierarchy to one of its deepest classes.
+    - Enumerations, outside the hierarchies, with a given number of literals.
+    - Relations between random classes, with their source and target ends.
+
+Classes are written as soon as they are generated, so files with millions of triples are written without being
+built in memory.
+
+Usage:
+    ```
+    model_generator = ModelGenerator(num_classes=10000, hierarchy_depth=4, fan_out=3, num_cycles=2, seed=42)
+    with open("model.ttl", "w", encoding="utf-8") as output_file:
+        num_triples = model_generator.write(output_file)
+    ```
+"""
+import io
+import random
+from typing import TextIO
+
+MODEL_NAMESPACE = "https://example.org#"
+
+TURTLE_PREFIXES = f"@prefix :        <{MODEL_NAMESPACE}> .\n@prefix ontouml: <https://w3id.org/ontouml#> .\n\n"
+
+# Default mix of class stereotypes, as relative weights. None represents classes without stereotypes
+DEFAULT_STEREOTYPES_WEIGHTS = {
+    "kind": 20,
+    "subkind": 20,
+    "role": 15,
+    "phase": 10,
+    "category": 6,
+    "roleMixin": 4,
+    "mixin": 3,
+    "relator": 8,
+    "mode": 4,
+    "quality": 3,
+    "collective": 2,
+    "quantity": 1,
+    "event": 2,
+    "situation": 1,
+    "datatype": 1,
+    None: 0,
+}
+
+# Ontological natures to which the classes of each stereotype are restricted. Other stereotypes are restricted to
+# functional complexes
+STEREOTYPES_NATURES = {
+    "collective": "collectiveNature",
+    "datatype": "abstractNature",
+    "enumeration": "abstractNature",
+    "event": "eventNature",
+    "mode": "intrinsicModeNature",
+    "quality": "qualityNature",
+    "quantity": "quantityNature",
+    "relator": "relatorNature",
+    "situation": "situationNature",
+    "type": "typeNature",
+}
+DEFAULT_NATURE = "functionalComplexNature"
+
+RELATIONS_STEREOTYPES = ["material", "mediation", "characterization", "componentOf", "memberOf"]
+
+# Number of classes of the model generated to estimate the number of triples per class
+ESTIMATION_NUM_CLASSES = 2000
+
+
+class ModelGenerator:
+    """A class to represent the settings of a deterministic generator of synthetic OntoUML models."""
+
+    def __init__(
+        self,
+        num_classes: int,
+        stereotypes_weights: dict[str | None, float] | None = None,
+        hierarchy_depth: int = 4,
+        fan_out: int = 3,
+        num_cycles: int = 0,
+        enumerations_ratio: float = 0.05,
+        literals_per_enumeration: int = 3,
+        relations_ratio: float = 0.5,
+        abstract_ratio: float = 0.1,
+        seed: int = 0,
+    ):
+        """Initialize a ModelGenerator object.
+
+        :param num_classes: Number of classes of the model, including enumerations.
+        :type num_classes: int
+        :param stereotypes_weights: Relative weights of the stereotypes of the classes in the hierarchies, identified
+                                    by their names in the ontouml-vocabulary (e.g., 'kind'). None is used for classes
+                                    without stereotypes. If not provided, DEFAULT_STEREOTYPES_WEIGHTS is used.
+        :type stereotypes_weights: dict[str | None, float] | None
+        :param hierarchy_depth: Number of levels of each generalization hierarchy. If 1, there are no generalizations.
+        :type hierarchy_depth: int
+        :param fan_out: Number of direct specializations of each class that is not in the last level of a hierarchy.
+        :type fan_out: int
+        :param num_cycles: Number of generalization cycles. Each cycle is created in a different hierarchy, while there
+                           are hierarchies with more than one level.
+        :type num_cycles: int
+        :param enumerations_ratio: Fraction of the classes that are enumerations.
+        :type enumerations_ratio: float
+        :param literals_per_enumeration: Number of literals of each enumeration.
+        :type literals_per_enumeration: int
+        :param relations_ratio: Number of relations per class.
+        :type relations_ratio: float
+        :param abstract_ratio: Fraction of the classes in the hierarchies that are abstract.
+        :type abstract_ratio: float
+        :param seed: Seed of the random choices. Equal settings and seeds generate equal models.
+        :type seed: int
+        """
+        if hierarchy_depth < 1 or fan_out < 1:
+            raise ValueError("The hierarchy depth and the fan-out must be positive.")
+
+        self.num_classes = num_classes
+        self.stereotypes_weights = (
+            DEFAULT_STEREOTYPES_WEIGHTS if stereotypes_weights is None else dict(stereotypes_weights)
+        )
+        self.hierarchy_depth = hierarchy_depth
+        self.fan_out = fan_out
+        self.num_cycles = num_cycles
+        self.enumerations_ratio = enumerations_ratio
+        self.literals_per_enumeration = literals_per_enumeration
+        self.relations_ratio = relations_ratio
+        self.abstract_ratio = abstract_ratio
+        self.seed = seed
+
+        self.num_enumerations = round(num_classes * enumerations_ratio)
+        self.num_hierarchy_classes = num_classes - self.num_enumerations
+        self.num_relations = round(num_classes * relations_ratio)
+        # Number of classes of a complete hierarchy, numbered in breadth-first order
+        self.hierarchy_size = sum(fan_out**level for level in range(hierarchy_depth))
+
+    def get_settings(self) -> dict:
+        """Return the settings of the generator, which identify the generated model together with the seed."""
+        return {
+            "num_classes": self.num_classes,
+            "stereotypes_weights": dict(self.stereotypes_weights),
+            "hierarchy_depth": self.hierarchy_depth,
+            "fan_out": self.fan_out,
+            "num_cycles": self.num_cycles,
+            "enumerations_ratio": self.enumerations_ratio,
+            "literals_per_enumeration": self.literals_per_enumeration,
+            "relations_ratio": self.relations_ratio,
+            "abstract_ratio": self.abstract_ratio,
+            "seed": self.seed,
+        }
+
+    def _get_general_number(self, class_number: int) -> int | None:
+        """Return the number of the direct generalization of a class of the hierarchies, or None for roots."""
+        position = class_number % self.hierarchy_size
+        if position == 0:
+            return None
+        return class_number - position + (position - 1) // self.fan_out
+
+    def write(self, output_file: TextIO) -> int:
+        """Write the generated model to a text file in Turtle format.
+
+        :param output_file: The text file in which the model is written.
+        :type output_file: TextIO
+        :return: The number of triples written.
+        :rtype: int
+        """
+        randomizer = random.Random(self.seed)
+        stereotypes = list(self.stereotypes_weights)
+        weights = list(self.stereotypes_weights.values())
+        num_triples = 0
+
+        output_file.write(TURTLE_PREFIXES)
+
+        for class_number in range(self.num_hierarchy_classes):
+            stereotype = randomizer.choices(stereotypes, weights)[0]
+            is_abstract = "true" if randomizer.random() < self.abstract_ratio else "false"
+            num_triples += self._write_class(output_file, class_number, stereotype, is_abstract)
+
+            general_number = self._get_general_number(class_number)
+            if general_number is not None:
+                num_triples += self._write_generalization(output_file, f"g{class_number}", general_number, class_number)
+
+        num_triples += self._write_cycles(output_file)
+
+        for class_number in range(self.num_hierarchy_classes, self.num_classes):
+            num_triples += self._write_class(output_file, class_number, "enumeration", "false")
+            literals_ids = [f":c{class_number}_l{literal}" for literal in range(self.literals_per_enumeration)]
+            if literals_ids:
+                output_file.write(f":c{class_number} ontouml:literal {', '.join(literals_ids)} .\n")
+            for literal_number, literal_id in enumerate(literals_ids):
+                output_file.write(
+                    f'{literal_id} a ontouml:Literal ; ontouml:name "Literal {class_number}.{literal_number}" .\n'
+                )
+            num_triples += 3 * len(literals_ids)
+
+        if self.num_classes:
+            for relation_number in range(self.num_relations):
+                source_number = randomizer.randrange(self.num_classes)
+                target_number = randomizer.randrange(self.num_classes)
+                relation_stereotype = randomizer.choice(RELATIONS_STEREOTYPES)
+                num_triples += self._write_relation(
+                    output_file, relation_number, relation_stereotype, source_number, target_number
+                )
+
+        return num_triples
+
+    @staticmethod
+    def _write_class(output_file: TextIO, class_number: int, stereotype: str | None, is_abstract: str) -> int:
+        """Write a class and return the number of its triples."""
+        output_file.write(
+            f':c{class_number} a ontouml:Class ; ontouml:name "Class {class_number}" ; '
+            f"ontouml:isAbstract {is_abstract}"
+        )
+        if stereotype is None:
+            output_file.write(" .\n")
+            return 3
+        nature = STEREOTYPES_NATURES.get(stereotype, DEFAULT_NATURE)
+        output_file.write(f" ; ontouml:stereotype ontouml:{stereotype} ; ontouml:restrictedTo ontouml:{nature} .\n")
+        return 5
+
+    @staticmethod
+    def _write_generalization(
+        output_file: TextIO, generalization_id: str, general_number: int, specific_number: int
+    ) -> int:
+        """Write a generalization and return the number of its triples."""
+        output_file.write(
+            f":{generalization_id} a ontouml:Generalization ; "
+            f"ontouml:general :c{general_number} ; ontouml:specific :c{specific_number} .\n"
+        )
+        return 3
+
+    def _write_cycles(self, output_file: TextIO) -> int:
+        """Write the generalizations closing the cycles and return the number of their triples."""
+        if self.hierarchy_depth < 2:
+            return 0
+
+        num_triples = 0
+        for cycle_number in range(self.num_cycles):
+            root_number = cycle_number * self.hierarchy_size
+            # The last class of a hierarchy is one of its deepest classes (or the deepest one of an incomplete one)
+            last_number = min(root_number + self.hierarchy_size, self.num_hierarchy_classes) - 1
+            if last_number <= root_number:
+                break
+            num_triples += self._write_generalization(output_file, f"cycle{cycle_number}", last_number, root_number)
+        return num_triples
+
+    @staticmethod
+    def _write_relation(
+        output_file: TextIO, relation_number: int, stereotype: str, source_number: int, target_number: int
+    ) -> int:
+        """Write a relation and its ends and return the number of their triples."""
+        relation_id = f":r{relation_number}"
+        output_file.write(
+            f'{relation_id} a ontouml:Relation ; ontouml:name "relation {relation_number}" ; '
+            f"ontouml:stereotype ontouml:{stereotype} ; "
+            f"ontouml:relationEnd {relation_id}_s, {relation_id}_t ; "
+            f"ontouml:sourceEnd {relation_id}_s ; ontouml:targetEnd {relation_id}_t .\n"
+            f"{relation_id}_s a ontouml:Property ; ontouml:propertyType :c{source_number} .\n"
+            f"{relation_id}_t a ontouml:Property ; ontouml:propertyType :c{target_number} .\n"
+        )
+        return 11
+
+    def generate(self) -> str:
+        """Return the generated model as a string in Turtle format."""
+        output_file = io.StringIO()
+        self.write(output_file)
+        return output_file.getvalue()
+
+
+def get_num_classes_for_triples(num_triples: int, **generator_settings) -> int:
+    """Return the number of classes of a generated model with approximately the received number of triples.
+
+    The number of triples per class is estimated by generating a model with the same settings and
+    ESTIMATION_NUM_CLASSES classes.
+
+    :param num_triples: The approximate number of triples of the model.
+    :type num_triples: int
+    :param generator_settings: The other settings of the ModelGenerator, except for num_classes.
+    :return: The number of classes.
+    :rtype: int
+    """
+    estimation_generator = ModelGenerator(ESTIMATION_NUM_CLASSES, **generator_settings)
+    triples_per_class = estimation_generator.write(io.StringIO()) / ESTIMATION_NUM_CLASSES
+    return max(1, round(num_triples / triples_per_class))
@@ -0,0 +1,230 @@
+"""Prepared (pre-parsed and pre-translated) SPARQL queries used by the validation rules.
+
+Executing a query from its string makes RDFLib parse it and translate it into SPARQL algebra every time it is executed.
+This module prepares each query only once (lazily, on its first use) with the ONTOUML prefix bound, and keeps the
+resulting Query objects for the whole lifetime of the process.
+
+Prepared queries can also be persisted to a file with save_prepared_queries and restored with load_prepared_queries,
+so that worker processes can reuse the compiled algebra instead of each one paying the parsing cost. Process pools
+pass the file returned by get_prepared_queries_file, which is saved once per parent process, to the initializers of
+their workers.
+
+All modules containing SPARQL queries must be listed in SPARQL_QUERY_MODULES. Every module-level string whose name
+starts with "QUERY_" in these modules is prepared by prepare_all_queries.
+"""
+import atexit
+import importlib
+import os
+import pickle
+import tempfile
+from types import MethodType
+
+import rdflib
+from loguru import logger
+from rdflib.plugins.sparql import operators, prepareQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+from rdflib.plugins.sparql.sparql import Query
+
+from .errors import report_error_io_read, report_error_io_write
+from ..vocab_lib.ontouml import ONTOUML_NAMESPACE
+
+SPARQL_QUERY_MODULES = [
+    "validator.validations.rules_cl.sparql_cl",
+]
+
+# Prepared queries indexed by their query strings
+PREPARED_QUERIES: dict[str, Query] = {}
+
+# File in which the prepared queries were saved for the workers of this process (see get_prepared_queries_file)
+_prepared_queries_file: str | None = None
+
+
+def get_prepared_query(sparql_query: str) -> Query:
+    """Return the prepared version of a SPARQL query, preparing it if this is its first use.
+
+    :param sparql_query: The SPARQL query string.
+    :type sparql_query: str
+    :return: The prepared query, ready to be executed by RDFLib.
+    :rtype: Query
+    """
+    prepared_query = PREPARED_QUERIES.get(sparql_query)
+
+    if prepared_query is None:
+        prepared_query = prepareQuery(sparql_query, initNs={"ontouml": ONTOUML_NAMESPACE})
+        PREPARED_QUERIES[sparql_query] = prepared_query
+
+    return prepared_query
+
+
+def get_all_named_queries(prefixes: tuple[str, ...] = ("QUERY_", "ASK_")) -> dict[str, str]:
+    """Return the SPARQL queries defined in the modules listed in SPARQL_QUERY_MODULES, indexed by their names.
+
+    :param prefixes: Prefixes of the names of the module-level strings that are returned (default: SELECT and ASK
+                     queries of the rules).
+    :type prefixes: tuple[str, ...]
+    :return: Dictionary mapping the names of the queries (e.g., 'QUERY_R_CL_EDA') to their SPARQL query strings.
+    :rtype: dict[str, str]
+    """
+    named_queries = {}
+
+    for module_name in SPARQL_QUERY_MODULES:
+        module = importlib.import_module(module_name)
+        for attribute_name, attribute_value in vars(module).items():
+            if attribute_name.startswith(prefixes) and isinstance(attribute_value, str):
+                named_queries[attribute_name] = attribute_value
+
+    return named_queries
+
+
+def get_all_query_strings() -> list[str]:
+    """Return the strings of all SPARQL queries defined in the modules listed in SPARQL_QUERY_MODULES.
+
+    :return: List of SPARQL query strings.
+    :rtype: list[str]
+    """
+    return list(get_all_named_queries(("QUERY_",)).values())
+
+
+def prepare_all_queries() -> None:
+    """Prepare all SPARQL queries defined in the modules listed in SPARQL_QUERY_MODULES."""
+    for sparql_query in get_all_query_strings():
+        get_prepared_query(sparql_query)
+
+
+def _rebuild_comp_value(comp_class: type, items: list, state: dict, evalfn) -> CompValue:
+    """Rebuild a CompValue (a node of the SPARQL algebra) unpickled from a file.
+
+    :param comp_class: The class of the node (CompValue or one of its subclasses).
+    :type comp_class: type
+    :param items: The node's (key, value) items.
+    :type items: list
+    :param state: The node's attributes.
+    :type state: dict
+    :param evalfn: Evaluation function to be bound to the node, or None if the node has no evaluation function.
+    :type evalfn: Callable | None
+    :return: The rebuilt node.
+    :rtype: CompValue
+    """
+    comp_value = comp_class.__new__(comp_class)
+    comp_value.__dict__.update(state)
+    comp_value.update(items)
+    if evalfn is not None:
+        comp_value._evalfn = MethodType(evalfn, comp_value)
+    return comp_value
+
+
+def _get_true_filter() -> CompValue:
+    """Return RDFLib's TrueFilter node, which is shared by all queries and whose evaluation function is a lambda.
+
+    :return: The TrueFilter node of the rdflib.plugins.sparql.operators module.
+    :rtype: CompValue
+    """
+    return operators.TrueFilter
+
+
+class _QueryPickler(pickle.Pickler):
+    """Pickler for prepared queries. CompValue nodes cannot be unpickled by the default protocol, as their \
+    constructors require arguments and their evaluation functions are bound methods."""
+
+    def reducer_override(self, obj):
+        """Reduce CompValue nodes so that they can be rebuilt by _rebuild_comp_value.
+
+        :param obj: The object being pickled.
+        :type obj: Any
+        :return: The reduced CompValue or NotImplemented for all other objects.
+        :rtype: tuple | NotImplemented
+        """
+        if not isinstance(obj, CompValue):
+            return NotImplemented
+
+        if obj is operators.TrueFilter:
+            return _get_true_filter, ()
+
+        state = {key: value for key, value in vars(obj).items() if key not in ("_evalfn", "ctx")}
+        bound_evalfn = getattr(obj, "_evalfn", None)
+        evalfn = bound_evalfn.__func__ if bound_evalfn is not None else None
+
+        return _rebuild_comp_value, (type(obj), list(dict.items(obj)), state, evalfn)
+
+
+def save_prepared_queries(file_path: str) -> None:
+    """Prepare all queries and save them to a file to be loaded by other processes.
+
+    :param file_path: Path of the file in which the prepared queries will be saved.
+    :type file_path: str
+    """
+    prepare_all_queries()
+
+    try:
+        with open(file_path, "wb") as prepared_file:
+            _QueryPickler(prepared_file).dump((rdflib.__version__, PREPARED_QUERIES))
+    except OSError as error:
+        file_description = "prepared SPARQL queries file"
+        report_error_io_write(file_path, file_description, error)
+
+    logger.debug(f"{len(PREPARED_QUERIES)} prepared SPARQL queries saved to {file_path}.")
+
+
+def load_prepared_queries(file_path: str) -> None:
+    """Load prepared queries saved by save_prepared_queries.
+
+    Queries are indexed by their strings, so a query modified after the file was saved is prepared again on its first
+    use. Files saved with a different version of RDFLib are ignored.
+
+    :param file_path: Path of the file containing the prepared queries.
+    :type file_path: str
+    """
+    try:
+        with open(file_path, "rb") as prepared_file:
+            rdflib_version, loaded_queries = pickle.load(prepared_file)
+    except OSError as error:
+        file_description = "prepared SPARQL queries file"
+        report_error_io_read(file_path, file_description, error)
+
+    if rdflib_version != rdflib.__version__:
+        logger.warning(
+            f"Prepared SPARQL queries in {file_path} were saved with RDFLib {rdflib_version} and were not loaded."
+        )
+        return
+
+    PREPARED_QUERIES.update(loaded_queries)
+    logger.debug(f"{len(loaded_queries)} prepared SPARQL queries loaded from {file_path}.")
+
+
+def get_prepared_queries_file() -> str:
+    """Return the path of a temporary file with all prepared queries, to be loaded by the workers of this process.
+
+    The file is saved on the first call and removed when the process exits.
+
+    :return: Path of the file containing the prepared queries.
+    :rtype: str
+    """
+    global _prepared_queries_file
+
+    if _prepared_queries_file is None:
+        file_descriptor, file_path = tempfile.mkstemp(prefix="ontouml_prepared_queries_", suffix=".pickle")
+        os.close(file_descriptor)
+        save_prepared_queries(file_path)
+        atexit.register(_remove_prepared_queries_file, file_path, os.getpid())
+        _prepared_queries_file = file_path
+
+    return _prepared_queries_file
+
+
+def _remove_prepared_queries_file(file_path: str, owner_pid: int) -> None:
+    """Remove the file of prepared queries when the process that saved it exits (not when its forked children do)."""
+    if os.getpid() == owner_pid and os.path.exists(file_path):
+        os.remove(file_path)
+
+
+def initialize_prepared_queries(file_path: str | None) -> None:
+    """Initialize the prepared queries of a worker process, loading them from a file if one is received.
+
+    :param file_path: Path of the file returned by get_prepared_queries_file in the parent process. If None, all
+                      queries are prepared by the worker.
+    :type file_path: str | None
+    """
+    if file_path is None:
+        prepare_all_queries()
+    else:
+        load_prepared_queries(file_path)
@@ -0,0 +1,225 @@
+"""Process pool with worker recycling and per-task failure isolation.
+
+Tasks are dispatched to the workers in the order in which they are received and their results are yielded as soon as
+they are completed. A worker is replaced by a new process (i.e., recycled) after executing a maximum number of tasks or
+when its resident memory exceeds a maximum size, so that memory retained by the validation of large models is returned
+to the operating system.
+
+Exceptions raised by a task (e.g., by the report_error_* functions) are reported as the task's failure and do not
+affect the other tasks. If a worker terminates while executing a task (e.g., killed by the operating system when out of
+memory), the task is reported as failed and the worker is replaced.
+"""
+import multiprocessing
+import os
+import queue
+from collections.abc import Callable, Iterator
+from multiprocessing.sharedctypes import Synchronized
+from typing import Any
+
+from loguru import logger
+
+# Interval (in seconds) in which the pool checks whether its workers are still alive while waiting for results
+WORKERS_CHECK_INTERVAL = 0.5
+
+
+def get_process_rss_mb() -> float:
+    """Return the resident set size (RSS) of the current process in megabytes.
+
+    The current RSS is only available on Linux. On other platforms, zero is returned and workers are never recycled
+    because of their memory usage.
+
+    :return: The resident set size of the current process in megabytes.
+    :rtype: float
+    """
+    try:
+        with open("/proc/self/statm") as statm_file:
+            rss_pages = int(statm_file.read().split()[1])
+        return rss_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return 0.0
+
+
+def _execute_worker(
+    worker_id: int,
+    task_function: Callable,
+    task_queue: multiprocessing.Queue,
+    result_queue: multiprocessing.Queue,
+    current_task: Synchronized,
+    max_tasks_per_worker: int | None,
+    max_worker_rss_mb: float | None,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> None:
+    """Execute tasks received from the task queue until a stop signal (None) is received or the worker must be recycled.
+
+    Messages sent to the result queue are:
+        - ("completed", worker_id, task_index, result, error_message), when the worker finishes executing a task.
+        - ("exited", worker_id), when the worker stops because it must be recycled.
+
+    The index of the task being executed is also stored in the shared value current_task (-1 if there is none). Unlike
+    queue messages, which are sent by a background thread, it is available to the pool even if the worker is killed.
+
+    :param worker_id: Identifier of the worker in the pool.
+    :type worker_id: int
+    :param task_function: Function executed for each task. Must be defined at the top level of a module.
+    :type task_function: Callable
+    :param task_queue: Queue from which (task_index, task_args) tuples are received.
+    :type task_queue: multiprocessing.Queue
+    :param result_queue: Queue to which messages are sent.
+    :type result_queue: multiprocessing.Queue
+    :param current_task: Shared value in which the index of the task being executed is stored.
+    :type current_task: Synchronized
+    :param max_tasks_per_worker: Number of tasks after which the worker is recycled. If None, it is never recycled.
+    :type max_tasks_per_worker: int | None
+    :param max_worker_rss_mb: RSS (in megabytes) above which the worker is recycled. If None, memory is not checked.
+    :type max_worker_rss_mb: float | None
+    :param initializer: Optional function called when the worker starts, before it receives any task.
+    :type initializer: Callable | None
+    :param initargs: Arguments of the initializer.
+    :type initargs: tuple
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    executed_tasks = 0
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        task_index, task_args = task
+        current_task.value = task_index
+
+        try:
+            result_queue.put(("completed", worker_id, task_index, task_function(*task_args), None))
+        except Exception as error:
+            result_queue.put(("completed", worker_id, task_index, None, f"{type(error).__name__}: {error}"))
+
+        current_task.value = -1
+
+        executed_tasks += 1
+        if (max_tasks_per_worker is not None and executed_tasks >= max_tasks_per_worker) or (
+            max_worker_rss_mb is not None and get_process_rss_mb() > max_worker_rss_mb
+        ):
+            result_queue.put(("exited", worker_id))
+            return
+
+
+def execute_in_process_pool(
+    task_function: Callable,
+    tasks_args: list[tuple],
+    workers: int,
+    max_tasks_per_worker: int | None = None,
+    max_worker_rss_mb: float | None = None,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> Iterator[tuple[int, Any, str | None]]:
+    """Execute a function for each received tuple of arguments in a pool of recyclable processes.
+
+    :param task_function: Function executed for each task. Must be defined at the top level of a module.
+    :type task_function: Callable
+    :param tasks_args: Arguments of each task, in the order in which the tasks must be started.
+    :type tasks_args: list[tuple]
+    :param workers: Maximum number of worker processes running at the same time.
+    :type workers: int
+    :param max_tasks_per_worker: Number of tasks after which a worker is recycled. If None, workers are not recycled
+                                 because of the number of executed tasks.
+    :type max_tasks_per_worker: int | None
+    :param max_worker_rss_mb: RSS (in megabytes) above which a worker is recycled after finishing its current task. If
+                              None, workers are not recycled because of their memory usage.
+    :type max_worker_rss_mb: float | None
+    :param initializer: Optional function called by each worker process when it starts (including recycled ones).
+                        Must be defined at the top level of a module.
+    :type initializer: Callable | None
+    :param initargs: Arguments of the initializer.
+    :type initargs: tuple
+    :return: Iterator over (task_index, result, error_message) tuples, in the order in which the tasks are completed.
+             error_message is None for successful tasks and result is None for failed tasks.
+    :rtype: Iterator[tuple[int, Any, str | None]]
+    """
+    num_tasks = len(tasks_args)
+    if not num_tasks:
+        return
+
+    context = multiprocessing.get_context()
+    task_queue = context.Queue()
+    result_queue = context.Queue()
+
+    for task_index, task_args in enumerate(tasks_args):
+        task_queue.put((task_index, task_args))
+
+    processes: dict[int, multiprocessing.Process] = {}
+    current_tasks: dict[int, Synchronized] = {}
+    completed_tasks: set[int] = set()
+    next_worker_id = 0
+
+    def start_worker() -> None:
+        """Start a new worker process."""
+        nonlocal next_worker_id
+        current_task = context.Value("i", -1)
+        process = context.Process(
+            target=_execute_worker,
+            args=(
+                next_worker_id,
+                task_function,
+                task_queue,
+                result_queue,
+                current_task,
+                max_tasks_per_worker,
+                max_worker_rss_mb,
+                initializer,
+                initargs,
+            ),
+            daemon=True,
+        )
+        process.start()
+        processes[next_worker_id] = process
+        current_tasks[next_worker_id] = current_task
+        next_worker_id += 1
+
+    def replace_worker(worker_id: int) -> None:
+        """Remove a terminated worker from the pool and start a new one if there are tasks not started yet."""
+        processes.pop(worker_id).join()
+        current_tasks.pop(worker_id)
+        running_tasks = sum(1 for current_task in current_tasks.values() if current_task.value != -1)
+        if len(completed_tasks) + running_tasks < num_tasks and len(processes) < workers:
+            start_worker()
+
+    for _ in range(min(workers, num_tasks)):
+        start_worker()
+
+    try:
+        while len(completed_tasks) < num_tasks:
+            try:
+                message = result_queue.get(timeout=WORKERS_CHECK_INTERVAL)
+            except queue.Empty:
+                # Workers that terminated without notifying the pool are replaced and their tasks reported as failed
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    logger.warning(f"Worker process {process.pid} terminated with exit code {process.exitcode}.")
+                    task_index = current_tasks[worker_id].value
+                    if task_index != -1 and task_index not in completed_tasks:
+                        completed_tasks.add(task_index)
+                        yield task_index, None, f"Worker process terminated with exit code {process.exitcode}."
+                    replace_worker(worker_id)
+                continue
+
+            if message[0] == "completed":
+                _, worker_id, task_index, result, error_message = message
+                if task_index not in completed_tasks:
+                    completed_tasks.add(task_index)
+                    yield task_index, result, error_message
+            else:
+                _, worker_id = message
+                # The worker may have already been replaced if its termination was detected before this message
+                if worker_id in processes:
+                    logger.debug(f"Recycling worker process {processes[worker_id].pid}.")
+                    replace_worker(worker_id)
+    finally:
+        for _ in processes:
+            task_queue.put(None)
+        for process in processes.values():
+            process.join(timeout=WORKERS_CHECK_INTERVAL)
+            if process.is_alive():
+                process.terminate()
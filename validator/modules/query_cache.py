@@ -0,0 +1,92 @@
+"""SPARQL query results cache to be used during the validation of a single OntoUML model.
+
+Different rules may execute the same SPARQL query on the same model (e.g., rules R_CL_QJC and R_CL_EMV both use
+QUERY_TAGGED_VALUE). The QueryCache materializes the result rows of each distinct query the first time it is executed
+and returns the stored rows to all subsequent requests, counting hits and misses so that the savings can be verified.
+
+As the cached rows reflect the state of the graph when the query was first executed, a cache must only be used while
+its graph is not modified, i.e., during a single validation. A cache can be shared by rules executed in concurrent
+threads. All rows are kept in memory, even if the graph is kept in a disk-backed triple store.
+"""
+import threading
+from collections.abc import Iterable
+
+from loguru import logger
+from rdflib import Graph
+from rdflib.query import ResultRow
+
+from .prepared_queries import get_prepared_query
+from .validation_metrics import count_scanned_rows
+
+
+class QueryCache:
+    """A class to represent a cache of SPARQL query results over a single OntoUML model."""
+
+    def __init__(self, ontouml_model: Graph):
+        """Initialize an empty QueryCache object for the received OntoUML model.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be queried.
+        :type ontouml_model: Graph
+        """
+        self.ontouml_model = ontouml_model
+        self.results: dict[str, list[ResultRow]] = {}
+        self.hits = 0
+        self.misses = 0
+        # Each query has its own lock, so that different queries are executed concurrently but the same one only once
+        self._lock = threading.Lock()
+        self._query_locks: dict[str, threading.Lock] = {}
+
+    def query(self, sparql_query: str) -> list[ResultRow]:
+        """Return the result rows of a SPARQL query, executing it on the model only if it was not executed before.
+
+        :param sparql_query: The SPARQL query to be executed.
+        :type sparql_query: str
+        :return: List of the rows returned by the query.
+        :rtype: list[ResultRow]
+        """
+        with self._lock:
+            query_lock = self._query_locks.setdefault(sparql_query, threading.Lock())
+
+        with query_lock:
+            query_rows = self.results.get(sparql_query)
+            is_hit = query_rows is not None
+
+            if not is_hit:
+                query_rows = list(self.ontouml_model.query(get_prepared_query(sparql_query)))
+                self.results[sparql_query] = query_rows
+
+        with self._lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return query_rows
+
+    def log_statistics(self) -> None:
+        """Log (as debug) the number of hits and misses of the cache."""
+        logger.debug("SPARQL query cache: {} hit(s) and {} miss(es).", self.hits, self.misses)
+
+
+def execute_query(
+    ontouml_model: Graph, sparql_query: str, query_cache: QueryCache | None = None
+) -> Iterable[ResultRow]:
+    """Execute a SPARQL query on the OntoUML model, using the query cache if one is provided.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be queried.
+    :type ontouml_model: Graph
+    :param sparql_query: The SPARQL query to be executed.
+    :type sparql_query: str
+    :param query_cache: Optional cache of query results of the current validation.
+    :type query_cache: QueryCache | None
+    :return: The rows returned by the query, counted as scanned by the rule being executed if it is being measured. The
+             results of ASK queries are returned as they are.
+    :rtype: Iterable[ResultRow]
+    """
+    if query_cache is None:
+        query_result = ontouml_model.query(get_prepared_query(sparql_query))
+        if query_result.type != "SELECT":
+            return query_result
+        return count_scanned_rows(query_result)
+
+    return count_scanned_rows(query_cache.query(sparql_query))
@@ -0,0 +1,347 @@
+"""Profiler of the evaluation of the SPARQL queries used by the validation rules.
+
+RDFLib evaluates a query by evaluating each operator of its algebra (BGP, Filter, LeftJoin, Group, AggregateJoin...)
+lazily, as the rows of its parent operator are requested. While a QueryProfiler is active, the evaluation of every
+operator of the known queries is measured through RDFLib's CUSTOM_EVALS extension point, recording:
+    - How many times the operator was evaluated (e.g., the right side of an OPTIONAL is evaluated once per left row and
+      the pattern of a FILTER NOT EXISTS once per filtered row).
+    - The number of rows it produced (its intermediate cardinality).
+    - The time spent producing them, including the time of its child operators.
+
+The triple patterns of each BGP are measured individually: how many times each pattern was probed (with the bindings
+of the previous patterns) and how many triples matched it.
+
+Known queries are the ones prepared by get_prepared_query, which include all queries of the rules (defined in the
+modules listed in SPARQL_QUERY_MODULES). The profiler can be used around a whole validation or to profile queries
+individually. As it changes the evaluation functions of RDFLib for the whole process, it is meant to be used by a
+single thread at a time.
+
+Usage:
+    ```
+    with QueryProfiler() as query_profiler:
+        validate_ontouml_model(ontouml_model, "owa", include=["R_CL_EDA"])
+    print(format_profiles_report(query_profiler.get_profiles()))
+    ```
+"""
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+
+from rdflib import RDF, Graph, URIRef, Variable
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql import evaluate as sparql_evaluate
+from rdflib.plugins.sparql.parserutils import CompValue
+
+from .prepared_queries import PREPARED_QUERIES, get_all_named_queries, get_prepared_query
+from ..vocab_lib.ontouml import ONTOUML_NAMESPACE
+
+CUSTOM_EVAL_NAME = "ontouml_query_profiler"
+
+# Attributes of the algebra operators that contain their child operators
+CHILDREN_ATTRIBUTES = ("p", "p1", "p2")
+
+# Names of the algebra expressions whose graph patterns are evaluated for each row (FILTER EXISTS and NOT EXISTS)
+EXISTS_EXPRESSIONS = {"Builtin_EXISTS": "EXISTS", "Builtin_NOTEXISTS": "NOT EXISTS"}
+
+# State of the evaluation in each thread: the operator whose evaluation must not be profiled again (as its profiling
+# evaluates it through RDFLib's evalPart) and the stack of the triple patterns being matched
+_evaluation_state = threading.local()
+
+
+def format_term(term) -> str:
+    """Return a compact representation of a term of a triple pattern, with the ontouml prefix."""
+    if isinstance(term, Variable):
+        return f"?{term}"
+    if term == RDF.type:
+        return "a"
+    if isinstance(term, URIRef):
+        if str(term).startswith(ONTOUML_NAMESPACE):
+            return f"ontouml:{str(term)[len(ONTOUML_NAMESPACE):]}"
+        return f"<{term}>"
+    return term.n3()
+
+
+class OperatorProfile:
+    """A class to represent the measurements of an operator (or of a triple pattern) of a profiled query."""
+
+    def __init__(self, name: str, depth: int):
+        """Initialize an OperatorProfile object with no measurements.
+
+        :param name: The description of the operator (e.g., 'LeftJoin' or a triple pattern).
+        :type name: str
+        :param depth: The depth of the operator in the query's plan.
+        :type depth: int
+        """
+        self.name = name
+        self.depth = depth
+        self.calls = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> dict:
+        """Return the measurements of the operator as a dictionary."""
+        return {
+            "operator": self.name,
+            "depth": self.depth,
+            "calls": self.calls,
+            "rows": self.rows,
+            "seconds": self.seconds,
+        }
+
+
+class QueryProfile:
+    """A class to represent the plan of a profiled query and the measurements of each of its operators.
+
+    The plan is the query's algebra, in which each operator is followed by its children. The triple patterns of a BGP
+    are its children and the graph patterns of FILTER EXISTS and NOT EXISTS expressions are children of their Filter.
+    For triple patterns, calls are the number of times the pattern was probed and rows the number of matched triples.
+    Triple patterns are listed in the order of the query; RDFLib probes first the patterns with more bound terms.
+    The single row of an ASK query is counted only when its answer is true.
+    """
+
+    def __init__(self, query_name: str, sparql_query: str, algebra: CompValue):
+        """Initialize a QueryProfile object, building the plan of the query with no measurements.
+
+        :param query_name: The name of the query (e.g., 'QUERY_R_CL_EDA').
+        :type query_name: str
+        :param sparql_query: The SPARQL query string.
+        :type sparql_query: str
+        :param algebra: The algebra of the prepared query.
+        :type algebra: CompValue
+        """
+        self.query_name = query_name
+        self.sparql_query = sparql_query
+        self.plan: list[OperatorProfile] = []
+        # Profiles of the operators and triple patterns, indexed by the ids of their algebra objects
+        self.operators: dict[int, OperatorProfile] = {}
+        self.patterns: dict[int, OperatorProfile] = {}
+        self._add_operator(algebra, 0)
+        self.root = self.plan[0]
+
+    def _add_operator(self, operator: CompValue, depth: int, prefix: str = "") -> None:
+        """Add an operator and its children (in depth-first order) to the plan."""
+        name = operator.name
+        if name == "Filter":
+            exists_names = [EXISTS_EXPRESSIONS[expression.name] for expression in _find_exists(operator.expr)]
+            if exists_names:
+                name += f" ({', '.join(exists_names)})"
+        elif name == "AggregateJoin" and operator.p.expr is not None:
+            name += f" (GROUP BY {' '.join(format_term(term) for term in operator.p.expr)})"
+
+        operator_profile = OperatorProfile(prefix + name, depth)
+        self.plan.append(operator_profile)
+        self.operators[id(operator)] = operator_profile
+
+        if operator.name == "BGP":
+            for triple in operator.triples:
+                pattern_profile = OperatorProfile(" ".join(format_term(term) for term in triple), depth + 1)
+                self.plan.append(pattern_profile)
+                self.patterns[id(triple)] = pattern_profile
+
+        for attribute in CHILDREN_ATTRIBUTES:
+            child = operator.get(attribute)
+            if isinstance(child, CompValue):
+                self._add_operator(child, depth + 1)
+
+        if operator.name == "Filter":
+            for expression in _find_exists(operator.expr):
+                self._add_operator(expression.graph, depth + 1, f"[{EXISTS_EXPRESSIONS[expression.name]}] ")
+
+    def to_dict(self) -> dict:
+        """Return the plan of the query and its measurements as a dictionary."""
+        return {
+            "query_name": self.query_name,
+            "rows": self.root.rows,
+            "seconds": self.root.seconds,
+            "plan": [operator_profile.to_dict() for operator_profile in self.plan],
+        }
+
+    def format_plan(self) -> str:
+        """Return the plan of the query as text, with a line per operator and the measurements of each one."""
+        lines = [f"{self.query_name}: {self.root.rows} rows in {self.root.seconds * 1000:.2f} ms"]
+        name_width = max(2 * operator_profile.depth + len(operator_profile.name) for operator_profile in self.plan)
+        for operator_profile in self.plan:
+            indented_name = "  " * operator_profile.depth + operator_profile.name
+            lines.append(
+                f"  {indented_name.ljust(name_width)}  calls={operator_profile.calls:<8} "
+                f"rows={operator_profile.rows:<9} time={operator_profile.seconds * 1000:.2f} ms"
+            )
+        return "\n".join(lines)
+
+
+def _find_exists(expression) -> list[CompValue]:
+    """Return the EXISTS and NOT EXISTS expressions contained in an expression of the algebra (not nested in them)."""
+    if isinstance(expression, CompValue):
+        if expression.name in EXISTS_EXPRESSIONS:
+            return [expression]
+        return [found for value in expression.values() for found in _find_exists(value)]
+    if isinstance(expression, list):
+        return [found for value in expression for found in _find_exists(value)]
+    return []
+
+
+def _profile_rows(rows: Iterable, operator_profile: OperatorProfile) -> Iterator:
+    """Yield the rows produced by an operator, counting them and the time spent producing them."""
+    start_time = time.perf_counter()
+    iterator = iter(rows)
+    operator_profile.seconds += time.perf_counter() - start_time
+    while True:
+        start_time = time.perf_counter()
+        try:
+            row = next(iterator)
+        except StopIteration:
+            operator_profile.seconds += time.perf_counter() - start_time
+            return
+        operator_profile.seconds += time.perf_counter() - start_time
+        operator_profile.rows += 1
+        yield row
+
+
+class QueryProfiler:
+    """A class to represent a profiler of the evaluation of the known SPARQL queries, active within its context."""
+
+    def __init__(self):
+        """Initialize a QueryProfiler object with no profiled queries."""
+        self.profiles: dict[str, QueryProfile] = {}
+        # Profiles of the operators and triple patterns of the profiled queries, indexed by their algebra objects' ids
+        self._operators: dict[int, OperatorProfile] = {}
+        self._patterns: dict[int, OperatorProfile] = {}
+        self._original_eval_bgp = None
+
+    def _get_query_profile(self, algebra: CompValue) -> QueryProfile | None:
+        """Return the profile of the known query with the received algebra, created on its first evaluation."""
+        query_names = {sparql_query: query_name for query_name, sparql_query in get_all_named_queries().items()}
+        for sparql_query, prepared_query in PREPARED_QUERIES.items():
+            if prepared_query.algebra is algebra:
+                query_profile = QueryProfile(query_names.get(sparql_query, "query"), sparql_query, algebra)
+                self.profiles[sparql_query] = query_profile
+                self._operators.update(query_profile.operators)
+                self._patterns.update(query_profile.patterns)
+                return query_profile
+        return None
+
+    def _evaluate_operator(self, ctx, operator: CompValue):
+        """Evaluate and measure an operator of a known query. Other operators are left to RDFLib.
+
+        :raises NotImplementedError: If the operator is not measured, so that RDFLib evaluates it.
+        """
+        if getattr(_evaluation_state, "bypassed_operator", None) is operator:
+            _evaluation_state.bypassed_operator = None
+            raise NotImplementedError
+
+        operator_profile = self._operators.get(id(operator))
+        if operator_profile is None:
+            if not operator.name.endswith("Query") or self._get_query_profile(operator) is None:
+                raise NotImplementedError
+            operator_profile = self._operators[id(operator)]
+
+        operator_profile.calls += 1
+        start_time = time.perf_counter()
+        _evaluation_state.bypassed_operator = operator
+        try:
+            result = sparql_evaluate.evalPart(ctx, operator)
+        finally:
+            _evaluation_state.bypassed_operator = None
+            operator_profile.seconds += time.perf_counter() - start_time
+
+        # Queries return their results in a dictionary
+        if isinstance(result, Mapping):
+            if "bindings" in result:
+                result = dict(result)
+                result["bindings"] = _profile_rows(result["bindings"], operator_profile)
+            else:
+                operator_profile.rows += int(bool(result.get("askAnswer")))
+            return result
+        return _profile_rows(result, operator_profile)
+
+    def _evaluate_bgp(self, ctx, bgp: list):
+        """Evaluate the triple patterns of a BGP, starting from the first one, measuring each pattern."""
+        patterns_stack = _evaluation_state.__dict__.setdefault("patterns_stack", [])
+
+        # Each evaluation of the remaining patterns is caused by a triple matched by the pattern being evaluated
+        if patterns_stack:
+            patterns_stack[-1].rows += 1
+
+        pattern_profile = self._patterns.get(id(bgp[0])) if bgp else None
+        if pattern_profile is None:
+            return self._original_eval_bgp(ctx, bgp)
+        pattern_profile.calls += 1
+        return self._profile_pattern_rows(self._original_eval_bgp(ctx, bgp), pattern_profile, patterns_stack)
+
+    @staticmethod
+    def _profile_pattern_rows(rows: Iterator, pattern_profile: OperatorProfile, patterns_stack: list) -> Iterator:
+        """Yield the rows produced from a triple pattern, keeping it on the stack while they are produced."""
+        while True:
+            patterns_stack.append(pattern_profile)
+            start_time = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                pattern_profile.seconds += time.perf_counter() - start_time
+                patterns_stack.pop()
+            yield row
+
+    def __enter__(self) -> "QueryProfiler":
+        """Start profiling the evaluation of the known queries."""
+        self._original_eval_bgp = sparql_evaluate.evalBGP
+        sparql_evaluate.evalBGP = self._evaluate_bgp
+        CUSTOM_EVALS[CUSTOM_EVAL_NAME] = self._evaluate_operator
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop profiling, restoring the evaluation functions of RDFLib."""
+        CUSTOM_EVALS.pop(CUSTOM_EVAL_NAME, None)
+        sparql_evaluate.evalBGP = self._original_eval_bgp
+
+    def get_profiles(self) -> list[QueryProfile]:
+        """Return the profiles of the evaluated queries, from the slowest to the fastest one."""
+        return sorted(self.profiles.values(), key=lambda query_profile: query_profile.root.seconds, reverse=True)
+
+
+def profile_query(ontouml_model: Graph, sparql_query: str) -> QueryProfile:
+    """Evaluate a SPARQL query on an OntoUML model, consuming all its results, and return its profile.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be queried.
+    :type ontouml_model: Graph
+    :param sparql_query: The SPARQL query string.
+    :type sparql_query: str
+    :return: The profile of the query.
+    :rtype: QueryProfile
+    """
+    prepared_query = get_prepared_query(sparql_query)
+    with QueryProfiler() as query_profiler:
+        query_result = ontouml_model.query(prepared_query)
+        if query_result.type == "SELECT":
+            for _ in query_result:
+                pass
+    return query_profiler.profiles[sparql_query]
+
+
+def profile_all_queries(ontouml_model: Graph, query_names: list[str] | None = None) -> list[QueryProfile]:
+    """Profile each SPARQL query of the rules on an OntoUML model.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be queried.
+    :type ontouml_model: Graph
+    :param query_names: Names of the queries to be profiled (e.g., 'QUERY_R_CL_EDA'). If not provided, all queries
+                        defined in the modules listed in SPARQL_QUERY_MODULES are profiled.
+    :type query_names: list[str] | None
+    :return: The profiles of the queries, from the slowest to the fastest one.
+    :rtype: list[QueryProfile]
+    """
+    named_queries = get_all_named_queries()
+    query_names = list(named_queries) if query_names is None else query_names
+    query_profiles = [profile_query(ontouml_model, named_queries[query_name]) for query_name in query_names]
+    return sorted(query_profiles, key=lambda query_profile: query_profile.root.seconds, reverse=True)
+
+
+def format_profiles_report(query_profiles: list[QueryProfile]) -> str:
+    """Return a report with the plan of each profiled query, to be attached to reports of slow models.
+
+    :param query_profiles: The profiles of the queries.
+    :type query_profiles: list[QueryProfile]
+    :return: The report, with the plans separated by blank lines.
+    :rtype: str
+    """
+    return "\n\n".join(query_profile.format_plan() for query_profile in query_profiles) + "\n"
@@ -0,0 +1,27 @@
+"""Switch that removes logging, and the formatting of log messages, from the hot path of validations.
+
+Batch runners validating many models usually do not need the messages logged for each rule and each model. When the
+quiet mode is on, the loggers of the validator are disabled and the per-rule and per-model messages are not even
+created. Errors are still raised as exceptions.
+"""
+from loguru import logger
+
+_quiet_mode = {"is_on": False}
+
+
+def set_quiet_mode(is_on: bool = True) -> None:
+    """Turn the quiet mode on or off for all validations of the current process.
+
+    :param is_on: Whether the quiet mode is turned on (default) or off.
+    :type is_on: bool
+    """
+    _quiet_mode["is_on"] = is_on
+    if is_on:
+        logger.disable("validator")
+    else:
+        logger.enable("validator")
+
+
+def is_quiet_mode() -> bool:
+    """Return whether the quiet mode is on."""
+    return _quiet_mode["is_on"]
@@ -0,0 +1,227 @@
+"""Persistent content-addressed cache of validation results.
+
+Models that did not change between validations do not need to be validated again. The ResultCache stores, in a local
+SQLite database, the warnings and errors found by each rule in each model, identified by:
+    - The content key of the model's file: the hash of its bytes and of its extension (which defines its format).
+    - The code of the rule, the backend used and the version of the rule's implementation in that backend.
+
+Results are stored per rule, before severities are filtered and the world-assumption is applied, so they are reused by
+validations selecting other rules, severities or world-assumptions. When the results of all selected rules are found,
+the model's file does not need to be parsed.
+
+The total size of the stored results is bounded: when it exceeds the maximum size, the least recently used results are
+removed. A database can be shared by concurrent processes, each one using its own ResultCache object.
+
+Usage:
+    ```
+    result_cache = ResultCache("/path/to/results.sqlite3", max_size_mb=256)
+    content_key = get_file_content_key(ontouml_file_path)
+    cached_results = result_cache.get_rules_results(content_key, rules_codes, backend)
+    ```
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from loguru import logger
+
+from ..validations.result_issue import ResultIssue
+from ..validations.rules_registry import RULES_REGISTRY
+
+DEFAULT_RESULT_CACHE_SIZE_MB = 256
+
+# Maximum time (in seconds) a process waits for the database to be unlocked by another process
+DATABASE_TIMEOUT = 30.0
+
+SQL_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rule_results (
+    content_key TEXT NOT NULL,
+    rule_code TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    rule_version INTEGER NOT NULL,
+    issues TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_key, rule_code, backend, rule_version)
+)
+"""
+
+
+def get_file_content_key(file_path: str) -> str:
+    """Return the content key of a file: the hash of its bytes and of its extension.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :return: The hexadecimal content key of the file.
+    :rtype: str
+    :raises OSError: If the file cannot be read.
+    """
+    content_hash = hashlib.sha256(os.path.splitext(file_path)[1].lower().encode("utf-8") + b"|")
+    with open(file_path, "rb") as read_file:
+        for block in iter(lambda: read_file.read(2**20), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def _encode_issues(rule_w_list: list[ResultIssue], rule_e_list: list[ResultIssue]) -> str:
+    """Return the JSON representation of the warnings and errors found by a rule.
+
+    :param rule_w_list: The warnings found by the rule.
+    :type rule_w_list: list[ResultIssue]
+    :param rule_e_list: The errors found by the rule.
+    :type rule_e_list: list[ResultIssue]
+    :return: JSON object with lists of [issue_description, related_id] pairs for warnings and errors.
+    :rtype: str
+    """
+    return json.dumps(
+        {
+            "warnings": [[issue.issue_description, str(issue.related_id)] for issue in rule_w_list],
+            "errors": [[issue.issue_description, str(issue.related_id)] for issue in rule_e_list],
+        }
+    )
+
+
+def _decode_issues(rule_code: str, issues: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Return the warnings and errors of a rule represented in JSON by _encode_issues.
+
+    :param rule_code: The code of the rule.
+    :type rule_code: str
+    :param issues: The JSON representation of the issues.
+    :type issues: str
+    :return: A tuple with the lists of warnings and errors found by the rule.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    decoded_issues = json.loads(issues)
+    rule_w_list = [
+        ResultIssue(rule_code, description, related_id) for description, related_id in decoded_issues["warnings"]
+    ]
+    rule_e_list = [
+        ResultIssue(rule_code, description, related_id) for description, related_id in decoded_issues["errors"]
+    ]
+    return rule_w_list, rule_e_list
+
+
+class ResultCache:
+    """A class to represent a size-bounded SQLite database of the results of validation rules."""
+
+    def __init__(self, database_path: str, max_size_mb: float = DEFAULT_RESULT_CACHE_SIZE_MB):
+        """Initialize a ResultCache object, creating its database if it does not exist.
+
+        :param database_path: Path of the SQLite database file.
+        :type database_path: str
+        :param max_size_mb: Maximum total size (in megabytes) of the stored results.
+        :type max_size_mb: float
+        """
+        self.database_path = database_path
+        self.max_size_bytes = int(max_size_mb * 2**20)
+        self.hits = 0
+        self.misses = 0
+
+        database_dir = os.path.dirname(os.path.abspath(database_path))
+        os.makedirs(database_dir, exist_ok=True)
+
+        self._connection = sqlite3.connect(database_path, timeout=DATABASE_TIMEOUT)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(SQL_CREATE_TABLE)
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def get_rules_results(
+        self, content_key: str, rules_codes: list[str], backend: str
+    ) -> dict[str, tuple[list[ResultIssue], list[ResultIssue]]]:
+        """Return the stored results of the received rules for a model, updating their last use.
+
+        :param content_key: The content key of the model's file.
+        :type content_key: str
+        :param rules_codes: Codes of the rules whose results are requested.
+        :type rules_codes: list[str]
+        :param backend: The backend used for executing the rules.
+        :type backend: str
+        :return: Dictionary mapping the codes of the rules with stored results to their warnings and errors. Rules
+                 without stored results for the current version of their implementations are not included.
+        :rtype: dict[str, tuple[list[ResultIssue], list[ResultIssue]]]
+        """
+        rules_results = {}
+
+        with self._connection:
+            for rule_code in rules_codes:
+                rule_key = (content_key, rule_code, backend, RULES_REGISTRY[rule_code].get_version(backend))
+                row = self._connection.execute(
+                    "SELECT issues FROM rule_results "
+                    "WHERE content_key = ? AND rule_code = ? AND backend = ? AND rule_version = ?",
+                    rule_key,
+                ).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    continue
+
+                self.hits += 1
+                rules_results[rule_code] = _decode_issues(rule_code, row[0])
+                self._connection.execute(
+                    "UPDATE rule_results SET last_used = ? "
+                    "WHERE content_key = ? AND rule_code = ? AND backend = ? AND rule_version = ?",
+                    (time.time(),) + rule_key,
+                )
+
+        return rules_results
+
+    def store_rules_results(
+        self, content_key: str, rules_results: dict[str, tuple[list[ResultIssue], list[ResultIssue]]], backend: str
+    ) -> None:
+        """Store the results of rules for a model and evict the least recently used results if needed.
+
+        :param content_key: The content key of the model's file.
+        :type content_key: str
+        :param rules_results: Dictionary mapping the codes of the executed rules to their warnings and errors.
+        :type rules_results: dict[str, tuple[list[ResultIssue], list[ResultIssue]]]
+        :param backend: The backend used for executing the rules.
+        :type backend: str
+        """
+        now = time.time()
+
+        try:
+            with self._connection:
+                for rule_code, (rule_w_list, rule_e_list) in rules_results.items():
+                    issues = _encode_issues(rule_w_list, rule_e_list)
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO rule_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            content_key,
+                            rule_code,
+                            backend,
+                            RULES_REGISTRY[rule_code].get_version(backend),
+                            issues,
+                            len(issues),
+                            now,
+                        ),
+                    )
+        except sqlite3.Error as error:
+            logger.warning(f"Results of {content_key} could not be stored: {error}")
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used results until their total size is below the maximum size of the cache."""
+        with self._connection:
+            total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM rule_results").fetchone()[0]
+            if total_size <= self.max_size_bytes:
+                return
+
+            rows = self._connection.execute("SELECT rowid, size FROM rule_results ORDER BY last_used").fetchall()
+            evicted_rowids = []
+            for rowid, size in rows:
+                if total_size <= self.max_size_bytes:
+                    break
+                evicted_rowids.append((rowid,))
+                total_size -= size
+
+            self._connection.executemany("DELETE FROM rule_results WHERE rowid = ?", evicted_rowids)
+
+        logger.debug(f"{len(evicted_rowids)} results evicted from the result cache {self.database_path}.")
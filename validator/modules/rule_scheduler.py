@@ -0,0 +1,82 @@
+"""Cost estimation and scheduling of validation rules for parallel execution.
+
+Rules only read the OntoUML model and do not depend on each other, so they can be executed concurrently. The makespan
+of a parallel validation is dominated by its most expensive rules, which must therefore be started first. This module
+estimates the relative cost of each rule, combining the cost factors declared in the registry of rules with statistics
+of the model being validated (numbers of classes and generalizations), and orders the rules from the most to the least
+expensive one (longest-processing-time-first).
+
+The cost factors declared by the rules of the group CL are rough estimates for the 'sparql' backend, based on the
+shape of their queries: those with GROUP BY clauses or OPTIONAL patterns over all classes (e.g., R_CL_GJU and R_CL_EMV)
+are expected to dominate.
+
+Cost estimates only affect the order in which rules are started, never their results.
+"""
+from rdflib import Graph, RDF
+
+from ..validations.rules_registry import RULES_REGISTRY
+from ..vocab_lib.model_index import ModelIndex
+from ..vocab_lib.ontouml import ONTOUML
+
+# Factors used for rules without declared costs, as (class_factor, generalization_factor)
+DEFAULT_COST_FACTORS = (1.0, 1.0)
+
+
+class ModelStatistics:
+    """A class to represent the size statistics of an OntoUML model used for estimating the cost of its rules."""
+
+    def __init__(self, ontouml_model: Graph | None, model_index: ModelIndex | None = None):
+        """Initialize a ModelStatistics object, counting the classes and generalizations of an OntoUML model.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary), or None if only its
+                              index is available.
+        :type ontouml_model: Graph | None
+        :param model_index: Optional precomputed index of the OntoUML model. If it indexes generalizations or there is
+                            no graph, it is used instead of the graph.
+        :type model_index: ModelIndex | None
+        """
+        if model_index is not None and (ontouml_model is None or model_index.is_indexed(ONTOUML.general)):
+            self.num_classes = len(model_index.classes)
+            self.num_generalizations = len(model_index.generalization_generals)
+        else:
+            self.num_classes = sum(1 for _ in ontouml_model.triples((None, RDF.type, ONTOUML.Class)))
+            self.num_generalizations = sum(1 for _ in ontouml_model.triples((None, ONTOUML.general, None)))
+
+
+def estimate_rule_cost(rule_code: str, model_statistics: ModelStatistics) -> float:
+    """Estimate the relative cost of executing a rule on a model with the received statistics.
+
+    :param rule_code: Code of the rule whose cost is estimated.
+    :type rule_code: str
+    :param model_statistics: Size statistics of the model to be validated.
+    :type model_statistics: ModelStatistics
+    :return: The estimated relative cost of the rule.
+    :rtype: float
+    """
+    registered_rule = RULES_REGISTRY.get(rule_code)
+    class_factor, generalization_factor = registered_rule.cost if registered_rule else DEFAULT_COST_FACTORS
+    return class_factor * model_statistics.num_classes + generalization_factor * model_statistics.num_generalizations
+
+
+def schedule_rules(
+    rules_codes: list[str], model_statistics: ModelStatistics, most_expensive_first: bool = True
+) -> list[str]:
+    """Return the received rules ordered from the most to the least expensive one (or the reverse).
+
+    Rules with the same estimated cost keep their relative order, so the schedule is deterministic.
+
+    :param rules_codes: Codes of the rules to be scheduled.
+    :type rules_codes: list[str]
+    :param model_statistics: Size statistics of the model to be validated.
+    :type model_statistics: ModelStatistics
+    :param most_expensive_first: If True (default), as used by parallel validations, the most expensive rules are
+                                 started first. If False, as used by fail-fast validations, the cheapest ones are.
+    :type most_expensive_first: bool
+    :return: The codes of the rules in the order in which they must be started.
+    :rtype: list[str]
+    """
+    return sorted(
+        rules_codes,
+        key=lambda rule_code: estimate_rule_cost(rule_code, model_statistics),
+        reverse=most_expensive_first,
+    )
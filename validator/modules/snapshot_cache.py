@@ -0,0 +1,288 @@
+"""Persistent cache of binary snapshots of parsed OntoUML models.
+
+Parsing large Turtle files dominates the validation time of unchanged models. The SnapshotCache stores, for each parsed
+file, a snapshot of its triples in a compact binary format, identified by the hash of the file's contents and of the
+parser settings. When the same contents are loaded again, the triples are read from the snapshot instead of being
+parsed.
+
+Snapshot files are composed of:
+    - A header with the snapshot format version, the number of terms and triples and the offset of the triples.
+    - A table of terms (URIs, blank nodes and literals), each one encoded once.
+    - An array of unsigned 32-bit integers with three term ids per triple.
+
+Snapshots are read through memory mapping, so the triples array is not copied before the graph is rebuilt. The cache
+directory is bounded: when its total size exceeds the maximum size, the least recently used snapshots are removed.
+
+Usage:
+    ```
+    snapshot_cache = SnapshotCache("/path/to/cache_dir", max_size_mb=512)
+    ontouml_model = load_graph_safely(ontouml_file_path, snapshot_cache=snapshot_cache)
+    ```
+"""
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+import rdflib
+from loguru import logger
+from rdflib import BNode, Graph, Literal, URIRef
+
+# Version of the snapshot format. Snapshots of other versions are never read
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_MAGIC = b"OUMLSNAP"
+SNAPSHOT_EXTENSION = ".snap"
+DEFAULT_SNAPSHOT_CACHE_SIZE_MB = 1024
+
+# Header: magic, format version, number of terms, number of triples, offset of the triples array
+HEADER_STRUCT = struct.Struct("<8sIIIQ")
+# Term record: kind, length of the value, length of the literal's language or datatype
+TERM_STRUCT = struct.Struct("<BII")
+
+TERM_URIREF = 0
+TERM_BNODE = 1
+TERM_LITERAL = 2
+TERM_LITERAL_LANG = 3
+TERM_LITERAL_DATATYPE = 4
+
+# Number of triples added to the graph at once when a snapshot is loaded
+LOAD_CHUNK_SIZE = 65536
+
+
+def _encode_term(term: rdflib.term.Node) -> bytes:
+    """Return the binary record of an RDF term.
+
+    :param term: The term to be encoded.
+    :type term: rdflib.term.Node
+    :return: The record of the term, composed of a TERM_STRUCT followed by its value and its language or datatype.
+    :rtype: bytes
+    """
+    extra = b""
+    if isinstance(term, Literal):
+        if term.language is not None:
+            kind, extra = TERM_LITERAL_LANG, term.language.encode("utf-8")
+        elif term.datatype is not None:
+            kind, extra = TERM_LITERAL_DATATYPE, str(term.datatype).encode("utf-8")
+        else:
+            kind = TERM_LITERAL
+    elif isinstance(term, BNode):
+        kind = TERM_BNODE
+    else:
+        kind = TERM_URIREF
+
+    value = str(term).encode("utf-8")
+    return TERM_STRUCT.pack(kind, len(value), len(extra)) + value + extra
+
+
+def _decode_terms(buffer: mmap.mmap, num_terms: int) -> list[rdflib.term.Node]:
+    """Decode the table of terms of a snapshot, which starts right after its header.
+
+    :param buffer: The memory-mapped snapshot.
+    :type buffer: mmap.mmap
+    :param num_terms: The number of terms in the table.
+    :type num_terms: int
+    :return: List of the terms, indexed by their ids.
+    :rtype: list[rdflib.term.Node]
+    """
+    terms = []
+    position = HEADER_STRUCT.size
+
+    for _ in range(num_terms):
+        kind, value_length, extra_length = TERM_STRUCT.unpack_from(buffer, position)
+        position += TERM_STRUCT.size
+        value_end = position + value_length
+        extra_end = value_end + extra_length
+        value = buffer[position:value_end].decode("utf-8")
+        extra = buffer[value_end:extra_end].decode("utf-8")
+        position = extra_end
+
+        if kind == TERM_URIREF:
+            terms.append(URIRef(value))
+        elif kind == TERM_BNODE:
+            terms.append(BNode(value))
+        elif kind == TERM_LITERAL_LANG:
+            terms.append(Literal(value, lang=extra))
+        elif kind == TERM_LITERAL_DATATYPE:
+            terms.append(Literal(value, datatype=URIRef(extra)))
+        else:
+            terms.append(Literal(value))
+
+    return terms
+
+
+class SnapshotCache:
+    """A class to represent a size-bounded directory of binary snapshots of parsed OntoUML models."""
+
+    def __init__(self, cache_dir: str, max_size_mb: float = DEFAULT_SNAPSHOT_CACHE_SIZE_MB):
+        """Initialize a SnapshotCache object, creating its directory if it does not exist.
+
+        :param cache_dir: Path of the directory in which snapshots are stored.
+        :type cache_dir: str
+        :param max_size_mb: Maximum total size (in megabytes) of the stored snapshots.
+        :type max_size_mb: float
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 2**20)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_key(self, file_contents: bytes, parser_settings: str) -> str:
+        """Return the key of the snapshot of a file, which depends on its contents and on the parser settings.
+
+        :param file_contents: The contents of the parsed file.
+        :type file_contents: bytes
+        :param parser_settings: The format used for parsing the file and any other setting that changes the parsed
+                                triples (e.g., a projection).
+        :type parser_settings: str
+        :return: The hexadecimal key of the snapshot.
+        :rtype: str
+        """
+        settings = f"{SNAPSHOT_FORMAT_VERSION}|{rdflib.__version__}|{parser_settings}|".encode("utf-8")
+        return hashlib.sha256(settings + file_contents).hexdigest()
+
+    def _get_snapshot_path(self, key: str) -> str:
+        """Return the path of the snapshot file with the received key.
+
+        :param key: The key of the snapshot.
+        :type key: str
+        :return: The path of the snapshot file.
+        :rtype: str
+        """
+        return os.path.join(self.cache_dir, key + SNAPSHOT_EXTENSION)
+
+    def load(self, key: str) -> Graph | None:
+        """Return the graph stored in the snapshot with the received key, or None if there is no valid snapshot.
+
+        :param key: The key of the snapshot.
+        :type key: str
+        :return: The graph rebuilt from the snapshot or None.
+        :rtype: Graph | None
+        """
+        snapshot_path = self._get_snapshot_path(key)
+
+        try:
+            with open(snapshot_path, "rb") as snapshot_file, mmap.mmap(
+                snapshot_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                magic, version, num_terms, num_triples, triples_offset = HEADER_STRUCT.unpack_from(buffer, 0)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                    raise ValueError("unsupported snapshot format")
+
+                terms = _decode_terms(buffer, num_terms)
+                triples_end = triples_offset + 12 * num_triples
+                triples_ids = memoryview(buffer)[triples_offset:triples_end].cast("I")
+
+                # Terms read from snapshots are valid, so triples are added directly to the store, without checks
+                ontouml_model = Graph()
+                try:
+                    for chunk_start in range(0, 3 * num_triples, 3 * LOAD_CHUNK_SIZE):
+                        chunk_end = chunk_start + 3 * LOAD_CHUNK_SIZE
+                        chunk = triples_ids[chunk_start:chunk_end].tolist()
+                        ontouml_model.store.addN(
+                            (terms[chunk[i]], terms[chunk[i + 1]], terms[chunk[i + 2]], ontouml_model)
+                            for i in range(0, len(chunk), 3)
+                        )
+                finally:
+                    triples_ids.release()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, IndexError, struct.error) as error:
+            logger.warning(f"Discarding invalid snapshot {snapshot_path}: {error}")
+            self._remove(snapshot_path)
+            self.misses += 1
+            return None
+
+        # The modification time of a snapshot is its last use, which defines the eviction order
+        os.utime(snapshot_path)
+        self.hits += 1
+        logger.debug(f"Snapshot {snapshot_path} loaded ({num_triples} triples).")
+        return ontouml_model
+
+    def store(self, key: str, ontouml_model: Graph) -> None:
+        """Store the snapshot of a graph with the received key and evict the least recently used snapshots if needed.
+
+        The snapshot is written to a temporary file that replaces the final one, so that concurrent readers never see
+        incomplete snapshots.
+
+        :param key: The key of the snapshot.
+        :type key: str
+        :param ontouml_model: The graph to be stored.
+        :type ontouml_model: Graph
+        """
+        term_ids: dict[rdflib.term.Node, int] = {}
+        term_records = []
+        triples_ids = array("I")
+
+        for triple in ontouml_model:
+            for term in triple:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = len(term_records)
+                    term_ids[term] = term_id
+                    term_records.append(_encode_term(term))
+                triples_ids.append(term_id)
+
+        if triples_ids.itemsize != 4:
+            logger.warning("Snapshots are not supported on this platform.")
+            return
+
+        terms_blob = b"".join(term_records)
+        # The triples array is aligned to 8 bytes, so that it can be cast from the memory-mapped snapshot
+        triples_offset = HEADER_STRUCT.size + len(terms_blob)
+        padding = -triples_offset % 8
+        triples_offset += padding
+        header = HEADER_STRUCT.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(term_records), len(triples_ids) // 3, triples_offset
+        )
+
+        try:
+            temporary_file, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(temporary_file, "wb") as snapshot_file:
+                snapshot_file.write(header)
+                snapshot_file.write(terms_blob)
+                snapshot_file.write(b"\0" * padding)
+                triples_ids.tofile(snapshot_file)
+            os.replace(temporary_path, self._get_snapshot_path(key))
+        except OSError as error:
+            logger.warning(f"Snapshot of key {key} could not be stored: {error}")
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used snapshots until the total size of the cache is below its maximum size."""
+        snapshots = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(SNAPSHOT_EXTENSION):
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    snapshots.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in snapshots)
+        for _, size, snapshot_path in sorted(snapshots):
+            if total_size <= self.max_size_bytes:
+                break
+            self._remove(snapshot_path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(snapshot_path: str) -> None:
+        """Remove a snapshot file, ignoring snapshots already removed (e.g., by another process).
+
+        :param snapshot_path: The path of the snapshot file.
+        :type snapshot_path: str
+        """
+        try:
+            os.remove(snapshot_path)
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            logger.warning(f"Snapshot {snapshot_path} could not be removed: {error}")
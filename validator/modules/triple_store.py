@@ -0,0 +1,492 @@
+"""Disk-backed store of OntoUML models, for models whose graphs do not fit in memory.
+
+The SQLiteStore is an RDFLib store that keeps the triples of a graph in an SQLite database instead of in memory, so the
+SPARQL queries of the rules and the functions of the vocab_lib read them through the Graph interface as usual, while the
+resident memory of the validation is bounded by the page cache of the database and by the results of the queries.
+
+The store does not bound the structures built from the graph: the ModelIndex (which stores the classes, their properties
+and the generalizations, and possibly the transitive closure of the hierarchy) and the QueryCache (which stores every
+row of each distinct query) are still kept in memory during the validation.
+
+The database is composed of:
+    - A table of terms, in which each URI, blank node and literal is stored once and identified by an integer.
+    - A table of triples of term ids, indexed by (subject, predicate, object) and by (predicate, object, subject). Every
+      triple pattern of the rules has a bound predicate (e.g., `?class rdf:type ontouml:Class`, `?gen ontouml:general
+      ?class`), so these two indexes serve all their lookups, including the ones by stereotype or by general class.
+    - A table of metadata, which identifies the source file and parser settings of the stored triples, so that a store
+      built by an earlier run is opened without importing the file again while it does not change.
+
+Usage:
+    ```
+    ontouml_model = load_graph_safely(ontouml_file_path, store_path="/path/to/model.sqlite")
+    ontouml_model = open_stored_graph("/path/to/model.sqlite")
+    ```
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+import rdflib
+from rdflib import RDF, BNode, Graph, Literal, URIRef, plugin
+from rdflib.store import NO_STORE, VALID_STORE, Store
+
+from .errors import report_error_io_read
+
+# Version of the database schema. Stores of other versions are cleared when opened
+STORE_FORMAT_VERSION = 1
+
+STORE_EXTENSION = ".sqlite"
+DEFAULT_STORE_CACHE_SIZE_MB = 64
+
+# Number of added triples buffered before being written to the database
+WRITE_BATCH_SIZE = 10000
+# Maximum number of term ids kept in memory while triples are added and looked up
+TERM_IDS_CACHE_SIZE = 100000
+
+TERM_SEPARATOR = "\x1f"
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS triples (
+    subject INTEGER NOT NULL,
+    predicate INTEGER NOT NULL,
+    object INTEGER NOT NULL,
+    PRIMARY KEY (subject, predicate, object)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS triples_pos ON triples (predicate, object, subject);
+CREATE TABLE IF NOT EXISTS namespaces (prefix TEXT PRIMARY KEY, namespace TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def is_discarded_by_projection(triple: tuple, predicates: set[URIRef], classes: set[URIRef] | None) -> bool:
+    """Return whether a triple is discarded by a projection of the graph.
+
+    :param triple: The triple.
+    :type triple: tuple
+    :param predicates: The predicates of the triples kept by the projection.
+    :type predicates: set[URIRef]
+    :param classes: If provided, only the rdf:type triples whose objects are these classes are kept.
+    :type classes: set[URIRef] | None
+    :return: True if the triple is discarded, False if it is kept.
+    :rtype: bool
+    """
+    _, predicate, value = triple
+    return predicate not in predicates or (predicate == RDF.type and classes is not None and value not in classes)
+
+
+def _encode_term(term: rdflib.term.Node) -> str:
+    """Return the text with which an RDF term is stored: its kind, its language or datatype and its value.
+
+    :param term: The term to be encoded.
+    :type term: rdflib.term.Node
+    :return: The encoded term.
+    :rtype: str
+    """
+    if isinstance(term, Literal):
+        if term.language is not None:
+            return f"L@{term.language}{TERM_SEPARATOR}{term}"
+        if term.datatype is not None:
+            return f"L^{term.datatype}{TERM_SEPARATOR}{term}"
+        return f"L{TERM_SEPARATOR}{term}"
+    if isinstance(term, BNode):
+        return "B" + term
+    return "U" + term
+
+
+@lru_cache(maxsize=65536)
+def _decode_term(encoded_term: str) -> rdflib.term.Node:
+    """Return the RDF term stored as the received text.
+
+    :param encoded_term: The encoded term, as returned by _encode_term.
+    :type encoded_term: str
+    :return: The term.
+    :rtype: rdflib.term.Node
+    """
+    kind = encoded_term[0]
+    if kind == "U":
+        return URIRef(encoded_term[1:])
+    if kind == "B":
+        return BNode(encoded_term[1:])
+
+    annotation, value = encoded_term[1:].split(TERM_SEPARATOR, 1)
+    if annotation.startswith("@"):
+        return Literal(value, lang=annotation[1:])
+    if annotation.startswith("^"):
+        return Literal(value, datatype=URIRef(annotation[1:]))
+    return Literal(value)
+
+
+class SQLiteStore(Store):
+    """An RDFLib store that keeps the triples of a graph in an SQLite database.
+
+    Stores are opened in WAL mode, so a store can be read by several processes (e.g., the process workers of a
+    validation, which receive the store's path instead of a copy of its triples) while it is not being written. Each
+    thread using the store (e.g., the thread workers of a validation) reads it through its own connection, while the
+    cache of term ids and the buffer of added triples, which are shared by all threads, are guarded by a lock.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(
+        self,
+        configuration: str | None = None,
+        identifier=None,
+        predicates: set[URIRef] | None = None,
+        classes: set[URIRef] | None = None,
+        cache_size_mb: float = DEFAULT_STORE_CACHE_SIZE_MB,
+    ):
+        """Initialize an SQLiteStore object, opening it if a configuration is provided.
+
+        :param configuration: Optional path of the database of the store. If provided, the store is opened and the
+                              database is created if it does not exist.
+        :type configuration: str | None
+        :param identifier: Identifier of the store (not used).
+        :param predicates: Optional projection of the graph. If provided, only triples with these predicates are added
+                           while the store is projecting, as in load_graph_safely.
+        :type predicates: set[URIRef] | None
+        :param classes: Optional classes of the projection, as in load_graph_safely.
+        :type classes: set[URIRef] | None
+        :param cache_size_mb: Maximum size (in megabytes) of the page cache of the database.
+        :type cache_size_mb: float
+        """
+        self.store_path: str | None = None
+        self.is_open = False
+        self.predicates = predicates
+        self.classes = classes
+        self.is_projecting = predicates is not None
+        self.discarded_triples = 0
+        self.cache_size_mb = cache_size_mb
+
+        self._term_ids: dict[str, int] = {}
+        self._pending_triples: list[tuple[int, int, int]] = []
+        self._lock = threading.Lock()
+        self._thread_data = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        super().__init__(None, identifier)
+        if configuration:
+            self.open(configuration, create=True)
+
+    def __reduce__(self) -> tuple:
+        """Return the arguments with which a copy of the store is created: the store is reopened from its database."""
+        self.commit()
+        return SQLiteStore, (self.store_path, None, None, None, self.cache_size_mb)
+
+    def open(self, configuration: str, create: bool = False) -> int:
+        """Open the database of the store.
+
+        :param configuration: Path of the database.
+        :type configuration: str
+        :param create: If True, the database is created if it does not exist.
+        :type create: bool
+        :return: VALID_STORE if the database was opened or NO_STORE if it does not exist and was not created.
+        :rtype: int
+        """
+        if not create and not os.path.isfile(configuration):
+            return NO_STORE
+
+        # Reopening the store closes the connections to its previous database
+        self.close()
+        self.store_path = configuration
+        self.is_open = True
+
+        format_version = None
+        if self.connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'metadata'").fetchone() is not None:
+            format_version = self.get_metadata("format_version")
+        if format_version != str(STORE_FORMAT_VERSION):
+            self.connection.executescript(
+                "DROP TABLE IF EXISTS terms; DROP TABLE IF EXISTS triples; "
+                "DROP TABLE IF EXISTS namespaces; DROP TABLE IF EXISTS metadata;"
+            )
+            self.connection.executescript(STORE_SCHEMA)
+            self.set_metadata("format_version", str(STORE_FORMAT_VERSION))
+            self.connection.commit()
+        return VALID_STORE
+
+    @property
+    def connection(self) -> sqlite3.Connection | None:
+        """Return the connection of the current thread to the database, opening it on its first use.
+
+        :return: The connection of the current thread, or None if the store is not open.
+        :rtype: sqlite3.Connection | None
+        """
+        if not self.is_open:
+            return None
+
+        connection = getattr(self._thread_data, "connection", None)
+        if connection is None:
+            # Connections are only used by their threads, but they are closed by the thread that closes the store
+            connection = sqlite3.connect(self.store_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA cache_size={-int(self.cache_size_mb * 1024)}")
+            connection.execute("PRAGMA temp_store=FILE")
+            self._thread_data.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        """Close the database of the store (i.e., the connections of all threads), writing the triples added to it.
+
+        :param commit_pending_transaction: Ignored: added triples are always written, as the store is not transactional.
+        :type commit_pending_transaction: bool
+        """
+        if not self.is_open:
+            return
+        self.commit()
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._thread_data = threading.local()
+        self.is_open = False
+
+    def commit(self) -> None:
+        """Write the buffered triples to the database and commit the current transaction of the current thread."""
+        if not self.is_open:
+            return
+        self._write_pending_triples()
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        """Discard the buffered triples and the changes of the current transaction of the current thread."""
+        with self._lock:
+            self._pending_triples = []
+            self._term_ids = {}
+        self.connection.rollback()
+
+    def clear(self) -> None:
+        """Remove all triples, terms, namespaces and metadata of the store, except for its format version."""
+        with self._lock:
+            self._pending_triples = []
+            self._term_ids = {}
+        self.connection.execute("DELETE FROM triples")
+        self.connection.execute("DELETE FROM terms")
+        self.connection.execute("DELETE FROM namespaces")
+        self.connection.execute("DELETE FROM metadata WHERE key != 'format_version'")
+        self.connection.commit()
+
+    def get_metadata(self, key: str) -> str | None:
+        """Return a metadata value of the store, or None if it is not set.
+
+        :param key: The key of the value.
+        :type key: str
+        :return: The value.
+        :rtype: str | None
+        """
+        row = self.connection.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def set_metadata(self, key: str, value: str) -> None:
+        """Set a metadata value of the store, which is written with the next commit.
+
+        :param key: The key of the value.
+        :type key: str
+        :param value: The value.
+        :type value: str
+        """
+        self.connection.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (key, value))
+
+    def _get_term_id(self, term: rdflib.term.Node, create: bool) -> int | None:
+        """Return the id of a term in the database.
+
+        :param term: The term.
+        :type term: rdflib.term.Node
+        :param create: If True, the term is added to the database if it is not there yet.
+        :type create: bool
+        :return: The id of the term, or None if it is not in the database and was not created.
+        :rtype: int | None
+        """
+        encoded_term = _encode_term(term)
+        with self._lock:
+            term_id = self._term_ids.get(encoded_term)
+        if term_id is not None:
+            return term_id
+
+        row = self.connection.execute("SELECT id FROM terms WHERE term = ?", (encoded_term,)).fetchone()
+        if row is not None:
+            term_id = row[0]
+        elif create:
+            term_id = self.connection.execute("INSERT INTO terms (term) VALUES (?)", (encoded_term,)).lastrowid
+        else:
+            return None
+
+        # The cache is bounded, so the memory used does not grow with the number of terms of the model
+        with self._lock:
+            if len(self._term_ids) >= TERM_IDS_CACHE_SIZE:
+                self._term_ids = {}
+            self._term_ids[encoded_term] = term_id
+        return term_id
+
+    def _write_pending_triples(self) -> None:
+        """Write the buffered triples to the database."""
+        with self._lock:
+            pending_triples = self._pending_triples
+            self._pending_triples = []
+        if pending_triples:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO triples (subject, predicate, object) VALUES (?, ?, ?)", pending_triples
+            )
+
+    def add(self, triple: tuple, context: Graph, quoted: bool = False) -> None:
+        """Add a triple to the store, unless it is discarded by the projection."""
+        if self.is_projecting and is_discarded_by_projection(triple, self.predicates, self.classes):
+            self.discarded_triples += 1
+            return
+        triple_ids = tuple(self._get_term_id(term, True) for term in triple)
+        with self._lock:
+            self._pending_triples.append(triple_ids)
+            is_batch_full = len(self._pending_triples) >= WRITE_BATCH_SIZE
+        if is_batch_full:
+            self._write_pending_triples()
+        super().add(triple, context, quoted)
+
+    def addN(self, quads: Iterable[tuple]) -> None:  # noqa: N802
+        """Add the triples of quads to the store, unless they are discarded by the projection."""
+        for subject, predicate, value, context in quads:
+            self.add((subject, predicate, value), context)
+
+    def _get_pattern_conditions(self, triple_pattern: tuple) -> tuple[str, list[int]] | None:
+        """Return the SQL conditions and parameters that select the triples matching a pattern.
+
+        :param triple_pattern: The (subject, predicate, object) pattern, with None for unbound terms.
+        :type triple_pattern: tuple
+        :return: The conditions and their parameters, or None if a bound term is not in the store.
+        :rtype: tuple[str, list[int]] | None
+        """
+        self._write_pending_triples()
+
+        conditions = []
+        parameters = []
+        for column, term in zip(("subject", "predicate", "object"), triple_pattern):
+            if term is not None:
+                term_id = self._get_term_id(term, False)
+                if term_id is None:
+                    return None
+                conditions.append(f"triples.{column} = ?")
+                parameters.append(term_id)
+        return " AND ".join(conditions) or "1", parameters
+
+    def triples(self, triple_pattern: tuple, context: Graph | None = None) -> Iterator[tuple]:
+        """Return an iterator over the triples matching a pattern, which are read from the database as iterated."""
+        pattern_conditions = self._get_pattern_conditions(triple_pattern)
+        if pattern_conditions is None:
+            return
+        conditions, parameters = pattern_conditions
+
+        rows = self.connection.execute(
+            "SELECT subjects.term, predicates.term, objects.term FROM triples "
+            "JOIN terms AS subjects ON subjects.id = triples.subject "
+            "JOIN terms AS predicates ON predicates.id = triples.predicate "
+            "JOIN terms AS objects ON objects.id = triples.object "
+            f"WHERE {conditions}",
+            parameters,
+        )
+        for subject, predicate, value in rows:
+            yield (_decode_term(subject), _decode_term(predicate), _decode_term(value)), iter(())
+
+    def remove(self, triple_pattern: tuple, context: Graph | None = None) -> None:
+        """Remove the triples matching a pattern from the store."""
+        pattern_conditions = self._get_pattern_conditions(triple_pattern)
+        if pattern_conditions is not None:
+            conditions, parameters = pattern_conditions
+            self.connection.execute(f"DELETE FROM triples WHERE {conditions}", parameters)
+        super().remove(triple_pattern, context)
+
+    def __len__(self, context: Graph | None = None) -> int:
+        """Return the number of triples in the store."""
+        self._write_pending_triples()
+        return self.connection.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def contexts(self, triple: tuple | None = None) -> Iterator[Graph]:
+        """Return an empty iterator, as the store is not context aware."""
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a namespace to a prefix, replacing previous bindings of the prefix or namespace if override is set."""
+        if not override and (self.namespace(prefix) is not None or self.prefix(namespace) is not None):
+            return
+        self.connection.execute("DELETE FROM namespaces WHERE prefix = ? OR namespace = ?", (prefix, str(namespace)))
+        self.connection.execute("INSERT INTO namespaces (prefix, namespace) VALUES (?, ?)", (prefix, str(namespace)))
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        """Return the prefix bound to a namespace, or None if it is not bound."""
+        row = self.connection.execute("SELECT prefix FROM namespaces WHERE namespace = ?", (str(namespace),)).fetchone()
+        return row[0] if row is not None else None
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        """Return the namespace bound to a prefix, or None if it is not bound."""
+        row = self.connection.execute("SELECT namespace FROM namespaces WHERE prefix = ?", (prefix,)).fetchone()
+        return URIRef(row[0]) if row is not None else None
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        """Return an iterator over the (prefix, namespace) bindings of the store."""
+        for prefix, namespace in self.connection.execute("SELECT prefix, namespace FROM namespaces").fetchall():
+            yield prefix, URIRef(namespace)
+
+
+# The store can also be created by name, as the other RDFLib stores
+plugin.register("OntoUMLSQLite", Store, "validator.modules.triple_store", "SQLiteStore")
+
+
+def get_source_key(file_path: str, parser_settings: str) -> str:
+    """Return the key of the triples of a file stored with the received parser settings.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param parser_settings: The format used for parsing the file and any other setting that changes the parsed triples
+                            (e.g., a projection).
+    :type parser_settings: str
+    :return: The hexadecimal key of the stored triples.
+    :rtype: str
+    :raises OSError: If the file cannot be read.
+    """
+    source_hash = hashlib.sha256(f"{STORE_FORMAT_VERSION}|{rdflib.__version__}|{parser_settings}|".encode("utf-8"))
+    with open(file_path, "rb") as read_file:
+        for block in iter(lambda: read_file.read(2**20), b""):
+            source_hash.update(block)
+    return source_hash.hexdigest()
+
+
+def get_store_path(store_dir: str, file_path: str) -> str:
+    """Return the path of the store of a file in a directory of stores, creating the directory if it does not exist.
+
+    Each file has a single store, identified by the file's absolute path, which is replaced when the file changes.
+
+    :param store_dir: Path of the directory of stores.
+    :type store_dir: str
+    :param file_path: Path of the stored file.
+    :type file_path: str
+    :return: The path of the store.
+    :rtype: str
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    path_hash = hashlib.sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(store_dir, path_hash + STORE_EXTENSION)
+
+
+def open_stored_graph(store_path: str, cache_size_mb: float = DEFAULT_STORE_CACHE_SIZE_MB) -> Graph:
+    """Open the graph kept in an existing store, e.g., one built by an earlier run from a file that is not available.
+
+    :param store_path: Path of the database of the store.
+    :type store_path: str
+    :param cache_size_mb: Maximum size (in megabytes) of the page cache of the database.
+    :type cache_size_mb: float
+    :return: The graph kept in the store.
+    :rtype: Graph
+    """
+    triple_store = SQLiteStore(cache_size_mb=cache_size_mb)
+    try:
+        if triple_store.open(store_path) == NO_STORE:
+            raise FileNotFoundError(f"No triple store found at {store_path}.")
+    except (OSError, sqlite3.Error) as error:
+        file_description = "triple store"
+        report_error_io_read(store_path, file_description, error)
+    return Graph(store=triple_store)
@@ -1,12 +1,51 @@
 """Util functions related to graphs."""
 from loguru import logger
-from rdflib import Graph
+from rdflib import Graph, URIRef
+from rdflib.plugins.stores.memory import Memory
 
 from .errors import report_error_io_read
+from .snapshot_cache import SnapshotCache
+from .triple_store import SQLiteStore, get_source_key, is_discarded_by_projection
 from .utils_validations import validate_input_extension
 
 
-def load_graph_safely(ontology_file: str, file_format: str = "not_provided") -> Graph:
+class ProjectedMemory(Memory):
+    """An in-memory store that, while projecting, discards the triples not read by the validation rules.
+
+    Triples are filtered when added to the store, so discarded triples are never indexed. All RDFLib parsers add the
+    parsed triples through the store, including the ones that bypass the methods of the Graph.
+    """
+
+    def __init__(self, predicates: set[URIRef], classes: set[URIRef] | None):
+        """Initialize a ProjectedMemory object.
+
+        :param predicates: The predicates of the triples to be kept.
+        :type predicates: set[URIRef]
+        :param classes: If provided, only the rdf:type triples whose objects are these classes are kept.
+        :type classes: set[URIRef] | None
+        """
+        super().__init__()
+        self.predicates = predicates
+        self.classes = classes
+        self.is_projecting = True
+        self.discarded_triples = 0
+
+    def add(self, triple: tuple, context: Graph, quoted: bool = False) -> None:
+        """Add a triple to the store, unless it is discarded by the projection."""
+        if self.is_projecting and is_discarded_by_projection(triple, self.predicates, self.classes):
+            self.discarded_triples += 1
+            return
+        super().add(triple, context, quoted)
+
+
+def load_graph_safely(
+    ontology_file: str,
+    file_format: str = "not_provided",
+    snapshot_cache: SnapshotCache | None = None,
+    predicates: set[URIRef] | None = None,
+    classes: set[URIRef] | None = None,
+    store_path: str | None = None,
+) -> Graph:
     """Safely load graph from file to working memory using arguments provided by the user, which are the file path \
     and (optionally) the file type.
 
@@ -14,13 +53,76 @@ def load_graph_safely(ontology_file: str, file_format: str = "not_provided") ->
     :type ontology_file: str
     :param file_format: Optional argument. Format of the file to be loaded.
     :type file_format: str
+    :param snapshot_cache: Optional cache of snapshots of parsed files. If provided, the graph is read from the snapshot
+                           of the file's contents, if there is one, and a snapshot is stored after the file is parsed.
+    :type snapshot_cache: SnapshotCache | None
+    :param predicates: Optional projection of the graph. If provided, only triples with these predicates are kept while
+                       parsing (e.g., the ones read by the selected validation rules), so diagram data and other
+                       metadata are never stored.
+    :type predicates: set[URIRef] | None
+    :param classes: Optional classes of the projection. If provided with predicates, only the rdf:type triples whose
+                    objects are these classes are kept.
+    :type classes: set[URIRef] | None
+    :param store_path: Optional path of an SQLite triple store in which the graph is kept instead of in memory (see
+                       SQLiteStore). If the store was built from the same file contents with the same format and
+                       projection, it is opened without parsing the file again. The snapshot cache is not used.
+    :type store_path: str | None
     :return: RDFLib graph loaded as object.
     :rtype: Graph
     """
-    ontology_graph = Graph()
+    if predicates is None:
+        parser_settings = file_format.lower().strip()
+    else:
+        projected_classes = "*" if classes is None else ",".join(sorted(classes))
+        parser_settings = f"{file_format.lower().strip()}|{','.join(sorted(predicates))}|{projected_classes}"
+
+    if store_path is not None:
+        return _load_stored_graph(ontology_file, file_format, parser_settings, store_path, predicates, classes)
+
+    if predicates is None:
+        ontology_graph = Graph()
+    else:
+        ontology_graph = Graph(store=ProjectedMemory(predicates, classes))
+
+    snapshot_key = None
+    if snapshot_cache is not None:
+        try:
+            with open(ontology_file, "rb") as read_file:
+                snapshot_key = snapshot_cache.get_key(read_file.read(), parser_settings)
+        except OSError as error:
+            file_description = "input ontology file"
+            report_error_io_read(ontology_file, file_description, error)
+
+        cached_graph = snapshot_cache.load(snapshot_key)
+        if cached_graph is not None:
+            logger.debug("Ontology file {} successfully loaded from its snapshot.", ontology_file)
+            return cached_graph
+
+    _parse_graph_file(ontology_graph, ontology_file, file_format)
 
-    print(f"{ontology_file = }")
+    if predicates is not None:
+        # Triples added after parsing (e.g., by incremental changes) are not projected
+        ontology_graph.store.is_projecting = False
+        logger.debug("{} triples discarded by the projection.", ontology_graph.store.discarded_triples)
 
+    logger.debug("Ontology file {} successfully loaded to working memory.", ontology_file)
+
+    if snapshot_key is not None:
+        snapshot_cache.store(snapshot_key, ontology_graph)
+
+    return ontology_graph
+
+
+def _parse_graph_file(ontology_graph: Graph, ontology_file: str, file_format: str) -> None:
+    """Parse a graph file into a graph, reporting the errors of reading the file.
+
+    :param ontology_graph: The graph to which the parsed triples are added.
+    :type ontology_graph: Graph
+    :param ontology_file: Path to the ontology file to be parsed.
+    :type ontology_file: str
+    :param file_format: Format of the file to be parsed or 'not_provided' to guess it from the file's extension.
+    :type file_format: str
+    """
     try:
         if file_format == "not_provided":
             ontology_graph.parse(ontology_file, encoding="utf-8")
@@ -32,6 +134,88 @@ def load_graph_safely(ontology_file: str, file_format: str = "not_provided") ->
         file_description = "input ontology file"
         report_error_io_read(ontology_file, file_description, error)
 
-    logger.debug(f"Ontology file {ontology_file} successfully loaded to working memory.")
+
+def _load_stored_graph(
+    ontology_file: str,
+    file_format: str,
+    parser_settings: str,
+    store_path: str,
+    predicates: set[URIRef] | None,
+    classes: set[URIRef] | None,
+) -> Graph:
+    """Load a graph file into an SQLite triple store, unless the store already keeps the triples of the same file.
+
+    :param ontology_file: Path to the ontology file to be loaded.
+    :type ontology_file: str
+    :param file_format: Format of the file to be loaded or 'not_provided' to guess it from the file's extension.
+    :type file_format: str
+    :param parser_settings: The format and projection used for parsing the file, which identify the stored triples.
+    :type parser_settings: str
+    :param store_path: Path of the database of the store.
+    :type store_path: str
+    :param predicates: Optional projection of the graph, as in load_graph_safely.
+    :type predicates: set[URIRef] | None
+    :param classes: Optional classes of the projection, as in load_graph_safely.
+    :type classes: set[URIRef] | None
+    :return: The graph kept in the store.
+    :rtype: Graph
+    """
+    try:
+        source_key = get_source_key(ontology_file, parser_settings)
+    except OSError as error:
+        file_description = "input ontology file"
+        report_error_io_read(ontology_file, file_description, error)
+
+    triple_store = SQLiteStore(store_path, predicates=predicates, classes=classes)
+    ontology_graph = Graph(store=triple_store)
+
+    if triple_store.get_metadata("source_key") == source_key:
+        triple_store.is_projecting = False
+        logger.debug("Ontology file {} successfully opened from its triple store {}.", ontology_file, store_path)
+        return ontology_graph
+
+    triple_store.clear()
+    _parse_graph_file(ontology_graph, ontology_file, file_format)
+
+    # Triples added after parsing (e.g., by incremental changes) are not projected
+    triple_store.is_projecting = False
+    triple_store.set_metadata("source_key", source_key)
+    triple_store.commit()
+    logger.debug("Ontology file {} successfully loaded to its triple store {}.", ontology_file, store_path)
+
+    return ontology_graph
+
+
+def load_graph_from_data(
+    graph_data: str | bytes,
+    file_format: str = "turtle",
+    predicates: set[URIRef] | None = None,
+    classes: set[URIRef] | None = None,
+) -> Graph:
+    """Load a graph from its serialized contents (e.g., received by a service instead of read from a file).
+
+    :param graph_data: The serialized graph.
+    :type graph_data: str | bytes
+    :param file_format: Format of the serialized graph (default: 'turtle').
+    :type file_format: str
+    :param predicates: Optional projection of the graph, as in load_graph_safely.
+    :type predicates: set[URIRef] | None
+    :param classes: Optional classes of the projection, as in load_graph_safely.
+    :type classes: set[URIRef] | None
+    :return: RDFLib graph loaded as object.
+    :rtype: Graph
+    """
+    file_format = file_format.lower().strip()
+    validate_input_extension(file_format)
+
+    if predicates is None:
+        ontology_graph = Graph()
+    else:
+        ontology_graph = Graph(store=ProjectedMemory(predicates, classes))
+
+    ontology_graph.parse(data=graph_data, format=file_format)
+
+    if predicates is not None:
+        ontology_graph.store.is_projecting = False
 
     return ontology_graph
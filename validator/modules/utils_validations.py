@@ -61,3 +61,40 @@ def validate_assumption(world_assumption: str) -> str:
         report_error_invalid_parameter("world_assumption", ["cwa", "owa"], current_function)
 
     return assumption
+
+
+def validate_backend(backend: str) -> str:
+    """Validate and normalize the backend parameter, which selects the implementation of the validation rules.
+
+    The 'sparql' backend executes the rules through SPARQL queries and is the reference implementation. The 'native'
+    backend executes the same rules using only the precomputed ModelIndex of the model.
+
+    :param backend: The backend to be validated and normalized.
+    :type backend: str
+    :return: The validated and normalized backend ("sparql" or "native").
+    :rtype: str
+    """
+    normalized_backend = backend.lower().strip()
+
+    if normalized_backend not in ["sparql", "native"]:
+        current_function = inspect.stack()[0][3]
+        report_error_invalid_parameter("backend", ["sparql", "native"], current_function)
+
+    return normalized_backend
+
+
+def validate_executor(executor: str) -> str:
+    """Validate and normalize the executor parameter, which selects the type of workers used for parallel validation.
+
+    :param executor: The executor to be validated and normalized.
+    :type executor: str
+    :return: The validated and normalized executor ("thread" or "process").
+    :rtype: str
+    """
+    normalized_executor = executor.lower().strip()
+
+    if normalized_executor not in ["thread", "process"]:
+        current_function = inspect.stack()[0][3]
+        report_error_invalid_parameter("executor", ["thread", "process"], current_function)
+
+    return normalized_executor
@@ -0,0 +1,129 @@
+"""Runtime metrics of validations, used to find slow rules and to catch performance regressions.
+
+A ValidationMetrics object can be provided to the validation functions, which fill it in with:
+    - The time spent loading (parsing or reading from a snapshot) the model's file and the model's number of triples.
+    - The time spent building the index of the model, when it is used by the executed rules.
+    - For each executed rule, its wall-clock and CPU times, the number of rows it scanned (rows of SPARQL query results
+      or entries of the model's index) and the number of issues it emitted.
+
+Metrics are only collected when requested. Rows are counted through count_scanned_rows, which returns the received
+rows unchanged when no rule is being measured in the current thread.
+
+Usage:
+    ```
+    validation_metrics = ValidationMetrics()
+    is_valid, w_list, e_list = validate_ontouml_file(ontouml_file_path, "owa", metrics=validation_metrics)
+    slowest_rule = max(validation_metrics.rules.values(), key=lambda rule_metrics: rule_metrics.wall_seconds)
+    validation_metrics.to_json(output_file)
+    ```
+"""
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+# Metrics of the rule being executed in each thread, if it is being measured
+_current_rule = threading.local()
+
+
+class RuleMetrics:
+    """A class to represent the runtime metrics of the execution of a single rule."""
+
+    def __init__(self, rule_code: str):
+        """Initialize a RuleMetrics object with no measurements.
+
+        :param rule_code: The code of the measured rule.
+        :type rule_code: str
+        """
+        self.rule_code = rule_code
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rows_scanned = 0
+        self.num_issues = 0
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def start(self) -> None:
+        """Start measuring the rule, whose rows scanned in the current thread are counted until it is stopped."""
+        _current_rule.metrics = self
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def stop(self) -> None:
+        """Stop measuring the rule, adding the elapsed times to its measurements."""
+        self.wall_seconds += time.perf_counter() - self._wall_start
+        self.cpu_seconds += time.thread_time() - self._cpu_start
+        _current_rule.metrics = None
+
+    def to_dict(self) -> dict:
+        """Return the measurements of the rule as a dictionary."""
+        return {
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "rows_scanned": self.rows_scanned,
+            "num_issues": self.num_issues,
+        }
+
+
+class ValidationMetrics:
+    """A class to represent the runtime metrics of a validation, filled in by the validation functions."""
+
+    def __init__(self):
+        """Initialize a ValidationMetrics object with no measurements."""
+        self.parse_seconds: float | None = None
+        self.num_triples: int | None = None
+        self.index_seconds: float | None = None
+        self.rules: dict[str, RuleMetrics] = {}
+
+    def get_rule_metrics(self, rule_code: str) -> RuleMetrics:
+        """Return the metrics of a rule, creating them if the rule was not measured yet.
+
+        :param rule_code: The code of the rule.
+        :type rule_code: str
+        :return: The metrics of the rule.
+        :rtype: RuleMetrics
+        """
+        rule_metrics = self.rules.get(rule_code)
+        if rule_metrics is None:
+            rule_metrics = self.rules[rule_code] = RuleMetrics(rule_code)
+        return rule_metrics
+
+    def to_dict(self) -> dict:
+        """Return the measurements of the validation as a dictionary, with the rules in the order they were measured."""
+        return {
+            "parse_seconds": self.parse_seconds,
+            "num_triples": self.num_triples,
+            "index_seconds": self.index_seconds,
+            "rules": {rule_code: rule_metrics.to_dict() for rule_code, rule_metrics in self.rules.items()},
+        }
+
+    def to_json(self, output_file: TextIO) -> None:
+        """Write the measurements of the validation to a file as a JSON object.
+
+        :param output_file: The text file in which the measurements are written.
+        :type output_file: TextIO
+        """
+        json.dump(self.to_dict(), output_file)
+        output_file.write("\n")
+
+
+def _count_rows(rows: Iterable, rule_metrics: RuleMetrics) -> Iterator:
+    """Yield the received rows, counting them in the metrics of a rule."""
+    for row in rows:
+        rule_metrics.rows_scanned += 1
+        yield row
+
+
+def count_scanned_rows(rows: Iterable) -> Iterable:
+    """Return the rows to be scanned by a rule, counting them in its metrics if it is being measured.
+
+    :param rows: The rows to be scanned (e.g., rows of SPARQL query results or entries of the model's index).
+    :type rows: Iterable
+    :return: The received rows, if the rule being executed is not measured, or an iterator over them.
+    :rtype: Iterable
+    """
+    rule_metrics = getattr(_current_rule, "metrics", None)
+    if rule_metrics is None:
+        return rows
+    return _count_rows(rows, rule_metrics)
@@ -0,0 +1,559 @@
+"""Long-running local HTTP/JSON validation service.
+
+Starting a Python process for each validation pays the import of RDFLib, the preparation of the SPARQL queries and the
+parsing of the model every time. The ValidationService is an asyncio HTTP server, listening on a local TCP port or on a
+Unix socket, that keeps these costs warm:
+    - Validations are executed by a pool of worker processes, each one with all SPARQL queries prepared when it starts.
+    - Each worker keeps the models it recently parsed in a bounded LRU cache, indexed by the hash of their contents.
+    - Identical requests received while the first one of them is being validated are coalesced: they wait for the same
+      validation and receive the same response.
+
+The service protects itself from overload: requests larger than the maximum request size are rejected with status 413
+and, when the maximum number of pending validations is reached, new validations are rejected with status 503 (and a
+Retry-After header) instead of being queued without bounds.
+
+Endpoints:
+    - POST /validate: validates the model in the JSON request body and responds with the JSON validation report (see
+      ValidationReport.to_json). Request body fields: 'model' (required, the serialized model), 'format' (default:
+      'turtle'), 'world_assumption' (default: 'owa'), 'backend' (default: 'sparql'), 'include', 'exclude' and
+      'severities' (as in validate_ontouml_model).
+    - GET /status: responds with the counters of the service (see ValidationService.get_status).
+
+Usage:
+    ```
+    python -m validator.modules.validation_service --port 8765 --workers 2
+    python -m validator.modules.validation_service --unix-socket /tmp/ontouml-validator.sock
+    ```
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+from loguru import logger
+from rdflib import Graph
+
+from .prepared_queries import get_prepared_queries_file, initialize_prepared_queries
+from .quiet_mode import is_quiet_mode, set_quiet_mode
+from .utils_graph import load_graph_from_data
+from .utils_validations import validate_assumption, validate_backend, validate_input_extension
+from ..lib import get_validation_report
+from ..validations.rules_registry import (
+    get_registered_rules_codes,
+    get_required_classes,
+    get_required_predicates,
+    select_rules_codes,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 1
+DEFAULT_MAX_MODELS = 32
+DEFAULT_MAX_REQUEST_BYTES = 16 * 2**20
+DEFAULT_MAX_PENDING = 64
+
+# Maximum size of the request line and of each header line
+MAX_HEADER_LINE_BYTES = 8 * 2**10
+MAX_HEADERS = 64
+# Maximum time (in seconds) for receiving a request after its connection is opened or reused
+REQUEST_TIMEOUT = 30.0
+
+VALIDATION_OPTIONS = ("world_assumption", "backend", "include", "exclude", "severities")
+
+# State of each worker process: the LRU cache of its parsed models
+_service_worker_state: dict = {}
+
+
+class RequestError(Exception):
+    """Exception raised when a request cannot be served, with the HTTP status of the response."""
+
+    def __init__(self, status: int, message: str):
+        """Initialize a RequestError object.
+
+        :param status: The HTTP status of the response.
+        :type status: int
+        :param message: The description of the error sent in the response.
+        :type message: str
+        """
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
+class ModelCache:
+    """A class to represent a bounded LRU cache of parsed OntoUML models, indexed by the hash of their contents.
+
+    Models are parsed with the projection of all registered rules, so a cached model serves requests selecting any
+    rules.
+    """
+
+    def __init__(self, max_models: int = DEFAULT_MAX_MODELS):
+        """Initialize an empty ModelCache object.
+
+        :param max_models: Maximum number of cached models. When it is exceeded, the least recently used one is removed.
+        :type max_models: int
+        """
+        self.max_models = max_models
+        self.models: OrderedDict[str, Graph] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        rules_codes = get_registered_rules_codes()
+        self._predicates = get_required_predicates(rules_codes)
+        self._classes = get_required_classes(rules_codes)
+
+    def get_model(self, model_key: str, model_data: str, model_format: str) -> Graph:
+        """Return the parsed model with the received key, parsing its data if it is not cached.
+
+        :param model_key: The hash of the model's data and format.
+        :type model_key: str
+        :param model_data: The serialized model.
+        :type model_data: str
+        :param model_format: The format of the serialized model.
+        :type model_format: str
+        :return: The parsed OntoUML model.
+        :rtype: Graph
+        """
+        ontouml_model = self.models.get(model_key)
+        if ontouml_model is not None:
+            self.hits += 1
+            self.models.move_to_end(model_key)
+            return ontouml_model
+
+        self.misses += 1
+        ontouml_model = load_graph_from_data(model_data, model_format, self._predicates, self._classes)
+        self.models[model_key] = ontouml_model
+        if len(self.models) > self.max_models:
+            self.models.popitem(last=False)
+        return ontouml_model
+
+
+def get_model_key(model_data: str, model_format: str) -> str:
+    """Return the key of a serialized model: the hash of its data and of its format.
+
+    :param model_data: The serialized model.
+    :type model_data: str
+    :param model_format: The format of the serialized model.
+    :type model_format: str
+    :return: The hexadecimal key of the model.
+    :rtype: str
+    """
+    return hashlib.sha256(f"{model_format}\n{model_data}".encode("utf-8")).hexdigest()
+
+
+def _initialize_service_worker(
+    max_models: int, is_quiet: bool = False, prepared_queries_file: str | None = None
+) -> None:
+    """Initialize a worker process, loading the prepared SPARQL queries and creating its cache of parsed models.
+
+    :param max_models: Maximum number of models cached by the worker.
+    :type max_models: int
+    :param is_quiet: Whether the quiet mode is on in the service's process, as it is not inherited by spawned processes.
+    :type is_quiet: bool
+    :param prepared_queries_file: File with the SPARQL queries prepared by the service's process. If None, all queries
+                                  are prepared by the worker.
+    :type prepared_queries_file: str | None
+    """
+    if is_quiet:
+        set_quiet_mode()
+    initialize_prepared_queries(prepared_queries_file)
+    _service_worker_state["model_cache"] = ModelCache(max_models)
+
+
+def _validate_in_worker(model_key: str, model_data: str, model_format: str, options: dict) -> str:
+    """Validate a serialized model in a worker process and return its validation report in JSON.
+
+    :param model_key: The key of the model, under which it is cached by the worker.
+    :type model_key: str
+    :param model_data: The serialized model.
+    :type model_data: str
+    :param model_format: The format of the serialized model.
+    :type model_format: str
+    :param options: The validation options of the request (world_assumption, backend, include, exclude, severities).
+    :type options: dict
+    :return: The JSON validation report.
+    :rtype: str
+    :raises RequestError: If the model cannot be parsed.
+    """
+    try:
+        ontouml_model = _service_worker_state["model_cache"].get_model(model_key, model_data, model_format)
+    except Exception as error:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"The model could not be parsed: {error}")
+
+    report = get_validation_report(ontouml_model, **options)
+    report_output = io.StringIO()
+    report.to_json(report_output)
+    return report_output.getvalue()
+
+
+def _get_worker_status() -> dict:
+    """Return the counters of the cache of parsed models of a worker process."""
+    model_cache = _service_worker_state["model_cache"]
+    return {"cached_models": len(model_cache.models), "hits": model_cache.hits, "misses": model_cache.misses}
+
+
+def parse_validation_request(request_body: bytes) -> tuple[str, str, dict]:
+    """Parse and check the body of a validation request.
+
+    :param request_body: The JSON body of the request.
+    :type request_body: bytes
+    :return: A tuple with the serialized model, its format and the validation options.
+    :rtype: tuple[str, str, dict]
+    :raises RequestError: If the body is not a valid validation request.
+    """
+    try:
+        request = json.loads(request_body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"The request body is not valid JSON: {error}")
+
+    if not isinstance(request, dict) or not isinstance(request.get("model"), str):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "The request body must be an object with the 'model' string.")
+    unknown_fields = set(request) - {"model", "format", *VALIDATION_OPTIONS}
+    if unknown_fields:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown request fields: {sorted(unknown_fields)}.")
+
+    # Options are checked here, so that invalid requests are not sent to the workers
+    try:
+        model_format = str(request.get("format", "turtle")).lower().strip()
+        validate_input_extension(model_format)
+        options = {
+            "world_assumption": validate_assumption(str(request.get("world_assumption", "owa"))),
+            "backend": validate_backend(str(request.get("backend", "sparql"))),
+            "include": request.get("include"),
+            "exclude": request.get("exclude"),
+            "severities": request.get("severities"),
+        }
+        select_rules_codes(options["include"], options["exclude"], options["severities"])
+    except (ValueError, TypeError) as error:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid validation options: {error}")
+
+    return request["model"], model_format, options
+
+
+class ValidationService:
+    """A class to represent the local validation service, with its pool of worker processes."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_models: int = DEFAULT_MAX_MODELS,
+        max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """Initialize a ValidationService object. Its workers are started by the start method.
+
+        :param workers: Number of worker processes executing validations.
+        :type workers: int
+        :param max_models: Maximum number of parsed models cached by each worker.
+        :type max_models: int
+        :param max_request_bytes: Maximum size of the body of a request. Larger requests are rejected.
+        :type max_request_bytes: int
+        :param max_pending: Maximum number of validations being executed or waiting for a worker. Validations received
+                            when it is reached are rejected.
+        :type max_pending: int
+        """
+        self.workers = workers
+        self.max_models = max_models
+        self.max_request_bytes = max_request_bytes
+        self.max_pending = max_pending
+        self.server: asyncio.AbstractServer | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        # Validations being executed, indexed by the keys of their requests, awaited by identical requests
+        self._pending_validations: dict[str, asyncio.Future] = {}
+        self.num_requests = 0
+        self.num_validations = 0
+        self.num_coalesced = 0
+        self.num_rejected = 0
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket_path: str | None = None
+    ) -> asyncio.AbstractServer:
+        """Start the workers, warming them up, and start listening for requests.
+
+        :param host: The host on which the service listens (default: the local interface).
+        :type host: str
+        :param port: The TCP port on which the service listens. If 0, a free port is chosen.
+        :type port: int
+        :param unix_socket_path: If provided, the service listens on this Unix socket instead of a TCP port.
+        :type unix_socket_path: str | None
+        :return: The asyncio server.
+        :rtype: asyncio.AbstractServer
+        """
+        self._pool = self._create_pool()
+        # Workers are started (and their queries prepared) before the first request
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _get_worker_status) for _ in range(self.workers)))
+
+        if unix_socket_path is not None:
+            self.server = await asyncio.start_unix_server(
+                self._handle_connection, unix_socket_path, limit=MAX_HEADER_LINE_BYTES
+            )
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_LINE_BYTES)
+
+        if not is_quiet_mode():
+            addresses = [str(server_socket.getsockname()) for server_socket in self.server.sockets]
+            logger.info("Validation service listening on {} with {} workers.", ", ".join(addresses), self.workers)
+        return self.server
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Return a new pool of worker processes."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_service_worker,
+            initargs=(self.max_models, is_quiet_mode(), get_prepared_queries_file()),
+        )
+
+    async def close(self) -> None:
+        """Stop listening for requests and stop the workers."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    def get_status(self) -> dict:
+        """Return the counters of the service.
+
+        :return: Dictionary with the numbers of received requests, executed validations, requests coalesced with an
+                 identical pending request and requests rejected because of the service's load, and the number of
+                 pending validations.
+        :rtype: dict
+        """
+        return {
+            "workers": self.workers,
+            "requests": self.num_requests,
+            "validations": self.num_validations,
+            "coalesced": self.num_coalesced,
+            "rejected": self.num_rejected,
+            "pending": len(self._pending_validations),
+        }
+
+    async def validate(self, request_body: bytes) -> bytes:
+        """Validate the model of a validation request, coalescing it with an identical pending request.
+
+        :param request_body: The JSON body of the request.
+        :type request_body: bytes
+        :return: The JSON validation report.
+        :rtype: bytes
+        :raises RequestError: If the request is invalid or the maximum number of pending validations is reached.
+        """
+        model_data, model_format, options = parse_validation_request(request_body)
+        model_key = get_model_key(model_data, model_format)
+        request_key = f"{model_key}:{json.dumps(options, sort_keys=True)}"
+
+        pending_validation = self._pending_validations.get(request_key)
+        if pending_validation is not None:
+            self.num_coalesced += 1
+            return await asyncio.shield(pending_validation)
+
+        if len(self._pending_validations) >= self.max_pending:
+            self.num_rejected += 1
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "The service is overloaded. Retry later.")
+
+        self.num_validations += 1
+        loop = asyncio.get_running_loop()
+        validation = loop.create_future()
+        self._pending_validations[request_key] = validation
+        try:
+            report_json = await loop.run_in_executor(
+                self._pool, _validate_in_worker, model_key, model_data, model_format, options
+            )
+        except asyncio.CancelledError:
+            validation.cancel()
+            raise
+        except BrokenProcessPool:
+            # A worker was terminated (e.g., killed when out of memory), so the pool is replaced
+            self._pool = self._create_pool()
+            validation.set_exception(
+                RequestError(HTTPStatus.INTERNAL_SERVER_ERROR, "The worker validating the model was terminated.")
+            )
+        except Exception as error:
+            validation.set_exception(error)
+        else:
+            validation.set_result(report_json.encode("utf-8"))
+        finally:
+            del self._pending_validations[request_key]
+
+        # The exception of a validation without coalesced requests is raised here and not left unretrieved
+        return validation.result()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes] | None:
+        """Read an HTTP request from a connection.
+
+        :param reader: The reader of the connection.
+        :type reader: asyncio.StreamReader
+        :return: A tuple with the method, the path, the headers (with lowercase names) and the body of the request, or
+                 None if the connection was closed before a new request.
+        :rtype: tuple[str, str, dict, bytes] | None
+        :raises RequestError: If the request is malformed or too large.
+        """
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return None
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+            headers = {"http-version": version}
+            while True:
+                header_line = await reader.readline()
+                if header_line in (b"\r\n", b"\n", b""):
+                    break
+                if len(headers) > MAX_HEADERS:
+                    raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many request headers.")
+                name, _, value = header_line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # Raised by the reader when a line exceeds its limit
+            raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request line or header too large.")
+
+        if "transfer-encoding" in headers:
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Requests must have a Content-Length.")
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+        if content_length > self.max_request_bytes:
+            raise RequestError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Requests are limited to {self.max_request_bytes} bytes."
+            )
+
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method.upper(), path, headers, body
+
+    async def _respond(self, method: str, path: str, body: bytes) -> bytes:
+        """Return the JSON body of the response to a request, raising a RequestError if it cannot be served."""
+        if path == "/validate":
+            if method != "POST":
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST to validate a model.")
+            return await self.validate(body)
+        if path == "/status":
+            if method != "GET":
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET to read the status of the service.")
+            return json.dumps(self.get_status()).encode("utf-8")
+        raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown path {path}.")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of a connection until it is closed by the client or must be closed by the service."""
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), REQUEST_TIMEOUT)
+                except RequestError as error:
+                    # The rest of a rejected request is not read, so the connection cannot be reused
+                    self._write_response(writer, error.status, _get_error_body(error), False)
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                self.num_requests += 1
+                connection_header = headers.get("connection", "").lower()
+                keep_alive = connection_header == "keep-alive" or (
+                    headers["http-version"] == "HTTP/1.1" and connection_header != "close"
+                )
+
+                try:
+                    status, response_body = HTTPStatus.OK, await self._respond(method, path, body)
+                except RequestError as error:
+                    status, response_body = error.status, _get_error_body(error)
+                except Exception as error:
+                    logger.error("Request {} {} failed: {}", method, path, error)
+                    status, response_body = HTTPStatus.INTERNAL_SERVER_ERROR, _get_error_body(error)
+
+                self._write_response(writer, status, response_body, keep_alive)
+                await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool) -> None:
+        """Write an HTTP response with a JSON body to a connection."""
+        status = HTTPStatus(status)
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+
+
+def _get_error_body(error: Exception) -> bytes:
+    """Return the JSON body of the response to a request that could not be served."""
+    message = error.message if isinstance(error, RequestError) else str(error)
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+async def serve(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket_path: str | None = None, **service_settings
+) -> None:
+    """Run a validation service until it is cancelled.
+
+    :param host: The host on which the service listens.
+    :type host: str
+    :param port: The TCP port on which the service listens.
+    :type port: int
+    :param unix_socket_path: If provided, the service listens on this Unix socket instead of a TCP port.
+    :type unix_socket_path: str | None
+    :param service_settings: Arguments of the ValidationService (workers, max_models, max_request_bytes, max_pending).
+    """
+    validation_service = ValidationService(**service_settings)
+    server = await validation_service.start(host, port, unix_socket_path)
+    try:
+        await server.serve_forever()
+    finally:
+        await validation_service.close()
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Run the validation service from the command line.
+
+    :param arguments: The command line arguments. If not provided, the arguments of the script are used.
+    :type arguments: list[str] | None
+    """
+    parser = argparse.ArgumentParser(description="Serve OntoUML validations over HTTP on a local socket.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix-socket", help="path of the Unix socket on which the service listens instead of a port")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="number of worker processes")
+    parser.add_argument("--max-models", type=int, default=DEFAULT_MAX_MODELS, help="parsed models cached per worker")
+    parser.add_argument("--max-request-bytes", type=int, default=DEFAULT_MAX_REQUEST_BYTES)
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING, help="maximum pending validations")
+    parser.add_argument("--quiet", action="store_true", help="do not log the validation of each model")
+    parsed_arguments = parser.parse_args(arguments)
+
+    if parsed_arguments.quiet:
+        set_quiet_mode()
+    try:
+        asyncio.run(
+            serve(
+                parsed_arguments.host,
+                parsed_arguments.port,
+                parsed_arguments.unix_socket,
+                workers=parsed_arguments.workers,
+                max_models=parsed_arguments.max_models,
+                max_request_bytes=parsed_arguments.max_request_bytes,
+                max_pending=parsed_arguments.max_pending,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    logger.configure(handlers=[{"sink": sys.stderr, "level": "INFO"}])
+    main()
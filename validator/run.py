@@ -1,21 +1,172 @@
 """Main module for validating OntoUML Graphs.
 
-This module serves as the main component for validating OntoUML Graphs, providing functions to verify and assess
-the correctness of OntoUML models. The module handles input validation, model loading, and execution flow control,
-supporting multiple execution modes.
+This module is the command-line entry point of the validator. It validates a batch of OntoUML models in parallel
+processes and writes the result of each model as a JSON Lines record (see ResultFile.to_dict) as soon as the model is
+validated, so results can be consumed while the batch is running.
+
+Models can be given as files, directories (searched recursively for files in RDF formats), glob patterns or manifests
+(text files with one file, directory or glob pattern per line, relative to the manifest's directory).
+
+The exit code reflects the validity of the batch:
+    - 0: all models are valid.
+    - 1: at least one model is invalid.
+    - 2: at least one model could not be validated (e.g., it could not be loaded), or the arguments are invalid.
+
+Usage:
+    ```
+    ontouml-validator models/ extra/model.ttl --workers 8 -a cwa > results.jsonl
+    python -m validator.run "models/**/*.ttl" --include CL --exclude R_CL_EMV --output results.jsonl
+    python -m validator.run --manifest models.txt --severities error
+    ```
 """
+import argparse
+import glob
+import json
+import os
 import sys
 
 from loguru import logger
+from rdflib.util import guess_format
 
-from validator.lib import validate_ontouml_file
+from validator.lib import set_quiet_mode, validate_ontouml_files
+from validator.validations.rules_registry import select_rules_codes
 
-if __name__ == "__main__":
-    """This block of code is executed when the module is run as a script. It initializes arguments for script
-    execution and calls the validate_ontouml_model function in script mode.
+EXIT_VALID = 0
+EXIT_INVALID = 1
+EXIT_FAILED = 2
+
+GLOB_CHARACTERS = "*?["
+
+
+def _expand_input(model_input: str) -> list[str]:
+    """Return the paths of the model files of an input: a file, a directory or a glob pattern.
+
+    :param model_input: The input given by the user.
+    :type model_input: str
+    :return: The paths of the files of the input. Files of directories and glob patterns are sorted and only files in
+             RDF formats are returned for directories.
+    :rtype: list[str]
+    """
+    if os.path.isdir(model_input):
+        return [
+            os.path.join(directory_path, file_name)
+            for directory_path, _, files_names in sorted(os.walk(model_input))
+            for file_name in sorted(files_names)
+            if guess_format(file_name) is not None
+        ]
+    if any(character in model_input for character in GLOB_CHARACTERS):
+        return [file_path for file_path in sorted(glob.glob(model_input, recursive=True)) if os.path.isfile(file_path)]
+    # Missing files are reported as failed results by the batch
+    return [model_input]
+
+
+def collect_input_files(models_inputs: list[str], manifests_paths: list[str] | None = None) -> list[str]:
+    """Return the paths of the model files given as inputs and listed in manifests, without repetitions.
+
+    :param models_inputs: Files, directories and glob patterns.
+    :type models_inputs: list[str]
+    :param manifests_paths: Paths of manifests ('-' for the standard input). Empty lines and lines starting with '#'
+                            are ignored.
+    :type manifests_paths: list[str] | None
+    :return: The paths of the model files, in the order in which they were given.
+    :rtype: list[str]
+    :raises OSError: If a manifest cannot be read.
     """
+    models_inputs = list(models_inputs)
 
-    logger.configure(handlers=[{"sink": sys.stderr, "level": "DEBUG"}])
+    for manifest_path in manifests_paths or []:
+        if manifest_path == "-":
+            manifest_lines, manifest_directory = sys.stdin.read().splitlines(), ""
+        else:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                manifest_lines, manifest_directory = manifest_file.read().splitlines(), os.path.dirname(manifest_path)
+        for manifest_line in manifest_lines:
+            manifest_line = manifest_line.strip()
+            if manifest_line and not manifest_line.startswith("#"):
+                models_inputs.append(os.path.join(manifest_directory, manifest_line))
 
-    ontouml_file = "./validator/tests/test_files/R_CL_GJUF.ttl"
-    validate_ontouml_file(ontouml_file, "owa")
+    files_paths = [file_path for model_input in models_inputs for file_path in _expand_input(model_input)]
+    return list(dict.fromkeys(files_paths))
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Validate a batch of OntoUML models from the command line, writing the result of each one as a JSON line.
+
+    :param arguments: The command line arguments. If not provided, the arguments of the script are used.
+    :type arguments: list[str] | None
+    :return: The exit code: 0 if all models are valid, 1 if some model is invalid and 2 if some model could not be
+             validated or the arguments are invalid.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Validate OntoUML models in graph format.")
+    parser.add_argument("inputs", nargs="*", help="model files, directories or glob patterns")
+    parser.add_argument("--manifest", action="append", help="file listing the models, one per line ('-' for stdin)")
+    parser.add_argument("-w", "--workers", type=int, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("-a", "--world-assumption", default="owa", choices=["owa", "cwa"])
+    parser.add_argument(
+        "--backend", choices=["sparql", "native"], help="implementation of the rules (default: sparql, native for JSON)"
+    )
+    parser.add_argument("--include", nargs="+", help="selectors of the executed rules (e.g., R_CL_GJU, CL or R_CL_*)")
+    parser.add_argument("--exclude", nargs="+", help="selectors of the rules not executed")
+    parser.add_argument("--severities", nargs="+", choices=["warning", "error"], help="severities of reported issues")
+    parser.add_argument("-o", "--output", default="-", help="path of the JSON Lines output (default: stdout)")
+    parser.add_argument("--snapshot-cache-dir", help="directory of the cache of snapshots of parsed files")
+    parser.add_argument("--result-cache", help="path of the SQLite database of the result cache")
+    parser.add_argument("--store-dir", help="directory of the disk-backed triple stores of the models")
+    parser.add_argument("--metrics", action="store_true", help="include the runtime metrics of each validation")
+    parser.add_argument("--log-level", default="WARNING", help="level of the messages logged to stderr")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not log the validation of each model")
+    parsed_arguments = parser.parse_args(arguments)
+
+    logger.configure(handlers=[{"sink": sys.stderr, "level": parsed_arguments.log_level.upper()}])
+    if parsed_arguments.quiet:
+        set_quiet_mode()
+
+    try:
+        files_paths = collect_input_files(parsed_arguments.inputs, parsed_arguments.manifest)
+    except OSError as error:
+        parser.error(f"manifest could not be read: {error}")
+    if not files_paths:
+        parser.error("no OntoUML models found in the inputs")
+    try:
+        rules_codes = select_rules_codes(
+            parsed_arguments.include, parsed_arguments.exclude, parsed_arguments.severities
+        )
+    except ValueError:
+        parser.error("some rule selectors match no implemented rule")
+    if not rules_codes:
+        parser.error("no rules selected by the rule selectors")
+
+    results = validate_ontouml_files(
+        files_paths,
+        parsed_arguments.world_assumption,
+        workers=parsed_arguments.workers,
+        backend=parsed_arguments.backend,
+        include=parsed_arguments.include,
+        exclude=parsed_arguments.exclude,
+        severities=parsed_arguments.severities,
+        snapshot_cache_dir=parsed_arguments.snapshot_cache_dir,
+        result_cache_path=parsed_arguments.result_cache,
+        store_dir=parsed_arguments.store_dir,
+        collect_metrics=parsed_arguments.metrics,
+    )
+
+    exit_code = EXIT_VALID
+    output_file = sys.stdout if parsed_arguments.output == "-" else open(parsed_arguments.output, "w", encoding="utf-8")
+    try:
+        for result_file in results:
+            output_file.write(json.dumps(result_file.to_dict()) + "\n")
+            output_file.flush()
+            if result_file.error is not None:
+                exit_code = EXIT_FAILED
+            elif not result_file.is_valid and exit_code == EXIT_VALID:
+                exit_code = EXIT_INVALID
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
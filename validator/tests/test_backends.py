@@ -0,0 +1,48 @@
+""" This script is used to verify, using pytest, that the 'native' backend is equivalent to the 'sparql' backend.
+
+Every test file listed in tests_list.csv is validated by all rules of both backends, which must report the same issues.
+"""
+import os
+
+import pytest
+
+from validator.modules.utils_graph import load_graph_safely
+from validator.validations.rules_general import execute_rule_switch
+from validator.vocab_lib.model_index import ModelIndex
+from validator.tests.test_main import LIST_OF_TESTS, package_dir, test_files_dir
+
+# Each file is listed once for each world-assumption, but the rules' results do not depend on it
+LIST_OF_FILES = list(dict.fromkeys(test_information[2] for test_information in LIST_OF_TESTS))
+
+# All rules covered by the tests are compared, independently of the rule a test file was written for
+LIST_OF_RULES = list(dict.fromkeys(test_information[1] for test_information in LIST_OF_TESTS))
+
+
+def get_issues_keys(issues_list: list) -> list[tuple[str, str, str]]:
+    """Return a sorted list of comparable keys of the received issues.
+
+    :param issues_list: List of ResultIssue objects.
+    :type issues_list: list[ResultIssue]
+    :return: Sorted list of (rule_code, issue_description, related_id) tuples.
+    :rtype: list[tuple[str, str, str]]
+    """
+    return sorted((issue.rule_code, issue.issue_description, str(issue.related_id)) for issue in issues_list)
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+def test_backends_equivalence(input_file: str):
+    """Validate a test file with the 'sparql' and 'native' backends and checks if both report the same issues.
+
+    :param input_file: Path to an input file that is going to be validated as a test.
+    :type input_file: str
+    """
+    input_file_path = os.path.join(package_dir, test_files_dir, input_file)
+    ontouml_model = load_graph_safely(input_file_path, "ttl")
+    model_index = ModelIndex(ontouml_model)
+
+    for rule_code in LIST_OF_RULES:
+        sparql_w_list, sparql_e_list = execute_rule_switch(ontouml_model, rule_code, model_index, backend="sparql")
+        native_w_list, native_e_list = execute_rule_switch(ontouml_model, rule_code, model_index, backend="native")
+
+        assert get_issues_keys(native_w_list) == get_issues_keys(sparql_w_list), rule_code
+        assert get_issues_keys(native_e_list) == get_issues_keys(sparql_e_list), rule_code
@@ -0,0 +1,86 @@
+""" This script is used to verify, using pytest, the validation of batches of OntoUML files in worker processes.
+
+Each file of a batch must be reported with the results of its individual validation, and failures must be isolated.
+"""
+import os
+import shutil
+
+import pytest
+
+from validator.lib import validate_ontouml_file, validate_ontouml_files
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+from validator.validations.rules_registry import get_registered_rules_codes
+
+
+def test_batch_validation():
+    """Checks that batch results are those of the validation of each file and that failures are isolated."""
+    files_paths = [get_test_file_path(input_file) for input_file in TEST_FILES]
+    missing_file_path = get_test_file_path("missing_file.ttl")
+
+    results = {
+        result.file_path: result
+        for result in validate_ontouml_files(
+            files_paths + [missing_file_path], "owa", workers=2, max_tasks_per_worker=1
+        )
+    }
+
+    assert set(results) == set(files_paths + [missing_file_path])
+    assert not results[missing_file_path].is_valid
+    assert results[missing_file_path].error is not None
+
+    for file_path in files_paths:
+        is_valid, w_list, e_list = validate_ontouml_file(file_path, "owa")
+        assert results[file_path].error is None
+        assert results[file_path].is_valid == is_valid
+        assert get_issues_keys(results[file_path].w_list) == get_issues_keys(w_list)
+        assert get_issues_keys(results[file_path].e_list) == get_issues_keys(e_list)
+
+
+def test_identical_files(tmp_path):
+    """Checks that every copy of a file is reported, with the results of the file."""
+    file_path = get_test_file_path(TEST_FILES[0])
+    copy_path = str(tmp_path / TEST_FILES[0])
+    shutil.copyfile(file_path, copy_path)
+
+    results = {result.file_path: result for result in validate_ontouml_files([file_path, copy_path], "owa", workers=2)}
+
+    assert set(results) == {file_path, copy_path}
+    assert get_issues_keys(results[copy_path].w_list) == get_issues_keys(results[file_path].w_list)
+    assert get_issues_keys(results[copy_path].e_list) == get_issues_keys(results[file_path].e_list)
+
+
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+def test_all_rules_executed(backend: str):
+    """Checks that a batch validation executes every registered rule without failing (e.g., on unknown rule codes).
+
+    :param backend: Implementation of the rules to be executed.
+    :type backend: str
+    """
+    files_paths = [get_test_file_path(input_file) for input_file in TEST_FILES]
+    results = list(
+        validate_ontouml_files(files_paths, "owa", workers=2, backend=backend, include=get_registered_rules_codes())
+    )
+
+    assert len(results) == len(files_paths)
+    assert all(result.error is None for result in results)
+
+
+def test_invalid_parameters():
+    """Checks that invalid parameters are reported before any file is validated."""
+    with pytest.raises(ValueError):
+        next(validate_ontouml_files([get_test_file_path(TEST_FILES[0])], "unknown_assumption"))
+
+
+def test_json_files():
+    """Checks that JSON files are validated in batches with the native backend unless another backend is requested."""
+    json_file_path = get_test_file_path(os.path.join("base files", "R_CL_ZGT_B03.json"))
+    file_path = get_test_file_path(TEST_FILES[0])
+
+    results = {result.file_path: result for result in validate_ontouml_files([json_file_path, file_path], "owa")}
+    assert all(result.error is None for result in results.values())
+    assert get_issues_keys(results[json_file_path].w_list) == get_issues_keys(
+        validate_ontouml_file(json_file_path, "owa")[1]
+    )
+
+    sparql_results = list(validate_ontouml_files([json_file_path], "owa", backend="sparql"))
+    assert sparql_results[0].error is not None
@@ -0,0 +1,109 @@
+""" This script is used to verify, using pytest, the SCCs and the transitive closure computed by the ClassHierarchy.
+
+The closure of random hierarchies (with cycles, self-generalizations and disconnected components) is compared with the
+one obtained by a breadth-first search from every class.
+"""
+import random
+from collections import deque
+
+import pytest
+
+from validator.vocab_lib.class_hierarchy import ClassHierarchy
+
+
+def get_reachable(model_class: str, adjacency: dict[str, list[str]]) -> set[str]:
+    """Return the classes reachable from a class through one or more edges, using a breadth-first search.
+
+    :param model_class: The class from which the search starts.
+    :type model_class: str
+    :param adjacency: Dictionary mapping each class to its neighbors (superclasses or subclasses).
+    :type adjacency: dict[str, list[str]]
+    :return: The set of reachable classes, which only contains the class itself if it is part of a cycle.
+    :rtype: set[str]
+    """
+    reachable = set()
+    queue = deque(adjacency.get(model_class, []))
+    while queue:
+        neighbor = queue.popleft()
+        if neighbor not in reachable:
+            reachable.add(neighbor)
+            queue.extend(adjacency.get(neighbor, []))
+    return reachable
+
+
+def get_subclasses(direct_superclasses: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Return the direct subclasses of each class, inverting the received direct superclasses."""
+    direct_subclasses = {}
+    for specific, generals in direct_superclasses.items():
+        for general in generals:
+            direct_subclasses.setdefault(general, []).append(specific)
+    return direct_subclasses
+
+
+def test_cycles():
+    """Checks the SCCs of a hierarchy with a cycle, a self-generalization and a disconnected component."""
+    direct_superclasses = {"b": ["a"], "c": ["b"], "a": ["c"], "d": ["c"], "e": ["e"], "g": ["f"]}
+    hierarchy = ClassHierarchy(["a", "b", "c", "d", "e", "f", "g", "h"], direct_superclasses)
+
+    assert hierarchy.get_cycles() == [["a", "b", "c"], ["e"]]
+    assert hierarchy.get_ancestors("a") == ["a", "b", "c"]
+    assert hierarchy.get_ancestors("d") == ["a", "b", "c"]
+    assert hierarchy.get_descendants("c") == ["a", "b", "c", "d"]
+    assert hierarchy.get_ancestors("e") == hierarchy.get_descendants("e") == ["e"]
+    assert hierarchy.get_ancestors("g") == ["f"] and hierarchy.get_descendants("f") == ["g"]
+    assert hierarchy.get_ancestors("h") == hierarchy.get_descendants("h") == []
+    assert hierarchy.get_ancestors("unknown") == [] and hierarchy.get_ancestor_bits("unknown") == 0
+
+
+def test_components_order():
+    """Checks that every component is listed after the components of its ancestors."""
+    direct_superclasses = {"d": ["c", "b"], "c": ["a"], "b": ["a"], "a": ["e"], "e": ["a"]}
+    hierarchy = ClassHierarchy(["d", "c", "b", "a", "e"], direct_superclasses)
+
+    for specific, generals in direct_superclasses.items():
+        for general in generals:
+            assert (
+                hierarchy.component_of[hierarchy.class_ids[general]]
+                <= hierarchy.component_of[hierarchy.class_ids[specific]]
+            )
+
+
+def test_bits():
+    """Checks the conversion between lists of classes and bitsets."""
+    hierarchy = ClassHierarchy(["a", "b", "c"], {"d": ["a"]})
+
+    assert hierarchy.id_classes == ["a", "b", "c", "d"]
+    assert hierarchy.get_bits(["c", "a", "unknown"]) == 0b101
+    assert hierarchy.decode_bits(0b1010) == ["b", "d"]
+    assert hierarchy.decode_bits(0) == []
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_closure_equivalence(seed: int):
+    """Checks that the closure of a random hierarchy is the one computed by breadth-first searches.
+
+    :param seed: Seed of the random hierarchy.
+    :type seed: int
+    """
+    rng = random.Random(seed)
+    num_classes = rng.randrange(1, 40)
+    classes = [f"c{class_number}" for class_number in range(num_classes)]
+
+    # Generalizations may be repeated, may form cycles and may reference classes that are not in the list of classes
+    direct_superclasses = {}
+    for _ in range(rng.randrange(num_classes * 2)):
+        specific = f"c{rng.randrange(num_classes + 3)}"
+        direct_superclasses.setdefault(specific, []).append(f"c{rng.randrange(num_classes + 3)}")
+    direct_subclasses = get_subclasses(direct_superclasses)
+    hierarchy = ClassHierarchy(classes, direct_superclasses)
+
+    for model_class in hierarchy.id_classes:
+        assert set(hierarchy.get_ancestors(model_class)) == get_reachable(model_class, direct_superclasses)
+        assert set(hierarchy.get_descendants(model_class)) == get_reachable(model_class, direct_subclasses)
+
+    cyclic_classes = {model_class for cycle in hierarchy.get_cycles() for model_class in cycle}
+    assert cyclic_classes == {
+        model_class
+        for model_class in hierarchy.id_classes
+        if model_class in get_reachable(model_class, direct_superclasses)
+    }
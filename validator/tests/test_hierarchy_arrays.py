@@ -0,0 +1,173 @@
+""" This script is used to verify, using pytest, the rules evaluated through the NumPy arrays of the hierarchy.
+
+The vectorized implementations of the native backend must report the same issues, in the same order, as the reference
+implementations, which use the transitive closure of the hierarchy.
+"""
+import random
+import time
+
+import pytest
+
+from validator.validations.rules_cl import rules_cl_native
+from validator.validations.rules_general import execute_rule_switch
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+from validator.vocab_lib.variables import ONTOUML_CLASS_STEREOTYPES
+
+np = pytest.importorskip("numpy")
+
+VECTORIZED_RULES = ["R_CL_ZGT", "R_CL_ALX"]
+
+INDEX_PREDICATES = [ONTOUML.name, ONTOUML.stereotype, ONTOUML.general, ONTOUML.specific]
+
+
+def get_issues_keys(issues_list: list) -> list[tuple[str, str, str]]:
+    """Return the comparable keys of the received issues, keeping their order."""
+    return [(issue.rule_code, issue.issue_description, str(issue.related_id)) for issue in issues_list]
+
+
+def get_random_index(num_classes: int, seed: int) -> ModelIndex:
+    """Return the index of a random model, whose classes may have several stereotypes and several superclasses.
+
+    Generalizations may form cycles and may reference classes that are not in the model.
+
+    :param num_classes: Number of classes of the model.
+    :type num_classes: int
+    :param seed: Seed of the random choices.
+    :type seed: int
+    :return: The index of the random model.
+    :rtype: ModelIndex
+    """
+    rng = random.Random(seed)
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+
+    for class_number in range(num_classes):
+        class_sts = rng.sample(ONTOUML_CLASS_STEREOTYPES, rng.choice([0, 1, 1, 1, 2]))
+        model_index.index_class(
+            f"https://example.org#c{class_number}",
+            {ONTOUML.name: [f"C{class_number}"], ONTOUML.stereotype: class_sts},
+        )
+
+    for gen_number in range(num_classes):
+        specific = f"https://example.org#c{rng.randrange(num_classes)}"
+        general = f"https://example.org#c{rng.randrange(num_classes + 2)}"
+        model_index.index_generalization(f"https://example.org#g{gen_number}", [general], [specific])
+
+    return model_index
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_vectorized_rules_equivalence(seed: int):
+    """Checks that the vectorized rules report the issues of the reference implementations on random models.
+
+    :param seed: Seed of the random model.
+    :type seed: int
+    """
+    model_index = get_random_index(60, seed)
+    focused_index = model_index.get_focused_index(model_index.classes[::3])
+
+    for rule_code in VECTORIZED_RULES:
+        for rule_index in [model_index, focused_index]:
+            sparql_w_list, sparql_e_list = execute_rule_switch(None, rule_code, rule_index, backend="sparql")
+            native_w_list, native_e_list = execute_rule_switch(None, rule_code, rule_index, backend="native")
+
+            assert get_issues_keys(native_w_list) == get_issues_keys(sparql_w_list), rule_code
+            assert get_issues_keys(native_e_list) == get_issues_keys(sparql_e_list), rule_code
+
+
+def test_vectorized_rules_fallback(monkeypatch):
+    """Checks that, without NumPy, the native rules run their reference implementations."""
+    model_index = get_random_index(30, 0)
+    native_results = [
+        execute_rule_switch(None, rule_code, model_index, backend="native") for rule_code in VECTORIZED_RULES
+    ]
+
+    monkeypatch.setattr(rules_cl_native, "is_vectorization_available", lambda: False)
+    model_index = get_random_index(30, 0)
+    for rule_code, (native_w_list, native_e_list) in zip(VECTORIZED_RULES, native_results):
+        fallback_w_list, fallback_e_list = execute_rule_switch(None, rule_code, model_index, backend="native")
+
+        assert get_issues_keys(fallback_w_list) == get_issues_keys(native_w_list)
+        assert get_issues_keys(fallback_e_list) == get_issues_keys(native_e_list)
+    assert model_index._hierarchy is not None and model_index._hierarchy_arrays is None
+
+
+def test_descendant_pairs():
+    """Checks the pairs of classes and subclasses of a hierarchy with repeated paths and a cycle."""
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+    for specific, general in [("b", "a"), ("c", "b"), ("c", "a"), ("d", "e"), ("e", "d"), ("f", "e")]:
+        model_index.index_generalization(f"{specific}{general}", [general], [specific])
+    model_index.index_class("a", {ONTOUML.stereotype: [str(ONTOUML.kind)]})
+    hierarchy_arrays = model_index.hierarchy_arrays
+
+    category_bits = hierarchy_arrays.get_category_bits([[str(ONTOUML.kind)], [str(ONTOUML.role)]])
+    assert category_bits.tolist() == [1 if model_class == "a" else 0 for model_class in hierarchy_arrays.id_classes]
+    assert hierarchy_arrays.get_category_mask([str(ONTOUML.kind)]).tolist() == [
+        model_class == "a" for model_class in hierarchy_arrays.id_classes
+    ]
+    assert not hierarchy_arrays.get_category_mask([str(ONTOUML.role)]).any()
+
+    sources, descendants = hierarchy_arrays.get_descendant_pairs(category_bits >= 0)
+    pairs = {
+        (hierarchy_arrays.id_classes[source], hierarchy_arrays.id_classes[descendant])
+        for source, descendant in zip(sources, descendants)
+    }
+    assert pairs == {
+        ("a", "b"),
+        ("a", "c"),
+        ("b", "c"),
+        ("d", "d"),
+        ("d", "e"),
+        ("d", "f"),
+        ("e", "d"),
+        ("e", "e"),
+        ("e", "f"),
+    }
+    assert len(sources) == len(pairs)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_descendant_pairs_closure(seed: int):
+    """Checks that the pairs of random and deep hierarchies are those of the closure, ordered by (source, descendant).
+
+    :param seed: Seed of the random model and of the selected sources.
+    :type seed: int
+    """
+    model_index = get_random_index(60, seed)
+    num_chain_classes = 300
+    for class_number in range(1, num_chain_classes):
+        model_index.index_generalization(f"chain{class_number}", [f"d{class_number - 1}"], [f"d{class_number}"])
+    model_index.index_generalization("chain_cycle", [f"d{num_chain_classes - 1}"], [f"d{num_chain_classes // 2}"])
+    hierarchy_arrays = model_index.hierarchy_arrays
+    hierarchy = model_index.hierarchy
+
+    rng = random.Random(seed)
+    sources_mask = np.array([rng.random() < 0.5 for _ in hierarchy_arrays.id_classes])
+    sources, descendants = hierarchy_arrays.get_descendant_pairs(sources_mask)
+
+    expected_pairs = [
+        (source, hierarchy_arrays.class_ids[descendant])
+        for source in np.flatnonzero(sources_mask).tolist()
+        for descendant in hierarchy.get_descendants(hierarchy_arrays.id_classes[source])
+    ]
+    assert list(zip(sources.tolist(), descendants.tolist())) == sorted(expected_pairs)
+
+
+def test_vectorized_rules_performance():
+    """Checks that the vectorized rules evaluate a model with 100000 classes in less than a second."""
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+    stereotypes = [str(ONTOUML.kind), str(ONTOUML.subkind), str(ONTOUML.phase), str(ONTOUML.role)]
+    for class_number in range(100000):
+        class_st = stereotypes[0] if class_number % 1000 == 0 else stereotypes[class_number % 3 + 1]
+        model_index.index_class(
+            f"c{class_number}", {ONTOUML.name: [f"C{class_number}"], ONTOUML.stereotype: [class_st]}
+        )
+        if class_number:
+            model_index.index_generalization(f"g{class_number}", [f"c{(class_number - 1) // 3}"], [f"c{class_number}"])
+
+    start_time = time.perf_counter()
+    issues_lists = [
+        execute_rule_switch(None, rule_code, model_index, backend="native") for rule_code in VECTORIZED_RULES
+    ]
+    assert time.perf_counter() - start_time < 1.0
+    assert issues_lists[0][1] and issues_lists[1][1]
@@ -0,0 +1,177 @@
+""" This script is used to verify, using pytest, that the incremental validation is equivalent to a full validation.
+
+Every test file listed in tests_list.csv is loaded in an IncrementalValidator and changed by a sequence of edits. After
+each edit, the incremental results must be the same as the ones of the validation of the whole changed model.
+"""
+import os
+
+import pytest
+from rdflib import Graph, Literal, RDF, URIRef
+
+from validator.lib import validate_ontouml_model
+from validator.modules.model_generator import MODEL_NAMESPACE, ModelGenerator
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import LIST_OF_FILES, get_issues_keys
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations.incremental_validation import IncrementalValidator
+from validator.vocab_lib.hierarchy_arrays import HierarchyArrays
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+
+NEW_CLASS = URIRef("https://example.org#IncrementalClass")
+NEW_GENERALIZATION = URIRef("https://example.org#IncrementalGeneralization")
+
+
+def get_edits(ontouml_model: Graph) -> list[tuple[list[tuple], list[tuple]]]:
+    """Return a sequence of edits, as (added_triples, removed_triples) tuples, applicable to the received model.
+
+    :param ontouml_model: The OntoUML model to be edited.
+    :type ontouml_model: Graph
+    :return: List of edits, to be applied in order.
+    :rtype: list[tuple[list[tuple], list[tuple]]]
+    """
+    classes = sorted(ontouml_model.subjects(RDF.type, ONTOUML.Class))
+    gens = sorted(ontouml_model.subjects(ONTOUML.specific, None, unique=True))
+    if not classes:
+        return []
+    first_class = classes[0]
+    last_class = classes[-1]
+
+    return [
+        # Changes the stereotype of a class
+        (
+            [(first_class, ONTOUML.stereotype, ONTOUML.kind)],
+            [
+                (first_class, ONTOUML.stereotype, class_st)
+                for class_st in ontouml_model.objects(first_class, ONTOUML.stereotype)
+            ],
+        ),
+        # Adds a class and a generalization in which it is the general class of an existing class
+        (
+            [
+                (NEW_CLASS, RDF.type, ONTOUML.Class),
+                (NEW_CLASS, ONTOUML.name, Literal("IncrementalClass")),
+                (NEW_CLASS, ONTOUML.stereotype, ONTOUML.role),
+                (NEW_GENERALIZATION, RDF.type, ONTOUML.Generalization),
+                (NEW_GENERALIZATION, ONTOUML.general, NEW_CLASS),
+                (NEW_GENERALIZATION, ONTOUML.specific, last_class),
+            ],
+            [],
+        ),
+        # Creates a cycle by making an existing class the general class of the new one
+        ([(NEW_GENERALIZATION, ONTOUML.specific, first_class), (NEW_GENERALIZATION, ONTOUML.general, last_class)], []),
+        # Removes the specific classes of an existing generalization
+        (
+            [],
+            [(gens[0], ONTOUML.specific, specific) for specific in ontouml_model.objects(gens[0], ONTOUML.specific)]
+            if gens
+            else [],
+        ),
+        # Renames a class and changes its stereotype to enumeration
+        (
+            [(last_class, ONTOUML.name, Literal("Renamed")), (last_class, ONTOUML.stereotype, ONTOUML.enumeration)],
+            [(last_class, ONTOUML.name, name) for name in ontouml_model.objects(last_class, ONTOUML.name)]
+            + [
+                (last_class, ONTOUML.stereotype, class_st)
+                for class_st in ontouml_model.objects(last_class, ONTOUML.stereotype)
+            ],
+        ),
+        # Removes a class
+        ([], [(first_class, RDF.type, ONTOUML.Class)]),
+        # Restores the removed class
+        ([(first_class, RDF.type, ONTOUML.Class)], []),
+    ]
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+def test_incremental_validation(input_file: str):
+    """Edits a test file through an IncrementalValidator and checks its results against full validations.
+
+    :param input_file: Path to an input file that is going to be validated as a test.
+    :type input_file: str
+    """
+    input_file_path = os.path.join(package_dir, test_files_dir, input_file)
+    ontouml_model = load_graph_safely(input_file_path, "ttl")
+    incremental_validator = IncrementalValidator(ontouml_model, "owa")
+
+    is_valid, w_list, e_list = incremental_validator.get_results()
+    full_valid, full_w_list, full_e_list = validate_ontouml_model(ontouml_model, "owa", backend="native")
+    assert (is_valid, get_issues_keys(w_list), get_issues_keys(e_list)) == (
+        full_valid,
+        get_issues_keys(full_w_list),
+        get_issues_keys(full_e_list),
+    )
+
+    # Edits are computed after the previous ones are applied, as they depend on the current state of the model
+    for edit_number in range(len(get_edits(ontouml_model))):
+        added_triples, removed_triples = get_edits(ontouml_model)[edit_number]
+        is_valid, w_list, e_list = incremental_validator.apply_changes(added_triples, removed_triples)
+
+        full_model = Graph()
+        for triple in ontouml_model:
+            full_model.add(triple)
+        full_valid, full_w_list, full_e_list = validate_ontouml_model(full_model, "owa", backend="native")
+
+        assert (is_valid, get_issues_keys(w_list), get_issues_keys(e_list)) == (
+            full_valid,
+            get_issues_keys(full_w_list),
+            get_issues_keys(full_e_list),
+        ), edit_number
+
+
+def test_incremental_work_is_bounded(monkeypatch):
+    """Checks that a change to a class only traverses its own hierarchy instead of rebuilding the whole hierarchy.
+
+    The generated model has hierarchies of 7 classes (c0 to c6 in the first one), so the superclasses traversed by the
+    rules after a change to a class of the first hierarchy must be classes of that hierarchy.
+    """
+    rules_codes = ["R_CL_AIB", "R_CL_ZGT", "R_CL_ALX"]
+    ontouml_model = Graph().parse(
+        data=ModelGenerator(300, hierarchy_depth=3, fan_out=2, seed=7).generate(), format="ttl"
+    )
+    incremental_validator = IncrementalValidator(ontouml_model, "owa", include=rules_codes)
+    first_hierarchy = {MODEL_NAMESPACE + f"c{class_number}" for class_number in range(7)}
+    leaf_class = URIRef(MODEL_NAMESPACE + "c6")
+
+    calls = {"arrays": 0, "pairs": 0}
+    traversed_classes = set()
+    get_superclasses = ModelIndex.get_superclasses
+
+    def count_arrays(*args, **kwargs):
+        calls["arrays"] += 1
+
+    def count_pairs(*args, **kwargs):
+        calls["pairs"] += 1
+
+    def record_superclasses(model_index: ModelIndex, ontouml_class: str) -> list[str]:
+        superclasses = get_superclasses(model_index, ontouml_class)
+        traversed_classes.update([ontouml_class, *superclasses])
+        return superclasses
+
+    edits = [
+        # Changes the stereotype of a leaf class
+        (
+            [(leaf_class, ONTOUML.stereotype, ONTOUML.role)],
+            list(ontouml_model.triples((leaf_class, ONTOUML.stereotype, None))),
+        ),
+        # Removes the generalization between the leaf class and its superclass
+        ([], list(ontouml_model.triples((None, ONTOUML.specific, leaf_class)))),
+    ]
+    for added_triples, removed_triples in edits:
+        with monkeypatch.context() as patches:
+            patches.setattr(HierarchyArrays, "__init__", count_arrays)
+            patches.setattr(HierarchyArrays, "get_descendant_pairs", count_pairs)
+            patches.setattr(ModelIndex, "get_superclasses", record_superclasses)
+            is_valid, w_list, e_list = incremental_validator.apply_changes(added_triples, removed_triples)
+
+        full_valid, full_w_list, full_e_list = validate_ontouml_model(
+            ontouml_model, "owa", backend="native", include=rules_codes
+        )
+        assert (is_valid, get_issues_keys(w_list), get_issues_keys(e_list)) == (
+            full_valid,
+            get_issues_keys(full_w_list),
+            get_issues_keys(full_e_list),
+        )
+
+    assert traversed_classes and traversed_classes <= first_hierarchy
+    assert calls == {"arrays": 0, "pairs": 0}
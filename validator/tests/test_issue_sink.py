@@ -0,0 +1,118 @@
+""" This script is used to perform tests on the streaming of issues to sinks using pytest."""
+import io
+import json
+
+import pytest
+from rdflib import RDF, Graph, Literal, URIRef
+
+from validator.lib import stream_validation_issues, validate_ontouml_model
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import get_issues_keys
+from validator.tests.test_lib import TEST_FILES, get_test_file_path
+from validator.validations.issue_sink import JsonLinesSink, MemorySink, SarifSink
+from validator.vocab_lib.ontouml import ONTOUML
+
+
+class CountingSink(MemorySink):
+    """A MemorySink that counts the issues sent to it, including the ones it does not accept."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize a CountingSink object with the caps described in IssueSink."""
+        super().__init__(*args, **kwargs)
+        self.num_received = 0
+
+    def add(self, issue, severity):
+        """Count and accept an issue."""
+        self.num_received += 1
+        super().add(issue, severity)
+
+
+def create_model_without_stereotypes(num_classes: int) -> Graph:
+    """Return an OntoUML model with classes without stereotypes, each one reported as a warning by R_CL_GJU.
+
+    :param num_classes: The number of classes of the model.
+    :type num_classes: int
+    :return: The OntoUML model.
+    :rtype: Graph
+    """
+    ontouml_model = Graph()
+    for class_number in range(num_classes):
+        class_id = URIRef(f"https://example.org#class{class_number}")
+        ontouml_model.add((class_id, RDF.type, ONTOUML.Class))
+        ontouml_model.add((class_id, ONTOUML.name, Literal(f"Class {class_number}")))
+    return ontouml_model
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+@pytest.mark.parametrize("world_assumption", ["owa", "cwa"])
+def test_memory_sink_equivalence(input_file: str, world_assumption: str):
+    """Checks that the issues streamed without caps are the ones returned by validate_ontouml_model.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :param world_assumption: The world-assumption used in the validation.
+    :type world_assumption: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path(input_file))
+    is_valid, w_list, e_list = validate_ontouml_model(ontouml_model, world_assumption)
+
+    issue_sink = MemorySink(world_assumption)
+    assert stream_validation_issues(ontouml_model, issue_sink) == is_valid
+    assert get_issues_keys(issue_sink.w_list) == get_issues_keys(w_list)
+    assert get_issues_keys(issue_sink.e_list) == get_issues_keys(e_list)
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+def test_capped_sink_validity(input_file: str):
+    """Checks that caps limit the issues of each rule without changing the validity of the model.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path(input_file))
+    is_valid, _, _ = validate_ontouml_model(ontouml_model, "owa")
+
+    issue_sink = MemorySink("owa", max_issues_per_rule=1, max_issues=3)
+    assert stream_validation_issues(ontouml_model, issue_sink) == is_valid
+    assert issue_sink.num_issues <= 3
+    issues_rules = [issue.rule_code for issue in issue_sink.w_list + issue_sink.e_list]
+    assert len(issues_rules) == len(set(issues_rules))
+
+
+def test_cap_stops_enumeration():
+    """Checks that a rule stops its enumeration when its cap is reached, unless it may still report an error."""
+    ontouml_model = create_model_without_stereotypes(50)
+
+    issue_sink = CountingSink("cwa", max_issues_per_rule=2)
+    assert not stream_validation_issues(ontouml_model, issue_sink, include=["R_CL_GJU"])
+    assert (issue_sink.num_errors, issue_sink.num_received) == (2, 3)
+    assert issue_sink.truncated_rules == {"R_CL_GJU"}
+
+    # In OWA, the warnings of R_CL_GJU are dropped, but its enumeration continues, as it may still report an error
+    issue_sink = CountingSink("owa", max_issues_per_rule=2)
+    assert stream_validation_issues(ontouml_model, issue_sink, include=["R_CL_GJU"])
+    assert (issue_sink.num_warnings, issue_sink.num_received) == (2, 50)
+
+
+def test_file_sinks():
+    """Checks that the JSON Lines and SARIF sinks write all accepted issues."""
+    ontouml_model = create_model_without_stereotypes(3)
+
+    jsonl_file = io.StringIO()
+    with JsonLinesSink(jsonl_file, "owa") as issue_sink:
+        stream_validation_issues(ontouml_model, issue_sink, include=["R_CL_GJU"])
+    lines = [json.loads(line) for line in jsonl_file.getvalue().splitlines()]
+    assert [(line["rule_code"], line["severity"]) for line in lines] == [("R_CL_GJU", "warning")] * 3
+    assert sorted(line["issue_description"] for line in lines) == [
+        f"The class 'Class {class_number}' has no stereotype." for class_number in range(3)
+    ]
+
+    sarif_file = io.StringIO()
+    with SarifSink(sarif_file, "cwa", max_issues=2) as issue_sink:
+        stream_validation_issues(ontouml_model, issue_sink, include=["R_CL_GJU", "R_CL_BWZ"])
+    sarif_log = json.loads(sarif_file.getvalue())
+    sarif_run = sarif_log["runs"][0]
+    assert sarif_log["version"] == "2.1.0"
+    assert len(sarif_run["results"]) == 2
+    assert all(result["level"] == "error" for result in sarif_run["results"])
+    assert [rule["id"] for rule in sarif_run["tool"]["driver"]["rules"]] == ["R_CL_BWZ"]
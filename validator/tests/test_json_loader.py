@@ -0,0 +1,253 @@
+""" This script is used to perform tests on the loading and validation of OntoUML JSON files using pytest.
+
+The JSON files of the test models are compared to their graph versions (produced by ontouml-json2graph).
+"""
+import json
+import os
+
+import pytest
+
+from validator import lib
+from validator.lib import validate_ontouml_file, validate_ontouml_json_file
+from validator.modules import json_loader
+from validator.modules.json_loader import (
+    DEFAULT_BASE_URI,
+    _build_json_objects,
+    get_nature_uri,
+    load_model_index_from_json,
+)
+from validator.modules.utils_graph import load_graph_safely
+from validator.modules.validation_metrics import ValidationMetrics
+from validator.tests.test_lib import get_issues_keys, get_test_file_path
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML_NAMESPACE
+
+BASE_FILES_DIR = get_test_file_path("base files")
+
+# Graph versions that were edited after the conversion (e.g., to add a second stereotype) or of other models
+NOT_CONVERTED_FILES = ["R_CL_BWZ", "R_CL_GJU_D", "R_CL_GJU_E", "R_CL_GJU_F", "R_CL_QJC_F", "R_CL_QJC_H"]
+
+JSON_TEST_FILES = sorted(
+    file_name[: -len(".json")]
+    for file_name in os.listdir(BASE_FILES_DIR)
+    if file_name.endswith(".json") and not file_name.startswith(tuple(NOT_CONVERTED_FILES))
+)
+
+INDEX_ATTRIBUTES = [
+    "class_names",
+    "class_stereotypes",
+    "class_restricted_to",
+    "class_literals",
+    "class_attributes",
+    "class_is_abstract",
+    "class_order",
+    "generalization_generals",
+    "generalization_specifics",
+]
+
+
+def get_sorted_values(index_dict: dict) -> dict:
+    """Return a copy of a dictionary of the index with its lists of values sorted."""
+    return {key: sorted(values, key=str) for key, values in index_dict.items()}
+
+
+@pytest.mark.parametrize("test_model", JSON_TEST_FILES)
+def test_json_index(test_model: str):
+    """Checks that the index loaded from an OntoUML JSON file is the index of its graph version.
+
+    :param test_model: Name of the test model.
+    :type test_model: str
+    """
+    json_index = load_model_index_from_json(os.path.join(BASE_FILES_DIR, test_model + ".json"))
+    graph_index = ModelIndex(load_graph_safely(get_test_file_path(test_model + ".ttl")))
+
+    assert sorted(json_index.classes) == sorted(graph_index.classes)
+    for index_attribute in INDEX_ATTRIBUTES:
+        assert get_sorted_values(getattr(json_index, index_attribute)) == get_sorted_values(
+            getattr(graph_index, index_attribute)
+        )
+    assert get_sorted_values(json_index.direct_superclasses) == get_sorted_values(graph_index.direct_superclasses)
+
+
+@pytest.mark.parametrize("test_model", JSON_TEST_FILES)
+@pytest.mark.parametrize("world_assumption", ["owa", "cwa"])
+def test_json_validation(test_model: str, world_assumption: str):
+    """Checks that the validation of an OntoUML JSON file finds the issues found in its graph version.
+
+    :param test_model: Name of the test model.
+    :type test_model: str
+    :param world_assumption: The world-assumption used in the validation.
+    :type world_assumption: str
+    """
+    is_valid, w_list, e_list = validate_ontouml_json_file(
+        os.path.join(BASE_FILES_DIR, test_model + ".json"), world_assumption
+    )
+    graph_is_valid, graph_w_list, graph_e_list = validate_ontouml_file(
+        get_test_file_path(test_model + ".ttl"), world_assumption, "native"
+    )
+
+    assert is_valid == graph_is_valid
+    assert sorted(get_issues_keys(w_list)) == sorted(get_issues_keys(graph_w_list))
+    assert sorted(get_issues_keys(e_list)) == sorted(get_issues_keys(graph_e_list))
+
+
+def test_json_file_routing():
+    """Checks that validate_ontouml_file validates JSON files without graphs and measures their loading."""
+    json_file_path = os.path.join(BASE_FILES_DIR, "R_CL_ZGT_B03.json")
+    metrics = ValidationMetrics()
+    results = validate_ontouml_file(json_file_path, "cwa", workers=2, executor="process", metrics=metrics)
+
+    assert metrics.parse_seconds > 0 and metrics.num_triples is None
+    assert get_issues_keys(results[2]) == get_issues_keys(validate_ontouml_json_file(json_file_path, "cwa")[2])
+
+    with pytest.raises(OSError):
+        validate_ontouml_file(os.path.join(BASE_FILES_DIR, "missing.json"), "owa")
+
+
+def test_json_file_options(tmp_path, monkeypatch):
+    """Checks that JSON files use the result cache and reject the options that only apply to graph files."""
+    json_file_path = os.path.join(BASE_FILES_DIR, "R_CL_ZGT_B03.json")
+    result_cache_path = str(tmp_path / "results.sqlite")
+    _, w_list, e_list = validate_ontouml_file(json_file_path, "owa", "native")
+
+    num_loads = []
+    load_function = lib.load_model_index_from_json
+
+    def count_load(*args, **kwargs):
+        num_loads.append(args)
+        return load_function(*args, **kwargs)
+
+    monkeypatch.setattr(lib, "load_model_index_from_json", count_load)
+    for _ in range(2):
+        _, cached_w_list, cached_e_list = validate_ontouml_file(
+            json_file_path, "owa", result_cache_path=result_cache_path
+        )
+        assert get_issues_keys(cached_w_list) == get_issues_keys(w_list)
+        assert get_issues_keys(cached_e_list) == get_issues_keys(e_list)
+    assert len(num_loads) == 1
+
+    # Results depend on the base URI, so they are not shared by validations with different base URIs
+    validate_ontouml_json_file(
+        json_file_path, "owa", base_uri="https://example.org/other#", result_cache_path=result_cache_path
+    )
+    assert len(num_loads) == 2
+
+    for graph_options in [
+        {"backend": "sparql"},
+        {"snapshot_cache_dir": str(tmp_path / "snapshots")},
+        {"store_dir": str(tmp_path / "stores")},
+    ]:
+        with pytest.raises(ValueError):
+            validate_ontouml_file(json_file_path, "owa", **graph_options)
+
+
+def test_json_events_builder():
+    """Checks that the builder used with incremental parsers decodes documents as json.loads with a pairs hook."""
+    document = {"a": [1, 2.5, {"b": None, "c": [True, {}]}], "d": "text", "e": []}
+
+    def get_events(value):
+        if isinstance(value, dict):
+            yield "start_map", None
+            for key, item in value.items():
+                yield "map_key", key
+                yield from get_events(item)
+            yield "end_map", None
+        elif isinstance(value, list):
+            yield "start_array", None
+            for item in value:
+                yield from get_events(item)
+            yield "end_array", None
+        else:
+            yield "value", value
+
+    def object_pairs_hook(pairs):
+        return {**dict(pairs), "keys": [key for key, _ in pairs]}
+
+    assert _build_json_objects(get_events(document), object_pairs_hook) == json.loads(
+        json.dumps(document), object_pairs_hook=object_pairs_hook
+    )
+    assert get_nature_uri("functional-complex") == ONTOUML_NAMESPACE + "functionalComplexNature"
+
+
+@pytest.mark.parametrize("test_model", JSON_TEST_FILES)
+def test_streaming_and_fallback_indexes(test_model: str, monkeypatch):
+    """Checks that the index loaded incrementally with ijson is identical to the one loaded with json.load.
+
+    :param test_model: Name of the test model.
+    :type test_model: str
+    """
+    pytest.importorskip("ijson")
+    json_file_path = os.path.join(BASE_FILES_DIR, test_model + ".json")
+    streaming_index = load_model_index_from_json(json_file_path)
+    monkeypatch.setattr(json_loader, "ijson", None)
+    fallback_index = load_model_index_from_json(json_file_path)
+
+    assert streaming_index.classes == fallback_index.classes
+    for index_attribute in INDEX_ATTRIBUTES:
+        assert getattr(streaming_index, index_attribute) == getattr(fallback_index, index_attribute)
+    assert streaming_index.direct_superclasses == fallback_index.direct_superclasses
+
+
+@pytest.mark.parametrize("is_streaming", [True, False])
+def test_minimal_elements(is_streaming: bool, tmp_path, monkeypatch):
+    """Checks that classes with only their ids and types are indexed, while references to classes are not.
+
+    :param is_streaming: Whether the file is read with ijson (if installed) or with json.load.
+    :type is_streaming: bool
+    """
+    if is_streaming:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(json_loader, "ijson", None)
+
+    document = {
+        "id": "project",
+        "type": "Project",
+        "model": {
+            "id": "package",
+            "type": "Package",
+            "contents": [
+                {"id": "minimal", "type": "Class"},
+                {
+                    "id": "gen",
+                    "type": "Generalization",
+                    "general": {"id": "minimal", "type": "Class"},
+                    "specific": {"id": "missing", "type": "Class"},
+                },
+            ],
+        },
+        "diagrams": [
+            {"id": "diagram", "type": "Diagram", "contents": [{"modelElement": {"id": "other", "type": "Class"}}]}
+        ],
+    }
+    json_file_path = str(tmp_path / "minimal.json")
+    with open(json_file_path, "w", encoding="utf-8") as json_file:
+        json.dump(document, json_file)
+
+    model_index = load_model_index_from_json(json_file_path)
+    assert model_index.classes == [DEFAULT_BASE_URI + "minimal"]
+    assert model_index.generalization_generals == {DEFAULT_BASE_URI + "gen": [DEFAULT_BASE_URI + "minimal"]}
+    assert model_index.get_name(DEFAULT_BASE_URI + "minimal") is None
+
+
+@pytest.mark.parametrize("is_streaming", [True, False])
+@pytest.mark.parametrize("contents", ['{"id": "project", "type": "Project", ', "", "[1, 2] 3"])
+def test_malformed_json(is_streaming: bool, contents: str, tmp_path, monkeypatch):
+    """Checks that files that are not valid JSON documents are reported as IO errors, as other unreadable files.
+
+    :param is_streaming: Whether the file is read with ijson (if installed) or with json.load.
+    :type is_streaming: bool
+    :param contents: The contents of the file.
+    :type contents: str
+    """
+    if is_streaming:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(json_loader, "ijson", None)
+
+    json_file_path = str(tmp_path / "malformed.json")
+    with open(json_file_path, "w", encoding="utf-8") as json_file:
+        json_file.write(contents)
+
+    with pytest.raises(OSError):
+        load_model_index_from_json(json_file_path)
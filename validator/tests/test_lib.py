@@ -0,0 +1,129 @@
+""" This script is used to perform tests on the library functions of the ontouml-validator using pytest.
+
+The validation of complete files is tested with different world-assumptions, numbers of workers and backends.
+"""
+import os
+
+import pytest
+
+from validator.lib import validate_ontouml_file
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations.rules_registry import get_registered_rules_codes, select_rules_codes
+
+TEST_FILES = ["R_CL_GJU_F.ttl", "R_CL_ALX_D01.ttl", "R_CL_EGT_M.ttl", "R_CL_XJZ_A.ttl"]
+
+
+def get_test_file_path(input_file: str) -> str:
+    """Return the path of a test file.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :return: Path of the test file.
+    :rtype: str
+    """
+    return os.path.join(package_dir, test_files_dir, input_file)
+
+
+def get_issues_keys(issues_list: list) -> list[tuple[str, str, str]]:
+    """Return a list of comparable keys of the received issues, keeping their order.
+
+    :param issues_list: List of ResultIssue objects.
+    :type issues_list: list[ResultIssue]
+    :return: List of (rule_code, issue_description, related_id) tuples.
+    :rtype: list[tuple[str, str, str]]
+    """
+    return [(issue.rule_code, issue.issue_description, str(issue.related_id)) for issue in issues_list]
+
+
+def test_only_registered_rules_executed():
+    """Checks that the validation of a complete file executes only implemented (i.e., registered) rules."""
+    is_valid, w_list, e_list = validate_ontouml_file(get_test_file_path("R_CL_GJU_F.ttl"), "owa")
+
+    registered_rules_codes = get_registered_rules_codes()
+    assert registered_rules_codes
+    assert all(issue.rule_code in registered_rules_codes for issue in w_list + e_list)
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+def test_cwa_warnings_are_errors(input_file: str):
+    """Checks that, in CWA, the warnings found in OWA are reported as errors.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    owa_valid, owa_w_list, owa_e_list = validate_ontouml_file(get_test_file_path(input_file), "owa")
+    cwa_valid, cwa_w_list, cwa_e_list = validate_ontouml_file(get_test_file_path(input_file), "cwa")
+
+    assert not cwa_w_list
+    assert get_issues_keys(cwa_e_list) == get_issues_keys(owa_e_list + owa_w_list)
+    assert cwa_valid == (not owa_e_list and not owa_w_list)
+
+
+@pytest.mark.parametrize(
+    "include, exclude, expected_rules",
+    [
+        (["R_CL_GJU", "R_CL_BWZ"], None, ["R_CL_BWZ", "R_CL_GJU"]),
+        (["R_CL_E*"], None, ["R_CL_EDA", "R_CL_EGT", "R_CL_EMV"]),
+        (["CL"], ["R_CL_[A-E]*"], ["R_CL_GJU", "R_CL_JOJ", "R_CL_QJC", "R_CL_UMC", "R_CL_XJZ", "R_CL_YOK", "R_CL_ZGT"]),
+        (["R_GE_M*", "R_GE_X*"], None, ["R_GE_MDR", "R_GE_MXI", "R_GE_XRS"]),
+        (["r_cl_e*"], ["r_cl_egt"], ["R_CL_EDA", "R_CL_EMV"]),
+    ],
+)
+def test_rules_selection(include: list[str], exclude: list[str], expected_rules: list[str]):
+    """Checks that only the selected rules are executed and that they report the same issues as in a full validation.
+
+    :param include: Selectors of the rules to be executed.
+    :type include: list[str]
+    :param exclude: Selectors of the rules not to be executed.
+    :type exclude: list[str]
+    :param expected_rules: Codes of the rules expected to be selected.
+    :type expected_rules: list[str]
+    """
+    assert select_rules_codes(include, exclude) == expected_rules
+
+    for input_file in TEST_FILES:
+        file_path = get_test_file_path(input_file)
+        _, all_w_list, all_e_list = validate_ontouml_file(file_path, "owa")
+        _, w_list, e_list = validate_ontouml_file(file_path, "owa", include=include, exclude=exclude)
+
+        assert get_issues_keys(w_list) == [key for key in get_issues_keys(all_w_list) if key[0] in expected_rules]
+        assert get_issues_keys(e_list) == [key for key in get_issues_keys(all_e_list) if key[0] in expected_rules]
+
+
+def test_lowercase_group():
+    """Checks that group names are case-insensitive."""
+    assert select_rules_codes(["cl"]) == select_rules_codes(["CL"]) != []
+    assert select_rules_codes(exclude=["ge"]) == select_rules_codes(exclude=["GE"])
+
+
+@pytest.mark.parametrize("include, exclude", [(["R_CL_EGTX"], None), (["CL"], ["R_CL_EGTX"]), (["XX"], None)])
+def test_unknown_selectors(include: list[str], exclude: list[str]):
+    """Checks that selectors matching no registered rule are rejected instead of being ignored.
+
+    :param include: Selectors of the rules to be executed.
+    :type include: list[str]
+    :param exclude: Selectors of the rules not to be executed.
+    :type exclude: list[str]
+    """
+    with pytest.raises(ValueError):
+        select_rules_codes(include, exclude)
+
+    with pytest.raises(ValueError):
+        validate_ontouml_file(get_test_file_path(TEST_FILES[0]), "owa", include=include, exclude=exclude)
+
+
+def test_severities_selection():
+    """Checks that only issues of the selected severities are reported and that invalid severities are rejected."""
+    assert "R_CL_XJZ" not in select_rules_codes(severities=["warning"])
+    assert "R_CL_UMC" not in select_rules_codes(severities=["error"])
+
+    for input_file in TEST_FILES:
+        file_path = get_test_file_path(input_file)
+        _, all_w_list, all_e_list = validate_ontouml_file(file_path, "owa")
+        _, w_list, e_list = validate_ontouml_file(file_path, "owa", severities=["warning"])
+
+        assert get_issues_keys(w_list) == get_issues_keys(all_w_list)
+        assert not e_list
+
+    with pytest.raises(ValueError):
+        select_rules_codes(severities=["info"])
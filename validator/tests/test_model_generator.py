@@ -0,0 +1,40 @@
+""" This script is used to perform tests on the generator of synthetic OntoUML models using pytest."""
+import io
+
+from rdflib import RDF, Graph, URIRef
+
+from validator.modules.model_generator import MODEL_NAMESPACE, ModelGenerator, get_num_classes_for_triples
+from validator.vocab_lib.ontouml import ONTOUML
+
+
+def test_generated_model_contents():
+    """Checks that the generated models are deterministic, parse as Turtle and have the requested elements."""
+    model_generator = ModelGenerator(
+        100, hierarchy_depth=3, fan_out=2, num_cycles=2, enumerations_ratio=0.1, literals_per_enumeration=4, seed=7
+    )
+    model_turtle = model_generator.generate()
+    assert model_turtle == ModelGenerator(**model_generator.get_settings()).generate()
+    assert model_turtle != ModelGenerator(**{**model_generator.get_settings(), "seed": 8}).generate()
+
+    ontouml_model = Graph().parse(data=model_turtle, format="ttl")
+    assert len(ontouml_model) == model_generator.write(io.StringIO())
+    assert len(list(ontouml_model.subjects(RDF.type, ONTOUML.Class))) == 100
+    assert len(list(ontouml_model.subjects(ONTOUML.stereotype, ONTOUML.enumeration))) == 10
+    assert len(list(ontouml_model.triples((None, ONTOUML.literal, None)))) == 40
+    assert len(list(ontouml_model.subjects(RDF.type, ONTOUML.Relation))) == 50
+
+    # Hierarchies of 7 classes: 90 classes in 12 complete hierarchies and an incomplete one, plus 2 cycles
+    assert len(list(ontouml_model.subjects(RDF.type, ONTOUML.Generalization))) == 90 - 13 + 2
+
+    # Each cycle closes the path from the root of a hierarchy to its last class
+    cycle_id = URIRef(MODEL_NAMESPACE + "cycle0")
+    assert (cycle_id, ONTOUML.general, URIRef(MODEL_NAMESPACE + "c6")) in ontouml_model
+    assert (cycle_id, ONTOUML.specific, URIRef(MODEL_NAMESPACE + "c0")) in ontouml_model
+
+
+def test_num_classes_estimation():
+    """Checks that the number of classes estimated for a number of triples generates approximately that many."""
+    for num_triples in [1000, 50000]:
+        num_classes = get_num_classes_for_triples(num_triples, num_cycles=1, relations_ratio=1.0)
+        generated_triples = ModelGenerator(num_classes, num_cycles=1, relations_ratio=1.0).write(io.StringIO())
+        assert abs(generated_triples - num_triples) < 0.02 * num_triples
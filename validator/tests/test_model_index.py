@@ -0,0 +1,154 @@
+""" This script is used to verify, using pytest, the lookups of the ModelIndex.
+
+The index of each test file listed in tests_list.csv must return the same results as the functions of the vocab_lib
+that query the graph. Other tests check the lookups on small models built in memory.
+"""
+import os
+
+import pytest
+from rdflib import Graph, Literal, RDF, URIRef
+
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import LIST_OF_FILES
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.vocab_lib.functions import (
+    get_all_classes,
+    get_all_subclasses,
+    get_all_superclasses,
+    get_class_name,
+    get_class_stereotype,
+    get_classes_of_types,
+    get_direct_subclasses,
+    get_direct_superclasses,
+)
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+from validator.vocab_lib.variables import ONTOUML_ST_SORTALS
+
+EXAMPLE = "https://example.org#"
+
+
+def get_sorted(model_classes: list) -> list[str]:
+    """Return the received classes as sorted strings, as queries of the graph may return them as URIRefs."""
+    return sorted(str(model_class) for model_class in model_classes)
+
+
+def get_example_model() -> Graph:
+    """Return a small model with a class with two stereotypes, a class without name and a generalization set."""
+    ontouml_model = Graph()
+    for class_name, class_sts in [("A", [ONTOUML.kind]), ("B", [ONTOUML.subkind, ONTOUML.role]), ("C", [])]:
+        model_class = URIRef(EXAMPLE + class_name)
+        ontouml_model.add((model_class, RDF.type, ONTOUML.Class))
+        ontouml_model.add((model_class, ONTOUML.name, Literal(class_name)))
+        for class_st in class_sts:
+            ontouml_model.add((model_class, ONTOUML.stereotype, class_st))
+    ontouml_model.add((URIRef(EXAMPLE + "D"), RDF.type, ONTOUML.Class))
+
+    for gen_name, general, specific in [("g1", "A", "B"), ("g2", "B", "C"), ("g3", "A", "C")]:
+        gen = URIRef(EXAMPLE + gen_name)
+        ontouml_model.add((gen, RDF.type, ONTOUML.Generalization))
+        ontouml_model.add((gen, ONTOUML.general, URIRef(EXAMPLE + general)))
+        ontouml_model.add((gen, ONTOUML.specific, URIRef(EXAMPLE + specific)))
+    return ontouml_model
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+def test_index_lookups(input_file: str):
+    """Checks that the lookups of the index return the classes returned by the queries of the graph.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, input_file))
+    model_index = ModelIndex(ontouml_model)
+
+    classes = get_all_classes(ontouml_model)
+    assert get_sorted(get_all_classes(ontouml_model, model_index)) == get_sorted(classes)
+    assert get_sorted(get_classes_of_types(ontouml_model, ONTOUML_ST_SORTALS, model_index)) == get_sorted(
+        get_classes_of_types(ontouml_model, ONTOUML_ST_SORTALS)
+    )
+
+    for model_class in classes:
+        assert get_class_name(ontouml_model, model_class, model_index) == get_class_name(ontouml_model, model_class)
+        assert get_class_stereotype(ontouml_model, model_class, model_index) == get_class_stereotype(
+            ontouml_model, model_class
+        )
+        for lookup_function in [
+            get_direct_superclasses,
+            get_direct_subclasses,
+            get_all_superclasses,
+            get_all_subclasses,
+        ]:
+            assert get_sorted(lookup_function(ontouml_model, model_class, model_index=model_index)) == get_sorted(
+                lookup_function(ontouml_model, model_class)
+            ), lookup_function.__name__
+
+
+def test_index_contents():
+    """Checks the values stored by the index for a small model."""
+    model_index = ModelIndex(get_example_model())
+
+    assert sorted(model_index.classes) == [EXAMPLE + class_name for class_name in "ABCD"]
+    assert model_index.get_name(EXAMPLE + "A") == "A"
+    assert model_index.get_name(EXAMPLE + "D") is None
+    assert model_index.get_stereotype(EXAMPLE + "C") is None
+    assert sorted(model_index.class_stereotypes[EXAMPLE + "B"]) == [str(ONTOUML.role), str(ONTOUML.subkind)]
+    assert model_index.classes_by_stereotype[str(ONTOUML.role)] == [EXAMPLE + "B"]
+
+    assert sorted(model_index.direct_superclasses[EXAMPLE + "C"]) == [EXAMPLE + "A", EXAMPLE + "B"]
+    assert sorted(model_index.direct_subclasses[EXAMPLE + "A"]) == [EXAMPLE + "B", EXAMPLE + "C"]
+    assert model_index.generalization_generals[EXAMPLE + "g2"] == [EXAMPLE + "B"]
+    assert model_index.hierarchy.get_descendants(EXAMPLE + "A") == [EXAMPLE + "B", EXAMPLE + "C"]
+    assert sorted(model_index.get_superclasses(EXAMPLE + "C")) == [EXAMPLE + "A", EXAMPLE + "B"]
+    assert sorted(model_index.generalizations_by_general[EXAMPLE + "A"]) == [EXAMPLE + "g1", EXAMPLE + "g3"]
+
+    # The inverted index of the general classes is kept up to date when a generalization changes
+    ontouml_model = get_example_model()
+    model_index = ModelIndex(ontouml_model)
+    changed_triple = (URIRef(EXAMPLE + "g1"), ONTOUML.general, URIRef(EXAMPLE + "A"))
+    new_triple = (URIRef(EXAMPLE + "g1"), ONTOUML.general, URIRef(EXAMPLE + "D"))
+    ontouml_model.remove(changed_triple)
+    ontouml_model.add(new_triple)
+    model_index.update(ontouml_model, [new_triple], [changed_triple])
+    assert model_index.generalizations_by_general[EXAMPLE + "A"] == [EXAMPLE + "g3"]
+    assert model_index.generalizations_by_general[EXAMPLE + "D"] == [EXAMPLE + "g1"]
+
+
+def test_classes_of_types_order():
+    """Checks that, with an index, the classes of the received stereotypes are grouped by stereotype."""
+    ontouml_model = get_example_model()
+    model_index = ModelIndex(ontouml_model)
+    stereotypes = [str(ONTOUML.role), str(ONTOUML.kind), str(ONTOUML.subkind)]
+
+    assert get_classes_of_types(ontouml_model, stereotypes, model_index) == [
+        EXAMPLE + "B",
+        EXAMPLE + "A",
+        EXAMPLE + "B",
+    ]
+    assert sorted(get_classes_of_types(ontouml_model, stereotypes)) == [EXAMPLE + "A", EXAMPLE + "B", EXAMPLE + "B"]
+
+
+def test_restricted_index():
+    """Checks that the properties whose predicates are not indexed are left empty."""
+    model_index = ModelIndex(get_example_model(), [ONTOUML.stereotype])
+
+    assert model_index.is_indexed(ONTOUML.stereotype) and not model_index.is_indexed(ONTOUML.name)
+    assert model_index.get_name(EXAMPLE + "A") is None
+    assert model_index.get_stereotype(EXAMPLE + "A") == str(ONTOUML.kind)
+    assert not model_index.generalizations
+
+
+def test_build_indexes():
+    """Checks that the lazily computed indexes are only built when requested and are then kept."""
+    model_index = ModelIndex(get_example_model())
+
+    model_index.build_indexes(["hierarchy", "query_cache"])
+    hierarchy = model_index.hierarchy
+    assert hierarchy is not None and model_index._hierarchy_arrays is None
+
+    model_index.build_indexes(["hierarchy", "hierarchy_arrays"])
+    assert model_index.hierarchy is hierarchy and model_index._hierarchy_arrays is not None
+
+    # Hierarchies built through a focused copy are kept in the index from which it was created
+    model_index = ModelIndex(get_example_model())
+    assert model_index.get_focused_index([EXAMPLE + "A"]).hierarchy is model_index._hierarchy is not None
@@ -0,0 +1,75 @@
+""" This script is used to verify, using pytest, the concurrent execution of the validation rules.
+
+The parallel validation of complete files, with threads or processes, must return the same results in the same order as
+the sequential one. Other tests check the order in which the rules are scheduled.
+"""
+import pytest
+
+from validator.lib import validate_ontouml_file
+from validator.modules.rule_scheduler import ModelStatistics, estimate_rule_cost, schedule_rules
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+from validator.validations.rules_general import execute_all_validation_rules
+from validator.validations.rules_registry import get_registered_rules_codes
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_execution(input_file: str, backend: str, executor: str):
+    """Checks that the parallel execution of the rules returns the same results, in the same order, as the sequential.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :param backend: Implementation of the rules to be executed.
+    :type backend: str
+    :param executor: Type of the workers.
+    :type executor: str
+    """
+    file_path = get_test_file_path(input_file)
+    seq_valid, seq_w_list, seq_e_list = validate_ontouml_file(file_path, "owa", backend)
+    par_valid, par_w_list, par_e_list = validate_ontouml_file(file_path, "owa", backend, workers=3, executor=executor)
+
+    assert par_valid == seq_valid
+    assert get_issues_keys(par_w_list) == get_issues_keys(seq_w_list)
+    assert get_issues_keys(par_e_list) == get_issues_keys(seq_e_list)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_empty_selection(executor: str):
+    """Checks that a parallel validation without selected rules reports no issues instead of failing.
+
+    :param executor: Type of the workers.
+    :type executor: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl"))
+
+    assert execute_all_validation_rules(ontouml_model, workers=2, executor=executor, rules_codes=[]) == ([], [])
+
+
+def test_schedule_order():
+    """Checks that rules are started from the most to the least expensive one and that ties keep their order."""
+    model_statistics = ModelStatistics(load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl")))
+    rules_codes = get_registered_rules_codes()
+
+    scheduled_rules = schedule_rules(rules_codes, model_statistics)
+    costs = [estimate_rule_cost(rule_code, model_statistics) for rule_code in scheduled_rules]
+    assert sorted(scheduled_rules) == sorted(rules_codes)
+    assert costs == sorted(costs, reverse=True)
+
+    for first_rule, second_rule in zip(scheduled_rules, scheduled_rules[1:]):
+        if estimate_rule_cost(first_rule, model_statistics) == estimate_rule_cost(second_rule, model_statistics):
+            assert rules_codes.index(first_rule) < rules_codes.index(second_rule)
+
+    cheapest_first = schedule_rules(rules_codes, model_statistics, most_expensive_first=False)
+    assert [estimate_rule_cost(rule_code, model_statistics) for rule_code in cheapest_first] == sorted(costs)
+
+
+def test_model_statistics():
+    """Checks that the statistics of a model count its classes and that unknown rules have the default costs."""
+    model_statistics = ModelStatistics(load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl")))
+
+    assert model_statistics.num_classes > 0
+    assert estimate_rule_cost("R_UNKNOWN", model_statistics) == (
+        model_statistics.num_classes + model_statistics.num_generalizations
+    )
@@ -0,0 +1,92 @@
+""" This script is used to verify, using pytest, that the prepared SPARQL queries saved to a file and loaded back (as
+done by worker processes) return the same results as freshly prepared queries.
+"""
+import os
+import pickle
+
+import pytest
+from rdflib.plugins.sparql import prepareQuery
+
+from validator.modules import prepared_queries
+from validator.modules.process_pool import execute_in_process_pool
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations import rules_general
+from validator.vocab_lib.ontouml import ONTOUML_NAMESPACE
+
+TEST_FILES = ["R_CL_EMV_B.ttl", "R_CL_EGT_M.ttl", "R_CL_JOJ_C.ttl"]
+
+
+@pytest.fixture
+def empty_prepared_queries(monkeypatch):
+    """Replace the prepared queries of the process by an empty dictionary, restored after the test."""
+    monkeypatch.setattr(prepared_queries, "PREPARED_QUERIES", {})
+
+
+def get_num_prepared_queries() -> int:
+    """Return the number of queries prepared in the current process, as the task of a process pool."""
+    return len(prepared_queries.PREPARED_QUERIES)
+
+
+def get_rows(query_result) -> list[tuple]:
+    """Return the rows of a query result as sorted tuples of strings."""
+    return sorted(tuple(str(value) for value in row) for row in query_result)
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+def test_round_trip(input_file: str, tmp_path, empty_prepared_queries):
+    """Checks that saved and loaded queries return the results of freshly prepared queries.
+
+    :param input_file: Name of the test file on which the queries are executed.
+    :type input_file: str
+    """
+    file_path = str(tmp_path / "prepared_queries.pickle")
+    prepared_queries.save_prepared_queries(file_path)
+    query_strings = prepared_queries.get_all_query_strings()
+    prepared_queries.PREPARED_QUERIES.clear()
+
+    prepared_queries.load_prepared_queries(file_path)
+    assert sorted(prepared_queries.PREPARED_QUERIES) == sorted(query_strings)
+
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, input_file))
+    for sparql_query in query_strings:
+        fresh_query = prepareQuery(sparql_query, initNs={"ontouml": ONTOUML_NAMESPACE})
+        assert get_rows(ontouml_model.query(prepared_queries.get_prepared_query(sparql_query))) == get_rows(
+            ontouml_model.query(fresh_query)
+        )
+
+
+def test_other_rdflib_version(tmp_path, empty_prepared_queries):
+    """Checks that files saved with another version of RDFLib are not loaded."""
+    file_path = str(tmp_path / "prepared_queries.pickle")
+    with open(file_path, "wb") as prepared_file:
+        pickle.dump(("0.0.0", {"SELECT * WHERE { ?s ?p ?o . }": None}), prepared_file)
+
+    prepared_queries.load_prepared_queries(file_path)
+    assert not prepared_queries.PREPARED_QUERIES
+
+
+def test_worker_initialization(empty_prepared_queries):
+    """Checks that rule workers load the queries saved by the parent process instead of preparing them."""
+    prepared_file = prepared_queries.get_prepared_queries_file()
+    assert prepared_queries.get_prepared_queries_file() == prepared_file and os.path.exists(prepared_file)
+    prepared_queries.PREPARED_QUERIES.clear()
+
+    rules_general._initialize_rule_worker(None, None, "sparql", prepared_queries_file=prepared_file)
+    assert sorted(prepared_queries.PREPARED_QUERIES) == sorted(prepared_queries.get_all_query_strings())
+
+
+def test_pool_initialization(empty_prepared_queries):
+    """Checks that the workers of a process pool are initialized with the queries saved by the parent process."""
+    prepared_file = prepared_queries.get_prepared_queries_file()
+    num_queries = len(prepared_queries.get_all_query_strings())
+    prepared_queries.PREPARED_QUERIES.clear()
+
+    results = execute_in_process_pool(
+        get_num_prepared_queries,
+        [()] * 3,
+        2,
+        initializer=prepared_queries.initialize_prepared_queries,
+        initargs=(prepared_file,),
+    )
+    assert [result for _, result, _ in results] == [num_queries] * 3
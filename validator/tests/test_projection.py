@@ -0,0 +1,71 @@
+""" This script is used to verify, using pytest, that loading only the triples read by rules does not change results.
+
+Every test file listed in tests_list.csv is validated after being loaded with and without the projection of the
+selected rules, which must report the same issues.
+"""
+import os
+
+import pytest
+from rdflib import RDF, Literal, URIRef
+
+from validator.lib import validate_ontouml_model
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import LIST_OF_FILES, get_issues_keys
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations.rules_registry import (
+    get_registered_rules_codes,
+    get_required_classes,
+    get_required_predicates,
+)
+from validator.vocab_lib.ontouml import ONTOUML
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+def test_projection_equivalence(input_file: str, backend: str):
+    """Validate a test file loaded with and without projection and checks if both report the same issues.
+
+    :param input_file: Path to an input file that is going to be validated as a test.
+    :type input_file: str
+    :param backend: Backend used for executing the rules.
+    :type backend: str
+    """
+    input_file_path = os.path.join(package_dir, test_files_dir, input_file)
+    rules_codes = get_registered_rules_codes()
+
+    ontouml_model = load_graph_safely(input_file_path, "ttl")
+    projected_model = load_graph_safely(
+        input_file_path,
+        "ttl",
+        predicates=get_required_predicates(rules_codes),
+        classes=get_required_classes(rules_codes),
+    )
+
+    assert set(projected_model) <= set(ontouml_model)
+
+    _, w_list, e_list = validate_ontouml_model(ontouml_model, "owa", backend)
+    _, projected_w_list, projected_e_list = validate_ontouml_model(projected_model, "owa", backend)
+
+    assert get_issues_keys(projected_w_list) == get_issues_keys(w_list)
+    assert get_issues_keys(projected_e_list) == get_issues_keys(e_list)
+
+
+def test_projection_discards_triples():
+    """Checks that only the projected predicates and classes are kept and that later changes are not projected."""
+    input_file_path = os.path.join(package_dir, test_files_dir, LIST_OF_FILES[0])
+    ontouml_model = load_graph_safely(input_file_path, "ttl")
+    projected_model = load_graph_safely(
+        input_file_path, "ttl", predicates={RDF.type, ONTOUML.name}, classes={ONTOUML.Class}
+    )
+
+    expected_triples = {
+        (subject, predicate, value)
+        for subject, predicate, value in ontouml_model
+        if predicate == ONTOUML.name or (predicate == RDF.type and value == ONTOUML.Class)
+    }
+    assert set(projected_model) == expected_triples
+    assert len(projected_model) < len(ontouml_model)
+
+    added_triple = (URIRef("https://example.org#a"), ONTOUML.description, Literal("Added after loading"))
+    projected_model.add(added_triple)
+    assert added_triple in projected_model
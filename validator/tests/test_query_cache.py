@@ -0,0 +1,58 @@
+""" This script is used to verify, using pytest, that the QueryCache evaluates each distinct SPARQL query only once.
+
+Rules R_CL_QJC and R_CL_EMV both execute QUERY_TAGGED_VALUE, so the second rule must be answered from the cache and
+report the same issues as without a cache.
+"""
+import os
+
+from rdflib import Graph
+
+from validator.modules.query_cache import QueryCache
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import get_issues_keys
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations.rules_general import execute_rule_switch
+
+SHARED_QUERY_RULES = ["R_CL_QJC", "R_CL_EMV"]
+
+
+def test_shared_query(monkeypatch):
+    """Checks that two rules executing the same query evaluate it once and report the same issues as without cache."""
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, "R_CL_EMV_B.ttl"))
+    uncached_results = [
+        execute_rule_switch(ontouml_model, rule_code, backend="sparql") for rule_code in SHARED_QUERY_RULES
+    ]
+
+    evaluated_queries = []
+    graph_query = Graph.query
+
+    def count_query(graph: Graph, sparql_query, *args, **kwargs):
+        evaluated_queries.append(sparql_query)
+        return graph_query(graph, sparql_query, *args, **kwargs)
+
+    monkeypatch.setattr(Graph, "query", count_query)
+    query_cache = QueryCache(ontouml_model)
+    cached_results = [
+        execute_rule_switch(ontouml_model, rule_code, query_cache=query_cache, backend="sparql")
+        for rule_code in SHARED_QUERY_RULES
+    ]
+
+    assert len(evaluated_queries) == 1
+    assert (query_cache.hits, query_cache.misses) == (1, 1)
+    assert len(query_cache.results) == 1
+    for (cached_w_list, cached_e_list), (uncached_w_list, uncached_e_list) in zip(cached_results, uncached_results):
+        assert get_issues_keys(cached_w_list) == get_issues_keys(uncached_w_list)
+        assert get_issues_keys(cached_e_list) == get_issues_keys(uncached_e_list)
+
+
+def test_distinct_queries():
+    """Checks that every distinct query is a miss and that repeated queries are hits returning the stored rows."""
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, "R_CL_EMV_B.ttl"))
+    query_cache = QueryCache(ontouml_model)
+    first_query = "SELECT ?s WHERE { ?s ?p ?o . }"
+    second_query = "SELECT DISTINCT ?p WHERE { ?s ?p ?o . }"
+
+    first_rows = query_cache.query(first_query)
+    query_cache.query(second_query)
+    assert query_cache.query(first_query) is first_rows
+    assert (query_cache.hits, query_cache.misses) == (1, 2)
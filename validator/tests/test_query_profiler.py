@@ -0,0 +1,107 @@
+""" This script is used to perform tests on the profiler of the SPARQL queries of the rules using pytest."""
+import json
+
+import pytest
+from rdflib import RDF, URIRef
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql import evaluate as sparql_evaluate
+
+from validator.benchmarks.query_plan_report import main
+from validator.lib import validate_ontouml_model
+from validator.modules.prepared_queries import get_all_named_queries, get_prepared_query
+from validator.modules.query_profiler import QueryProfile, QueryProfiler, profile_all_queries
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_lib import get_issues_keys, get_test_file_path
+from validator.vocab_lib.ontouml import ONTOUML_NAMESPACE
+
+PROFILER_TEST_FILES = ["R_CL_EDA_B.ttl", "R_CL_EDA_D.ttl", "R_CL_GJU_F.ttl", "R_CL_UMC_B.ttl"]
+
+
+def get_operator_profiles(query_profile: QueryProfile, operator_name: str) -> list:
+    """Return the profiles of the operators of a query's plan with the received name."""
+    return [operator_profile for operator_profile in query_profile.plan if operator_profile.name == operator_name]
+
+
+@pytest.mark.parametrize("input_file", PROFILER_TEST_FILES)
+def test_profiled_rows(input_file: str):
+    """Checks that the rows counted for each query are its results and that every query is profiled.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path(input_file))
+    named_queries = get_all_named_queries()
+    query_profiles = profile_all_queries(ontouml_model)
+
+    assert {query_profile.query_name for query_profile in query_profiles} == set(named_queries)
+    for query_profile in query_profiles:
+        query_result = ontouml_model.query(get_prepared_query(query_profile.sparql_query))
+        expected_rows = int(query_result.askAnswer) if query_result.type == "ASK" else len(query_result)
+        assert query_profile.root.rows == expected_rows
+        assert query_profile.root.calls == 1
+        assert json.loads(json.dumps(query_profile.to_dict()))["rows"] == expected_rows
+
+
+@pytest.mark.parametrize("input_file", ["R_CL_EDA_B.ttl", "R_CL_EDA_D.ttl"])
+def test_not_exists_profile(input_file: str):
+    """Checks that the pattern of the FILTER NOT EXISTS of R_CL_EDA is evaluated once for each filtered row.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path(input_file))
+    (query_profile,) = profile_all_queries(ontouml_model, ["QUERY_R_CL_EDA"])
+
+    (filter_profile,) = get_operator_profiles(query_profile, "Filter (NOT EXISTS)")
+    (left_join_profile,) = get_operator_profiles(query_profile, "LeftJoin")
+    (not_exists_profile,) = get_operator_profiles(query_profile, "[NOT EXISTS] Join")
+    (pattern_profile,) = get_operator_profiles(query_profile, "?class_sup ontouml:stereotype ontouml:abstract")
+
+    assert not_exists_profile.calls == pattern_profile.calls == left_join_profile.rows
+    assert filter_profile.rows == left_join_profile.rows - pattern_profile.rows
+    assert "Filter (NOT EXISTS)" in query_profile.format_plan()
+
+
+def test_group_by_profile():
+    """Checks that the groups of R_CL_GJU and R_CL_UMC are shown in their plans."""
+    ontouml_model = load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl"))
+
+    for query_profile in profile_all_queries(ontouml_model, ["QUERY_R_CL_GJU", "QUERY_R_CL_UMC"]):
+        (aggregate_profile,) = get_operator_profiles(query_profile, "AggregateJoin (GROUP BY ?class_id)")
+        (group_profile,) = get_operator_profiles(query_profile, "Group")
+        assert aggregate_profile.depth + 1 == group_profile.depth
+        assert aggregate_profile.calls == 1
+
+    # Every class of the model matches the first pattern of R_CL_GJU
+    (query_profile,) = profile_all_queries(ontouml_model, ["QUERY_R_CL_GJU"])
+    (class_pattern_profile,) = get_operator_profiles(query_profile, "?class_id a ontouml:Class")
+    num_classes = len(set(ontouml_model.subjects(RDF.type, URIRef(ONTOUML_NAMESPACE + "Class"))))
+    assert class_pattern_profile.calls == 1
+    assert class_pattern_profile.rows == num_classes > 0
+
+
+def test_validation_profile(tmp_path):
+    """Checks that the queries of a validation are profiled without changing its results and that RDFLib's \
+    evaluation functions are restored afterwards."""
+    ontouml_model = load_graph_safely(get_test_file_path("R_CL_EDA_B.ttl"))
+    original_eval_bgp = sparql_evaluate.evalBGP
+    is_valid, w_list, e_list = validate_ontouml_model(ontouml_model, "owa", include=["R_CL_EDA", "R_CL_GJU"])
+
+    with QueryProfiler() as query_profiler:
+        profiled_is_valid, profiled_w_list, profiled_e_list = validate_ontouml_model(
+            ontouml_model, "owa", include=["R_CL_EDA", "R_CL_GJU"]
+        )
+
+    assert (is_valid, get_issues_keys(w_list), get_issues_keys(e_list)) == (
+        profiled_is_valid,
+        get_issues_keys(profiled_w_list),
+        get_issues_keys(profiled_e_list),
+    )
+    assert {query_profile.query_name for query_profile in query_profiler.get_profiles()} >= {"QUERY_R_CL_EDA"}
+    assert sparql_evaluate.evalBGP is original_eval_bgp
+    assert not CUSTOM_EVALS
+
+    json_path = tmp_path / "plans.json"
+    input_file_path = get_test_file_path("R_CL_EDA_B.ttl")
+    assert main([input_file_path, "--queries", "QUERY_R_CL_EDA", "--json", str(json_path)]) == 0
+    assert [plan["query_name"] for plan in json.loads(json_path.read_text())] == ["QUERY_R_CL_EDA"]
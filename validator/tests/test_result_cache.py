@@ -0,0 +1,95 @@
+""" This script is used to perform tests on the cache of validation results using pytest."""
+import shutil
+import sqlite3
+
+import pytest
+
+import validator.lib
+from validator.lib import validate_ontouml_file, validate_ontouml_files
+from validator.modules.result_cache import ResultCache, get_file_content_key
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+from validator.validations.rules_registry import RULES_REGISTRY
+
+
+def fail_loading(*args, **kwargs):
+    """Replace load_graph_safely in tests in which files must not be loaded."""
+    raise AssertionError("The file should not be loaded.")
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+def test_cached_results(input_file: str, tmp_path, monkeypatch):
+    """Checks that cached results are the same as the computed ones and that files are not loaded on cache hits.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    """
+    result_cache_path = str(tmp_path / "results.sqlite3")
+    input_file_path = get_test_file_path(input_file)
+
+    expected_results = validate_ontouml_file(input_file_path, "cwa")
+    validate_ontouml_file(input_file_path, "owa", result_cache_path=result_cache_path)
+
+    monkeypatch.setattr(validator.lib, "load_graph_safely", fail_loading)
+    is_valid, w_list, e_list = validate_ontouml_file(input_file_path, "cwa", result_cache_path=result_cache_path)
+
+    assert is_valid == expected_results[0]
+    assert get_issues_keys(w_list) == get_issues_keys(expected_results[1])
+    assert get_issues_keys(e_list) == get_issues_keys(expected_results[2])
+
+
+def test_rule_version_invalidates_results(tmp_path, monkeypatch):
+    """Checks that results stored by previous versions of a rule's implementation are not used."""
+    result_cache_path = str(tmp_path / "results.sqlite3")
+    input_file_path = get_test_file_path(TEST_FILES[0])
+    validate_ontouml_file(input_file_path, "owa", include=["R_CL_GJU", "R_CL_BWZ"], result_cache_path=result_cache_path)
+
+    monkeypatch.setitem(RULES_REGISTRY["R_CL_GJU"].implementations_versions, "sparql", 2)
+    result_cache = ResultCache(result_cache_path)
+    rules_results = result_cache.get_rules_results(
+        get_file_content_key(input_file_path), ["R_CL_GJU", "R_CL_BWZ"], "sparql"
+    )
+    result_cache.close()
+
+    assert list(rules_results) == ["R_CL_BWZ"]
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+
+def test_result_cache_eviction(tmp_path):
+    """Checks that the least recently used results are removed when the cache exceeds its maximum size."""
+    result_cache_path = str(tmp_path / "results.sqlite3")
+    for input_file in TEST_FILES:
+        validate_ontouml_file(get_test_file_path(input_file), "owa", result_cache_path=result_cache_path)
+
+    result_cache = ResultCache(result_cache_path, max_size_mb=0)
+    result_cache.evict()
+    result_cache.close()
+
+    with sqlite3.connect(result_cache_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM rule_results").fetchone()[0] == 0
+
+
+def test_batch_identical_files(tmp_path):
+    """Checks that identical files in a batch are validated once and that all of them receive their results."""
+    result_cache_path = str(tmp_path / "results.sqlite3")
+    copies_paths = []
+    for copy_number in range(3):
+        copy_path = str(tmp_path / f"copy_{copy_number}.ttl")
+        shutil.copyfile(get_test_file_path(TEST_FILES[0]), copy_path)
+        copies_paths.append(copy_path)
+
+    results = list(
+        validate_ontouml_files(
+            copies_paths + [get_test_file_path(TEST_FILES[1])], "owa", workers=2, result_cache_path=result_cache_path
+        )
+    )
+    is_valid, w_list, e_list = validate_ontouml_file(get_test_file_path(TEST_FILES[0]), "owa")
+
+    assert sorted(result.file_path for result in results) == sorted(copies_paths + [get_test_file_path(TEST_FILES[1])])
+    for result in results:
+        if result.file_path in copies_paths:
+            assert result.is_valid == is_valid
+            assert get_issues_keys(result.w_list) == get_issues_keys(w_list)
+            assert get_issues_keys(result.e_list) == get_issues_keys(e_list)
+
+    with sqlite3.connect(result_cache_path) as connection:
+        assert connection.execute("SELECT COUNT(DISTINCT content_key) FROM rule_results").fetchone()[0] == 2
@@ -0,0 +1,152 @@
+""" This script is used to verify, using pytest, the rules of the group GE, evaluated in a single sweep over the
+generalizations of the model's index.
+
+Each case indexes a general class and a specific class connected by a generalization and checks the severities of the
+issues reported by every rule of the group.
+"""
+import time
+
+import pytest
+
+from validator.validations.rules_general import execute_rule_switch
+from validator.validations.rules_ge import rules_ge
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+
+INDEX_PREDICATES = [
+    ONTOUML.name,
+    ONTOUML.stereotype,
+    ONTOUML.restrictedTo,
+    ONTOUML.order,
+    ONTOUML.isExtensional,
+    ONTOUML.general,
+    ONTOUML.specific,
+]
+
+GE_RULES = list(rules_ge.GE_RULES_DESCRIPTIONS)
+
+
+def get_class_values(class_name: str, class_st: str | None, **tagged_values: list) -> dict:
+    """Return the values of the indexed properties of a class, setting its order to 1 if it is not received."""
+    return {
+        ONTOUML.name: [class_name],
+        ONTOUML.stereotype: [str(getattr(ONTOUML, class_st))] if class_st else [],
+        ONTOUML.restrictedTo: [str(getattr(ONTOUML, nature)) for nature in tagged_values.get("restricted_to", [])],
+        ONTOUML.order: tagged_values.get("order", [1]),
+        ONTOUML.isExtensional: tagged_values.get("is_extensional", []),
+    }
+
+
+def get_rules_severities(model_index: ModelIndex) -> dict[str, str]:
+    """Return the severity of the issues reported by each rule of the group that reported some issue."""
+    rules_severities = {}
+    for rule_code in GE_RULES:
+        w_list, e_list = execute_rule_switch(None, rule_code, model_index)
+        assert len(w_list) + len(e_list) <= 1
+        if w_list or e_list:
+            rules_severities[rule_code] = "warning" if w_list else "error"
+            issue = (w_list + e_list)[0]
+            assert str(issue.related_id) == "specific" and "'Specific'" in issue.issue_description
+    return rules_severities
+
+
+@pytest.mark.parametrize(
+    "general_values, specific_values, expected_severities",
+    [
+        (("abstract", {}), ("datatype", {}), {}),
+        (("abstract", {}), ("kind", {}), {"R_GE_BAK": "error"}),
+        (("abstract", {}), (None, {}), {"R_GE_BAK": "warning"}),
+        (("kind", {}), ("subkind", {}), {}),
+        (("kind", {}), ("collective", {}), {"R_GE_EPG": "error"}),
+        (("subkind", {}), ("category", {}), {"R_GE_HGQ": "error"}),
+        (("role", {}), ("subkind", {}), {"R_GE_MXI": "error"}),
+        (("phase", {}), ("mixin", {}), {"R_GE_HGQ": "error", "R_GE_MXI": "error"}),
+        (("event", {}), ("event", {}), {}),
+        (("event", {}), ("kind", {}), {"R_GE_IJM": "error"}),
+        (("datatype", {}), (None, {}), {"R_GE_JLW": "warning"}),
+        (("situation", {}), ("relator", {}), {"R_GE_UXR": "error"}),
+        (("enumeration", {}), ("datatype", {}), {"R_GE_VEZ": "error"}),
+        (("category", {"restricted_to": ["functionalComplexNature", "collectiveNature"]}), ("kind", {}), {}),
+        (
+            ("category", {"restricted_to": ["functionalComplexNature"]}),
+            ("kind", {"restricted_to": ["functionalComplexNature", "collectiveNature"]}),
+            {"R_GE_HPZ": "error"},
+        ),
+        (("category", {"order": [2]}), ("category", {"order": [2]}), {}),
+        (("category", {"order": [0]}), ("category", {"order": [3]}), {}),
+        (("category", {"order": [2]}), ("category", {"order": [3]}), {"R_GE_MDR": "error"}),
+        (("category", {"order": [2]}), ("category", {"order": []}), {"R_GE_MDR": "warning"}),
+        (("collective", {"is_extensional": [True]}), ("subkind", {"is_extensional": [True]}), {}),
+        (("collective", {"is_extensional": [False]}), ("subkind", {"is_extensional": [True]}), {}),
+        (("collective", {"is_extensional": [True]}), ("subkind", {"is_extensional": [False]}), {"R_GE_XRS": "error"}),
+        (("collective", {"is_extensional": [True]}), ("subkind", {}), {"R_GE_XRS": "warning"}),
+    ],
+)
+def test_ge_rules(general_values: tuple, specific_values: tuple, expected_severities: dict[str, str]):
+    """Checks the issues reported by the rules of the group for a generalization between two classes.
+
+    :param general_values: Stereotype (or None) and tagged values of the general class.
+    :type general_values: tuple
+    :param specific_values: Stereotype (or None) and tagged values of the specific class.
+    :type specific_values: tuple
+    :param expected_severities: Severity of the issues expected to be reported by each rule reporting some issue.
+    :type expected_severities: dict[str, str]
+    """
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+    model_index.index_class("general", get_class_values("General", general_values[0], **general_values[1]))
+    model_index.index_class("specific", get_class_values("Specific", specific_values[0], **specific_values[1]))
+    model_index.index_generalization("gen", ["general"], ["specific"])
+
+    assert get_rules_severities(model_index) == expected_severities
+
+
+def test_single_sweep(monkeypatch):
+    """Checks that all rules of the group share a single sweep, which is discarded when the index changes.
+
+    Sweeps of focused indexes only evaluate the generalizations of their focus classes.
+    """
+    num_sweeps = []
+    sweep_class = rules_ge.GeneralizationSweep
+
+    def count_sweep(model_index: ModelIndex):
+        num_sweeps.append(model_index)
+        return sweep_class(model_index)
+
+    monkeypatch.setattr(rules_ge, "GeneralizationSweep", count_sweep)
+
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+    model_index.index_class("general", get_class_values("General", "event"))
+    for class_number in range(3):
+        model_index.index_class(f"c{class_number}", get_class_values(f"C{class_number}", "kind"))
+        model_index.index_generalization(f"g{class_number}", ["general"], [f"c{class_number}"])
+
+    issues_lists = [execute_rule_switch(None, rule_code, model_index) for rule_code in GE_RULES]
+    assert len(num_sweeps) == 1
+    assert len(issues_lists[GE_RULES.index("R_GE_IJM")][1]) == 3
+
+    focused_index = model_index.get_focused_index(["c1"])
+    _, e_list = execute_rule_switch(None, "R_GE_IJM", focused_index)
+    assert [str(issue.related_id) for issue in e_list] == ["c1"]
+    assert len(num_sweeps) == 2
+
+    model_index.index_class("c3", get_class_values("C3", "event"))
+    model_index.index_generalization("g3", ["general"], ["c3"])
+    _, e_list = execute_rule_switch(None, "R_GE_IJM", model_index)
+    assert len(e_list) == 3 and len(num_sweeps) == 3
+
+
+def test_sweep_performance():
+    """Checks that all rules of the group evaluate a model with 50000 generalizations in less than a second."""
+    model_index = ModelIndex(None, INDEX_PREDICATES)
+    stereotypes = ["kind", "subkind", "phase", "role", "category", "mixin"]
+    for class_number in range(50000):
+        model_index.index_class(
+            f"c{class_number}", get_class_values(f"C{class_number}", stereotypes[class_number % len(stereotypes)])
+        )
+        if class_number:
+            model_index.index_generalization(f"g{class_number}", [f"c{(class_number - 1) // 3}"], [f"c{class_number}"])
+
+    start_time = time.perf_counter()
+    issues_lists = [execute_rule_switch(None, rule_code, model_index) for rule_code in GE_RULES]
+    assert time.perf_counter() - start_time < 1.0
+    assert issues_lists[GE_RULES.index("R_GE_HGQ")][1] and issues_lists[GE_RULES.index("R_GE_MXI")][1]
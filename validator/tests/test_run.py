@@ -0,0 +1,77 @@
+""" This script is used to perform tests on the command-line entry point of the ontouml-validator using pytest."""
+import json
+import shutil
+
+import pytest
+
+from validator.lib import validate_ontouml_file
+from validator.run import EXIT_FAILED, EXIT_INVALID, EXIT_VALID, collect_input_files, main
+from validator.tests.test_lib import get_issues_keys, get_test_file_path
+
+# R_CL_EDA_B.ttl is valid in OWA and R_CL_EDA_C.ttl is not
+VALID_FILE = "R_CL_EDA_B.ttl"
+INVALID_FILE = "R_CL_EDA_C.ttl"
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    """Return a directory with a valid and an invalid model in a subdirectory and a file that is not a model."""
+    models_dir = tmp_path / "models"
+    (models_dir / "nested").mkdir(parents=True)
+    shutil.copy(get_test_file_path(VALID_FILE), models_dir / VALID_FILE)
+    shutil.copy(get_test_file_path(INVALID_FILE), models_dir / "nested" / INVALID_FILE)
+    (models_dir / "notes.txt").write_text("not a model")
+    return models_dir
+
+
+def read_results(output_path) -> dict[str, dict]:
+    """Return the JSON Lines records of an output file, indexed by the names of the validated files."""
+    records = [json.loads(line) for line in output_path.read_text().splitlines()]
+    return {record["file_path"].replace("\\", "/").rsplit("/", 1)[-1]: record for record in records}
+
+
+def test_collect_input_files(models_dir, tmp_path):
+    """Checks that directories, glob patterns and manifests are expanded to model files without repetitions."""
+    valid_path = str(models_dir / VALID_FILE)
+    invalid_path = str(models_dir / "nested" / INVALID_FILE)
+    manifest_path = tmp_path / "manifest.txt"
+    manifest_path.write_text(f"# Models\n\nmodels/{VALID_FILE}\nmissing.ttl\n")
+
+    assert collect_input_files([str(models_dir)]) == [valid_path, invalid_path]
+    assert collect_input_files([str(models_dir / "**" / "*.ttl")]) == [valid_path, invalid_path]
+    assert collect_input_files([valid_path], [str(manifest_path)]) == [valid_path, str(tmp_path / "missing.ttl")]
+
+
+def test_run_batch(models_dir, tmp_path):
+    """Checks that each model is written as a JSON line with the results of its validation and the exit codes."""
+    output_path = tmp_path / "results.jsonl"
+
+    assert main([str(models_dir / VALID_FILE), "-o", str(output_path), "-w", "2"]) == EXIT_VALID
+    assert main([str(models_dir), "-o", str(output_path), "-w", "2", "--metrics"]) == EXIT_INVALID
+    results = read_results(output_path)
+    assert set(results) == {VALID_FILE, INVALID_FILE}
+    for file_name, record in results.items():
+        is_valid, w_list, e_list = validate_ontouml_file(get_test_file_path(file_name), "owa")
+        assert record["is_valid"] == is_valid and record["error"] is None
+        assert len(record["issues"]) == len(w_list) + len(e_list)
+        assert [issue["rule_code"] for issue in record["issues"] if issue["severity"] == "error"] == [
+            rule_code for rule_code, _, _ in get_issues_keys(e_list)
+        ]
+        assert record["metrics"]["num_triples"] > 0
+
+    # Rule selection and world-assumption are applied to every model
+    assert main([str(models_dir), "-o", str(output_path), "-a", "cwa", "--include", "R_CL_XJZ"]) == EXIT_VALID
+    assert all(record["issues"] == [] for record in read_results(output_path).values())
+
+    assert main([str(models_dir), str(tmp_path / "missing.ttl"), "-o", str(output_path)]) == EXIT_FAILED
+    assert read_results(output_path)["missing.ttl"]["error"] is not None
+
+    # Arguments selecting no models or no rules are rejected
+    for arguments in (
+        [str(tmp_path / "empty*")],
+        [str(models_dir), "--include", "R_XX"],
+        [str(models_dir), "--include", "CL", "--exclude", "CL"],
+    ):
+        with pytest.raises(SystemExit) as exit_info:
+            main(arguments)
+        assert exit_info.value.code == EXIT_FAILED
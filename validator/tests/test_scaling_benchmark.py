@@ -0,0 +1,69 @@
+""" This script is used to perform tests on the scaling benchmark using pytest."""
+import json
+
+import pytest
+
+from validator.benchmarks.scaling_benchmark import (
+    compare_with_baseline,
+    fit_scaling_exponent,
+    main,
+    run_scaling_benchmark,
+)
+
+
+def test_fit_scaling_exponent():
+    """Checks the exponents fitted to measurements of linear and quadratic stages."""
+    sizes = [1000, 10000, 100000]
+    assert fit_scaling_exponent(sizes, [0.01, 0.1, 1.0]) == pytest.approx(1.0)
+    assert fit_scaling_exponent(sizes, [0.001, 0.1, 10.0]) == pytest.approx(2.0)
+    assert fit_scaling_exponent(sizes, [0.0, 0.0, 1.0]) is None
+    assert fit_scaling_exponent([1000], [0.5]) is None
+
+
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+def test_run_scaling_benchmark(backend: str):
+    """Checks that every stage is measured at every size and that the generated cycles are found."""
+    results = run_scaling_benchmark(
+        [300, 600], backend, include=["R_CL_EGT", "R_CL_GJU"], generator_settings={"num_cycles": 2}
+    )
+
+    assert [size_results["target_triples"] for size_results in results["sizes"]] == [300, 600]
+    assert set(results["exponents"]) == {"load", "model_index", "R_CL_EGT", "R_CL_GJU"}
+    for size_results in results["sizes"]:
+        assert abs(size_results["num_triples"] - size_results["target_triples"]) < 0.1 * size_results["target_triples"]
+        assert size_results["issues"]["R_CL_EGT"] > 0
+        assert size_results["issues"]["R_CL_GJU"] == 0
+
+
+def test_compare_with_baseline(tmp_path):
+    """Checks that drops of throughput and increases of scaling exponents are reported as regressions."""
+    baseline = {
+        "backend": "sparql",
+        "sizes": [
+            {"target_triples": 1000, "num_triples": 1000, "seconds": {"load": 0.1, "R_CL_GJU": 0.1, "R_CL_EGT": 0.01}},
+            {"target_triples": 2000, "num_triples": 2000, "seconds": {"load": 0.2, "R_CL_GJU": 0.2, "R_CL_EGT": 0.02}},
+        ],
+        "exponents": {"load": 1.0, "R_CL_GJU": 1.0, "R_CL_EGT": 1.0},
+    }
+    results = {
+        "backend": "sparql",
+        "sizes": [
+            {"target_triples": 1000, "num_triples": 1000, "seconds": {"load": 0.12, "R_CL_GJU": 0.3, "R_CL_EGT": 0.04}},
+            {"target_triples": 4000, "num_triples": 4000, "seconds": {"load": 0.5, "R_CL_GJU": 1.0, "R_CL_EGT": 0.1}},
+        ],
+        "exponents": {"load": 1.1, "R_CL_GJU": 1.0, "R_CL_EGT": 1.5},
+    }
+
+    # Only the throughput of R_CL_GJU at 1000 triples and the exponent of R_CL_EGT regressed
+    regressions = compare_with_baseline(results, baseline)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("R_CL_GJU at 1000 triples")
+    assert regressions[1].startswith("R_CL_EGT: scaling exponent")
+    assert compare_with_baseline(results, baseline, tolerance=0.9, exponent_tolerance=0.5) == []
+    assert compare_with_baseline(results, {**baseline, "backend": "native"}) == []
+
+    # A benchmark compared with its own stored results has no regressions
+    baseline_path = tmp_path / "baseline.json"
+    assert main(["--sizes", "300", "--include", "R_CL_GJU", "--save-baseline", str(baseline_path)]) == 0
+    assert json.loads(baseline_path.read_text())["rules_codes"] == ["R_CL_GJU"]
+    assert main(["--sizes", "300", "--include", "R_CL_GJU", "--baseline", str(baseline_path)]) == 0
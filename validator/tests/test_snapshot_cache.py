@@ -0,0 +1,79 @@
+""" This script is used to perform tests on the cache of snapshots of parsed OntoUML models using pytest."""
+import os
+
+from rdflib import BNode, Graph, Literal, URIRef
+
+from validator.lib import validate_ontouml_file
+from validator.modules.snapshot_cache import SNAPSHOT_EXTENSION, SnapshotCache
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Checks that a graph loaded from a snapshot has the same triples as the parsed one."""
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    ontouml_model = Graph()
+    ontouml_model.add((URIRef("https://example.org#a"), URIRef("https://example.org#name"), Literal("A", lang="en")))
+    ontouml_model.add((URIRef("https://example.org#a"), URIRef("https://example.org#isAbstract"), Literal(False)))
+    ontouml_model.add((BNode("b1"), URIRef("https://example.org#label"), Literal("plain")))
+
+    snapshot_cache.store("key", ontouml_model)
+    loaded_model = snapshot_cache.load("key")
+
+    assert set(loaded_model) == set(ontouml_model)
+    assert snapshot_cache.hits == 1
+
+
+def test_snapshot_loading(tmp_path):
+    """Checks that files are parsed only when their contents have no snapshot and that results do not change."""
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    input_file_path = get_test_file_path(TEST_FILES[0])
+
+    parsed_model = load_graph_safely(input_file_path, snapshot_cache=snapshot_cache)
+    loaded_model = load_graph_safely(input_file_path, snapshot_cache=snapshot_cache)
+
+    assert (snapshot_cache.hits, snapshot_cache.misses) == (1, 1)
+    assert set(loaded_model) == set(parsed_model)
+
+    # Snapshots depend on the parser settings
+    load_graph_safely(input_file_path, "ttl", snapshot_cache=snapshot_cache)
+    assert (snapshot_cache.hits, snapshot_cache.misses) == (1, 2)
+
+    for input_file in TEST_FILES:
+        is_valid, w_list, e_list = validate_ontouml_file(get_test_file_path(input_file), "owa")
+        for _ in range(2):
+            cached_valid, cached_w_list, cached_e_list = validate_ontouml_file(
+                get_test_file_path(input_file), "owa", snapshot_cache_dir=str(tmp_path)
+            )
+            assert cached_valid == is_valid
+            assert sorted(get_issues_keys(cached_w_list)) == sorted(get_issues_keys(w_list))
+            assert sorted(get_issues_keys(cached_e_list)) == sorted(get_issues_keys(e_list))
+
+
+def test_snapshot_eviction(tmp_path):
+    """Checks that the least recently used snapshots are removed when the cache exceeds its maximum size."""
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    ontouml_model = load_graph_safely(get_test_file_path(TEST_FILES[0]))
+
+    for last_use, key in enumerate(["first", "second", "third"]):
+        snapshot_cache.store(key, ontouml_model)
+        # Explicit times, as snapshots stored in the same clock tick would have the same last use
+        os.utime(os.path.join(str(tmp_path), key + SNAPSHOT_EXTENSION), (last_use, last_use))
+    snapshot_cache.load("first")
+
+    snapshot_size = os.path.getsize(os.path.join(str(tmp_path), "first" + SNAPSHOT_EXTENSION))
+    snapshot_cache.max_size_bytes = 2 * snapshot_size
+    snapshot_cache.evict()
+
+    assert sorted(os.listdir(str(tmp_path))) == ["first" + SNAPSHOT_EXTENSION, "third" + SNAPSHOT_EXTENSION]
+
+
+def test_invalid_snapshot_discarded(tmp_path):
+    """Checks that an invalid snapshot is discarded and reported as a miss."""
+    snapshot_cache = SnapshotCache(str(tmp_path))
+    with open(os.path.join(str(tmp_path), "key" + SNAPSHOT_EXTENSION), "wb") as snapshot_file:
+        snapshot_file.write(b"not a snapshot")
+
+    assert snapshot_cache.load("key") is None
+    assert snapshot_cache.misses == 1
+    assert not os.listdir(str(tmp_path))
@@ -0,0 +1,115 @@
+""" This script is used to perform tests on the disk-backed triple store of OntoUML models using pytest."""
+import os
+
+import pytest
+from rdflib import RDF, BNode, Graph, Literal, URIRef
+
+from validator.lib import validate_ontouml_file, validate_ontouml_model
+from validator.modules.triple_store import STORE_EXTENSION, SQLiteStore, open_stored_graph
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+from validator.vocab_lib.ontouml import ONTOUML
+
+
+def test_store_round_trip(tmp_path):
+    """Checks that the triples and namespaces of a stored graph are read back after the store is reopened."""
+    store_path = str(tmp_path / "model.sqlite")
+    class_uri = URIRef("https://example.org#a")
+    triples = {
+        (class_uri, RDF.type, ONTOUML.Class),
+        (class_uri, ONTOUML.name, Literal("A", lang="en")),
+        (class_uri, ONTOUML.isAbstract, Literal(False)),
+        (BNode("b1"), ONTOUML.name, Literal("plain")),
+    }
+    ontouml_model = Graph(store=SQLiteStore(store_path))
+    ontouml_model.bind("ontouml", str(ONTOUML))
+    for triple in triples:
+        ontouml_model.add(triple)
+    ontouml_model.close()
+
+    stored_model = open_stored_graph(store_path)
+    assert set(stored_model) == triples
+    assert set(stored_model.triples((None, ONTOUML.name, None))) == {
+        triple for triple in triples if triple[1] == ONTOUML.name
+    }
+    assert list(stored_model.triples((URIRef("https://example.org#missing"), None, None))) == []
+    assert ("ontouml", URIRef(str(ONTOUML))) in set(stored_model.namespaces())
+
+    stored_model.remove((class_uri, None, None))
+    assert len(stored_model) == 1
+
+    with pytest.raises(OSError):
+        open_stored_graph(str(tmp_path / "missing.sqlite"))
+
+
+def test_stored_graph_loading(tmp_path):
+    """Checks that files are imported into their stores unless their stores keep the same contents and settings."""
+    input_file_path = get_test_file_path(TEST_FILES[0])
+    store_path = str(tmp_path / "model.sqlite")
+    predicates = {RDF.type, ONTOUML.stereotype}
+
+    stored_model = load_graph_safely(input_file_path, predicates=predicates, store_path=store_path)
+    stored_triples = set(stored_model)
+    assert stored_model.store.discarded_triples > 0
+    assert stored_triples == set(load_graph_safely(input_file_path, predicates=predicates))
+    stored_model.close()
+
+    # The store of the same contents and projection is opened without parsing (and projecting) the file again
+    reopened_model = load_graph_safely(input_file_path, predicates=predicates, store_path=store_path)
+    assert reopened_model.store.discarded_triples == 0
+    assert set(reopened_model) == stored_triples
+    reopened_model.close()
+
+    # Stores of other projections are replaced
+    replaced_model = load_graph_safely(input_file_path, store_path=store_path)
+    assert set(replaced_model) == set(load_graph_safely(input_file_path))
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+def test_stored_graph_validation(tmp_path, input_file: str, backend: str):
+    """Checks that validations of graphs kept in triple stores find the issues found in memory.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :param backend: The backend used in the validation.
+    :type backend: str
+    """
+    input_file_path = get_test_file_path(input_file)
+    is_valid, w_list, e_list = validate_ontouml_file(input_file_path, "owa", backend)
+
+    for _ in range(2):
+        stored_valid, stored_w_list, stored_e_list = validate_ontouml_file(
+            input_file_path, "owa", backend, store_dir=str(tmp_path)
+        )
+        assert stored_valid == is_valid
+        assert sorted(get_issues_keys(stored_w_list)) == sorted(get_issues_keys(w_list))
+        assert sorted(get_issues_keys(stored_e_list)) == sorted(get_issues_keys(e_list))
+    assert [file_name.endswith(STORE_EXTENSION) for file_name in os.listdir(tmp_path)].count(True) == 1
+
+
+def test_stored_graph_process_workers(tmp_path):
+    """Checks that process workers reopen the store of the validated graph instead of receiving its triples."""
+    input_file_path = get_test_file_path("R_CL_ZGT_D01.ttl")
+    stored_model = load_graph_safely(input_file_path, store_path=str(tmp_path / "model.sqlite"))
+
+    _, _, e_list = validate_ontouml_model(stored_model, "cwa")
+    _, _, process_e_list = validate_ontouml_model(stored_model, "cwa", workers=2, executor="process")
+
+    assert get_issues_keys(process_e_list) == get_issues_keys(e_list)
+
+
+def test_stored_graph_thread_workers(tmp_path):
+    """Checks that thread workers read the store of the validated graph through their own connections."""
+    input_file_path = get_test_file_path("R_CL_ZGT_D01.ttl")
+    stored_model = load_graph_safely(input_file_path, store_path=str(tmp_path / "model.sqlite"))
+
+    _, _, e_list = validate_ontouml_model(stored_model, "cwa")
+    _, _, thread_e_list = validate_ontouml_model(stored_model, "cwa", workers=4, executor="thread")
+
+    assert get_issues_keys(thread_e_list) == get_issues_keys(e_list)
+    assert len(stored_model.store._connections) > 1
+
+    # Closing the store closes the connections of all threads
+    stored_model.close()
+    assert stored_model.store.connection is None and not stored_model.store._connections
@@ -0,0 +1,117 @@
+""" This script is used to perform tests on the runtime metrics of validations and on the quiet mode using pytest."""
+import io
+import json
+
+import pytest
+from loguru import logger
+
+from validator.lib import (
+    set_quiet_mode,
+    stream_validation_issues,
+    validate_ontouml_file,
+    validate_ontouml_files,
+    validate_ontouml_model,
+)
+from validator.modules.utils_graph import load_graph_safely
+from validator.modules.validation_metrics import ValidationMetrics
+from validator.tests.test_lib import get_issues_keys, get_test_file_path
+from validator.validations.issue_sink import MemorySink
+from validator.validations.rules_registry import get_registered_rules_codes
+
+METRICS_TEST_FILES = ["R_CL_GJU_F.ttl", "R_CL_ZGT_D01.ttl", "R_CL_EGT_B.ttl"]
+
+
+def get_rules_counts(metrics: ValidationMetrics) -> dict[str, tuple[int, int]]:
+    """Return the rows scanned and the issues emitted by each rule measured in a validation."""
+    return {
+        rule_code: (rule_metrics.rows_scanned, rule_metrics.num_issues)
+        for rule_code, rule_metrics in metrics.rules.items()
+    }
+
+
+@pytest.mark.parametrize("input_file", METRICS_TEST_FILES)
+@pytest.mark.parametrize("backend", ["sparql", "native"])
+def test_file_metrics(input_file: str, backend: str):
+    """Checks that the loading of the file and every executed rule are measured.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :param backend: The backend used in the validation.
+    :type backend: str
+    """
+    metrics = ValidationMetrics()
+    _, w_list, e_list = validate_ontouml_file(get_test_file_path(input_file), "owa", backend, metrics=metrics)
+
+    assert metrics.parse_seconds > 0
+    # Only the triples read by the rules are loaded
+    assert 0 < metrics.num_triples < len(load_graph_safely(get_test_file_path(input_file)))
+    assert list(metrics.rules) == get_registered_rules_codes()
+    assert sum(rule_metrics.num_issues for rule_metrics in metrics.rules.values()) == len(w_list) + len(e_list)
+    assert sum(rule_metrics.rows_scanned for rule_metrics in metrics.rules.values()) > 0
+    for rule_metrics in metrics.rules.values():
+        assert rule_metrics.wall_seconds > 0 and rule_metrics.cpu_seconds >= 0
+
+    exported_metrics = json.loads(json.dumps(metrics.to_dict()))
+    assert set(exported_metrics["rules"]) == set(metrics.rules)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_metrics(executor: str):
+    """Checks that rules executed by concurrent workers scan and emit the same as when executed sequentially.
+
+    :param executor: The type of the workers.
+    :type executor: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path("R_CL_ZGT_D01.ttl"))
+
+    sequential_metrics = ValidationMetrics()
+    validate_ontouml_model(ontouml_model, "cwa", metrics=sequential_metrics)
+    parallel_metrics = ValidationMetrics()
+    validate_ontouml_model(ontouml_model, "cwa", workers=2, executor=executor, metrics=parallel_metrics)
+
+    assert parallel_metrics.num_triples == len(ontouml_model)
+    assert get_rules_counts(parallel_metrics) == get_rules_counts(sequential_metrics)
+
+
+def test_sink_metrics():
+    """Checks that the issues emitted by rules streaming to a sink are the ones the sink accepted."""
+    ontouml_model = load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl"))
+    metrics = ValidationMetrics()
+    issue_sink = MemorySink("cwa", max_issues_per_rule=1)
+    stream_validation_issues(ontouml_model, issue_sink, metrics=metrics)
+
+    for rule_code, rule_metrics in metrics.rules.items():
+        assert rule_metrics.num_issues == issue_sink.rules_num_issues.get(rule_code, 0) <= 1
+
+
+def test_batch_metrics():
+    """Checks that batch validations return the metrics of each file only when they are collected."""
+    files_paths = [get_test_file_path(input_file) for input_file in METRICS_TEST_FILES]
+
+    for result_file in validate_ontouml_files(files_paths, "owa", workers=1, collect_metrics=True):
+        assert result_file.metrics.num_triples > 0
+        assert list(result_file.metrics.rules) == get_registered_rules_codes()
+    assert all(result_file.metrics is None for result_file in validate_ontouml_files(files_paths, "owa", workers=1))
+
+
+def test_quiet_mode():
+    """Checks that no messages are logged in quiet mode and that the results do not change."""
+    input_file_path = get_test_file_path("R_CL_GJU_F.ttl")
+    log_output = io.StringIO()
+    handler_id = logger.add(log_output, level="DEBUG")
+    try:
+        set_quiet_mode()
+        quiet_is_valid, quiet_w_list, quiet_e_list = validate_ontouml_file(input_file_path, "owa")
+        assert log_output.getvalue() == ""
+
+        set_quiet_mode(False)
+        is_valid, w_list, e_list = validate_ontouml_file(input_file_path, "owa")
+        assert (is_valid, get_issues_keys(w_list), get_issues_keys(e_list)) == (
+            quiet_is_valid,
+            get_issues_keys(quiet_w_list),
+            get_issues_keys(quiet_e_list),
+        )
+        assert "Executing rule R_CL_GJU" in log_output.getvalue()
+    finally:
+        set_quiet_mode(False)
+        logger.remove(handler_id)
@@ -0,0 +1,81 @@
+""" This script is used to perform tests on the columnar report of validation results using pytest."""
+import csv
+import io
+import json
+
+import pytest
+
+from validator.lib import get_validation_report, validate_ontouml_model
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_lib import TEST_FILES, get_issues_keys, get_test_file_path
+from validator.validations.result_issue import ResultIssue
+from validator.validations.rules_cl.descriptions_cl import DESCRIPTION_R_CL_JOJ_STEREOTYPE
+from validator.validations.validation_report import ValidationReport
+
+
+@pytest.mark.parametrize("input_file", TEST_FILES)
+@pytest.mark.parametrize("world_assumption", ["owa", "cwa"])
+def test_report_equivalence(input_file: str, world_assumption: str):
+    """Checks that the issues of a report are the same as the ones returned by validate_ontouml_model.
+
+    :param input_file: Name of the test file.
+    :type input_file: str
+    :param world_assumption: The world-assumption used in the validation.
+    :type world_assumption: str
+    """
+    ontouml_model = load_graph_safely(get_test_file_path(input_file))
+    is_valid, w_list, e_list = validate_ontouml_model(ontouml_model, world_assumption)
+    report = get_validation_report(ontouml_model, world_assumption)
+
+    assert report.is_valid == is_valid
+    assert get_issues_keys(report.get_warnings()) == get_issues_keys(w_list)
+    assert get_issues_keys(report.get_errors()) == get_issues_keys(e_list)
+
+    for issue in w_list + e_list:
+        assert get_issues_keys([issue])[0] in get_issues_keys(report.get_issues_by_rule(issue.rule_code))
+        assert get_issues_keys([issue])[0] in get_issues_keys(report.get_issues_by_element(issue.related_id))
+
+
+def test_report_lookups_and_severities():
+    """Checks the lookups by rule and by element, the lazy descriptions and the filtering of severities."""
+    report = ValidationReport("owa", severities=["error"])
+    report.add_issue("R_CL_JOJ", "error", "https://example.org#a", DESCRIPTION_R_CL_JOJ_STEREOTYPE, ("A", "kind"))
+    report.add_issue("R_CL_GJU", "error", "https://example.org#a", "The class 'A' has more than one stereotype.")
+    report.add_issue("R_CL_GJU", "warning", "https://example.org#b", "The class 'B' has no stereotype.")
+
+    assert (len(report), report.num_warnings, report.num_errors, report.is_valid) == (2, 0, 2, False)
+    assert [issue.rule_code for issue in report.get_issues_by_element("https://example.org#a")] == [
+        "R_CL_JOJ",
+        "R_CL_GJU",
+    ]
+    assert report.get_issues_by_element("https://example.org#b") == []
+    assert report.get_issues_by_rule("R_CL_XJZ") == []
+
+    issue = report.get_issues_by_rule("R_CL_JOJ", "error")[0]
+    assert issue.description_params == ("A", "kind")
+    assert issue.issue_description == "The class 'A' is stereotyped as 'kind' but has enumeration literal(s)."
+    assert report.get_issues_by_rule("R_CL_JOJ", "warning") == []
+
+
+def test_report_export():
+    """Checks that the JSON and CSV exports of a report contain all of its issues."""
+    report = ValidationReport("cwa")
+    report.add_rule_results(
+        [ResultIssue("R_CL_GJU", "The class '{}' has no stereotype.", "https://example.org#b", ('B "quoted"',))],
+        [ResultIssue("R_CL_UMC", "The enumeration class 'A' has less than two literals.", "https://example.org#a")],
+    )
+    expected_rows = [
+        ["R_CL_GJU", "error", "https://example.org#b", "The class 'B \"quoted\"' has no stereotype."],
+        ["R_CL_UMC", "error", "https://example.org#a", "The enumeration class 'A' has less than two literals."],
+    ]
+
+    json_file = io.StringIO()
+    report.to_json(json_file)
+    exported_report = json.loads(json_file.getvalue())
+    assert exported_report["is_valid"] is False
+    assert [list(issue.values()) for issue in exported_report["issues"]] == expected_rows
+
+    csv_file = io.StringIO(newline="")
+    report.to_csv(csv_file)
+    csv_file.seek(0)
+    assert list(csv.reader(csv_file)) == [["rule_code", "severity", "related_id", "issue_description"]] + expected_rows
@@ -0,0 +1,104 @@
+""" This script is used to perform tests on the local validation service using pytest."""
+import asyncio
+import io
+import json
+
+import pytest
+
+from validator.lib import get_validation_report
+from validator.modules.utils_graph import load_graph_safely
+from validator.modules.validation_service import RequestError, ValidationService
+from validator.tests.test_lib import get_test_file_path
+
+
+async def send_request(port: int, method: str, path: str, body: bytes = b"") -> tuple[int, dict]:
+    """Send an HTTP request to the service and return the status and the JSON body of its response."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    response_head, _, response_body = response.partition(b"\r\n\r\n")
+    return int(response_head.split()[1]), json.loads(response_body)
+
+
+def get_request_body(input_file: str, **options) -> bytes:
+    """Return the body of a validation request for a test file."""
+    with open(get_test_file_path(input_file), encoding="utf-8") as model_file:
+        return json.dumps({"model": model_file.read(), **options}).encode("utf-8")
+
+
+async def run_with_service(test_coroutine, **service_settings):
+    """Run a test coroutine with a started service, listening on a free port, and close the service afterwards."""
+    validation_service = ValidationService(**service_settings)
+    server = await validation_service.start(port=0)
+    try:
+        return await test_coroutine(validation_service, server.sockets[0].getsockname()[1])
+    finally:
+        await validation_service.close()
+
+
+@pytest.mark.parametrize("world_assumption", ["owa", "cwa"])
+def test_service_validation(world_assumption: str):
+    """Checks that the service responds with the report of the validation of the received model."""
+    report = get_validation_report(load_graph_safely(get_test_file_path("R_CL_GJU_F.ttl")), world_assumption)
+    report_output = io.StringIO()
+    report.to_json(report_output)
+
+    async def validate_twice(validation_service, port):
+        request_body = get_request_body("R_CL_GJU_F.ttl", world_assumption=world_assumption)
+        return [await send_request(port, "POST", "/validate", request_body) for _ in range(2)]
+
+    # The second request is validated on the model cached by the worker
+    assert asyncio.run(run_with_service(validate_twice)) == [(200, json.loads(report_output.getvalue()))] * 2
+
+
+def test_coalesced_requests():
+    """Checks that identical concurrent requests share a single validation."""
+
+    async def validate_concurrently(validation_service, port):
+        request_body = get_request_body("R_CL_EGT_B.ttl", backend="native")
+        other_request_body = get_request_body("R_CL_EGT_B.ttl", backend="native", world_assumption="cwa")
+        responses = await asyncio.gather(
+            *(validation_service.validate(request_body) for _ in range(3)),
+            validation_service.validate(other_request_body),
+        )
+        return responses, validation_service.get_status()
+
+    responses, status = asyncio.run(run_with_service(validate_concurrently))
+    assert responses[0] == responses[1] == responses[2] != responses[3]
+    assert (status["validations"], status["coalesced"], status["pending"]) == (2, 2, 0)
+
+
+def test_service_limits():
+    """Checks that requests are rejected when the service is overloaded or when they are too large or invalid."""
+
+    async def send_rejected_requests(validation_service, port):
+        overloaded_requests = asyncio.gather(
+            validation_service.validate(get_request_body("R_CL_EGT_B.ttl")),
+            validation_service.validate(get_request_body("R_CL_GJU_F.ttl")),
+            return_exceptions=True,
+        )
+        return (
+            await overloaded_requests,
+            await send_request(port, "POST", "/validate", b"{" + b" " * 2000 + b"}"),
+            await send_request(port, "POST", "/validate", json.dumps({"model": "", "backend": "other"}).encode()),
+            await send_request(port, "POST", "/validate", json.dumps({"model": "not turtle"}).encode()),
+            await send_request(port, "GET", "/validate"),
+            await send_request(port, "GET", "/unknown"),
+            await send_request(port, "GET", "/status"),
+        )
+
+    overloaded_responses, *responses, status_response = asyncio.run(
+        run_with_service(send_rejected_requests, max_pending=1, max_request_bytes=1000)
+    )
+    assert isinstance(overloaded_responses[0], bytes)
+    assert isinstance(overloaded_responses[1], RequestError) and overloaded_responses[1].status == 503
+    assert [status for status, _ in responses] == [413, 400, 400, 405, 404]
+    assert all("error" in response_body for _, response_body in responses)
+    assert status_response == (
+        200,
+        {"workers": 1, "requests": 5, "validations": 2, "coalesced": 0, "rejected": 1, "pending": 0},
+    )
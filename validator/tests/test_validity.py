@@ -0,0 +1,61 @@
+""" This script is used to verify, using pytest, that the fail-fast validity mode agrees with the complete validation.
+
+Every test file listed in tests_list.csv is checked with both world-assumptions and both backends, and the existence
+checks of rules are compared with the issues reported by the rules themselves.
+"""
+import os
+
+import pytest
+
+from validator.lib import is_ontouml_model_valid, validate_ontouml_model
+from validator.modules.utils_graph import load_graph_safely
+from validator.tests.test_backends import LIST_OF_FILES
+from validator.tests.test_main import package_dir, test_files_dir
+from validator.validations.rules_general import execute_rule_switch, find_first_violated_rule
+from validator.validations.rules_registry import RULES_REGISTRY
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+def test_validity_equivalence(input_file: str):
+    """Checks that is_ontouml_model_valid returns the validity computed by validate_ontouml_model.
+
+    :param input_file: Path to an input file that is going to be validated as a test.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, input_file), "ttl")
+
+    for world_assumption in ["owa", "cwa"]:
+        is_valid, _, _ = validate_ontouml_model(ontouml_model, world_assumption)
+        for backend in ["sparql", "native"]:
+            assert is_ontouml_model_valid(ontouml_model, world_assumption, backend) == is_valid
+
+
+@pytest.mark.parametrize("input_file", LIST_OF_FILES)
+def test_existence_checks(input_file: str):
+    """Checks that the existence checks of rules agree with the issues the rules report.
+
+    :param input_file: Path to an input file that is going to be validated as a test.
+    :type input_file: str
+    """
+    ontouml_model = load_graph_safely(os.path.join(package_dir, test_files_dir, input_file), "ttl")
+
+    for rule_code, registered_rule in RULES_REGISTRY.items():
+        if registered_rule.existence_check is None:
+            continue
+
+        rule_w_list, rule_e_list = execute_rule_switch(ontouml_model, rule_code)
+        assert registered_rule.existence_check(ontouml_model, ["warning"]) == bool(rule_w_list)
+        assert registered_rule.existence_check(ontouml_model, ["error"]) == bool(rule_e_list)
+
+
+def test_first_violated_rule():
+    """Checks that the cheapest rule reporting an error is the one found."""
+    input_file_path = os.path.join(package_dir, test_files_dir, "R_CL_GJU_F.ttl")
+    ontouml_model = load_graph_safely(input_file_path, "ttl")
+    _, w_list, e_list = validate_ontouml_model(ontouml_model, "cwa", include=["R_CL_GJU", "R_CL_BWZ"])
+
+    assert e_list
+    assert find_first_violated_rule(ontouml_model, "cwa", rules_codes=["R_CL_GJU", "R_CL_BWZ"]) in {
+        issue.rule_code for issue in e_list
+    }
+    assert find_first_violated_rule(ontouml_model, "cwa", rules_codes=[]) is None
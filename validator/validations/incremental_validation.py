@@ -0,0 +1,244 @@
+"""Incremental validation of OntoUML models edited through triple deltas.
+
+The IncrementalValidator validates a model once and keeps its ModelIndex and the issues found by each rule for each
+class. After each change (a set of added and removed triples), only the affected rules are re-evaluated, and only for
+the affected classes (their focus), using a focused copy of the updated index:
+    - The affected rules are the ones that read at least one of the changed predicates (as declared in the registry).
+    - The affected classes are the subjects of the changed triples and, for changed generalizations, their general
+      and specific classes before and after the change.
+    - For rules that read generalizations, the affected classes are extended with all their (direct and indirect)
+      superclasses and subclasses before and after the change, as their issues depend on the rest of the hierarchy.
+
+Rules only compute the transitive closure of the hierarchy if they cannot be restricted to the superclasses of the
+focus classes (e.g., R_CL_EGT, which looks for cycles in the whole hierarchy). Closures computed through a focused copy
+are kept in the validator's index, so they are shared by the following changes until the hierarchy changes again.
+
+The issues of every rule are associated with the class they are related to, so the issues of the re-evaluated classes
+replace the previous ones and the issues of all other classes are kept.
+
+Usage:
+    ```
+    incremental_validator = IncrementalValidator(ontouml_model, "owa")
+    is_valid, w_list, e_list = incremental_validator.get_results()
+    is_valid, w_list, e_list = incremental_validator.apply_changes(added_triples, removed_triples)
+    ```
+"""
+from collections.abc import Iterable
+
+from loguru import logger
+from rdflib import Graph, URIRef
+
+from .result_issue import ResultIssue
+from .rules_general import execute_rule_switch
+from .rules_registry import RULES_REGISTRY, select_rules_codes
+from ..modules.utils_validations import validate_assumption
+from ..vocab_lib.model_index import ModelIndex
+from ..vocab_lib.ontouml import ONTOUML
+
+# Backend used for executing the rules, as only index-based implementations can be restricted to focus classes
+INCREMENTAL_BACKEND = "native"
+
+GENERALIZATION_PREDICATES = {ONTOUML.general, ONTOUML.specific}
+
+
+class IncrementalValidator:
+    """A class to represent the validation state of an OntoUML model that is updated after each change to the model.
+
+    The validator takes ownership of the received graph: all changes to the model must be made through apply_changes,
+    so that the index and the stored issues remain consistent with the graph.
+    """
+
+    def __init__(
+        self,
+        ontouml_model: Graph,
+        world_assumption: str,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ):
+        """Initialize an IncrementalValidator object, validating the received model with all selected rules.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+        :type ontouml_model: Graph
+        :param world_assumption: the world-assumption to be used during the validation. Allowed values are:'owa' and
+                                 'cwa'.
+        :type world_assumption: str
+        :param include: Selectors of the rules to be executed. If not provided (default), all implemented rules are
+                        executed.
+        :type include: list[str] | None
+        :param exclude: Selectors of the rules not to be executed, even if they are included.
+        :type exclude: list[str] | None
+        """
+        self.ontouml_model = ontouml_model
+        self.assumption = validate_assumption(world_assumption)
+        self.rules_codes = select_rules_codes(include, exclude)
+        self.model_index = ModelIndex(ontouml_model)
+
+        # Warnings and errors found by each rule, grouped by the classes they are related to
+        self.rules_issues: dict[str, dict[str, tuple[list[ResultIssue], list[ResultIssue]]]] = {}
+
+        for rule_code in self.rules_codes:
+            self.rules_issues[rule_code] = {}
+            self._execute_rule(rule_code, self.model_index)
+
+    def _execute_rule(self, rule_code: str, model_index: ModelIndex) -> None:
+        """Execute a rule on the focus classes of an index and store its issues.
+
+        :param rule_code: Code of the rule to be executed.
+        :type rule_code: str
+        :param model_index: The (possibly focused) index of the model.
+        :type model_index: ModelIndex
+        """
+        rule_w_list, rule_e_list = execute_rule_switch(
+            self.ontouml_model, rule_code, model_index, backend=INCREMENTAL_BACKEND
+        )
+
+        classes_issues = self.rules_issues[rule_code]
+        for issue in rule_w_list:
+            classes_issues.setdefault(str(issue.related_id), ([], []))[0].append(issue)
+        for issue in rule_e_list:
+            classes_issues.setdefault(str(issue.related_id), ([], []))[1].append(issue)
+
+    def get_results(self) -> tuple[bool, list[ResultIssue], list[ResultIssue]]:
+        """Return the current validation results of the model.
+
+        :return: A tuple with three components:
+            - A boolean indicating whether the validated model is valid or not.
+            - A list of warnings found during the validation process.
+            - A list of errors found during the validation process.
+        :rtype: tuple[bool, list[ResultIssue], list[ResultIssue]]
+        """
+        w_list = []
+        e_list = []
+
+        for rule_code in self.rules_codes:
+            for class_w_list, class_e_list in self.rules_issues[rule_code].values():
+                w_list.extend(class_w_list)
+                e_list.extend(class_e_list)
+
+        # In CWA, warnings also represent errors
+        if self.assumption == "cwa":
+            e_list.extend(w_list)
+            w_list = []
+
+        is_valid = True if not e_list else False
+
+        return is_valid, w_list, e_list
+
+    def apply_changes(
+        self,
+        added_triples: Iterable[tuple[URIRef, URIRef, URIRef]],
+        removed_triples: Iterable[tuple[URIRef, URIRef, URIRef]],
+    ) -> tuple[bool, list[ResultIssue], list[ResultIssue]]:
+        """Apply a change to the model, re-evaluate the affected rules and classes, and return the updated results.
+
+        Removals are applied before additions. Triples that are already in the model (for additions) or not in it (for
+        removals) are ignored.
+
+        :param added_triples: Triples to be added to the model.
+        :type added_triples: Iterable[tuple[URIRef, URIRef, URIRef]]
+        :param removed_triples: Triples to be removed from the model.
+        :type removed_triples: Iterable[tuple[URIRef, URIRef, URIRef]]
+        :return: A tuple with three components:
+            - A boolean indicating whether the changed model is valid or not.
+            - A list of warnings found in the changed model.
+            - A list of errors found in the changed model.
+        :rtype: tuple[bool, list[ResultIssue], list[ResultIssue]]
+        """
+        removed_triples = [triple for triple in dict.fromkeys(removed_triples) if triple in self.ontouml_model]
+        removed_set = set(removed_triples)
+        added_triples = [
+            triple
+            for triple in dict.fromkeys(added_triples)
+            if triple not in self.ontouml_model or triple in removed_set
+        ]
+        changed_triples = removed_triples + added_triples
+
+        changed_predicates = {predicate for _, predicate, _ in changed_triples}
+        affected_rules_codes = [
+            rule_code
+            for rule_code in self.rules_codes
+            if changed_predicates.intersection(RULES_REGISTRY[rule_code].predicates)
+        ]
+        changed_gens = {
+            str(subject) for subject, predicate, _ in changed_triples if predicate in GENERALIZATION_PREDICATES
+        }
+
+        # Classes affected before the change (the ones related to changed generalizations may change)
+        focus_classes = self._get_changed_classes(changed_triples, changed_gens)
+        hierarchy_focus_classes = self._get_hierarchy_classes(focus_classes) if changed_gens else set()
+
+        for triple in removed_triples:
+            self.ontouml_model.remove(triple)
+        for triple in added_triples:
+            self.ontouml_model.add(triple)
+        self.model_index.update(self.ontouml_model, added_triples, removed_triples)
+
+        focus_classes |= self._get_changed_classes(changed_triples, changed_gens)
+        hierarchy_focus_classes |= self._get_hierarchy_classes(focus_classes)
+
+        logger.debug(
+            f"Incremental validation of {len(changed_triples)} changed triples: {len(affected_rules_codes)} rules "
+            f"and {len(hierarchy_focus_classes)} classes affected."
+        )
+
+        for rule_code in affected_rules_codes:
+            registered_rule = RULES_REGISTRY[rule_code]
+            reads_hierarchy = bool(GENERALIZATION_PREDICATES.intersection(registered_rule.predicates))
+            rule_focus_classes = hierarchy_focus_classes if reads_hierarchy else focus_classes
+
+            classes_issues = self.rules_issues[rule_code]
+            for model_class in rule_focus_classes:
+                classes_issues.pop(model_class, None)
+            self._execute_rule(rule_code, self.model_index.get_focused_index(sorted(rule_focus_classes)))
+
+        return self.get_results()
+
+    def _get_changed_classes(self, changed_triples: list[tuple], changed_gens: set[str]) -> set[str]:
+        """Return the classes directly affected by the changed triples in the current state of the index.
+
+        :param changed_triples: The added and removed triples.
+        :type changed_triples: list[tuple]
+        :param changed_gens: The URIs of the generalizations whose general or specific classes changed.
+        :type changed_gens: set[str]
+        :return: Set of the URIs of the subjects of the changed triples and of the classes of changed generalizations.
+        :rtype: set[str]
+        """
+        changed_classes = set()
+
+        for subject, predicate, value in changed_triples:
+            if predicate in GENERALIZATION_PREDICATES:
+                changed_classes.add(str(value))
+            else:
+                changed_classes.add(str(subject))
+
+        for gen in changed_gens:
+            changed_classes.update(self.model_index.generalization_generals.get(gen, []))
+            changed_classes.update(self.model_index.generalization_specifics.get(gen, []))
+
+        return changed_classes
+
+    def _get_hierarchy_classes(self, model_classes: set[str]) -> set[str]:
+        """Return the received classes and all their (direct and indirect) superclasses and subclasses.
+
+        The direct hierarchy of the index is traversed from the received classes, so only the visited part of the
+        hierarchy is read, and the transitive closure of the index is neither used nor computed.
+
+        :param model_classes: The URIs of the classes.
+        :type model_classes: set[str]
+        :return: Set of the URIs of the received classes and of their superclasses and subclasses.
+        :rtype: set[str]
+        """
+        hierarchy_classes = set(model_classes)
+
+        for direct_classes in [self.model_index.direct_superclasses, self.model_index.direct_subclasses]:
+            visited = set(model_classes)
+            to_visit = list(model_classes)
+            while to_visit:
+                model_class = to_visit.pop()
+                for related_class in direct_classes.get(model_class, []):
+                    if related_class not in visited:
+                        visited.add(related_class)
+                        to_visit.append(related_class)
+            hierarchy_classes |= visited
+
+        return hierarchy_classes
@@ -0,0 +1,316 @@
+"""Define the sinks to which validation rules stream their issues as they are found.
+
+Rules usually return the complete lists of their warnings and errors. When a sink is provided, each issue is sent to the
+sink as soon as it is found and is not kept by the rule, so memory does not grow with the number of issues. Sinks may
+cap the number of issues accepted per rule and in total. When a rule reaches its cap, its enumeration is stopped.
+
+Caps never change the validity of the model: a rule that may still report an error is only stopped after one of its
+errors was accepted (or dropped by a cap), and the validation only ends early once some error is known.
+
+The available sinks are:
+    - MemorySink: keeps the accepted issues in lists.
+    - JsonLinesSink: writes each accepted issue as a JSON object in a line of a text file.
+    - SarifSink: writes the accepted issues as a SARIF 2.1.0 log (https://sarifweb.azurewebsites.net/).
+    - ValiditySink: keeps no issues, only whether the model is valid, stopping at the first issue that invalidates it.
+
+Usage:
+    ```
+    with open("issues.jsonl", "w", encoding="utf-8") as output_file:
+        with JsonLinesSink(output_file, "owa", max_issues_per_rule=1000) as issue_sink:
+            is_valid = stream_validation_issues(ontouml_model, issue_sink)
+    ```
+"""
+import json
+import threading
+from typing import TextIO
+
+from .result_issue import ResultIssue
+from .rules_definitions import RULES_DEFINITIONS
+from .rules_registry import RULES_REGISTRY
+from ..modules.utils_validations import validate_assumption
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+TOOL_NAME = "ontouml-validator"
+TOOL_INFORMATION_URI = "https://github.com/OntoUML/ontouml-validator"
+
+
+class IssueCapReached(Exception):
+    """Raised when a sink does not accept more issues from a rule, stopping the rule's enumeration."""
+
+
+class IssueSink:
+    """Base class of the sinks to which rules stream their issues. Subclasses define how accepted issues are written.
+
+    Sinks may be shared by rules executed in concurrent threads, so issues are accepted and written one at a time.
+    """
+
+    def __init__(
+        self,
+        world_assumption: str = "owa",
+        severities: list[str] | None = None,
+        max_issues_per_rule: int | None = None,
+        max_issues: int | None = None,
+    ):
+        """Initialize an IssueSink object.
+
+        :param world_assumption: The world-assumption used in the validation ('owa' or 'cwa'). In CWA, warnings are
+                                 written as errors.
+        :type world_assumption: str
+        :param severities: If provided, only issues with these severities (before the world-assumption is applied) are
+                           accepted and only rules that may report them are executed.
+        :type severities: list[str] | None
+        :param max_issues_per_rule: Optional maximum number of issues accepted from each rule.
+        :type max_issues_per_rule: int | None
+        :param max_issues: Optional maximum number of issues accepted in total.
+        :type max_issues: int | None
+        """
+        self.world_assumption = validate_assumption(world_assumption)
+        self.severities = severities
+        self.max_issues_per_rule = max_issues_per_rule
+        self.max_issues = max_issues
+
+        self.num_warnings = 0
+        self.num_errors = 0
+        self.rules_num_issues: dict[str, int] = {}
+        # Rules that found errors, including the ones dropped by caps
+        self.rules_with_errors: set[str] = set()
+        # Rules whose issues were not all accepted because of the caps
+        self.truncated_rules: set[str] = set()
+        self.has_dropped_errors = False
+
+        self._lock = threading.Lock()
+
+    @property
+    def num_issues(self) -> int:
+        """Return the number of accepted issues."""
+        return self.num_warnings + self.num_errors
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the validated model is valid: no errors were found, after the world-assumption is applied."""
+        return self.num_errors == 0 and not self.has_dropped_errors
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Return whether the sink does not accept more issues and the validity of the model is already known."""
+        if self.max_issues is None or self.num_issues < self.max_issues:
+            return False
+        return not self.is_valid or "error" not in self._get_written_severities()
+
+    def _get_written_severities(self, rule_code: str | None = None) -> set[str]:
+        """Return the severities (after the world-assumption is applied) that may be written, for a rule or in total."""
+        severities = RULES_REGISTRY[rule_code].severities if rule_code is not None else ["warning", "error"]
+        if self.severities is not None:
+            severities = [severity for severity in severities if severity in self.severities]
+        if self.world_assumption == "cwa":
+            return {"error"} if severities else set()
+        return set(severities)
+
+    def add(self, issue: ResultIssue, severity: str) -> None:
+        """Accept an issue found by a rule and write it, unless it is filtered out or dropped by the caps.
+
+        :param issue: The issue found by the rule.
+        :type issue: ResultIssue
+        :param severity: The severity of the issue, before the world-assumption is applied ('warning' or 'error').
+        :type severity: str
+        :raises IssueCapReached: If no more issues of the rule are needed, so that its enumeration can be stopped.
+        """
+        if self.severities is not None and severity not in self.severities:
+            return
+        if self.world_assumption == "cwa":
+            severity = "error"
+
+        rule_code = issue.rule_code
+        with self._lock:
+            rule_num_issues = self.rules_num_issues.get(rule_code, 0)
+            if severity == "error":
+                self.rules_with_errors.add(rule_code)
+
+            is_rule_capped = self.max_issues_per_rule is not None and rule_num_issues >= self.max_issues_per_rule
+            is_capped = self.max_issues is not None and self.num_issues >= self.max_issues
+            if is_rule_capped or is_capped:
+                self.truncated_rules.add(rule_code)
+                self.has_dropped_errors = self.has_dropped_errors or severity == "error"
+                # The rule is only stopped when its remaining issues cannot change the validity of the model
+                if rule_code in self.rules_with_errors or "error" not in self._get_written_severities(rule_code):
+                    raise IssueCapReached(rule_code)
+                return
+
+            self.rules_num_issues[rule_code] = rule_num_issues + 1
+            if severity == "error":
+                self.num_errors += 1
+            else:
+                self.num_warnings += 1
+            self.write(issue, severity)
+
+    def write(self, issue: ResultIssue, severity: str) -> None:
+        """Write an accepted issue.
+
+        :param issue: The accepted issue.
+        :type issue: ResultIssue
+        :param severity: The severity of the issue, after the world-assumption is applied.
+        :type severity: str
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish writing the accepted issues."""
+
+    def __enter__(self) -> "IssueSink":
+        """Return the sink, which is closed when the context is exited."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the sink."""
+        self.close()
+
+
+class MemorySink(IssueSink):
+    """A sink that keeps the accepted warnings and errors in lists, in the order in which they were found."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize a MemorySink object with the caps described in IssueSink."""
+        super().__init__(*args, **kwargs)
+        self.w_list: list[ResultIssue] = []
+        self.e_list: list[ResultIssue] = []
+
+    def write(self, issue: ResultIssue, severity: str) -> None:
+        """Keep an accepted issue in the list of its severity."""
+        if severity == "error":
+            self.e_list.append(issue)
+        else:
+            self.w_list.append(issue)
+
+
+class JsonLinesSink(IssueSink):
+    """A sink that writes each accepted issue as a JSON object in a line of a text file."""
+
+    def __init__(self, output_file: TextIO, *args, **kwargs):
+        """Initialize a JsonLinesSink object.
+
+        :param output_file: The text file in which the issues are written.
+        :type output_file: TextIO
+        """
+        super().__init__(*args, **kwargs)
+        self.output_file = output_file
+
+    def write(self, issue: ResultIssue, severity: str) -> None:
+        """Write an accepted issue as a line with its rule's code, severity, related element and description."""
+        self.output_file.write(
+            json.dumps(
+                {
+                    "rule_code": issue.rule_code,
+                    "severity": severity,
+                    "related_id": str(issue.related_id),
+                    "issue_description": issue.issue_description,
+                }
+            )
+            + "\n"
+        )
+
+
+class SarifSink(IssueSink):
+    """A sink that writes the accepted issues as the results of a single run of a SARIF 2.1.0 log.
+
+    Results are written as they are accepted. The description of the tool, including its rules, is written when the sink
+    is closed, after the results, so that only the rules that reported issues are listed.
+    """
+
+    def __init__(self, output_file: TextIO, *args, **kwargs):
+        """Initialize a SarifSink object.
+
+        :param output_file: The text file in which the log is written. It is complete only after the sink is closed.
+        :type output_file: TextIO
+        """
+        super().__init__(*args, **kwargs)
+        self.output_file = output_file
+        self._rules_indexes: dict[str, int] = {}
+        self._has_results = False
+        self.output_file.write(
+            f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": {json.dumps(SARIF_VERSION)}, "runs": [{{"results": ['
+        )
+
+    def write(self, issue: ResultIssue, severity: str) -> None:
+        """Write an accepted issue as a SARIF result whose logical location is its related element."""
+        rule_index = self._rules_indexes.setdefault(issue.rule_code, len(self._rules_indexes))
+        result = {
+            "ruleId": issue.rule_code,
+            "ruleIndex": rule_index,
+            "level": severity,
+            "message": {"text": issue.issue_description},
+            "locations": [{"logicalLocations": [{"fullyQualifiedName": str(issue.related_id)}]}],
+        }
+        self.output_file.write((", " if self._has_results else "") + json.dumps(result))
+        self._has_results = True
+
+    def close(self) -> None:
+        """Write the description of the tool and of the rules that reported issues, completing the log."""
+        tool = {
+            "driver": {
+                "name": TOOL_NAME,
+                "informationUri": TOOL_INFORMATION_URI,
+                "rules": [
+                    {"id": rule_code, "shortDescription": {"text": RULES_DEFINITIONS[rule_code]}}
+                    for rule_code in self._rules_indexes
+                ],
+            }
+        }
+        self.output_file.write(f'], "tool": {json.dumps(tool)}}}]}}\n')
+
+
+class ValiditySink(IssueSink):
+    """A sink that keeps no issues and stops each rule at its first issue that makes the model invalid.
+
+    Only errors are accepted in OWA (warnings do not change the validity of a model) and every issue counts as an error
+    in CWA. As no issue is accepted, the first one found ends the rule's enumeration and exhausts the sink.
+    """
+
+    def __init__(self, world_assumption: str = "owa"):
+        """Initialize a ValiditySink object.
+
+        :param world_assumption: The world-assumption used in the validation ('owa' or 'cwa').
+        :type world_assumption: str
+        """
+        severities = ["error"] if validate_assumption(world_assumption) == "owa" else None
+        super().__init__(world_assumption, severities, max_issues=0)
+
+    def write(self, issue: ResultIssue, severity: str) -> None:
+        """Do nothing, as issues are never accepted."""
+
+
+class IssueStream(list):
+    """A list of the issues of a rule that sends each appended issue to a sink instead of keeping it."""
+
+    def __init__(self, issue_sink: IssueSink, severity: str):
+        """Initialize an empty IssueStream object.
+
+        :param issue_sink: The sink to which the issues are sent.
+        :type issue_sink: IssueSink
+        :param severity: The severity of the issues appended to this list ('warning' or 'error').
+        :type severity: str
+        """
+        super().__init__()
+        self.issue_sink = issue_sink
+        self.severity = severity
+
+    def append(self, issue: ResultIssue) -> None:
+        """Send an issue to the sink.
+
+        :raises IssueCapReached: If no more issues of the rule are needed.
+        """
+        self.issue_sink.add(issue, self.severity)
+
+
+def create_issues_lists(issue_sink: IssueSink | None) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Return the lists in which a rule collects its warnings and errors.
+
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the lists send their issues to the
+                       sink and remain empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with the lists of warnings and errors of the rule.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    if issue_sink is None:
+        return [], []
+    return IssueStream(issue_sink, "warning"), IssueStream(issue_sink, "error")
@@ -0,0 +1,63 @@
+"""Result of the validation of a single OntoUML file within a batch."""
+from validator.modules.validation_metrics import ValidationMetrics
+from validator.validations.result_issue import ResultIssue
+
+
+class ResultFile:
+    """A class to represent the result of the validation of an OntoUML file.
+
+    If the file could not be validated (e.g., it could not be loaded), is_valid is False, the lists of issues are empty
+    and the error attribute describes the failure.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        is_valid: bool,
+        w_list: list[ResultIssue],
+        e_list: list[ResultIssue],
+        error: str | None = None,
+        metrics: ValidationMetrics | None = None,
+    ):
+        """Initialize a ResultFile object.
+
+        :param file_path: Path of the validated file.
+        :type file_path: str
+        :param is_valid: Indicates whether the file's model is valid.
+        :type is_valid: bool
+        :param w_list: List of warnings found during the validation.
+        :type w_list: list[ResultIssue]
+        :param e_list: List of errors found during the validation.
+        :type e_list: list[ResultIssue]
+        :param error: Description of the failure that prevented the validation of the file, or None if it was validated.
+        :type error: str | None
+        :param metrics: Metrics of the validation of the file, if they were collected.
+        :type metrics: ValidationMetrics | None
+        """
+        self.file_path = file_path
+        self.is_valid = is_valid
+        self.w_list = w_list
+        self.e_list = e_list
+        self.error = error
+        self.metrics = metrics
+
+    def to_dict(self) -> dict:
+        """Return the result as a dictionary, with the issues in the format of the JSON validation reports.
+
+        Issues are listed with their severities (in CWA, all issues are errors) and the metrics are only included if
+        they were collected.
+        """
+        issues = [
+            {
+                "rule_code": issue.rule_code,
+                "severity": severity,
+                "related_id": str(issue.related_id),
+                "issue_description": issue.issue_description,
+            }
+            for severity, issues_list in (("warning", self.w_list), ("error", self.e_list))
+            for issue in issues_list
+        ]
+        result = {"file_path": self.file_path, "is_valid": self.is_valid, "issues": issues, "error": self.error}
+        if self.metrics is not None:
+            result["metrics"] = self.metrics.to_dict()
+        return result
@@ -3,19 +3,42 @@ from validator.validations.rules_definitions import RULES_DEFINITIONS
 
 
 class ResultIssue:
-    """A class to represent an issue (warning or error) identified by a validation rule."""
+    """A class to represent an issue (warning or error) identified by a validation rule.
 
-    def __init__(self, rule_code: str, issue_description: str, related_id: str):
+    The description of an issue may be provided as a template and its parameters, in which case it is only formatted
+    when it is accessed.
+    """
+
+    __slots__ = ("rule_code", "related_id", "description_template", "description_params")
+
+    def __init__(
+        self, rule_code: str, issue_description: str, related_id: str, description_params: tuple | None = None
+    ):
         """Initialize a ResultIssue object.
 
         :param rule_code: The code of the rule that identified the issue.
         :type rule_code: str
-        :param issue_description: The textual description of the issue identified.
+        :param issue_description: The textual description of the issue identified or, if description_params is
+                                  provided, its template (formatted with str.format).
         :type issue_description: str
         :param related_id: The ID (URI) of the element affected by/related to the issue.
         :type related_id: str
+        :param description_params: Optional parameters of the description's template.
+        :type description_params: tuple | None
         """
         self.rule_code = rule_code
-        self.rule_definition = RULES_DEFINITIONS[rule_code]  # noqa: F841
-        self.issue_description = issue_description
         self.related_id = related_id
+        self.description_template = issue_description
+        self.description_params = description_params
+
+    @property
+    def issue_description(self) -> str:
+        """Return the textual description of the issue, formatting its template if needed."""
+        if self.description_params is None:
+            return self.description_template
+        return self.description_template.format(*self.description_params)
+
+    @property
+    def rule_definition(self) -> str:
+        """Return the definition of the rule that identified the issue."""
+        return RULES_DEFINITIONS[self.rule_code]
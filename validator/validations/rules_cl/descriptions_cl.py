@@ -0,0 +1,43 @@
+"""Define the templates of the descriptions of the issues reported by rules of the group CL.
+
+Templates are formatted with str.format using the parameters of each issue, only when its description is accessed.
+They are shared by all implementations of a rule, so that all backends report the same descriptions.
+"""
+
+DESCRIPTION_R_CL_XJZ = "The class '{}' is an enumeration and has attribute(s)."
+
+DESCRIPTION_R_CL_JOJ_NO_STEREOTYPE = (
+    "The class '{}' without stereotype has an enumeration literal and, hence, must be stereotyped as enumerator."
+)
+DESCRIPTION_R_CL_JOJ_STEREOTYPE = "The class '{}' is stereotyped as '{}' but has enumeration literal(s)."
+
+DESCRIPTION_R_CL_UMC = "The enumeration class '{}' has less than two literals."
+
+DESCRIPTION_R_CL_AIB = "The enumeration class '{}' has a specialization relation."
+
+DESCRIPTION_R_CL_EDA_NO_STEREOTYPE = "The enumeration class '{}' has a generalization class without stereotype."
+DESCRIPTION_R_CL_EDA_STEREOTYPE = (
+    "The enumeration class '{}' has a generalization class with stereotype different from 'Abstract'."
+)
+
+DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL = "The class '{}' is a base sortal without an ultimate sortal as supertype."
+DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS = "The class '{}' is a base sortal with {} ultimate sortals supertypes."
+
+DESCRIPTION_R_CL_GJU_NO_STEREOTYPE = "The class '{}' has no stereotype."
+DESCRIPTION_R_CL_GJU_STEREOTYPES = "The class '{}' has more than one stereotype."
+
+DESCRIPTION_R_CL_BWZ_NO_STEREOTYPE = "The class '{}' has no stereotype."
+DESCRIPTION_R_CL_BWZ_STEREOTYPE = "The class '{}' has stereotype '{}', which is not part of the OntoUML profile."
+
+DESCRIPTION_R_CL_YOK = "The non-sortal ('{}') class '{}' has isAbstract attribute set 'false'."
+
+DESCRIPTION_R_CL_QJC = "The class '{}' with stereotype '{}' has an incorrect restrictedTo value ('{}'). "
+
+DESCRIPTION_R_CL_EGT = "The class '{}' has the following classes as its subclasses and superclasses: {}. "
+
+DESCRIPTION_R_CL_EMV_NO_VALUE = "The class '{}' with stereotype '{}' has no restrictedTo value. "
+DESCRIPTION_R_CL_EMV_INVALID_VALUE = "The class '{}' with stereotype '{}' has an invalid restrictedTo value ('{}'). "
+
+DESCRIPTION_R_CL_ALX = (
+    "The class '{}' with stereotype {} has an invalid specialization with the class {} stereotyped as {}."
+)
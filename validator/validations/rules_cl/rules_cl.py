@@ -2,11 +2,38 @@
 
 This module provides a collection of functions for executing OntoUML validations for rules of the group CL.
 """
-from rdflib import Graph
-
-from validator.modules.utils_general import intersection_lists
+from rdflib import Graph, RDF
+
+from validator.modules.query_cache import QueryCache, execute_query
+from validator.modules.validation_metrics import count_scanned_rows
+from validator.validations.rules_cl.descriptions_cl import (
+    DESCRIPTION_R_CL_AIB,
+    DESCRIPTION_R_CL_ALX,
+    DESCRIPTION_R_CL_BWZ_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_BWZ_STEREOTYPE,
+    DESCRIPTION_R_CL_EDA_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_EDA_STEREOTYPE,
+    DESCRIPTION_R_CL_EGT,
+    DESCRIPTION_R_CL_EMV_INVALID_VALUE,
+    DESCRIPTION_R_CL_EMV_NO_VALUE,
+    DESCRIPTION_R_CL_GJU_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_GJU_STEREOTYPES,
+    DESCRIPTION_R_CL_JOJ_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_JOJ_STEREOTYPE,
+    DESCRIPTION_R_CL_QJC,
+    DESCRIPTION_R_CL_UMC,
+    DESCRIPTION_R_CL_XJZ,
+    DESCRIPTION_R_CL_YOK,
+    DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL,
+    DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS,
+)
+from validator.validations.issue_sink import IssueSink, create_issues_lists
 from validator.validations.result_issue import ResultIssue
+from validator.validations.rules_registry import register_existence_check, register_rule
 from validator.validations.rules_cl.sparql_cl import (
+    ASK_R_CL_GJU_ERROR,
+    ASK_R_CL_GJU_WARNING,
+    ASK_R_CL_UMC_WARNING,
     QUERY_R_CL_XJZ,
     QUERY_R_CL_JOJ,
     QUERY_R_CL_UMC,
@@ -20,11 +47,9 @@ from validator.validations.rules_cl.sparql_cl import (
 from validator.vocab_lib.functions import (
     get_classes_of_types,
     get_class_name,
-    get_all_superclasses,
-    get_all_classes,
-    get_all_subclasses,
     get_class_stereotype,
 )
+from validator.vocab_lib.model_index import ModelIndex
 from validator.vocab_lib.ontouml import ONTOUML
 from validator.vocab_lib.variables import (
     ONTOUML_CLASS_STEREOTYPES,
@@ -37,52 +62,91 @@ from validator.vocab_lib.variables import (
 )
 
 
-def execute_rule_R_CL_XJZ(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_XJZ",
+    "CL",
+    predicates=[RDF.type, ONTOUML.stereotype, ONTOUML.name, ONTOUML.attribute],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(0.5, 0.0),
+    severities=["error"],
+)
+def execute_rule_R_CL_XJZ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_XJZ and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Return enumeration classes that have attributes
-    query_answer = ontouml_model.query(QUERY_R_CL_XJZ)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_XJZ, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
         class_name = row.class_name.value
 
-        issue_description = f"The class '{class_name}' is an enumeration and has attribute(s)."
-        issue = ResultIssue(rule_code, issue_description, class_id)
+        issue = ResultIssue(rule_code, DESCRIPTION_R_CL_XJZ, class_id, (class_name,))
         rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_JOJ(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_JOJ",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.literal, ONTOUML.stereotype],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(1.0, 0.0),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_JOJ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_JOJ and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Return classes that have literals
-    query_answer = ontouml_model.query(QUERY_R_CL_JOJ)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_JOJ, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
@@ -90,42 +154,55 @@ def execute_rule_R_CL_JOJ(ontouml_model: Graph, rule_code: str) -> tuple[list[Re
 
         # Class without stereotype but with enumeration literals
         if row.class_st is None:
-            issue_description = (
-                f"The class '{class_name}' without stereotype has an enumeration literal and, hence, "
-                f"must be stereotyped as enumerator."
-            )
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_JOJ_NO_STEREOTYPE, class_id, (class_name,))
             rule_w_list.append(issue)
         # Class with stereotype different from enumeration and with enumeration literals
         else:
             class_st = row.class_st.toPython()
             if class_st != (ONTOUML.enumeration.toPython()):
-                issue_description = (
-                    f"The class '{class_name}' is stereotyped as '{class_st}' but has enumeration literal(s)."
-                )
-                issue = ResultIssue(rule_code, issue_description, class_id)
+                issue = ResultIssue(rule_code, DESCRIPTION_R_CL_JOJ_STEREOTYPE, class_id, (class_name, class_st))
                 rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_UMC(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_UMC",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype, ONTOUML.literal],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(1.0, 0.0),
+    severities=["warning"],
+)
+def execute_rule_R_CL_UMC(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_UMC and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Return classes and their respective number of literals
-    query_answer = ontouml_model.query(QUERY_R_CL_UMC)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_UMC, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
@@ -133,139 +210,223 @@ def execute_rule_R_CL_UMC(ontouml_model: Graph, rule_code: str) -> tuple[list[Re
         class_lt = row.num_lt.value
 
         if class_lt < 2:
-            issue_description = f"The enumeration class '{class_name}' has less than two literals."
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_UMC, class_id, (class_name,))
             rule_w_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_AIB(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_existence_check("R_CL_UMC")
+def check_rule_R_CL_UMC(ontouml_model: Graph, severities: list[str]) -> bool:
+    """Return whether rule R_CL_UMC reports some issue with the received severities, without enumerating its issues.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be checked.
+    :type ontouml_model: Graph
+    :param severities: The severities of the issues considered.
+    :type severities: list[str]
+    :return: True if the rule reports some issue with one of the severities, False otherwise.
+    :rtype: bool
+    """
+    return "warning" in severities and bool(execute_query(ontouml_model, ASK_R_CL_UMC_WARNING))
+
+
+@register_rule(
+    "R_CL_AIB",
+    "CL",
+    predicates=[RDF.type, ONTOUML.stereotype, ONTOUML.name, ONTOUML.general],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(0.5, 0.5),
+    severities=["error"],
+)
+def execute_rule_R_CL_AIB(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_AIB and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Return classes and their respective number of literals
-    query_answer = ontouml_model.query(QUERY_R_CL_AIB)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_AIB, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
         class_name = row.class_name.value
 
-        issue_description = f"The enumeration class '{class_name}' has a specialization relation."
-        issue = ResultIssue(rule_code, issue_description, class_id)
+        issue = ResultIssue(rule_code, DESCRIPTION_R_CL_AIB, class_id, (class_name,))
         rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_EDA(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_EDA",
+    "CL",
+    predicates=[RDF.type, ONTOUML.stereotype, ONTOUML.name, ONTOUML.specific, ONTOUML.general],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(1.0, 1.0),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_EDA(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_EDA and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Return classes and their respective number of literals
-    query_answer = ontouml_model.query(QUERY_R_CL_EDA)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_EDA, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
         class_name = row.class_name.value
 
         if row.sup_st is None:
-            issue_description = f"The enumeration class '{class_name}' has a generalization class without stereotype."
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EDA_NO_STEREOTYPE, class_id, (class_name,))
             rule_w_list.append(issue)
         else:
-            issue_description = (
-                f"The enumeration class '{class_name}' has a generalization class with stereotype "
-                f"different from 'Abstract'."
-            )
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EDA_STEREOTYPE, class_id, (class_name,))
             rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_ZGT(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_ZGT",
+    "CL",
+    predicates=[RDF.type, ONTOUML.stereotype, ONTOUML.name, ONTOUML.general, ONTOUML.specific],
+    classes=[ONTOUML.Class],
+    indexes=["model_index", "hierarchy"],
+    cost=(0.1, 0.1),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_ZGT(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_ZGT and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
-    # Creating a list of all base_sortals and of all ultimate_sortals in the ontology
-    base_sortals = get_classes_of_types(ontouml_model, ONTOUML_ST_BASE_SORTALS)
-    ultimate_sortals = get_classes_of_types(ontouml_model, ONTOUML_ST_ULTIMATE_SORTALS)
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+    hierarchy = model_index.hierarchy
 
-    for base_sortal in base_sortals:
-        base_sortal_sup = get_all_superclasses(ontouml_model, base_sortal)
-        sup_count = 0
+    # Creating a list of the base_sortals to be evaluated and a bitset of all ultimate_sortals in the ontology
+    base_sortals = model_index.get_focus_classes_of_types(ONTOUML_ST_BASE_SORTALS)
+    ultimate_sortals = get_classes_of_types(ontouml_model, ONTOUML_ST_ULTIMATE_SORTALS, model_index)
+    ultimate_sortals_bits = hierarchy.get_bits(ultimate_sortals)
 
-        for sup in base_sortal_sup:
-            if sup in ultimate_sortals:
-                sup_count += 1
+    for base_sortal in count_scanned_rows(base_sortals):
+        # Number of distinct ultimate sortals among all (direct and indirect) superclasses of the base sortal
+        sup_count = (hierarchy.get_ancestor_bits(base_sortal) & ultimate_sortals_bits).bit_count()
 
         if sup_count == 0:
-            class_name = get_class_name(ontouml_model, base_sortal)
-            issue_description = f"The class '{class_name}' is a base sortal without an ultimate sortal as supertype."
-            issue = ResultIssue(rule_code, issue_description, base_sortal)
+            class_name = get_class_name(ontouml_model, base_sortal, model_index)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL, base_sortal, (class_name,))
             rule_w_list.append(issue)
         elif sup_count > 1:
-            class_name = get_class_name(ontouml_model, base_sortal)
-            issue_description = (
-                f"The class '{class_name}' is a base sortal with {sup_count} ultimate sortals supertypes."
-            )
-            issue = ResultIssue(rule_code, issue_description, base_sortal)
+            class_name = get_class_name(ontouml_model, base_sortal, model_index)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS, base_sortal, (class_name, sup_count))
             rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_GJU(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_GJU",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(9.0, 0.0),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_GJU(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_GJU and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Returns every class and the amount of stereotypes they have
-    query_answer = ontouml_model.query(QUERY_R_CL_GJU)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_GJU, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
@@ -273,102 +434,173 @@ def execute_rule_R_CL_GJU(ontouml_model: Graph, rule_code: str) -> tuple[list[Re
         class_sts = row.num_sts.value
 
         if class_sts == 0:
-            issue_description = f"The class '{class_name}' has no stereotype."
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_GJU_NO_STEREOTYPE, class_id, (class_name,))
             rule_w_list.append(issue)
         elif class_sts > 1:
-            issue_description = f"The class '{class_name}' has more than one stereotype."
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_GJU_STEREOTYPES, class_id, (class_name,))
             rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_BWZ(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_existence_check("R_CL_GJU")
+def check_rule_R_CL_GJU(ontouml_model: Graph, severities: list[str]) -> bool:
+    """Return whether rule R_CL_GJU reports some issue with the received severities, without enumerating its issues.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be checked.
+    :type ontouml_model: Graph
+    :param severities: The severities of the issues considered.
+    :type severities: list[str]
+    :return: True if the rule reports some issue with one of the severities, False otherwise.
+    :rtype: bool
+    """
+    # Errors are checked first, as they invalidate the model under both world-assumptions
+    if "error" in severities and bool(execute_query(ontouml_model, ASK_R_CL_GJU_ERROR)):
+        return True
+    return "warning" in severities and bool(execute_query(ontouml_model, ASK_R_CL_GJU_WARNING))
+
+
+@register_rule(
+    "R_CL_BWZ",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(5.0, 0.0),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_BWZ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_BWZ and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Returns every class and their respective stereotype
-    query_answer = ontouml_model.query(QUERY_R_CL_BWZ)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_BWZ, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
         class_name = row.class_name.value
 
         if row.class_st is None:
-            issue_description = f"The class '{class_name}' has no stereotype."
-            issue = ResultIssue(rule_code, issue_description, class_id)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_BWZ_NO_STEREOTYPE, class_id, (class_name,))
             rule_w_list.append(issue)
         else:
             if row.class_st.toPython() not in ONTOUML_CLASS_STEREOTYPES:
-                issue_description = (
-                    f"The class '{class_name}' has stereotype '{row.class_st.toPython()}', "
-                    f"which is not part of the OntoUML profile."
+                issue = ResultIssue(
+                    rule_code, DESCRIPTION_R_CL_BWZ_STEREOTYPE, class_id, (class_name, row.class_st.toPython())
                 )
-                issue = ResultIssue(rule_code, issue_description, class_id)
                 rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_YOK(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_YOK",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype, ONTOUML.isAbstract],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(2.0, 0.0),
+    severities=["error"],
+)
+def execute_rule_R_CL_YOK(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_YOK and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Returns every non-sortal class that has its attribute isAbstract set" : "false
-    query_answer = ontouml_model.query(QUERY_R_CL_YOK)
+    query_answer = execute_query(ontouml_model, QUERY_R_CL_YOK, query_cache)
 
     for row in query_answer:
         class_id = row.class_id.toPython()
         class_name = row.class_name.toPython()
         class_st = row.class_st.toPython()
 
-        issue_description = f"The non-sortal ('{class_st}') class '{class_name}' has isAbstract attribute set 'false'."
-        issue = ResultIssue(rule_code, issue_description, class_id)
+        issue = ResultIssue(rule_code, DESCRIPTION_R_CL_YOK, class_id, (class_st, class_name))
         rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_QJC(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_QJC",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype, ONTOUML.restrictedTo],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(3.0, 0.0),
+    severities=["error"],
+)
+def execute_rule_R_CL_QJC(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_QJC and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Returns classes and their respective restrictedTo value
-    query_answer = ontouml_model.query(QUERY_TAGGED_VALUE)
+    query_answer = execute_query(ontouml_model, QUERY_TAGGED_VALUE, query_cache)
 
     map_dict = {
         ONTOUML.collective: ONTOUML.collectiveNature,
@@ -391,73 +623,112 @@ def execute_rule_R_CL_QJC(ontouml_model: Graph, rule_code: str) -> tuple[list[Re
 
         if class_st in map_dict.keys():
             if (tagged is not None) and (tagged != map_dict[class_st]):
-                issue_description = (
-                    f"The class '{class_name.toPython()}' with stereotype '{class_st.toPython()}' "
-                    f"has an incorrect restrictedTo value ('{tagged.toPython()}'). "
+                issue = ResultIssue(
+                    rule_code,
+                    DESCRIPTION_R_CL_QJC,
+                    class_id,
+                    (class_name.toPython(), class_st.toPython(), tagged.toPython()),
                 )
-                issue = ResultIssue(rule_code, issue_description, class_id)
                 rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_EGT(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_EGT",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.general, ONTOUML.specific],
+    classes=[ONTOUML.Class],
+    indexes=["model_index", "hierarchy"],
+    cost=(0.1, 0.1),
+    severities=["error"],
+)
+def execute_rule_R_CL_EGT(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_EGT and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
-
-    all_model_classes = get_all_classes(ontouml_model)
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
-    for model_class in all_model_classes:
-        superclasses = get_all_superclasses(ontouml_model, model_class)
-        subclasses = get_all_subclasses(ontouml_model, model_class)
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
 
-        intersection = intersection_lists(superclasses, subclasses)
+    # The classes that are both superclasses and subclasses of a class are exactly the members of its cycle
+    # Members are sorted by their URIs, so that descriptions do not depend on the order of the model's triples
+    for cycle in count_scanned_rows(model_index.hierarchy.get_cycles()):
+        cycle = sorted(cycle)
+        intersection_names = []
+        for int_class in cycle:
+            intersection_names.append(get_class_name(ontouml_model, int_class, model_index))
 
-        if intersection:
-            intersection_names = []
-            for int_class in intersection:
-                intersection_names.append(get_class_name(ontouml_model, int_class))
+        for model_class in cycle:
+            if not model_index.is_focus_class(model_class):
+                continue
 
-            class_name = get_class_name(ontouml_model, model_class)
+            class_name = get_class_name(ontouml_model, model_class, model_index)
 
-            issue_description = (
-                f"The class '{class_name}' has the following classes as its subclasses and "
-                f"superclasses: {intersection_names}. "
-            )
-            issue = ResultIssue(rule_code, issue_description, model_class)
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EGT, model_class, (class_name, intersection_names))
             rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_EMV(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_EMV",
+    "CL",
+    predicates=[RDF.type, ONTOUML.name, ONTOUML.stereotype, ONTOUML.restrictedTo],
+    classes=[ONTOUML.Class],
+    indexes=["query_cache"],
+    cost=(5.0, 0.0),
+    severities=["warning", "error"],
+)
+def execute_rule_R_CL_EMV(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_EMV and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
     # Returns classes and their respective restrictedTo value
-    query_answer = ontouml_model.query(QUERY_TAGGED_VALUE)
+    query_answer = execute_query(ontouml_model, QUERY_TAGGED_VALUE, query_cache)
 
     for row in query_answer:
         class_id = row.class_id
@@ -466,58 +737,83 @@ def execute_rule_R_CL_EMV(ontouml_model: Graph, rule_code: str) -> tuple[list[Re
         tagged = row.tagged
 
         if tagged is None:
-            issue_description = (
-                f"The class '{class_name.toPython()}' with stereotype '{class_st.toPython()}' "
-                f"has no restrictedTo value. "
+            issue = ResultIssue(
+                rule_code, DESCRIPTION_R_CL_EMV_NO_VALUE, class_id, (class_name.toPython(), class_st.toPython())
             )
-            issue = ResultIssue(rule_code, issue_description, class_id)
             rule_w_list.append(issue)
         elif tagged.toPython() not in ONTOUML_ONTOLOGICAL_NATURES:
-            issue_description = (
-                f"The class '{class_name.toPython()}' with stereotype '{class_st.toPython()}' "
-                f"has an invalid restrictedTo value ('{tagged.toPython()}'). "
+            issue = ResultIssue(
+                rule_code,
+                DESCRIPTION_R_CL_EMV_INVALID_VALUE,
+                class_id,
+                (class_name.toPython(), class_st.toPython(), tagged.toPython()),
             )
-            issue = ResultIssue(rule_code, issue_description, class_id)
             rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
 
 
-def execute_rule_R_CL_ALX(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+@register_rule(
+    "R_CL_ALX",
+    "CL",
+    predicates=[RDF.type, ONTOUML.stereotype, ONTOUML.name, ONTOUML.general, ONTOUML.specific],
+    classes=[ONTOUML.Class],
+    indexes=["model_index", "hierarchy"],
+    cost=(0.5, 0.5),
+    severities=["error"],
+)
+def execute_rule_R_CL_ALX(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Execute rule R_CL_ALX and return its description and results.
 
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary)" : "be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of this rule.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
     :return: A tuple with two components:
         - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
         - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    rule_w_list = []
-    rule_e_list = []
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
 
-    all_ultimate_classes = get_classes_of_types(ontouml_model, ONTOUML_ST_ULTIMATE_SORTALS)
-    all_non_sortal_classes = get_classes_of_types(ontouml_model, ONTOUML_ST_NON_SORTALS)
-    verify_classes = all_ultimate_classes + all_non_sortal_classes
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+    hierarchy = model_index.hierarchy
 
-    for ou_class in verify_classes:
-        class_name = get_class_name(ontouml_model, ou_class)
-        class_st = get_class_stereotype(ontouml_model, ou_class)
+    verify_classes = model_index.get_focus_classes_of_types(ONTOUML_ST_ULTIMATE_SORTALS + ONTOUML_ST_NON_SORTALS)
 
-        superclasses = get_all_superclasses(ontouml_model, ou_class)
+    # Bitset of all classes that cannot be specialized by the verified classes
+    invalid_general_classes = get_classes_of_types(
+        ontouml_model, ONTOUML_ST_SORTALS + ONTOUML_ST_ABSTRACTS, model_index
+    )
+    invalid_general_bits = hierarchy.get_bits(invalid_general_classes)
 
-        for superclass in superclasses:
-            superclass_st = get_class_stereotype(ontouml_model, superclass)
+    for ou_class in count_scanned_rows(verify_classes):
+        invalid_superclasses_bits = hierarchy.get_ancestor_bits(ou_class) & invalid_general_bits
+        if not invalid_superclasses_bits:
+            continue
 
-            if (superclass_st in ONTOUML_ST_SORTALS) or (superclass_st in ONTOUML_ST_ABSTRACTS):
-                superclass_name = get_class_name(ontouml_model, superclass)
-                issue_description = (
-                    f"The class '{class_name}' with stereotype {class_st} has an invalid specialization with "
-                    f"the class {superclass_name} stereotyped as {superclass_st}."
-                )
-                issue = ResultIssue(rule_code, issue_description, ou_class)
-                rule_e_list.append(issue)
+        class_name = get_class_name(ontouml_model, ou_class, model_index)
+        class_st = get_class_stereotype(ontouml_model, ou_class, model_index)
+
+        for superclass in hierarchy.decode_bits(invalid_superclasses_bits):
+            superclass_st = get_class_stereotype(ontouml_model, superclass, model_index)
+            superclass_name = get_class_name(ontouml_model, superclass, model_index)
+            issue = ResultIssue(
+                rule_code, DESCRIPTION_R_CL_ALX, ou_class, (class_name, class_st, superclass_name, superclass_st)
+            )
+            rule_e_list.append(issue)
 
     return rule_w_list, rule_e_list
@@ -0,0 +1,789 @@
+"""OntoUML Validation Rules: Group CL (native backend).
+
+This module provides an alternative implementation, without SPARQL, of the rules of the group CL that are evaluated in
+the module rules_cl through SPARQL queries. These functions read only the precomputed ModelIndex of the model and
+report the same issues as their SPARQL counterparts, which remain available as the reference implementation.
+
+Rules that are not based on SPARQL queries already use the ModelIndex. The native implementations of R_CL_ZGT and
+R_CL_ALX evaluate all classes at once through the NumPy arrays of the hierarchy (see HierarchyArrays) instead of testing
+the superclasses of each class. NumPy is optional: without it, they run their reference implementations, as R_CL_EGT
+(which has no native implementation) always does.
+
+Native rules only evaluate the focus classes of the received index (all classes, unless a focused copy of the index is
+received), which allows the incremental validation of a model to re-evaluate only the classes affected by a change.
+With a focused index, R_CL_ZGT and R_CL_ALX only traverse the superclasses of the focus classes instead of using the
+arrays of the whole hierarchy, which would be rebuilt after each change to the hierarchy or to the stereotypes.
+"""
+from rdflib import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from validator.modules.query_cache import QueryCache
+from validator.modules.validation_metrics import count_scanned_rows
+from validator.validations.rules_cl.descriptions_cl import (
+    DESCRIPTION_R_CL_AIB,
+    DESCRIPTION_R_CL_ALX,
+    DESCRIPTION_R_CL_BWZ_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_BWZ_STEREOTYPE,
+    DESCRIPTION_R_CL_EDA_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_EDA_STEREOTYPE,
+    DESCRIPTION_R_CL_EMV_INVALID_VALUE,
+    DESCRIPTION_R_CL_EMV_NO_VALUE,
+    DESCRIPTION_R_CL_GJU_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_GJU_STEREOTYPES,
+    DESCRIPTION_R_CL_JOJ_NO_STEREOTYPE,
+    DESCRIPTION_R_CL_JOJ_STEREOTYPE,
+    DESCRIPTION_R_CL_QJC,
+    DESCRIPTION_R_CL_UMC,
+    DESCRIPTION_R_CL_XJZ,
+    DESCRIPTION_R_CL_YOK,
+    DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL,
+    DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS,
+)
+from validator.validations.issue_sink import IssueSink, create_issues_lists
+from validator.validations.result_issue import ResultIssue
+from validator.validations.rules_cl import rules_cl
+from validator.validations.rules_registry import register_rule
+from validator.vocab_lib.hierarchy_arrays import is_vectorization_available
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+from validator.vocab_lib.variables import (
+    ONTOUML_CLASS_STEREOTYPES,
+    ONTOUML_ONTOLOGICAL_NATURES,
+    ONTOUML_ST_ABSTRACTS,
+    ONTOUML_ST_BASE_SORTALS,
+    ONTOUML_ST_NON_SORTALS,
+    ONTOUML_ST_SORTALS,
+    ONTOUML_ST_ULTIMATE_SORTALS,
+)
+
+ONTOUML_ENUMERATION = str(ONTOUML.enumeration)
+
+# Shared structures of the rules evaluated through the arrays of the hierarchy, which fall back to the closure of the
+# hierarchy used by their reference implementations when NumPy is not installed
+HIERARCHY_INDEXES = (
+    ["model_index", "hierarchy_arrays"] if is_vectorization_available() else ["model_index", "hierarchy"]
+)
+
+
+def _get_values_or_none(values: list[str]) -> list[str | None]:
+    """Return the received values or, if there are none, a list with a single None.
+
+    Emulates the solutions of an OPTIONAL pattern, which produces one solution with an unbound variable when the
+    optional property has no values.
+
+    :param values: The values of an optional property.
+    :type values: list[str]
+    :return: The received values or a list with a single None.
+    :rtype: list[str | None]
+    """
+    return values if values else [None]
+
+
+@register_rule("R_CL_XJZ", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_XJZ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_XJZ without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Enumeration classes that have attributes
+    for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(ONTOUML_ENUMERATION, [])):
+        if not model_index.class_attributes[class_id]:
+            continue
+
+        for class_name in dict.fromkeys(model_index.class_names[class_id]):
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_XJZ, class_id, (class_name,))
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_JOJ", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_JOJ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_JOJ without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Classes that have literals
+    for class_id in count_scanned_rows(model_index.focus_classes):
+        if not model_index.class_literals[class_id]:
+            continue
+
+        for class_name in dict.fromkeys(model_index.class_names[class_id]):
+            for class_st in _get_values_or_none(model_index.class_stereotypes[class_id]):
+                # Class without stereotype but with enumeration literals
+                if class_st is None:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_JOJ_NO_STEREOTYPE, class_id, (class_name,))
+                    rule_w_list.append(issue)
+                # Class with stereotype different from enumeration and with enumeration literals
+                elif class_st != ONTOUML_ENUMERATION:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_JOJ_STEREOTYPE, class_id, (class_name, class_st))
+                    rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_UMC", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_UMC(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_UMC without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Enumeration classes and their respective number of literals
+    for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(ONTOUML_ENUMERATION, [])):
+        class_names = model_index.class_names[class_id]
+        if not class_names:
+            continue
+
+        # As in the SPARQL query, literals are counted once for each name of the class
+        class_lt = len(class_names) * len(model_index.class_literals[class_id])
+
+        if class_lt < 2:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_UMC, class_id, (class_names[0],))
+            rule_w_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_AIB", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_AIB(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_AIB without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Enumeration classes that are the general class of some generalization
+    for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(ONTOUML_ENUMERATION, [])):
+        if class_id not in model_index.generalizations_by_general:
+            continue
+
+        for class_name in dict.fromkeys(model_index.class_names[class_id]):
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_AIB, class_id, (class_name,))
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_EDA", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_EDA(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_EDA without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    abstract_st = str(ONTOUML.abstract)
+
+    for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(ONTOUML_ENUMERATION, [])):
+        # Distinct stereotypes (None for no stereotype) of the superclasses not decorated with «abstract»
+        superclasses_sts = {}
+        for superclass in model_index.direct_superclasses.get(class_id, []):
+            superclass_sts = model_index.class_stereotypes.get(superclass, [])
+            if abstract_st not in superclass_sts:
+                superclasses_sts.update(dict.fromkeys(_get_values_or_none(superclass_sts)))
+
+        for class_name in dict.fromkeys(model_index.class_names[class_id]):
+            for superclass_st in superclasses_sts:
+                if superclass_st is None:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EDA_NO_STEREOTYPE, class_id, (class_name,))
+                    rule_w_list.append(issue)
+                else:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EDA_STEREOTYPE, class_id, (class_name,))
+                    rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_GJU", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_GJU(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_GJU without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Every class and the amount of stereotypes they have
+    for class_id in count_scanned_rows(model_index.focus_classes):
+        class_names = model_index.class_names[class_id]
+        if not class_names:
+            continue
+
+        # As in the SPARQL query, stereotypes are counted once for each name of the class
+        class_sts = len(class_names) * len(model_index.class_stereotypes[class_id])
+
+        if class_sts == 0:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_GJU_NO_STEREOTYPE, class_id, (class_names[0],))
+            rule_w_list.append(issue)
+        elif class_sts > 1:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_GJU_STEREOTYPES, class_id, (class_names[0],))
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_BWZ", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_BWZ(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_BWZ without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Every class and their respective stereotype
+    for class_id in count_scanned_rows(model_index.focus_classes):
+        for class_name in dict.fromkeys(model_index.class_names[class_id]):
+            for class_st in _get_values_or_none(model_index.class_stereotypes[class_id]):
+                if class_st is None:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_BWZ_NO_STEREOTYPE, class_id, (class_name,))
+                    rule_w_list.append(issue)
+                elif class_st not in ONTOUML_CLASS_STEREOTYPES:
+                    issue = ResultIssue(rule_code, DESCRIPTION_R_CL_BWZ_STEREOTYPE, class_id, (class_name, class_st))
+                    rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_YOK", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_YOK(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_YOK without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Every non-sortal class that has its attribute isAbstract set to false
+    for class_st in ONTOUML_ST_NON_SORTALS:
+        for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(class_st, [])):
+            if not any(is_abstract is False for is_abstract in model_index.class_is_abstract[class_id]):
+                continue
+
+            for class_name in model_index.class_names[class_id]:
+                issue = ResultIssue(rule_code, DESCRIPTION_R_CL_YOK, class_id, (class_st, class_name))
+                rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+# Ontological nature to which classes decorated with each stereotype must be restricted (used by rule R_CL_QJC)
+STEREOTYPES_NATURES = {
+    str(ONTOUML.collective): str(ONTOUML.collectiveNature),
+    str(ONTOUML.event): str(ONTOUML.eventNature),
+    str(ONTOUML.kind): str(ONTOUML.functionalComplexNature),
+    str(ONTOUML.quality): str(ONTOUML.qualityNature),
+    str(ONTOUML.quantity): str(ONTOUML.quantityNature),
+    str(ONTOUML.relator): str(ONTOUML.relatorNature),
+    str(ONTOUML.situation): str(ONTOUML.situationNature),
+    str(ONTOUML.abstract): str(ONTOUML.abstractNature),
+    str(ONTOUML.datatype): str(ONTOUML.abstractNature),
+    str(ONTOUML.enumeration): str(ONTOUML.abstractNature),
+}
+
+
+@register_rule("R_CL_QJC", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_QJC(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_QJC without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Classes and their respective restrictedTo value
+    for class_st, expected_nature in STEREOTYPES_NATURES.items():
+        for class_id in count_scanned_rows(model_index.focus_classes_by_stereotype.get(class_st, [])):
+            for class_name in model_index.class_names[class_id]:
+                for tagged in model_index.class_restricted_to[class_id]:
+                    if tagged != expected_nature:
+                        issue = ResultIssue(rule_code, DESCRIPTION_R_CL_QJC, class_id, (class_name, class_st, tagged))
+                        rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_EMV", "CL", indexes=["model_index"], backend="native")
+def execute_rule_R_CL_EMV(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_EMV without SPARQL and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    # Classes with stereotypes and their respective restrictedTo value
+    for class_id in count_scanned_rows(model_index.focus_classes):
+        for class_name in model_index.class_names[class_id]:
+            for class_st in model_index.class_stereotypes[class_id]:
+                for tagged in _get_values_or_none(model_index.class_restricted_to[class_id]):
+                    if tagged is None:
+                        issue = ResultIssue(rule_code, DESCRIPTION_R_CL_EMV_NO_VALUE, class_id, (class_name, class_st))
+                        rule_w_list.append(issue)
+                    elif tagged not in ONTOUML_ONTOLOGICAL_NATURES:
+                        issue = ResultIssue(
+                            rule_code, DESCRIPTION_R_CL_EMV_INVALID_VALUE, class_id, (class_name, class_st, tagged)
+                        )
+                        rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_ZGT", "CL", indexes=HIERARCHY_INDEXES, backend="native")
+def execute_rule_R_CL_ZGT(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_ZGT through the arrays of the hierarchy and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    if model_index is not None and model_index.is_focused():
+        return _execute_rule_R_CL_ZGT_focused(rule_code, model_index, issue_sink)
+    if not is_vectorization_available():
+        return rules_cl.execute_rule_R_CL_ZGT(ontouml_model, rule_code, model_index, query_cache, issue_sink)
+
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+    hierarchy_arrays = model_index.hierarchy_arrays
+
+    base_sortals = model_index.get_focus_classes_of_types(ONTOUML_ST_BASE_SORTALS)
+    base_sortals_ids = hierarchy_arrays.get_ids(count_scanned_rows(base_sortals))
+
+    # Number of distinct ultimate sortals among all (direct and indirect) superclasses of each class
+    ultimate_sortals_mask = hierarchy_arrays.get_category_mask(ONTOUML_ST_ULTIMATE_SORTALS)
+    _, descendants = hierarchy_arrays.get_descendant_pairs(ultimate_sortals_mask)
+    sup_counts = np.bincount(descendants, minlength=hierarchy_arrays.num_classes)[base_sortals_ids]
+
+    for base_index in np.flatnonzero(sup_counts != 1):
+        base_sortal = base_sortals[base_index]
+        sup_count = int(sup_counts[base_index])
+        class_name = model_index.get_name(base_sortal)
+
+        if sup_count == 0:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL, base_sortal, (class_name,))
+            rule_w_list.append(issue)
+        else:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS, base_sortal, (class_name, sup_count))
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+@register_rule("R_CL_ALX", "CL", indexes=HIERARCHY_INDEXES, backend="native")
+def execute_rule_R_CL_ALX(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_ALX through the arrays of the hierarchy and return its description and results.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the native backend. Kept for compatibility with the SPARQL backend.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    if model_index is not None and model_index.is_focused():
+        return _execute_rule_R_CL_ALX_focused(rule_code, model_index, issue_sink)
+    if not is_vectorization_available():
+        return rules_cl.execute_rule_R_CL_ALX(ontouml_model, rule_code, model_index, query_cache, issue_sink)
+
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+    hierarchy_arrays = model_index.hierarchy_arrays
+
+    verify_classes = model_index.get_focus_classes_of_types(ONTOUML_ST_ULTIMATE_SORTALS + ONTOUML_ST_NON_SORTALS)
+    verify_ids = hierarchy_arrays.get_ids(count_scanned_rows(verify_classes))
+    verify_mask = np.zeros(hierarchy_arrays.num_classes, dtype=bool)
+    verify_mask[verify_ids] = True
+
+    # Pairs of a class that cannot be specialized by the verified classes and one of its verified subclasses
+    invalid_generals_mask = hierarchy_arrays.get_category_mask(ONTOUML_ST_SORTALS + ONTOUML_ST_ABSTRACTS)
+    generals, descendants = hierarchy_arrays.get_descendant_pairs(invalid_generals_mask)
+    is_verified = verify_mask[descendants]
+    generals, descendants = generals[is_verified], descendants[is_verified]
+
+    # Invalid superclasses of each verified class, ordered by id as in the reference implementation
+    pairs_order = np.lexsort((generals, descendants))
+    sorted_generals = generals[pairs_order].tolist()
+    superclasses_counts = np.bincount(descendants, minlength=hierarchy_arrays.num_classes)
+    superclasses_ends = np.cumsum(superclasses_counts).tolist()
+    invalid_verify_indexes = np.flatnonzero(superclasses_counts[verify_ids]).tolist()
+
+    # Names and stereotypes are read once for each invalid superclass, which may be reported for many classes
+    superclasses_data = {}
+    for superclass_id in np.unique(generals).tolist():
+        superclass = hierarchy_arrays.id_classes[superclass_id]
+        superclasses_data[superclass_id] = (model_index.get_name(superclass), model_index.get_stereotype(superclass))
+
+    for verify_index in invalid_verify_indexes:
+        ou_class = verify_classes[verify_index]
+        class_id = hierarchy_arrays.class_ids[ou_class]
+        class_name = model_index.get_name(ou_class)
+        class_st = model_index.get_stereotype(ou_class)
+
+        superclasses_start = superclasses_ends[class_id - 1] if class_id else 0
+        superclasses_end = superclasses_ends[class_id]
+        for superclass_id in sorted_generals[superclasses_start:superclasses_end]:
+            superclass_name, superclass_st = superclasses_data[superclass_id]
+            issue = ResultIssue(
+                rule_code, DESCRIPTION_R_CL_ALX, ou_class, (class_name, class_st, superclass_name, superclass_st)
+            )
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+def _execute_rule_R_CL_ZGT_focused(
+    rule_code: str, model_index: ModelIndex, issue_sink: IssueSink | None
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_ZGT on the focus classes of a focused index, only traversing their superclasses.
+
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Focused index of the OntoUML model.
+    :type model_index: ModelIndex
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+    ultimate_sortals_sts = set(ONTOUML_ST_ULTIMATE_SORTALS)
+
+    for base_sortal in count_scanned_rows(model_index.get_focus_classes_of_types(ONTOUML_ST_BASE_SORTALS)):
+        # Number of distinct ultimate sortals among all (direct and indirect) superclasses of the base sortal
+        sup_count = sum(
+            1
+            for superclass in model_index.get_superclasses(base_sortal)
+            if ultimate_sortals_sts.intersection(model_index.class_stereotypes.get(superclass, []))
+        )
+        if sup_count == 1:
+            continue
+
+        class_name = model_index.get_name(base_sortal)
+        if sup_count == 0:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_NO_ULTIMATE_SORTAL, base_sortal, (class_name,))
+            rule_w_list.append(issue)
+        else:
+            issue = ResultIssue(rule_code, DESCRIPTION_R_CL_ZGT_ULTIMATE_SORTALS, base_sortal, (class_name, sup_count))
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+def _execute_rule_R_CL_ALX_focused(
+    rule_code: str, model_index: ModelIndex, issue_sink: IssueSink | None
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute rule R_CL_ALX on the focus classes of a focused index, only traversing their superclasses.
+
+    :param rule_code: Code of this rule.
+    :type rule_code: str
+    :param model_index: Focused index of the OntoUML model.
+    :type model_index: ModelIndex
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+    invalid_generals_sts = set(ONTOUML_ST_SORTALS + ONTOUML_ST_ABSTRACTS)
+
+    verify_classes = model_index.get_focus_classes_of_types(ONTOUML_ST_ULTIMATE_SORTALS + ONTOUML_ST_NON_SORTALS)
+    for ou_class in count_scanned_rows(verify_classes):
+        # Superclasses that cannot be specialized by the verified class, in the order of the reference implementation
+        invalid_superclasses = sorted(
+            (
+                superclass
+                for superclass in model_index.get_superclasses(ou_class)
+                if invalid_generals_sts.intersection(model_index.class_stereotypes.get(superclass, []))
+            ),
+            key=model_index.class_numbers.__getitem__,
+        )
+        if not invalid_superclasses:
+            continue
+
+        class_name = model_index.get_name(ou_class)
+        class_st = model_index.get_stereotype(ou_class)
+        for superclass in invalid_superclasses:
+            superclass_name = model_index.get_name(superclass)
+            superclass_st = model_index.get_stereotype(superclass)
+            issue = ResultIssue(
+                rule_code, DESCRIPTION_R_CL_ALX, ou_class, (class_name, class_st, superclass_name, superclass_st)
+            )
+            rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
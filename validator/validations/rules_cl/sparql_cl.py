@@ -39,6 +39,23 @@ WHERE {
 } GROUP BY ?class_id """
 )
 
+# Existence check of the warnings of R_CL_UMC: enumeration classes that, as counted by QUERY_R_CL_UMC (once for each
+# name of the class), have less than two literals
+ASK_R_CL_UMC_WARNING = (
+    ONTOUML_SPARQL_PREFIX
+    + """
+ASK {
+    ?class_id rdf:type ontouml:Class .
+    ?class_id ontouml:name ?class_name .
+    ?class_id ontouml:stereotype ontouml:enumeration .
+    FILTER NOT EXISTS { ?class_id ontouml:literal ?class_lt1, ?class_lt2 . FILTER (?class_lt1 != ?class_lt2) }
+    FILTER NOT EXISTS {
+        ?class_id ontouml:literal ?class_lt ; ontouml:name ?other_name . FILTER (?other_name != ?class_name)
+    }
+}
+"""
+)
+
 QUERY_R_CL_AIB = (
     ONTOUML_SPARQL_PREFIX
     + """
@@ -79,6 +96,33 @@ WHERE {
 } GROUP BY ?class_id """
 )
 
+# Existence check of the warnings of R_CL_GJU: classes without stereotypes
+ASK_R_CL_GJU_WARNING = (
+    ONTOUML_SPARQL_PREFIX
+    + """
+ASK {
+    ?class_id rdf:type ontouml:Class .
+    ?class_id ontouml:name ?class_name .
+    FILTER NOT EXISTS { ?class_id ontouml:stereotype ?class_st . }
+}
+"""
+)
+
+# Existence check of the errors of R_CL_GJU: classes with more than one stereotype, as counted by QUERY_R_CL_GJU (once
+# for each name of the class)
+ASK_R_CL_GJU_ERROR = (
+    ONTOUML_SPARQL_PREFIX
+    + """
+ASK {
+    ?class_id rdf:type ontouml:Class .
+    ?class_id ontouml:name ?class_name .
+    ?class_id ontouml:stereotype ?class_st .
+    FILTER (EXISTS { ?class_id ontouml:stereotype ?other_st . FILTER (?other_st != ?class_st) }
+            || EXISTS { ?class_id ontouml:name ?other_name . FILTER (?other_name != ?class_name) })
+}
+"""
+)
+
 QUERY_R_CL_BWZ = (
     ONTOUML_SPARQL_PREFIX
     + """
@@ -0,0 +1,66 @@
+"""Define the templates of the descriptions of the issues reported by rules of the group GE.
+
+Templates are formatted with str.format using the parameters of each issue, only when its description is accessed.
+Issues are related to the specific class of the invalid generalization. Warnings are reported when the specific class
+has no value for a tagged value (or no stereotype) that is required by the general class.
+"""
+
+DESCRIPTION_R_GE_BAK_NO_STEREOTYPE = (
+    "The class '{}' without stereotype specializes the class '{}' stereotyped as abstract and, hence, must be "
+    "stereotyped as abstract, datatype or enumeration."
+)
+DESCRIPTION_R_GE_BAK_STEREOTYPE = (
+    "The class '{}' with stereotype {} specializes the class '{}' stereotyped as abstract, but is not stereotyped as "
+    "abstract, datatype or enumeration."
+)
+
+DESCRIPTION_R_GE_EPG = (
+    "The ultimate sortal class '{}' with stereotype {} specializes the ultimate sortal class '{}' ({})."
+)
+
+DESCRIPTION_R_GE_HGQ = "The non-sortal class '{}' with stereotype {} specializes the sortal class '{}' ({})."
+
+DESCRIPTION_R_GE_HPZ = (
+    "The class '{}' has restrictedTo values ({}) that are not restrictedTo values of its general class '{}' ({})."
+)
+
+DESCRIPTION_R_GE_IJM_NO_STEREOTYPE = (
+    "The class '{}' without stereotype specializes the class '{}' stereotyped as event and, hence, must be "
+    "stereotyped as event."
+)
+DESCRIPTION_R_GE_IJM_STEREOTYPE = "The class '{}' with stereotype {} specializes the class '{}' stereotyped as event."
+
+DESCRIPTION_R_GE_JLW_NO_STEREOTYPE = (
+    "The class '{}' without stereotype specializes the class '{}' stereotyped as datatype and, hence, must be "
+    "stereotyped as datatype."
+)
+DESCRIPTION_R_GE_JLW_STEREOTYPE = (
+    "The class '{}' with stereotype {} specializes the class '{}' stereotyped as datatype."
+)
+
+DESCRIPTION_R_GE_MDR_NO_ORDER = "The class '{}' without order specializes the class '{}' with order {}."
+DESCRIPTION_R_GE_MDR_ORDER = "The class '{}' with order {} specializes the class '{}' with order {}."
+
+DESCRIPTION_R_GE_MXI = "The class '{}' with stereotype {} specializes the anti-rigid class '{}' ({})."
+
+DESCRIPTION_R_GE_UXR_NO_STEREOTYPE = (
+    "The class '{}' without stereotype specializes the class '{}' stereotyped as situation and, hence, must be "
+    "stereotyped as situation."
+)
+DESCRIPTION_R_GE_UXR_STEREOTYPE = (
+    "The class '{}' with stereotype {} specializes the class '{}' stereotyped as situation."
+)
+
+DESCRIPTION_R_GE_VEZ_NO_STEREOTYPE = (
+    "The class '{}' without stereotype specializes the class '{}' stereotyped as enumeration and, hence, must be "
+    "stereotyped as enumeration."
+)
+DESCRIPTION_R_GE_VEZ_STEREOTYPE = (
+    "The class '{}' with stereotype {} specializes the class '{}' stereotyped as enumeration."
+)
+
+DESCRIPTION_R_GE_XRS_NO_VALUE = (
+    "The class '{}' has no isExtensional value, but specializes the extensional class '{}' and, hence, must be "
+    "extensional."
+)
+DESCRIPTION_R_GE_XRS_NOT_EXTENSIONAL = "The class '{}' is not extensional, but specializes the extensional class '{}'."
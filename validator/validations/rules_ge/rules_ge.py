@@ -0,0 +1,352 @@
+"""OntoUML Validation Rules: Group GE.
+
+This module provides the execution of the rules of the group GE, which constrain the general and specific classes
+connected by each generalization. Instead of evaluating each rule separately, all rules of the group are evaluated by a
+single sweep over the generalizations of the model's index (see GeneralizationSweep), whose issues are shared by the
+rules through the index. Hence, executing all rules of the group costs one scan of the generalizations:
+    - Rules on stereotypes are evaluated through a compatibility matrix, precomputed for all pairs of general and
+      specific stereotypes, whose entries are the bitmasks of the rules violated by each pair.
+    - Rules on tagged values (restrictedTo, order and isExtensional) compare the values of both classes, which are
+      gathered only once for each class.
+
+Only the generalizations whose specific classes are focus classes of the index are evaluated, and their issues are
+related to their specific classes. Warnings are reported when the specific class has no stereotype, or no value for the
+tagged value, required by its general class, as its missing information may still satisfy the rule. Classes with more
+than one stereotype are checked for every pair of stereotypes.
+
+The sweep only reads the ModelIndex, so its implementation is used by all backends.
+"""
+import threading
+
+from rdflib import Graph, RDF
+
+from validator.modules.query_cache import QueryCache
+from validator.validations.issue_sink import IssueSink, create_issues_lists
+from validator.validations.result_issue import ResultIssue
+from validator.validations.rules_ge.descriptions_ge import (
+    DESCRIPTION_R_GE_BAK_NO_STEREOTYPE,
+    DESCRIPTION_R_GE_BAK_STEREOTYPE,
+    DESCRIPTION_R_GE_EPG,
+    DESCRIPTION_R_GE_HGQ,
+    DESCRIPTION_R_GE_HPZ,
+    DESCRIPTION_R_GE_IJM_NO_STEREOTYPE,
+    DESCRIPTION_R_GE_IJM_STEREOTYPE,
+    DESCRIPTION_R_GE_JLW_NO_STEREOTYPE,
+    DESCRIPTION_R_GE_JLW_STEREOTYPE,
+    DESCRIPTION_R_GE_MDR_NO_ORDER,
+    DESCRIPTION_R_GE_MDR_ORDER,
+    DESCRIPTION_R_GE_MXI,
+    DESCRIPTION_R_GE_UXR_NO_STEREOTYPE,
+    DESCRIPTION_R_GE_UXR_STEREOTYPE,
+    DESCRIPTION_R_GE_VEZ_NO_STEREOTYPE,
+    DESCRIPTION_R_GE_VEZ_STEREOTYPE,
+    DESCRIPTION_R_GE_XRS_NO_VALUE,
+    DESCRIPTION_R_GE_XRS_NOT_EXTENSIONAL,
+)
+from validator.validations.rules_registry import register_rule
+from validator.vocab_lib.model_index import ModelIndex
+from validator.vocab_lib.ontouml import ONTOUML
+from validator.vocab_lib.variables import (
+    ONTOUML_CLASS_STEREOTYPES,
+    ONTOUML_ST_ABSTRACTS,
+    ONTOUML_ST_NON_SORTALS,
+    ONTOUML_ST_RIGIDS,
+    ONTOUML_ST_SEMI_RIGIDS,
+    ONTOUML_ST_SORTALS,
+    ONTOUML_ST_ULTIMATE_SORTALS,
+    ST_ANTI_RIGIDS,
+)
+
+# Templates of the descriptions of the warnings (reported when the specific class has no stereotype or no value for the
+# tagged value required by the general class) and of the errors of the rules of the group. The order of the rules is
+# the order of their bits in the bitmasks of violated rules.
+GE_RULES_DESCRIPTIONS = {
+    "R_GE_BAK": (DESCRIPTION_R_GE_BAK_NO_STEREOTYPE, DESCRIPTION_R_GE_BAK_STEREOTYPE),
+    "R_GE_EPG": (None, DESCRIPTION_R_GE_EPG),
+    "R_GE_HGQ": (None, DESCRIPTION_R_GE_HGQ),
+    "R_GE_HPZ": (None, DESCRIPTION_R_GE_HPZ),
+    "R_GE_IJM": (DESCRIPTION_R_GE_IJM_NO_STEREOTYPE, DESCRIPTION_R_GE_IJM_STEREOTYPE),
+    "R_GE_JLW": (DESCRIPTION_R_GE_JLW_NO_STEREOTYPE, DESCRIPTION_R_GE_JLW_STEREOTYPE),
+    "R_GE_MDR": (DESCRIPTION_R_GE_MDR_NO_ORDER, DESCRIPTION_R_GE_MDR_ORDER),
+    "R_GE_MXI": (None, DESCRIPTION_R_GE_MXI),
+    "R_GE_UXR": (DESCRIPTION_R_GE_UXR_NO_STEREOTYPE, DESCRIPTION_R_GE_UXR_STEREOTYPE),
+    "R_GE_VEZ": (DESCRIPTION_R_GE_VEZ_NO_STEREOTYPE, DESCRIPTION_R_GE_VEZ_STEREOTYPE),
+    "R_GE_XRS": (DESCRIPTION_R_GE_XRS_NO_VALUE, DESCRIPTION_R_GE_XRS_NOT_EXTENSIONAL),
+}
+RULES_BITS = {rule_code: 1 << rule_index for rule_index, rule_code in enumerate(GE_RULES_DESCRIPTIONS)}
+
+# Rules requiring the specific classes of a general class with a stereotype to have the same stereotype
+SAME_STEREOTYPE_RULES = {
+    "R_GE_IJM": str(ONTOUML.event),
+    "R_GE_JLW": str(ONTOUML.datatype),
+    "R_GE_UXR": str(ONTOUML.situation),
+    "R_GE_VEZ": str(ONTOUML.enumeration),
+}
+
+# Predicates of the OntoUML model read by the sweep, which are the predicates of all rules of the group
+GE_PREDICATES = [
+    RDF.type,
+    ONTOUML.name,
+    ONTOUML.stereotype,
+    ONTOUML.restrictedTo,
+    ONTOUML.order,
+    ONTOUML.isExtensional,
+    ONTOUML.general,
+    ONTOUML.specific,
+]
+
+# Key of the sweep among the structures derived from the ModelIndex
+SWEEP_KEY = "generalization_sweep"
+
+# Rules of the group executed at the same time by different threads wait for a single sweep
+_SWEEP_LOCK = threading.Lock()
+
+
+def get_violated_rules_bits(general_st: str | None, specific_st: str | None) -> int:
+    """Return the bitmask of the rules on stereotypes violated by a generalization between two stereotyped classes.
+
+    If the specific class has no stereotype, the returned rules are the ones requiring it to have some stereotype.
+
+    :param general_st: Stereotype of the general class, None if it has no stereotype.
+    :type general_st: str | None
+    :param specific_st: Stereotype of the specific class, None if it has no stereotype.
+    :type specific_st: str | None
+    :return: Bitmask of the violated rules, whose bits are the ones in RULES_BITS.
+    :rtype: int
+    """
+    violated_bits = 0
+
+    if general_st == str(ONTOUML.abstract) and specific_st not in ONTOUML_ST_ABSTRACTS:
+        violated_bits |= RULES_BITS["R_GE_BAK"]
+    if general_st in ONTOUML_ST_ULTIMATE_SORTALS and specific_st in ONTOUML_ST_ULTIMATE_SORTALS:
+        violated_bits |= RULES_BITS["R_GE_EPG"]
+    if general_st in ONTOUML_ST_SORTALS and specific_st in ONTOUML_ST_NON_SORTALS:
+        violated_bits |= RULES_BITS["R_GE_HGQ"]
+    if general_st in ST_ANTI_RIGIDS and specific_st in ONTOUML_ST_RIGIDS + ONTOUML_ST_SEMI_RIGIDS:
+        violated_bits |= RULES_BITS["R_GE_MXI"]
+
+    for rule_code, rule_st in SAME_STEREOTYPE_RULES.items():
+        if general_st == rule_st and specific_st != rule_st:
+            violated_bits |= RULES_BITS[rule_code]
+
+    return violated_bits
+
+
+# Compatibility matrix, mapping each (general_st, specific_st) pair of stereotypes of the profile (or None, for classes
+# without stereotypes) to the bitmask of the violated rules. Pairs with other stereotypes are evaluated when found.
+MATRIX_STEREOTYPES = ONTOUML_CLASS_STEREOTYPES + [None]
+STEREOTYPES_MATRIX = {
+    (general_st, specific_st): get_violated_rules_bits(general_st, specific_st)
+    for general_st in MATRIX_STEREOTYPES
+    for specific_st in MATRIX_STEREOTYPES
+}
+
+# Stereotypes of the classes without stereotypes in the compatibility matrix
+NO_STEREOTYPES = [None]
+
+
+def _format_values(values: list) -> str:
+    """Return the values of a tagged value of a class as a string, to be used in issue descriptions."""
+    return ", ".join(str(value) for value in values)
+
+
+class GeneralizationSweep:
+    """A class to represent the issues of all rules of the group GE found in a single sweep over the generalizations."""
+
+    def __init__(self, model_index: ModelIndex):
+        """Initialize a GeneralizationSweep object, evaluating the generalizations of the focus classes of an index.
+
+        Only generalizations whose specific classes are focus classes of the index are evaluated.
+
+        :param model_index: The (possibly focused) index of the model.
+        :type model_index: ModelIndex
+        """
+        self.model_index = model_index
+        self.rules_warnings: dict[str, list[ResultIssue]] = {rule_code: [] for rule_code in GE_RULES_DESCRIPTIONS}
+        self.rules_errors: dict[str, list[ResultIssue]] = {rule_code: [] for rule_code in GE_RULES_DESCRIPTIONS}
+
+        is_focus_class = model_index.is_focus_class
+        class_stereotypes = model_index.class_stereotypes
+        class_restricted_to = model_index.class_restricted_to
+        class_order = model_index.class_order
+        class_is_extensional = model_index.class_is_extensional
+
+        # As for the hierarchy, the rows scanned to build the sweep are not counted in the metrics of the rule that
+        # happens to build it, so that the metrics of each rule do not depend on the order in which rules are executed
+        for _, general, specific in model_index.generalizations:
+            if not is_focus_class(specific):
+                continue
+            warning_bits = 0
+            error_bits = 0
+
+            stereotypes_bits = 0
+            specific_sts = class_stereotypes.get(specific) or NO_STEREOTYPES
+            for general_st in class_stereotypes.get(general) or NO_STEREOTYPES:
+                for specific_st in specific_sts:
+                    pair_bits = STEREOTYPES_MATRIX.get((general_st, specific_st))
+                    if pair_bits is None:
+                        pair_bits = get_violated_rules_bits(general_st, specific_st)
+                    stereotypes_bits |= pair_bits
+            if specific_sts is NO_STEREOTYPES:
+                warning_bits |= stereotypes_bits
+            else:
+                error_bits |= stereotypes_bits
+
+            # Tagged values are only compared when the general class has some value constraining the specific class.
+            # restrictedTo values are only compared if both classes have some.
+            general_restricted_to = class_restricted_to.get(general)
+            if general_restricted_to and not set(class_restricted_to[specific]).issubset(general_restricted_to):
+                error_bits |= RULES_BITS["R_GE_HPZ"]
+
+            # Orders set to '*' (represented as 0) do not constrain the orders of the specific classes
+            general_orders = class_order.get(general)
+            specific_orders = class_order[specific]
+            if general_orders and general_orders != specific_orders:
+                for order in general_orders:
+                    if isinstance(order, int) and order > 0 and order not in specific_orders:
+                        if any(isinstance(specific_order, int) for specific_order in specific_orders):
+                            error_bits |= RULES_BITS["R_GE_MDR"]
+                        else:
+                            warning_bits |= RULES_BITS["R_GE_MDR"]
+                        break
+
+            general_is_extensional = class_is_extensional.get(general)
+            if general_is_extensional and True in general_is_extensional:
+                specific_is_extensional = class_is_extensional[specific]
+                if True not in specific_is_extensional:
+                    if specific_is_extensional:
+                        error_bits |= RULES_BITS["R_GE_XRS"]
+                    else:
+                        warning_bits |= RULES_BITS["R_GE_XRS"]
+
+            if warning_bits:
+                self._add_issues(warning_bits, general, specific, self.rules_warnings, 0)
+            if error_bits:
+                self._add_issues(error_bits, general, specific, self.rules_errors, 1)
+
+    def _add_issues(
+        self,
+        violated_bits: int,
+        general: str,
+        specific: str,
+        rules_issues: dict[str, list[ResultIssue]],
+        description_index: int,
+    ) -> None:
+        """Add the issues of the rules violated by a generalization.
+
+        :param violated_bits: Bitmask of the violated rules.
+        :type violated_bits: int
+        :param general: The URI of the generalization's general class.
+        :type general: str
+        :param specific: The URI of the generalization's specific class.
+        :type specific: str
+        :param rules_issues: Dictionary mapping each rule to the list of issues to which its issue is added.
+        :type rules_issues: dict[str, list[ResultIssue]]
+        :param description_index: Index of the description's template in GE_RULES_DESCRIPTIONS: 0 for warnings and 1
+                                  for errors.
+        :type description_index: int
+        """
+        model_index = self.model_index
+        general_name = model_index.get_name(general)
+        specific_name = model_index.get_name(specific)
+        general_st = model_index.get_stereotype(general)
+        specific_st = model_index.get_stereotype(specific)
+        is_warning = description_index == 0
+
+        for rule_code, rule_bit in RULES_BITS.items():
+            if not violated_bits & rule_bit:
+                continue
+
+            if rule_code == "R_GE_HPZ":
+                general_restricted_to = model_index.class_restricted_to[general]
+                invalid_restricted_to = sorted(
+                    set(model_index.class_restricted_to[specific]).difference(general_restricted_to)
+                )
+                description_params = (
+                    specific_name,
+                    _format_values(invalid_restricted_to),
+                    general_name,
+                    _format_values(sorted(general_restricted_to)),
+                )
+            elif rule_code == "R_GE_MDR":
+                general_orders = _format_values(model_index.class_order[general])
+                if is_warning:
+                    description_params = (specific_name, general_name, general_orders)
+                else:
+                    specific_orders = _format_values(model_index.class_order[specific])
+                    description_params = (specific_name, specific_orders, general_name, general_orders)
+            elif is_warning or rule_code == "R_GE_XRS":
+                description_params = (specific_name, general_name)
+            elif rule_code == "R_GE_BAK" or rule_code in SAME_STEREOTYPE_RULES:
+                description_params = (specific_name, specific_st, general_name)
+            else:
+                description_params = (specific_name, specific_st, general_name, general_st)
+
+            template = GE_RULES_DESCRIPTIONS[rule_code][description_index]
+            rules_issues[rule_code].append(ResultIssue(rule_code, template, specific, description_params))
+
+
+def get_generalization_sweep(model_index: ModelIndex) -> GeneralizationSweep:
+    """Return the sweep over the generalizations of an index, which is only performed by the first rule requesting it.
+
+    :param model_index: The (possibly focused) index of the model.
+    :type model_index: ModelIndex
+    :return: The sweep over the generalizations whose specific classes are focus classes of the index.
+    :rtype: GeneralizationSweep
+    """
+    with _SWEEP_LOCK:
+        return model_index.get_derived(SWEEP_KEY, GeneralizationSweep)
+
+
+def execute_rule_R_GE(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    issue_sink: IssueSink | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
+    """Execute a rule of the group GE and return its description and results.
+
+    All rules of the group are registered with this function, which returns the rule's issues found by the sweep over
+    the generalizations of the index, performing the sweep if no other rule of the group has performed it yet.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
+                          Only used if model_index is not provided.
+    :type ontouml_model: Graph
+    :param rule_code: Code of the rule, which must be a key of GE_RULES_DESCRIPTIONS.
+    :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Not used by the rules of the group. Kept for compatibility with the other rules.
+    :type query_cache: QueryCache | None
+    :param issue_sink: Optional sink to which the issues are streamed. If provided, the returned lists are empty.
+    :type issue_sink: IssueSink | None
+    :return: A tuple with two components:
+        - A list of all warnings (as a ResultIssue object) found during the specific rule's validation process.
+        - A list of all errors (as a ResultIssue object) found during the specific rule's validation process.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue]]
+    """
+    rule_w_list, rule_e_list = create_issues_lists(issue_sink)
+
+    if model_index is None:
+        model_index = ModelIndex(ontouml_model)
+
+    sweep = get_generalization_sweep(model_index)
+    for issue in sweep.rules_warnings[rule_code]:
+        rule_w_list.append(issue)
+    for issue in sweep.rules_errors[rule_code]:
+        rule_e_list.append(issue)
+
+    return rule_w_list, rule_e_list
+
+
+for ge_rule_code in GE_RULES_DESCRIPTIONS:
+    register_rule(
+        ge_rule_code,
+        "GE",
+        predicates=GE_PREDICATES,
+        classes=[ONTOUML.Class],
+        indexes=["model_index"],
+        cost=(0.0, 0.1),
+        severities=["warning", "error"] if GE_RULES_DESCRIPTIONS[ge_rule_code][0] else ["error"],
+    )(execute_rule_R_GE)
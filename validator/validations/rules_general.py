@@ -5,84 +5,160 @@ validation process. It includes functions for validating input file extensions t
 with RDFLib's supported formats and for normalizing and validating world assumptions.
 """
 import inspect
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from loguru import logger
 from rdflib import Graph
 
+from .issue_sink import IssueCapReached, IssueSink, ValiditySink
 from .result_issue import ResultIssue
-from .rules_cl.rules_cl import (
-    execute_rule_R_CL_XJZ,
-    execute_rule_R_CL_JOJ,
-    execute_rule_R_CL_UMC,
-    execute_rule_R_CL_AIB,
-    execute_rule_R_CL_EDA,
-    execute_rule_R_CL_ZGT,
-    execute_rule_R_CL_GJU,
-    execute_rule_R_CL_BWZ,
-    execute_rule_R_CL_YOK,
-    execute_rule_R_CL_QJC,
-    execute_rule_R_CL_EGT,
-    execute_rule_R_CL_EMV,
-    execute_rule_R_CL_ALX,
-)
+
+# Modules containing rules are imported so that their rules are registered
+from .rules_cl import rules_cl, rules_cl_native  # noqa: F401
+from .rules_ge import rules_ge  # noqa: F401
 from .rules_definitions import RULES_DEFINITIONS
+from .validation_report import ValidationReport
+from .rules_registry import (
+    REFERENCE_BACKEND,
+    RULES_REGISTRY,
+    SEVERITIES,
+    get_registered_rules_codes,
+    get_required_indexes,
+    get_required_predicates,
+)
 from ..modules.errors import report_error_end_of_switch
+from ..modules.prepared_queries import get_prepared_queries_file, load_prepared_queries
+from ..modules.query_cache import QueryCache
+from ..modules.quiet_mode import is_quiet_mode, set_quiet_mode
+from ..modules.rule_scheduler import ModelStatistics, schedule_rules
+from ..modules.validation_metrics import RuleMetrics, ValidationMetrics
+from ..vocab_lib.model_index import ModelIndex
 
 
-def execute_rule_switch(ontouml_model: Graph, rule_code: str) -> tuple[list[ResultIssue], list[ResultIssue]]:
+def execute_rule_switch(
+    ontouml_model: Graph,
+    rule_code: str,
+    model_index: ModelIndex | None = None,
+    query_cache: QueryCache | None = None,
+    backend: str = "sparql",
+    issue_sink: IssueSink | None = None,
+    rule_metrics: RuleMetrics | None = None,
+) -> tuple[list[ResultIssue], list[ResultIssue]]:
     """Select a specific validation rule function based on the given 'rule_code' to be executed on the provided \
     OntoUML model.
 
+    The function is retrieved from the registry of rules, in which all implemented rules are registered when the
+    modules containing them (imported by this module) are loaded.
+
     :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated by the rule.
     :type ontouml_model: Graph
     :param rule_code: Code of the specific rule to be executed.
     :type rule_code: str
+    :param model_index: Optional precomputed index of the OntoUML model shared by all rules.
+    :type model_index: ModelIndex | None
+    :param query_cache: Optional cache of SPARQL query results shared by all rules.
+    :type query_cache: QueryCache | None
+    :param backend: Implementation of the rules to be executed. Allowed values are: 'sparql' (reference implementation,
+                    based on SPARQL queries) and 'native' (based only on the model_index).
+    :type backend: str
+    :param issue_sink: Optional sink to which the rule streams its issues. If provided, the returned lists are empty
+                       and the rule's enumeration is stopped when the sink does not need more of its issues.
+    :type issue_sink: IssueSink | None
+    :param rule_metrics: Optional metrics of the rule, to which the measurements of this execution are added.
+    :type rule_metrics: RuleMetrics | None
     :return: A tuple with two components:
         - A list of all warnings found during the specific rule's validation process.
         - A list of all errors found during the specific rule's validation process.
     :rtype: tuple[list[ResultIssue], list[ResultIssue]]
     """
-    logger.debug(f"Executing rule {rule_code}: {RULES_DEFINITIONS[rule_code]}")
-
-    if rule_code == "R_CL_GJU":
-        rule_w_list, rule_e_list = execute_rule_R_CL_GJU(ontouml_model, rule_code)
-    elif rule_code == "R_CL_BWZ":
-        rule_w_list, rule_e_list = execute_rule_R_CL_BWZ(ontouml_model, rule_code)
-    elif rule_code == "R_CL_XJZ":
-        rule_w_list, rule_e_list = execute_rule_R_CL_XJZ(ontouml_model, rule_code)
-    elif rule_code == "R_CL_JOJ":
-        rule_w_list, rule_e_list = execute_rule_R_CL_JOJ(ontouml_model, rule_code)
-    elif rule_code == "R_CL_UMC":
-        rule_w_list, rule_e_list = execute_rule_R_CL_UMC(ontouml_model, rule_code)
-    elif rule_code == "R_CL_AIB":
-        rule_w_list, rule_e_list = execute_rule_R_CL_AIB(ontouml_model, rule_code)
-    elif rule_code == "R_CL_EDA":
-        rule_w_list, rule_e_list = execute_rule_R_CL_EDA(ontouml_model, rule_code)
-    elif rule_code == "R_CL_ZGT":
-        rule_w_list, rule_e_list = execute_rule_R_CL_ZGT(ontouml_model, rule_code)
-    elif rule_code == "R_CL_YOK":
-        rule_w_list, rule_e_list = execute_rule_R_CL_YOK(ontouml_model, rule_code)
-    elif rule_code == "R_CL_QJC":
-        rule_w_list, rule_e_list = execute_rule_R_CL_QJC(ontouml_model, rule_code)
-    elif rule_code == "R_CL_EGT":
-        rule_w_list, rule_e_list = execute_rule_R_CL_EGT(ontouml_model, rule_code)
-    elif rule_code == "R_CL_EMV":
-        rule_w_list, rule_e_list = execute_rule_R_CL_EMV(ontouml_model, rule_code)
-    elif rule_code == "R_CL_ALX":
-        rule_w_list, rule_e_list = execute_rule_R_CL_ALX(ontouml_model, rule_code)
-    # This situation must never be reached
-    else:
+    registered_rule = RULES_REGISTRY.get(rule_code)
+
+    # Unimplemented (or unknown) rules cannot be executed
+    if registered_rule is None:
         current_function = inspect.stack()[0][3]
-        report_error_end_of_switch("rule_code", current_function)
+        report_error_end_of_switch(rule_code, current_function)
+
+    # Messages are only formatted if they are logged
+    is_logging = not is_quiet_mode()
+    if is_logging:
+        logger.debug("Executing rule {}: {}", rule_code, RULES_DEFINITIONS[rule_code])
+
+    rule_function = registered_rule.get_function(backend)
+    if rule_metrics is not None:
+        rule_metrics.start()
+    try:
+        rule_w_list, rule_e_list = rule_function(ontouml_model, rule_code, model_index, query_cache, issue_sink)
+    except IssueCapReached:
+        if is_logging:
+            logger.debug("Rule {} stopped, as no more of its issues are needed.", rule_code)
+        rule_w_list, rule_e_list = [], []
+    finally:
+        if rule_metrics is not None:
+            rule_metrics.stop()
+
+    if rule_metrics is not None:
+        # The issues of a rule streamed to a sink are the ones the sink accepted
+        if issue_sink is None:
+            rule_metrics.num_issues += len(rule_w_list) + len(rule_e_list)
+        else:
+            rule_metrics.num_issues += issue_sink.rules_num_issues.get(rule_code, 0)
 
     return rule_w_list, rule_e_list
 
 
-def execute_all_validation_rules(ontouml_model: Graph) -> tuple[list[str], list[str]]:
-    """Execute all validation rules and collect their results.
+def execute_all_validation_rules(
+    ontouml_model: Graph,
+    query_cache: QueryCache | None = None,
+    backend: str = "sparql",
+    workers: int = 1,
+    executor: str = "thread",
+    rules_codes: list[str] | None = None,
+    report: ValidationReport | None = None,
+    issue_sink: IssueSink | None = None,
+    metrics: ValidationMetrics | None = None,
+    model_index: ModelIndex | None = None,
+) -> tuple[list[str], list[str]]:
+    """Execute all implemented (i.e., registered) validation rules and collect their results.
 
-    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
-    :type ontouml_model: Graph
+    Rules only read the model and are independent of each other. When more than one worker is requested, they are
+    executed concurrently, started from the most to the least expensive one according to their estimated costs. The
+    results are always merged in the same rule order, so they do not depend on the number of workers.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated. May be
+                          None if a model_index is provided and the rules to be executed only use indexes.
+    :type ontouml_model: Graph | None
+    :param query_cache: Optional empty cache of SPARQL query results to be used during this validation. If not
+                        provided, a new one is created. Providing it allows the caller to inspect its hit/miss counters.
+                        Not used by process workers, which have their own caches.
+    :type query_cache: QueryCache | None
+    :param backend: Implementation of the rules to be executed. Allowed values are: 'sparql' and 'native'.
+    :type backend: str
+    :param workers: Number of rules executed concurrently. If 1 (default), rules are executed sequentially.
+    :type workers: int
+    :param executor: Type of the workers used when workers is greater than 1. Allowed values are: 'thread' (default)
+                     and 'process'. Each process worker receives a copy of the model and of its index. Both backends
+                     evaluate the rules in Python (rdflib's SPARQL engine included), holding the GIL, so threads only
+                     overlap the time the rules wait for I/O, e.g., reading a triple store whose pages are not cached.
+                     Only process workers run CPU-bound rules in parallel, at the cost of copying the model.
+    :type executor: str
+    :param rules_codes: Codes of the registered rules to be executed. If not provided, all registered rules are
+                        executed. Indexes and query results not used by these rules are not computed.
+    :type rules_codes: list[str] | None
+    :param report: Optional report to which the issues are added as the results of each rule are merged. If provided,
+                   the returned lists are empty.
+    :type report: ValidationReport | None
+    :param issue_sink: Optional sink to which the rules stream their issues as they are found. If provided, the
+                       returned lists are empty, issues are streamed in the order in which they are found and no more
+                       rules are executed once the sink is exhausted. Process workers return their complete results,
+                       which are streamed when merged.
+    :type issue_sink: IssueSink | None
+    :param metrics: Optional metrics of the validation, to which the time spent building the index of the model and
+                    the measurements of each executed rule are added.
+    :type metrics: ValidationMetrics | None
+    :param model_index: Optional index of the model (e.g., loaded from an OntoUML JSON file) with the predicates read
+                        by the rules to be executed. If provided, it is used instead of indexing the graph.
+    :type model_index: ModelIndex | None
     :return: A tuple with two components:
         - A list of all warnings found during the validation process.
         - A list of all errors found during the validation process.
@@ -92,11 +168,301 @@ def execute_all_validation_rules(ontouml_model: Graph) -> tuple[list[str], list[
     w_list = []
     e_list = []
 
-    validation_rules_list = RULES_DEFINITIONS.keys()
+    # Only implemented rules are executed
+    validation_rules_list = get_registered_rules_codes() if rules_codes is None else rules_codes
+
+    # Shared structures are only built if they are used by some of the rules to be executed
+    required_indexes = get_required_indexes(validation_rules_list, backend)
+
+    # The model is scanned only once, for the predicates read by the rules, and the index is shared by all rules
+    if model_index is None and required_indexes.intersection(["model_index", "hierarchy", "hierarchy_arrays"]):
+        index_start = time.perf_counter()
+        model_index = ModelIndex(ontouml_model, list(get_required_predicates(validation_rules_list)))
+        if metrics is not None:
+            metrics.index_seconds = time.perf_counter() - index_start
+
+    # Each distinct SPARQL query is executed only once during the validation
+    if query_cache is None and "query_cache" in required_indexes:
+        query_cache = QueryCache(ontouml_model)
+
+    if workers <= 1:
+        rules_results = {}
+        for rule_code in validation_rules_list:
+            if issue_sink is not None and issue_sink.is_exhausted:
+                logger.debug("The issue sink is exhausted, so {} and the following rules are not executed.", rule_code)
+                break
+            rule_metrics = metrics.get_rule_metrics(rule_code) if metrics is not None else None
+            rules_results[rule_code] = execute_rule_switch(
+                ontouml_model, rule_code, model_index, query_cache, backend, issue_sink, rule_metrics
+            )
+    else:
+        scheduled_rules_list = schedule_rules(validation_rules_list, ModelStatistics(ontouml_model, model_index))
+        logger.debug("Executing {} rules with {} {} workers.", len(scheduled_rules_list), workers, executor)
+
+        # The lazily computed hierarchies are built before the workers start, so that they are not built by each of them
+        if required_indexes.intersection(["hierarchy", "hierarchy_arrays"]):
+            index_start = time.perf_counter()
+            model_index.build_indexes(required_indexes)
+            if metrics is not None:
+                metrics.index_seconds = (metrics.index_seconds or 0.0) + time.perf_counter() - index_start
+
+        if executor == "process":
+            rules_results = _execute_rules_in_processes(
+                ontouml_model, scheduled_rules_list, model_index, backend, workers, metrics
+            )
+        else:
+            rules_results = _execute_rules_in_threads(
+                ontouml_model, scheduled_rules_list, model_index, query_cache, backend, workers, issue_sink, metrics
+            )
 
+    # Results are merged in the rules' definition order, independently of the order in which the rules finished
     for rule_code in validation_rules_list:
-        rule_w_list, rule_e_list = execute_rule_switch(ontouml_model, rule_code)
-        w_list.extend(rule_w_list)
-        e_list.extend(rule_e_list)
+        rule_w_list, rule_e_list = rules_results.pop(rule_code, ([], []))
+        if issue_sink is not None:
+            _stream_rule_results(issue_sink, rule_w_list, rule_e_list)
+        elif report is None:
+            w_list.extend(rule_w_list)
+            e_list.extend(rule_e_list)
+        else:
+            report.add_rule_results(rule_w_list, rule_e_list)
+
+    if query_cache is not None:
+        query_cache.log_statistics()
 
     return w_list, e_list
+
+
+def find_first_violated_rule(
+    ontouml_model: Graph, world_assumption: str, backend: str = "sparql", rules_codes: list[str] | None = None
+) -> str | None:
+    """Execute rules, from the cheapest to the most expensive one, until one of them makes the model invalid.
+
+    Each rule is stopped at its first issue that invalidates the model (an error or, in CWA, any issue). Queries are
+    not cached, so that their results are evaluated lazily and only until that issue is found. Rules with registered
+    existence checks only execute their checks when the 'sparql' backend is used. The index of the model is only built
+    when the first rule that uses it is reached.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param world_assumption: The validated world-assumption ('owa' or 'cwa').
+    :type world_assumption: str
+    :param backend: Implementation of the rules to be executed. Allowed values are: 'sparql' and 'native'.
+    :type backend: str
+    :param rules_codes: Codes of the registered rules to be executed. If not provided, all registered rules are
+                        executed. Rules that can only report warnings should not be provided in OWA.
+    :type rules_codes: list[str] | None
+    :return: The code of the first rule found to invalidate the model, or None if the model is valid.
+    :rtype: str | None
+    """
+    validation_rules_list = get_registered_rules_codes() if rules_codes is None else rules_codes
+    severities = SEVERITIES if world_assumption == "cwa" else ["error"]
+    validity_sink = ValiditySink(world_assumption)
+    model_index = None
+
+    for rule_code in schedule_rules(validation_rules_list, ModelStatistics(ontouml_model), most_expensive_first=False):
+        registered_rule = RULES_REGISTRY[rule_code]
+
+        if backend == REFERENCE_BACKEND and registered_rule.existence_check is not None:
+            logger.debug("Checking the existence of issues of rule {}.", rule_code)
+            if registered_rule.existence_check(ontouml_model, severities):
+                return rule_code
+            continue
+
+        if model_index is None and get_required_indexes([rule_code], backend).intersection(
+            ["model_index", "hierarchy", "hierarchy_arrays"]
+        ):
+            model_index = ModelIndex(ontouml_model, list(get_required_predicates(validation_rules_list)))
+
+        execute_rule_switch(ontouml_model, rule_code, model_index, None, backend, validity_sink)
+        if not validity_sink.is_valid:
+            return rule_code
+
+    return None
+
+
+def _stream_rule_results(issue_sink: IssueSink, rule_w_list: list[ResultIssue], rule_e_list: list[ResultIssue]) -> None:
+    """Stream to a sink the issues returned by a rule that was not executed with the sink (e.g., in a process worker).
+
+    :param issue_sink: The sink to which the issues are streamed.
+    :type issue_sink: IssueSink
+    :param rule_w_list: The warnings found by the rule.
+    :type rule_w_list: list[ResultIssue]
+    :param rule_e_list: The errors found by the rule.
+    :type rule_e_list: list[ResultIssue]
+    """
+    try:
+        for severity, issues in (("warning", rule_w_list), ("error", rule_e_list)):
+            for issue in issues:
+                issue_sink.add(issue, severity)
+    except IssueCapReached:
+        pass
+
+
+def _execute_rules_in_threads(
+    ontouml_model: Graph,
+    scheduled_rules_list: list[str],
+    model_index: ModelIndex | None,
+    query_cache: QueryCache | None,
+    backend: str,
+    workers: int,
+    issue_sink: IssueSink | None = None,
+    metrics: ValidationMetrics | None = None,
+) -> dict[str, tuple[list[ResultIssue], list[ResultIssue]]]:
+    """Execute the received rules concurrently in a thread pool, sharing the model, its index and the query cache.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param scheduled_rules_list: Codes of the rules to be executed, in the order in which they must be started.
+    :type scheduled_rules_list: list[str]
+    :param model_index: Precomputed index of the OntoUML model shared by all rules, if used by them.
+    :type model_index: ModelIndex | None
+    :param query_cache: Cache of SPARQL query results shared by all rules, if used by them.
+    :type query_cache: QueryCache | None
+    :param backend: Implementation of the rules to be executed.
+    :type backend: str
+    :param workers: Number of threads.
+    :type workers: int
+    :param issue_sink: Optional sink shared by all rules, to which they stream their issues.
+    :type issue_sink: IssueSink | None
+    :param metrics: Optional metrics of the validation, to which the measurements of each rule are added.
+    :type metrics: ValidationMetrics | None
+    :return: Dictionary mapping each rule code to the warnings and errors found by the rule.
+    :rtype: dict[str, tuple[list[ResultIssue], list[ResultIssue]]]
+    """
+    # The metrics of the rules are created before the workers start, so that they are not created concurrently
+    rules_metrics = {
+        rule_code: metrics.get_rule_metrics(rule_code) if metrics is not None else None
+        for rule_code in scheduled_rules_list
+    }
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            rule_code: pool.submit(
+                execute_rule_switch,
+                ontouml_model,
+                rule_code,
+                model_index,
+                query_cache,
+                backend,
+                issue_sink,
+                rules_metrics[rule_code],
+            )
+            for rule_code in scheduled_rules_list
+        }
+        return {rule_code: future.result() for rule_code, future in futures.items()}
+
+
+# State of each process worker: the worker's copy of the model, its index and its query cache
+_worker_state: dict = {}
+
+
+def _initialize_rule_worker(
+    ontouml_model: Graph,
+    model_index: ModelIndex | None,
+    backend: str,
+    is_quiet: bool = False,
+    prepared_queries_file: str | None = None,
+) -> None:
+    """Initialize a process worker with its copies of the OntoUML model and of its index.
+
+    The worker also receives a new query cache and the prepared SPARQL queries.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param model_index: Precomputed index of the OntoUML model, if used by the rules.
+    :type model_index: ModelIndex | None
+    :param backend: Implementation of the rules to be executed.
+    :type backend: str
+    :param is_quiet: Whether the quiet mode is on in the parent process, as it is not inherited by spawned processes.
+    :type is_quiet: bool
+    :param prepared_queries_file: File with the SPARQL queries prepared by the parent process, loaded instead of
+                                  preparing them again. If None, queries are prepared on their first use.
+    :type prepared_queries_file: str | None
+    """
+    if is_quiet:
+        set_quiet_mode()
+    if prepared_queries_file is not None:
+        load_prepared_queries(prepared_queries_file)
+    _worker_state["ontouml_model"] = ontouml_model
+    _worker_state["model_index"] = model_index
+    _worker_state["query_cache"] = QueryCache(ontouml_model)
+    _worker_state["backend"] = backend
+
+
+def _execute_rule_in_worker(
+    rule_code: str, is_measured: bool = False
+) -> tuple[list[ResultIssue], list[ResultIssue], RuleMetrics | None]:
+    """Execute a rule on the model of the current process worker.
+
+    :param rule_code: Code of the rule to be executed.
+    :type rule_code: str
+    :param is_measured: Whether the execution of the rule is measured.
+    :type is_measured: bool
+    :return: A tuple with the warnings and errors found by the rule and, if it was measured, its metrics.
+    :rtype: tuple[list[ResultIssue], list[ResultIssue], RuleMetrics | None]
+    """
+    rule_metrics = RuleMetrics(rule_code) if is_measured else None
+    rule_w_list, rule_e_list = execute_rule_switch(
+        _worker_state["ontouml_model"],
+        rule_code,
+        _worker_state["model_index"],
+        _worker_state["query_cache"],
+        _worker_state["backend"],
+        rule_metrics=rule_metrics,
+    )
+    return rule_w_list, rule_e_list, rule_metrics
+
+
+def _execute_rules_in_processes(
+    ontouml_model: Graph,
+    scheduled_rules_list: list[str],
+    model_index: ModelIndex | None,
+    backend: str,
+    workers: int,
+    metrics: ValidationMetrics | None = None,
+) -> dict[str, tuple[list[ResultIssue], list[ResultIssue]]]:
+    """Execute the received rules concurrently in a process pool.
+
+    Each process receives its copy of the model and of its index only once, when it starts. With the 'fork' start
+    method (the default on Linux), the copies are inherited from the parent process without being serialized.
+
+    :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be validated.
+    :type ontouml_model: Graph
+    :param scheduled_rules_list: Codes of the rules to be executed, in the order in which they must be started.
+    :type scheduled_rules_list: list[str]
+    :param model_index: Precomputed index of the OntoUML model, if used by the rules.
+    :type model_index: ModelIndex | None
+    :param backend: Implementation of the rules to be executed.
+    :type backend: str
+    :param workers: Number of processes.
+    :type workers: int
+    :param metrics: Optional metrics of the validation, to which the measurements of each rule, taken in the workers,
+                    are added.
+    :type metrics: ValidationMetrics | None
+    :return: Dictionary mapping each rule code to the warnings and errors found by the rule.
+    :rtype: dict[str, tuple[list[ResultIssue], list[ResultIssue]]]
+    """
+    # A pool cannot be created without workers, which would be the case for an empty selection of rules
+    if not scheduled_rules_list:
+        return {}
+
+    workers = min(workers, len(scheduled_rules_list))
+    is_measured = metrics is not None
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_rule_worker,
+        initargs=(ontouml_model, model_index, backend, is_quiet_mode(), get_prepared_queries_file()),
+    ) as pool:
+        futures = {
+            rule_code: pool.submit(_execute_rule_in_worker, rule_code, is_measured)
+            for rule_code in scheduled_rules_list
+        }
+
+        rules_results = {}
+        for rule_code, future in futures.items():
+            rule_w_list, rule_e_list, rule_metrics = future.result()
+            rules_results[rule_code] = (rule_w_list, rule_e_list)
+            if is_measured:
+                metrics.rules[rule_code] = rule_metrics
+        return rules_results
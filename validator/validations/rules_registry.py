@@ -0,0 +1,339 @@
+"""Registry of the implemented validation rules.
+
+Each rule function is registered with the register_rule decorator, which declares the rule's metadata:
+    - code: The rule's code, which must be a key of RULES_DEFINITIONS.
+    - group: The group of the rule (e.g., "CL" for rules about classes).
+    - predicates: The predicates of the OntoUML model read by the rule.
+    - classes: The classes whose instances (i.e., subjects of rdf:type triples) are read by the rule.
+    - indexes: The shared structures used by the rule's implementation (elements of SHARED_INDEXES).
+    - cost: The rule's relative cost per class and per generalization of the model, used for scheduling.
+    - severities: The severities (elements of SEVERITIES) of the issues the rule may report.
+    - version: The version of each implementation of the rule, which must be increased whenever the issues reported by
+      the implementation may change, so that results stored by caches are invalidated.
+
+The registry allows the rule executed for a code to be found in constant time and provides the metadata used by the
+scheduler, the caches and the selective execution of rules, so that they do not depend on hard-coded lists of rules.
+
+Rules have a reference implementation, registered with backend "sparql", and may have alternative implementations
+registered with other backends (e.g., "native"). Backends without an implementation of a rule use its reference one.
+
+Rules whose reference implementation must enumerate the whole model before reporting its first issue (e.g., because
+their queries aggregate results) may also register an existence check with the register_existence_check decorator. It
+only answers whether the rule reports some issue of the received severities and is used by fail-fast validations.
+
+Usage:
+    ```
+    @register_rule("R_CL_XJZ", "CL", predicates=[ONTOUML.stereotype], indexes=["query_cache"], cost=(0.5, 0.0))
+    def execute_rule_R_CL_XJZ(ontouml_model, rule_code, model_index=None, query_cache=None):
+        ...
+    ```
+"""
+import fnmatch
+import inspect
+from collections.abc import Callable
+
+from rdflib import URIRef
+
+from .rules_definitions import RULES_DEFINITIONS
+from ..modules.errors import report_error_invalid_parameter, report_error_requirement_not_met
+
+# Shared structures that may be required by rules:
+#   - model_index: the ModelIndex of the model.
+#   - hierarchy: the transitive closure of the generalization hierarchy (computed by the ModelIndex).
+#   - hierarchy_arrays: the NumPy encoding of the hierarchy and of the stereotypes (computed by the ModelIndex).
+#   - query_cache: the cache of SPARQL query results.
+SHARED_INDEXES = ["model_index", "hierarchy", "hierarchy_arrays", "query_cache"]
+
+# Severities of the issues reported by rules
+SEVERITIES = ["warning", "error"]
+
+# Backend of the reference implementation of the rules
+REFERENCE_BACKEND = "sparql"
+
+
+class RegisteredRule:
+    """A class to represent a registered validation rule, its metadata and its implementations."""
+
+    def __init__(
+        self,
+        code: str,
+        group: str,
+        predicates: list[URIRef],
+        cost: tuple[float, float],
+        severities: list[str],
+        classes: list[URIRef] | None = None,
+    ):
+        """Initialize a RegisteredRule object without implementations.
+
+        :param code: The code of the rule.
+        :type code: str
+        :param group: The group of the rule.
+        :type group: str
+        :param predicates: The predicates of the OntoUML model read by the rule.
+        :type predicates: list[URIRef]
+        :param cost: The rule's relative cost per class and per generalization of the model.
+        :type cost: tuple[float, float]
+        :param severities: The severities of the issues the rule may report.
+        :type severities: list[str]
+        :param classes: The classes whose instances are read by the rule.
+        :type classes: list[URIRef] | None
+        """
+        self.code = code
+        self.group = group
+        self.predicates = predicates
+        self.classes = classes or []
+        self.cost = cost
+        self.severities = severities
+
+        # Functions implementing the rule, shared structures used and versions of each one of them, indexed by backend
+        self.implementations: dict[str, Callable] = {}
+        self.implementations_indexes: dict[str, list[str]] = {}
+        self.implementations_versions: dict[str, int] = {}
+
+        # Function checking whether the rule reports some issue of the received severities, if one is registered
+        self.existence_check: Callable | None = None
+
+    def get_function(self, backend: str = REFERENCE_BACKEND) -> Callable:
+        """Return the function implementing the rule in the received backend or, if there is none, the reference one.
+
+        :param backend: The backend whose implementation is requested.
+        :type backend: str
+        :return: The function implementing the rule.
+        :rtype: Callable
+        """
+        function = self.implementations.get(backend)
+        return function if function is not None else self.implementations[REFERENCE_BACKEND]
+
+    def get_indexes(self, backend: str = REFERENCE_BACKEND) -> list[str]:
+        """Return the shared structures used by the function that implements the rule in the received backend.
+
+        :param backend: The backend whose implementation is considered.
+        :type backend: str
+        :return: List of the shared structures (elements of SHARED_INDEXES) used by the implementation.
+        :rtype: list[str]
+        """
+        if backend not in self.implementations:
+            backend = REFERENCE_BACKEND
+        return self.implementations_indexes[backend]
+
+    def get_version(self, backend: str = REFERENCE_BACKEND) -> int:
+        """Return the version of the function that implements the rule in the received backend.
+
+        :param backend: The backend whose implementation is considered.
+        :type backend: str
+        :return: The version of the implementation.
+        :rtype: int
+        """
+        if backend not in self.implementations:
+            backend = REFERENCE_BACKEND
+        return self.implementations_versions[backend]
+
+
+# Registered rules indexed by their codes
+RULES_REGISTRY: dict[str, RegisteredRule] = {}
+
+
+def register_rule(
+    code: str,
+    group: str,
+    predicates: list[URIRef] | None = None,
+    classes: list[URIRef] | None = None,
+    indexes: list[str] | None = None,
+    cost: tuple[float, float] = (1.0, 1.0),
+    severities: list[str] | None = None,
+    backend: str = REFERENCE_BACKEND,
+    version: int = 1,
+) -> Callable[[Callable], Callable]:
+    """Return a decorator that registers a function as the implementation of a rule in a backend.
+
+    The predicates, the classes, the cost and the severities of a rule are declared by its reference implementation.
+    Alternative implementations only need to provide the rule's code, group, backend and the shared structures they use.
+
+    :param code: The code of the rule, which must be a key of RULES_DEFINITIONS.
+    :type code: str
+    :param group: The group of the rule.
+    :type group: str
+    :param predicates: The predicates of the OntoUML model read by the rule.
+    :type predicates: list[URIRef] | None
+    :param classes: The classes whose instances (i.e., subjects of rdf:type triples) are read by the rule.
+    :type classes: list[URIRef] | None
+    :param indexes: The shared structures used by the rule. Allowed values are the elements of SHARED_INDEXES.
+    :type indexes: list[str] | None
+    :param cost: The rule's relative cost per class and per generalization of the model, as
+                 (class_factor, generalization_factor).
+    :type cost: tuple[float, float]
+    :param severities: The severities of the issues the rule may report. If not provided, all severities are assumed.
+    :type severities: list[str] | None
+    :param backend: The backend of the implementation.
+    :type backend: str
+    :param version: The version of the implementation, to be increased whenever the issues it reports may change.
+    :type version: int
+    :return: Decorator that registers the decorated function and returns it unchanged.
+    :rtype: Callable[[Callable], Callable]
+    """
+    if code not in RULES_DEFINITIONS:
+        report_error_requirement_not_met(f"Rule {code} cannot be registered, as it has no definition.")
+
+    for index in indexes or []:
+        if index not in SHARED_INDEXES:
+            current_function = inspect.stack()[0][3]
+            report_error_invalid_parameter(index, SHARED_INDEXES, current_function)
+
+    for severity in severities or []:
+        if severity not in SEVERITIES:
+            current_function = inspect.stack()[0][3]
+            report_error_invalid_parameter(severity, SEVERITIES, current_function)
+
+    def decorator(function: Callable) -> Callable:
+        """Register the decorated function as the implementation of the rule in the backend."""
+        registered_rule = RULES_REGISTRY.get(code)
+
+        if registered_rule is None:
+            registered_rule = RegisteredRule(code, group, [], cost, SEVERITIES)
+            RULES_REGISTRY[code] = registered_rule
+
+        if backend == REFERENCE_BACKEND:
+            registered_rule.group = group
+            registered_rule.predicates = predicates or []
+            registered_rule.classes = classes or []
+            registered_rule.cost = cost
+            registered_rule.severities = severities or SEVERITIES
+
+        registered_rule.implementations[backend] = function
+        registered_rule.implementations_indexes[backend] = indexes or []
+        registered_rule.implementations_versions[backend] = version
+        return function
+
+    return decorator
+
+
+def register_existence_check(code: str) -> Callable:
+    """Return a decorator that registers a function as the existence check of a rule.
+
+    The function receives the OntoUML model and a list of severities and returns whether the rule's reference
+    implementation would report some issue with one of these severities. The rule must already be registered.
+
+    :param code: The code of the rule.
+    :type code: str
+    :return: The decorator, which returns the decorated function unchanged.
+    :rtype: Callable
+    """
+
+    def decorator(function: Callable) -> Callable:
+        """Register the decorated function as the existence check of the rule."""
+        RULES_REGISTRY[code].existence_check = function
+        return function
+
+    return decorator
+
+
+def get_registered_rules_codes() -> list[str]:
+    """Return the codes of all registered rules, in the order in which they are defined in RULES_DEFINITIONS.
+
+    :return: List of the codes of the registered rules.
+    :rtype: list[str]
+    """
+    return [rule_code for rule_code in RULES_DEFINITIONS if rule_code in RULES_REGISTRY]
+
+
+def _matches_selector(registered_rule: RegisteredRule, selector: str) -> bool:
+    """Return whether a rule is matched by a selector.
+
+    A selector matches a rule if it is the rule's code, the rule's group (e.g., "CL") or a shell-style pattern matching
+    the rule's code (e.g., "R_CL_*").
+
+    :param registered_rule: The rule to be checked.
+    :type registered_rule: RegisteredRule
+    :param selector: The selector.
+    :type selector: str
+    :return: True if the selector matches the rule, False otherwise.
+    :rtype: bool
+    """
+    return selector == registered_rule.group or fnmatch.fnmatchcase(registered_rule.code, selector)
+
+
+def select_rules_codes(
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    severities: list[str] | None = None,
+) -> list[str]:
+    """Return the codes of the registered rules selected by the received criteria, in the order of RULES_DEFINITIONS.
+
+    Selectors may be rule codes (e.g., "R_CL_GJU"), group names (e.g., "CL") or shell-style patterns of rule codes
+    (e.g., "R_CL_*"). They are case-insensitive, and a selector that matches no registered rule (e.g., a misspelled
+    code) is reported as an invalid parameter.
+
+    :param include: Selectors of the rules to be executed. If not provided, all registered rules are included.
+    :type include: list[str] | None
+    :param exclude: Selectors of the rules not to be executed, even if they are included.
+    :type exclude: list[str] | None
+    :param severities: If provided, only rules that may report issues with one of these severities are selected.
+    :type severities: list[str] | None
+    :return: List of the codes of the selected rules.
+    :rtype: list[str]
+    """
+    for severity in severities or []:
+        if severity not in SEVERITIES:
+            current_function = inspect.stack()[0][3]
+            report_error_invalid_parameter(severity, SEVERITIES, current_function)
+
+    # Rule codes and group names are upper case
+    include = [selector.upper() for selector in include] if include is not None else None
+    exclude = [selector.upper() for selector in exclude] if exclude is not None else None
+
+    registered_rules = [RULES_REGISTRY[rule_code] for rule_code in get_registered_rules_codes()]
+    for selector in (include or []) + (exclude or []):
+        if not any(_matches_selector(registered_rule, selector) for registered_rule in registered_rules):
+            valid_selectors = sorted({registered_rule.group for registered_rule in registered_rules})
+            valid_selectors += [registered_rule.code for registered_rule in registered_rules]
+            current_function = inspect.stack()[0][3]
+            report_error_invalid_parameter(selector, valid_selectors, current_function)
+
+    selected_rules_codes = []
+
+    for registered_rule in registered_rules:
+        if include is not None and not any(_matches_selector(registered_rule, selector) for selector in include):
+            continue
+        if exclude is not None and any(_matches_selector(registered_rule, selector) for selector in exclude):
+            continue
+        if severities is not None and not set(severities).intersection(registered_rule.severities):
+            continue
+
+        selected_rules_codes.append(registered_rule.code)
+
+    return selected_rules_codes
+
+
+def get_required_indexes(rules_codes: list[str], backend: str = REFERENCE_BACKEND) -> set[str]:
+    """Return the shared structures used by the implementations of the received rules in a backend.
+
+    :param rules_codes: Codes of the registered rules.
+    :type rules_codes: list[str]
+    :param backend: The backend whose implementations are considered.
+    :type backend: str
+    :return: Set of the shared structures (elements of SHARED_INDEXES) used by the rules.
+    :rtype: set[str]
+    """
+    return {index for rule_code in rules_codes for index in RULES_REGISTRY[rule_code].get_indexes(backend)}
+
+
+def get_required_predicates(rules_codes: list[str]) -> set[URIRef]:
+    """Return the predicates of the OntoUML model read by the received rules.
+
+    :param rules_codes: Codes of the registered rules.
+    :type rules_codes: list[str]
+    :return: Set of the predicates read by the rules.
+    :rtype: set[URIRef]
+    """
+    return {predicate for rule_code in rules_codes for predicate in RULES_REGISTRY[rule_code].predicates}
+
+
+def get_required_classes(rules_codes: list[str]) -> set[URIRef]:
+    """Return the classes whose instances are read by the received rules.
+
+    :param rules_codes: Codes of the registered rules.
+    :type rules_codes: list[str]
+    :return: Set of the classes read by the rules.
+    :rtype: set[URIRef]
+    """
+    return {model_class for rule_code in rules_codes for model_class in RULES_REGISTRY[rule_code].classes}
@@ -0,0 +1,345 @@
+"""Define the ValidationReport class, which stores the issues found by a validation in a compact columnar form.
+
+Validations of large models may report hundreds of thousands of issues. Instead of keeping one ResultIssue object (and
+its formatted description) per issue, the report stores, for each issue:
+    - The id of its rule's code, of its related element and of its description's template, in typed arrays.
+    - The parameters of its description's template.
+    - Its severity, before the world-assumption is applied.
+
+Codes, element ids and templates are interned, so each distinct value is stored once, and the parameters of all
+issues are stored in a single flat list. ResultIssue objects and descriptions are only created when issues are
+accessed. Issues can be retrieved by rule or by element in constant time, through indexes built on the first lookup,
+and exported to JSON or CSV without materializing ResultIssue objects.
+
+Usage:
+    ```
+    report = get_validation_report(ontouml_model, "owa")
+    errors = report.get_issues_by_element(class_id, "error")
+    report.to_json(output_file)
+    ```
+"""
+import csv
+import json
+from array import array
+from typing import Iterator, TextIO
+
+from .result_issue import ResultIssue
+
+SEVERITY_WARNING = 0
+SEVERITY_ERROR = 1
+SEVERITIES_NAMES = ("warning", "error")
+
+CSV_HEADER = ["rule_code", "severity", "related_id", "issue_description"]
+
+
+class ValidationReport:
+    """A class to represent the issues found by a validation, stored column-wise."""
+
+    def __init__(self, world_assumption: str = "owa", severities: list[str] | None = None):
+        """Initialize an empty ValidationReport object.
+
+        :param world_assumption: The validated world-assumption ('owa' or 'cwa'). In CWA, warnings are reported as
+                                 errors.
+        :type world_assumption: str
+        :param severities: If provided, only issues with these severities (before the world-assumption is applied) are
+                           added to the report.
+        :type severities: list[str] | None
+        """
+        self.world_assumption = world_assumption
+        self.severities = severities
+
+        # Interned values and their ids
+        self.rules_codes: list[str] = []
+        self._rules_ids: dict[str, int] = {}
+        self.elements: list[str] = []
+        self._elements_ids: dict[str, int] = {}
+        # Templates are interned with whether they have parameters, as descriptions without them are not formatted
+        self._templates: list[tuple[str, bool]] = []
+        self._templates_ids: dict[tuple[str, bool], int] = {}
+
+        # Columns, with one position per issue. The parameters of the issue at position i are
+        # _params[_params_offsets[i]:_params_offsets[i + 1]]
+        self._rule_column = array("I")
+        self._element_column = array("I")
+        self._template_column = array("I")
+        self._severity_column = array("B")
+        self._params: list = []
+        self._params_offsets = array("I", [0])
+
+        # Positions of the issues of each rule and of each element, built on the first lookup
+        self._rules_positions: dict[int, array] | None = None
+        self._elements_positions: dict[int, array] | None = None
+
+        self.num_warnings = 0
+        self.num_errors = 0
+
+    @staticmethod
+    def _intern(value, values: list, values_ids: dict) -> int:
+        """Return the id of a value, assigning a new id to it if it was not interned yet."""
+        value_id = values_ids.get(value)
+        if value_id is None:
+            value_id = len(values)
+            values_ids[value] = value_id
+            values.append(value)
+        return value_id
+
+    def add_issue(
+        self,
+        rule_code: str,
+        severity: str,
+        related_id: str,
+        issue_description: str,
+        description_params: tuple | None = None,
+    ) -> None:
+        """Add an issue to the report.
+
+        :param rule_code: The code of the rule that identified the issue.
+        :type rule_code: str
+        :param severity: The severity of the issue, before the world-assumption is applied ('warning' or 'error').
+        :type severity: str
+        :param related_id: The ID (URI) of the element affected by/related to the issue.
+        :type related_id: str
+        :param issue_description: The description of the issue or, if description_params is provided, its template.
+        :type issue_description: str
+        :param description_params: Optional parameters of the description's template.
+        :type description_params: tuple | None
+        """
+        if self.severities is not None and severity not in self.severities:
+            return
+
+        template = (issue_description, description_params is not None)
+        self._rule_column.append(self._intern(rule_code, self.rules_codes, self._rules_ids))
+        self._element_column.append(self._intern(str(related_id), self.elements, self._elements_ids))
+        self._template_column.append(self._intern(template, self._templates, self._templates_ids))
+        if description_params:
+            self._params.extend(description_params)
+        self._params_offsets.append(len(self._params))
+
+        if severity == "error":
+            self._severity_column.append(SEVERITY_ERROR)
+            self.num_errors += 1
+        else:
+            self._severity_column.append(SEVERITY_WARNING)
+            self.num_warnings += 1
+
+        self._rules_positions = None
+        self._elements_positions = None
+
+    def add_rule_results(self, rule_w_list: list[ResultIssue], rule_e_list: list[ResultIssue]) -> None:
+        """Add the warnings and errors found by a rule, without formatting their descriptions.
+
+        :param rule_w_list: The warnings found by the rule.
+        :type rule_w_list: list[ResultIssue]
+        :param rule_e_list: The errors found by the rule.
+        :type rule_e_list: list[ResultIssue]
+        """
+        for severity, issues in (("warning", rule_w_list), ("error", rule_e_list)):
+            for issue in issues:
+                self.add_issue(
+                    issue.rule_code, severity, issue.related_id, issue.description_template, issue.description_params
+                )
+
+    def __len__(self) -> int:
+        """Return the number of issues in the report."""
+        return len(self._rule_column)
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the validated model is valid: it has no errors after the world-assumption is applied."""
+        if self.world_assumption == "cwa":
+            return len(self) == 0
+        return self.num_errors == 0
+
+    def get_severity(self, position: int) -> str:
+        """Return the severity of the issue at a position, after the world-assumption is applied.
+
+        :param position: The position of the issue in the report.
+        :type position: int
+        :return: The severity of the issue ('warning' or 'error').
+        :rtype: str
+        """
+        if self.world_assumption == "cwa":
+            return "error"
+        return SEVERITIES_NAMES[self._severity_column[position]]
+
+    def get_description(self, position: int) -> str:
+        """Return the formatted description of the issue at a position.
+
+        :param position: The position of the issue in the report.
+        :type position: int
+        :return: The description of the issue.
+        :rtype: str
+        """
+        template, has_params = self._templates[self._template_column[position]]
+        if not has_params:
+            return template
+        return template.format(*self._get_params(position))
+
+    def _get_params(self, position: int) -> tuple | None:
+        """Return the parameters of the description's template of the issue at a position."""
+        if not self._templates[self._template_column[position]][1]:
+            return None
+        params_start = self._params_offsets[position]
+        params_end = self._params_offsets[position + 1]
+        return tuple(self._params[params_start:params_end])
+
+    def get_issue(self, position: int) -> ResultIssue:
+        """Return a ResultIssue object representing the issue at a position.
+
+        :param position: The position of the issue in the report.
+        :type position: int
+        :return: The issue, whose description is only formatted when accessed.
+        :rtype: ResultIssue
+        """
+        return ResultIssue(
+            self.rules_codes[self._rule_column[position]],
+            self._templates[self._template_column[position]][0],
+            self.elements[self._element_column[position]],
+            self._get_params(position),
+        )
+
+    def _get_positions(self, severity: str | None) -> Iterator[int]:
+        """Return the positions of the issues of a severity, after the world-assumption is applied.
+
+        Positions are returned in the order of the lists returned by validate_ontouml_model.
+
+        :param severity: The severity of the issues ('warning' or 'error'). If None, all positions are returned.
+        :type severity: str | None
+        :return: Iterator over the positions of the issues.
+        :rtype: Iterator[int]
+        """
+        if severity is None:
+            return iter(range(len(self)))
+        if self.world_assumption == "cwa":
+            # As in validate_ontouml_model, warnings are reported after the errors
+            if severity == "warning":
+                return iter(())
+            return (
+                position
+                for severity_code in (SEVERITY_ERROR, SEVERITY_WARNING)
+                for position in range(len(self))
+                if self._severity_column[position] == severity_code
+            )
+        severity_code = SEVERITIES_NAMES.index(severity)
+        return (position for position in range(len(self)) if self._severity_column[position] == severity_code)
+
+    def iter_issues(self, severity: str | None = None) -> Iterator[ResultIssue]:
+        """Return an iterator over the issues of the report, creating each ResultIssue object only when it is reached.
+
+        :param severity: If provided, only issues with this severity (after the world-assumption is applied) are
+                         returned.
+        :type severity: str | None
+        :return: Iterator over the issues.
+        :rtype: Iterator[ResultIssue]
+        """
+        return (self.get_issue(position) for position in self._get_positions(severity))
+
+    def get_warnings(self) -> list[ResultIssue]:
+        """Return the list of warnings, after the world-assumption is applied."""
+        return list(self.iter_issues("warning"))
+
+    def get_errors(self) -> list[ResultIssue]:
+        """Return the list of errors, after the world-assumption is applied."""
+        return list(self.iter_issues("error"))
+
+    @staticmethod
+    def _index_positions(column: array) -> dict[int, array]:
+        """Return a dictionary mapping each id of a column to the positions in which it occurs."""
+        positions = {}
+        for position, value_id in enumerate(column):
+            value_positions = positions.get(value_id)
+            if value_positions is None:
+                positions[value_id] = value_positions = array("I")
+            value_positions.append(position)
+        return positions
+
+    def _filter_positions(self, positions: array, severity: str | None) -> list[int]:
+        """Return the received positions whose issues have a severity (after the world-assumption is applied)."""
+        if severity is None:
+            return list(positions)
+        return [position for position in positions if self.get_severity(position) == severity]
+
+    def get_issues_by_rule(self, rule_code: str, severity: str | None = None) -> list[ResultIssue]:
+        """Return the issues identified by a rule.
+
+        :param rule_code: The code of the rule.
+        :type rule_code: str
+        :param severity: If provided, only issues with this severity (after the world-assumption is applied) are
+                         returned.
+        :type severity: str | None
+        :return: List of the issues identified by the rule, in the order in which they were added.
+        :rtype: list[ResultIssue]
+        """
+        rule_id = self._rules_ids.get(rule_code)
+        if rule_id is None:
+            return []
+        if self._rules_positions is None:
+            self._rules_positions = self._index_positions(self._rule_column)
+        return [
+            self.get_issue(position) for position in self._filter_positions(self._rules_positions[rule_id], severity)
+        ]
+
+    def get_issues_by_element(self, related_id: str, severity: str | None = None) -> list[ResultIssue]:
+        """Return the issues related to an element of the model.
+
+        :param related_id: The ID (URI) of the element.
+        :type related_id: str
+        :param severity: If provided, only issues with this severity (after the world-assumption is applied) are
+                         returned.
+        :type severity: str | None
+        :return: List of the issues related to the element, in the order in which they were added.
+        :rtype: list[ResultIssue]
+        """
+        element_id = self._elements_ids.get(str(related_id))
+        if element_id is None:
+            return []
+        if self._elements_positions is None:
+            self._elements_positions = self._index_positions(self._element_column)
+        positions = self._elements_positions[element_id]
+        return [self.get_issue(position) for position in self._filter_positions(positions, severity)]
+
+    def to_json(self, output_file: TextIO) -> None:
+        """Write the report to a file as a JSON object with the validity of the model and the list of its issues.
+
+        Issues are written one at a time and the encoded codes and element ids are reused, so the whole document is
+        never built in memory.
+
+        :param output_file: The text file in which the report is written.
+        :type output_file: TextIO
+        """
+        encoded_rules = [json.dumps(rule_code) for rule_code in self.rules_codes]
+        encoded_elements = [json.dumps(element) for element in self.elements]
+        encoded_severities = [json.dumps(severity) for severity in SEVERITIES_NAMES]
+
+        output_file.write(
+            f'{{"is_valid": {json.dumps(self.is_valid)}, '
+            f'"world_assumption": {json.dumps(self.world_assumption)}, "issues": ['
+        )
+        for position in range(len(self)):
+            severity_code = SEVERITY_ERROR if self.world_assumption == "cwa" else self._severity_column[position]
+            output_file.write(
+                f'{", " if position else ""}'
+                f'{{"rule_code": {encoded_rules[self._rule_column[position]]}, '
+                f'"severity": {encoded_severities[severity_code]}, '
+                f'"related_id": {encoded_elements[self._element_column[position]]}, '
+                f'"issue_description": {json.dumps(self.get_description(position))}}}'
+            )
+        output_file.write("]}\n")
+
+    def to_csv(self, output_file: TextIO) -> None:
+        """Write the issues of the report to a CSV file with a header row.
+
+        :param output_file: The text file in which the issues are written. It should be opened with newline="".
+        :type output_file: TextIO
+        """
+        writer = csv.writer(output_file)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(
+            (
+                self.rules_codes[self._rule_column[position]],
+                self.get_severity(position),
+                self.elements[self._element_column[position]],
+                self.get_description(position),
+            )
+            for position in range(len(self))
+        )
@@ -0,0 +1,250 @@
+"""Transitive closure of the generalization hierarchy of an OntoUML model.
+
+The ClassHierarchy condenses the generalization graph into its strongly connected components (SCCs) and computes, in
+topological order of the condensed graph, the sets of ancestors and descendants of every class. These sets are stored
+as bitsets (Python integers in which bit i represents the class with id i), so that the closure of the whole hierarchy
+is computed in a single pass over its classes and generalizations, independently of the hierarchy's depth.
+
+Classes that are part of a generalization cycle (i.e., of an SCC with more than one class or with a self-generalization)
+are ancestors and descendants of themselves.
+"""
+
+
+class ClassHierarchy:
+    """A class to represent the transitive closure of the generalization hierarchy of an OntoUML model."""
+
+    def __init__(self, classes: list[str], direct_superclasses: dict[str, list[str]]):
+        """Initialize a ClassHierarchy object, computing its SCCs and the ancestor and descendant sets of all classes.
+
+        :param classes: List of the classes of the model. Classes only referenced in generalizations are also included.
+        :type classes: list[str]
+        :param direct_superclasses: Dictionary mapping each class to the list of its direct superclasses.
+        :type direct_superclasses: dict[str, list[str]]
+        """
+        self.class_ids: dict[str, int] = {}
+        self.id_classes: list[str] = []
+
+        for model_class in classes:
+            self._get_or_create_id(model_class)
+        for specific, generals in direct_superclasses.items():
+            self._get_or_create_id(specific)
+            for general in generals:
+                self._get_or_create_id(general)
+
+        self.parents: list[list[int]] = [[] for _ in self.id_classes]
+        self.children: list[list[int]] = [[] for _ in self.id_classes]
+        for specific, generals in direct_superclasses.items():
+            specific_id = self.class_ids[specific]
+            for general_id in dict.fromkeys(self.class_ids[general] for general in generals):
+                self.parents[specific_id].append(general_id)
+                self.children[general_id].append(specific_id)
+
+        # components are listed in topological order: every component appears after all components of its ancestors
+        self.components: list[list[int]] = self._compute_components()
+        self.component_of: list[int] = [0] * len(self.id_classes)
+        for component_index, component in enumerate(self.components):
+            for class_id in component:
+                self.component_of[class_id] = component_index
+
+        self.cyclic_components: list[bool] = [
+            len(component) > 1 or component[0] in self.parents[component[0]] for component in self.components
+        ]
+
+        self._component_ancestors: list[int] = self._compute_closure(self.parents, reverse=False)
+        self._component_descendants: list[int] = self._compute_closure(self.children, reverse=True)
+
+    def _get_or_create_id(self, model_class: str) -> int:
+        """Return the integer id of a class, creating a new one if the class has not been seen before.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        :return: The integer id of the class.
+        :rtype: int
+        """
+        model_class = str(model_class)
+        class_id = self.class_ids.get(model_class)
+        if class_id is None:
+            class_id = len(self.id_classes)
+            self.class_ids[model_class] = class_id
+            self.id_classes.append(model_class)
+        return class_id
+
+    def _compute_components(self) -> list[list[int]]:
+        """Compute the SCCs of the generalization graph using an iterative version of Tarjan's algorithm.
+
+        As edges go from specific to general classes, Tarjan's algorithm emits each component only after all the
+        components of its ancestors, which is the topological order used to compute the closures.
+
+        :return: List of components, each one represented as a list of class ids, in topological order.
+        :rtype: list[list[int]]
+        """
+        num_classes = len(self.id_classes)
+        indexes = [-1] * num_classes
+        low_links = [0] * num_classes
+        on_stack = [False] * num_classes
+        stack = []
+        components = []
+        next_index = 0
+
+        for root in range(num_classes):
+            if indexes[root] != -1:
+                continue
+
+            indexes[root] = low_links[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack[root] = True
+            work_stack = [(root, 0)]
+
+            while work_stack:
+                node, edge_position = work_stack[-1]
+                node_parents = self.parents[node]
+
+                if edge_position < len(node_parents):
+                    work_stack[-1] = (node, edge_position + 1)
+                    parent = node_parents[edge_position]
+                    if indexes[parent] == -1:
+                        indexes[parent] = low_links[parent] = next_index
+                        next_index += 1
+                        stack.append(parent)
+                        on_stack[parent] = True
+                        work_stack.append((parent, 0))
+                    elif on_stack[parent]:
+                        low_links[node] = min(low_links[node], indexes[parent])
+                    continue
+
+                work_stack.pop()
+                if work_stack:
+                    caller = work_stack[-1][0]
+                    low_links[caller] = min(low_links[caller], low_links[node])
+
+                if low_links[node] == indexes[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def _compute_closure(self, adjacency: list[list[int]], reverse: bool) -> list[int]:
+        """Compute, for each component, the bitset of the classes reachable from it through the received adjacency.
+
+        :param adjacency: Parents (for computing ancestors) or children (for computing descendants) of each class.
+        :type adjacency: list[list[int]]
+        :param reverse: If True, components are processed in reverse topological order (required for descendants).
+        :type reverse: bool
+        :return: List with the bitset of reachable classes of each component.
+        :rtype: list[int]
+        """
+        closure = [0] * len(self.components)
+        members_bits = [sum(1 << class_id for class_id in component) for component in self.components]
+
+        order = range(len(self.components) - 1, -1, -1) if reverse else range(len(self.components))
+
+        for component_index in order:
+            reachable = members_bits[component_index] if self.cyclic_components[component_index] else 0
+            for class_id in self.components[component_index]:
+                for neighbor in adjacency[class_id]:
+                    neighbor_component = self.component_of[neighbor]
+                    if neighbor_component != component_index:
+                        reachable |= closure[neighbor_component] | members_bits[neighbor_component]
+            closure[component_index] = reachable
+
+        return closure
+
+    def get_bits(self, model_classes: list[str]) -> int:
+        """Return the bitset representing the received classes. Classes not in the hierarchy are ignored.
+
+        :param model_classes: List of class URIs.
+        :type model_classes: list[str]
+        :return: Bitset in which the bits of the received classes are set.
+        :rtype: int
+        """
+        bits = 0
+        for model_class in model_classes:
+            class_id = self.class_ids.get(str(model_class))
+            if class_id is not None:
+                bits |= 1 << class_id
+        return bits
+
+    def decode_bits(self, bits: int) -> list[str]:
+        """Return the classes represented by the received bitset, ordered by their ids.
+
+        :param bits: Bitset of classes.
+        :type bits: int
+        :return: List of the URIs of the classes whose bits are set.
+        :rtype: list[str]
+        """
+        # Reversed binary representation, so that the character at position i corresponds to the class with id i
+        binary = bin(bits)[:1:-1]
+        decoded = []
+        position = binary.find("1")
+        while position != -1:
+            decoded.append(self.id_classes[position])
+            position = binary.find("1", position + 1)
+        return decoded
+
+    def get_ancestor_bits(self, model_class: str) -> int:
+        """Return the bitset of all (direct and indirect) superclasses of a class.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        :return: Bitset of the superclasses of the class. Zero if the class is not part of the hierarchy.
+        :rtype: int
+        """
+        class_id = self.class_ids.get(str(model_class))
+        if class_id is None:
+            return 0
+        return self._component_ancestors[self.component_of[class_id]]
+
+    def get_descendant_bits(self, model_class: str) -> int:
+        """Return the bitset of all (direct and indirect) subclasses of a class.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        :return: Bitset of the subclasses of the class. Zero if the class is not part of the hierarchy.
+        :rtype: int
+        """
+        class_id = self.class_ids.get(str(model_class))
+        if class_id is None:
+            return 0
+        return self._component_descendants[self.component_of[class_id]]
+
+    def get_ancestors(self, model_class: str) -> list[str]:
+        """Return all (direct and indirect) superclasses of a class, without duplicates.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        :return: List of the URIs of the superclasses of the class.
+        :rtype: list[str]
+        """
+        return self.decode_bits(self.get_ancestor_bits(model_class))
+
+    def get_descendants(self, model_class: str) -> list[str]:
+        """Return all (direct and indirect) subclasses of a class, without duplicates.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        :return: List of the URIs of the subclasses of the class.
+        :rtype: list[str]
+        """
+        return self.decode_bits(self.get_descendant_bits(model_class))
+
+    def get_cycles(self) -> list[list[str]]:
+        """Return the generalization cycles of the hierarchy, i.e., its SCCs with more than one class or whose single \
+        class specializes itself.
+
+        Every class of a returned cycle is both a superclass and a subclass of all classes in the same cycle.
+
+        :return: List of cycles, each one represented as the list of the URIs of its classes ordered by their ids.
+        :rtype: list[list[str]]
+        """
+        cycles = []
+        for component_index, component in enumerate(self.components):
+            if self.cyclic_components[component_index]:
+                cycles.append([self.id_classes[class_id] for class_id in sorted(component)])
+        return cycles
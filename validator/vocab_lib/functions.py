@@ -1,10 +1,13 @@
 """Library for manipulating ontouml-vocabulary."""
 from rdflib import Graph, URIRef, RDF
 
+from validator.vocab_lib.model_index import ModelIndex
 from validator.vocab_lib.ontouml import ONTOUML
 
 
-def get_direct_superclasses(ontouml_model: Graph, ontouml_class: str, type_restr_list: list[str] = []) -> list[str]:
+def get_direct_superclasses(
+    ontouml_model: Graph, ontouml_class: str, type_restr_list: list[str] = [], model_index: ModelIndex | None = None
+) -> list[str]:
     """Retrieve direct superclasses of a specified OntoUML class from a given OntoUML RDF graph.
 
     Allows the user to specify a list of restricted types.
@@ -17,9 +20,21 @@ def get_direct_superclasses(ontouml_model: Graph, ontouml_class: str, type_restr
     :param type_restr_list: A list of OntoUML stereotype URIs for type restriction. If provided, only superclasses
                             with matching stereotypes will be included. Defaults to an empty list.
     :type type_restr_list: list[str]
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
     :return: A list of URIs representing the direct superclasses of the specified OntoUML class.
     :rtype: list[str]
     """
+    if model_index is not None:
+        direct_superclasses = model_index.direct_superclasses.get(str(ontouml_class), [])
+        if type_restr_list:
+            return [
+                direct_class
+                for direct_class in direct_superclasses
+                if model_index.get_stereotype(direct_class) not in type_restr_list
+            ]
+        return list(direct_superclasses)
+
     onto_class = URIRef(ontouml_class)
     superclasses = []
     specific = URIRef(ONTOUML.specific)
@@ -39,7 +54,9 @@ def get_direct_superclasses(ontouml_model: Graph, ontouml_class: str, type_restr
     return superclasses
 
 
-def get_direct_subclasses(ontouml_model: Graph, ontouml_class: str, type_restr_list: list[str] = []) -> list[str]:
+def get_direct_subclasses(
+    ontouml_model: Graph, ontouml_class: str, type_restr_list: list[str] = [], model_index: ModelIndex | None = None
+) -> list[str]:
     """Retrieve direct subclasses of a specified OntoUML class from a given OntoUML RDF graph.
 
     Allows the user to specify a list of restricted types.
@@ -52,9 +69,21 @@ def get_direct_subclasses(ontouml_model: Graph, ontouml_class: str, type_restr_l
     :param type_restr_list: A list of OntoUML stereotype URIs for type restriction. If provided, only subclasses
                             with matching stereotypes will be included. Defaults to an empty list.
     :type type_restr_list: list[str]
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
     :return: A list of URIs representing the direct subclasses of the specified OntoUML class.
     :rtype: list[str]
     """
+    if model_index is not None:
+        direct_subclasses = model_index.direct_subclasses.get(str(ontouml_class), [])
+        if type_restr_list:
+            return [
+                direct_class
+                for direct_class in direct_subclasses
+                if model_index.get_stereotype(direct_class) not in type_restr_list
+            ]
+        return list(direct_subclasses)
+
     onto_class = URIRef(ontouml_class)
     subclasses = []
     specific = URIRef(ONTOUML.specific)
@@ -74,56 +103,83 @@ def get_direct_subclasses(ontouml_model: Graph, ontouml_class: str, type_restr_l
     return subclasses
 
 
-def get_all_superclasses(ontouml_model: Graph, ontouml_class: str) -> list[str]:
+def get_all_superclasses(ontouml_model: Graph, ontouml_class: str, model_index: ModelIndex | None = None) -> list[str]:
     """Retrieve all (direct and indirect) superclasses of a specified OntoUML class from a given OntoUML RDF graph.
 
     :param ontouml_model: The RDF graph containing OntoUML model data.
     :type ontouml_model: rdflib.Graph
     :param ontouml_class: The URI of the OntoUML class for which to retrieve superclasses.
     :type ontouml_class: str
-    :return: A list of URIs representing the direct superclasses of the specified OntoUML class.
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
+    :return: A list of URIs, without duplicates, representing all superclasses of the specified OntoUML class.
     :rtype: list[str]
     """
-    direct_super = get_direct_superclasses(ontouml_model, ontouml_class)
-    all_superclasses = []
-    all_superclasses.extend(direct_super)
+    if model_index is not None:
+        return model_index.hierarchy.get_ancestors(ontouml_class)
 
-    for superclass in direct_super:
-        sub_direct = get_direct_superclasses(ontouml_model, superclass)
-        all_superclasses.extend(sub_direct)
+    all_superclasses = []
+    visited = set()
+    to_visit = get_direct_superclasses(ontouml_model, ontouml_class)
+
+    # Breadth-first traversal of the hierarchy. Visited classes are skipped, so cycles are safely handled.
+    while to_visit:
+        next_to_visit = []
+        for superclass in to_visit:
+            if superclass not in visited:
+                visited.add(superclass)
+                all_superclasses.append(superclass)
+                next_to_visit.extend(get_direct_superclasses(ontouml_model, superclass))
+        to_visit = next_to_visit
 
     return all_superclasses
 
 
-def get_all_subclasses(ontouml_model: Graph, ontouml_class: str) -> list[str]:
+def get_all_subclasses(ontouml_model: Graph, ontouml_class: str, model_index: ModelIndex | None = None) -> list[str]:
     """Retrieve all (direct and indirect) subclasses of a specified OntoUML class from a given OntoUML RDF graph.
 
     :param ontouml_model: The RDF graph containing OntoUML model data.
     :type ontouml_model: rdflib.Graph
     :param ontouml_class: The URI of the OntoUML class for which to retrieve subclasses.
     :type ontouml_class: str
-    :return: A list of URIs representing the direct subclasses of the specified OntoUML class.
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
+    :return: A list of URIs, without duplicates, representing all subclasses of the specified OntoUML class.
     :rtype: list[str]
     """
-    direct_sub = get_direct_subclasses(ontouml_model, ontouml_class)
-    all_subclasses = []
-    all_subclasses.extend(direct_sub)
+    if model_index is not None:
+        return model_index.hierarchy.get_descendants(ontouml_class)
 
-    for subclass in direct_sub:
-        sub_direct = get_direct_subclasses(ontouml_model, subclass)
-        all_subclasses.extend(sub_direct)
+    all_subclasses = []
+    visited = set()
+    to_visit = get_direct_subclasses(ontouml_model, ontouml_class)
+
+    # Breadth-first traversal of the hierarchy. Visited classes are skipped, so cycles are safely handled.
+    while to_visit:
+        next_to_visit = []
+        for subclass in to_visit:
+            if subclass not in visited:
+                visited.add(subclass)
+                all_subclasses.append(subclass)
+                next_to_visit.extend(get_direct_subclasses(ontouml_model, subclass))
+        to_visit = next_to_visit
 
     return all_subclasses
 
 
-def get_all_classes(ontouml_model: Graph) -> list[str]:
+def get_all_classes(ontouml_model: Graph, model_index: ModelIndex | None = None) -> list[str]:
     """Retrieve all OntoUML classes from a given OntoUML RDF graph.
 
     :param ontouml_model: The RDF graph containing OntoUML model data.
     :type ontouml_model: rdflib.Graph
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
     :return: A list of URIs representing OntoUML classes.
     :rtype: list[str]
     """
+    if model_index is not None:
+        return list(model_index.classes)
+
     list_classes = []
 
     for model_class in ontouml_model.subjects(RDF.type, ONTOUML.Class):
@@ -132,16 +188,28 @@ def get_all_classes(ontouml_model: Graph) -> list[str]:
     return list_classes
 
 
-def get_classes_of_types(ontouml_model: Graph, type_restr_list: list[str]) -> list[str]:
+def get_classes_of_types(
+    ontouml_model: Graph, type_restr_list: list[str], model_index: ModelIndex | None = None
+) -> list[str]:
     """Retrieve OntoUML classes that match a list of stereotype URIs from a given OntoUML RDF graph.
 
     :param ontouml_model: The RDF graph containing OntoUML model data.
     :type ontouml_model: rdflib.Graph
     :param type_restr_list: A list of OntoUML stereotype URIs for filtering classes.
     :type type_restr_list: list[str]
-    :return: A list of URIs representing OntoUML classes that match the provided stereotype URIs.
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
+    :return: A list of URIs representing OntoUML classes that match the provided stereotype URIs. Without an index,
+             classes are listed in the order of the graph. With an index, they are grouped by stereotype, in the order
+             of type_restr_list. In both cases, a class appears once for each of its matching stereotypes.
     :rtype: list[str]
     """
+    if model_index is not None:
+        list_classes = []
+        for type_restr in type_restr_list:
+            list_classes.extend(model_index.classes_by_stereotype.get(str(type_restr), []))
+        return list_classes
+
     list_classes = []
 
     for onto_class in ontouml_model.subjects(RDF.type, ONTOUML.Class):
@@ -153,7 +221,7 @@ def get_classes_of_types(ontouml_model: Graph, type_restr_list: list[str]) -> li
     return list_classes
 
 
-def get_class_name(ontouml_model: Graph, ontouml_class: str) -> str:
+def get_class_name(ontouml_model: Graph, ontouml_class: str, model_index: ModelIndex | None = None) -> str:
     """
     Retrieve the name of a specified OntoUML class from a given OntoUML RDF graph.
 
@@ -161,25 +229,35 @@ def get_class_name(ontouml_model: Graph, ontouml_class: str) -> str:
     :type ontouml_model: rdflib.Graph
     :param ontouml_class: The URI of the OntoUML class for which to retrieve the name.
     :type ontouml_class: str
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
     :return: The name of the specified OntoUML class.
     :rtype: str
     """
+    if model_index is not None:
+        return model_index.get_name(ontouml_class)
+
     uri_class_name = ontouml_model.value(URIRef(ontouml_class), ONTOUML.name)
     class_name = uri_class_name.toPython()
 
     return class_name
 
 
-def get_class_stereotype(ontouml_model: Graph, ontouml_class: str) -> str | None:
+def get_class_stereotype(ontouml_model: Graph, ontouml_class: str, model_index: ModelIndex | None = None) -> str | None:
     """Retrieve the stereotype (if any) of a specified OntoUML class from a given OntoUML RDF graph.
 
     :param ontouml_model: The RDF graph containing OntoUML model data.
     :type ontouml_model: rdflib.Graph
     :param ontouml_class: The URI of the OntoUML class for which to retrieve the stereotype.
     :type ontouml_class: str
+    :param model_index: Optional precomputed index of the OntoUML model. If provided, it is used instead of the graph.
+    :type model_index: ModelIndex | None
     :return: The stereotype of the specified OntoUML class, or None if not found.
     :rtype: str | None
     """
+    if model_index is not None:
+        return model_index.get_stereotype(ontouml_class)
+
     try:
         uri_class_st = ontouml_model.value(URIRef(ontouml_class), ONTOUML.stereotype)
         class_stereotype = uri_class_st.toPython()
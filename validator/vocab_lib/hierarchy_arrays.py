@@ -0,0 +1,208 @@
+"""Array encoding of the generalization hierarchy and of the stereotypes of an OntoUML model, for vectorized rules.
+
+The ClassHierarchy stores the ancestors of each class as a bitset, whose size grows with the number of classes of the
+model, and rules using it test the classes one at a time. The HierarchyArrays encode the same information as NumPy
+arrays, so that rules evaluate all classes through array operations:
+    - Classes are identified by integers, assigned in the order used by the ClassHierarchy.
+    - Stereotypes are identified by small integers, and the stereotypes of each class are stored as (class, stereotype)
+      pairs, from which the categories of stereotypes of each class are computed as bitmasks.
+    - Generalizations are stored as arrays of (specific, general) edges and as the children of each class, in CSR form.
+
+Instead of the closure of the whole hierarchy, only the pairs of (source, descendant) classes for the source classes
+of a rule are computed, expanding all of them at once one generalization level at a time.
+
+NumPy is an optional dependency: is_vectorization_available() tells whether the vectorized rules can be used.
+
+Usage:
+    ```
+    hierarchy_arrays = model_index.hierarchy_arrays
+    ultimate_sortals_mask = hierarchy_arrays.get_category_mask(ONTOUML_ST_ULTIMATE_SORTALS)
+    sources, descendants = hierarchy_arrays.get_descendant_pairs(ultimate_sortals_mask)
+    num_ultimate_sortals = np.bincount(descendants, minlength=hierarchy_arrays.num_classes)
+    ```
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_vectorization_available() -> bool:
+    """Return whether the optional NumPy dependency used by the vectorized rules is installed.
+
+    :return: True if NumPy can be imported, False otherwise.
+    :rtype: bool
+    """
+    return np is not None
+
+
+class HierarchyArrays:
+    """A class to represent the generalization hierarchy and the stereotypes of an OntoUML model as NumPy arrays."""
+
+    def __init__(
+        self,
+        classes: list[str],
+        direct_superclasses: dict[str, list[str]],
+        class_stereotypes: dict[str, list[str]],
+    ):
+        """Initialize a HierarchyArrays object, encoding the classes, their stereotypes and their generalizations.
+
+        :param classes: List of the classes of the model. Classes only referenced in generalizations are also included.
+        :type classes: list[str]
+        :param direct_superclasses: Dictionary mapping each class to the list of its direct superclasses.
+        :type direct_superclasses: dict[str, list[str]]
+        :param class_stereotypes: Dictionary mapping each class to the list of its stereotypes.
+        :type class_stereotypes: dict[str, list[str]]
+        """
+        # Ids are assigned as in the ClassHierarchy, so that classes are ordered in the same way by both
+        self.class_ids: dict[str, int] = {model_class: class_id for class_id, model_class in enumerate(classes)}
+        self.id_classes: list[str] = list(classes)
+        for specific, generals in direct_superclasses.items():
+            if specific not in self.class_ids:
+                self._add_class(specific)
+            for general in generals:
+                if general not in self.class_ids:
+                    self._add_class(general)
+        self.num_classes = len(self.id_classes)
+
+        # Repeated edges are kept, as the pairs of classes reached through them are deduplicated when expanded
+        self.specifics = np.array(
+            [self.class_ids[specific] for specific, generals in direct_superclasses.items() for _ in generals],
+            dtype=np.int64,
+        )
+        self.generals = np.array(
+            [self.class_ids[general] for generals in direct_superclasses.values() for general in generals],
+            dtype=np.int64,
+        )
+
+        # Children of each class: children_ids[children_starts[i]:children_starts[i + 1]] are the children of class i
+        children_order = np.argsort(self.generals, kind="stable")
+        self.children_ids = self.specifics[children_order]
+        self.children_starts = np.zeros(self.num_classes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.generals, minlength=self.num_classes), out=self.children_starts[1:])
+
+        self.stereotype_codes: dict[str, int] = {
+            class_st: code
+            for code, class_st in enumerate(
+                dict.fromkeys(st for class_sts in class_stereotypes.values() for st in class_sts)
+            )
+        }
+        self.pairs_classes = np.array(
+            [self.class_ids[model_class] for model_class, class_sts in class_stereotypes.items() for _ in class_sts],
+            dtype=np.int64,
+        )
+        self.pairs_codes = np.array(
+            [self.stereotype_codes[class_st] for class_sts in class_stereotypes.values() for class_st in class_sts],
+            dtype=np.int64,
+        )
+
+    def _add_class(self, model_class: str) -> None:
+        """Assign the next integer id to a class that is only referenced by generalizations.
+
+        :param model_class: The URI of the class.
+        :type model_class: str
+        """
+        self.class_ids[model_class] = len(self.id_classes)
+        self.id_classes.append(model_class)
+
+    def get_ids(self, model_classes: list[str]) -> "np.ndarray":
+        """Return the ids of the received classes, keeping their order and repetitions.
+
+        :param model_classes: List of class URIs, which must be classes of the hierarchy.
+        :type model_classes: list[str]
+        :return: Array with the ids of the classes.
+        :rtype: np.ndarray
+        """
+        return np.array([self.class_ids[model_class] for model_class in model_classes], dtype=np.int64)
+
+    def get_category_bits(self, categories: list[list[str]]) -> "np.ndarray":
+        """Return, for each class, the bitmask of the categories of stereotypes with which it is decorated.
+
+        :param categories: Lists of stereotype URIs. Bit i of a class's bitmask is set if the class has some stereotype
+                           of the i-th list. At most eight categories are supported.
+        :type categories: list[list[str]]
+        :return: Array with the bitmask of each class, indexed by class id.
+        :rtype: np.ndarray
+        """
+        codes_bits = np.zeros(len(self.stereotype_codes), dtype=np.uint8)
+        for category_index, category_sts in enumerate(categories):
+            category_codes = [
+                self.stereotype_codes[class_st] for class_st in category_sts if class_st in self.stereotype_codes
+            ]
+            codes_bits[category_codes] |= np.uint8(1 << category_index)
+
+        classes_bits = np.zeros(self.num_classes, dtype=np.uint8)
+        np.bitwise_or.at(classes_bits, self.pairs_classes, codes_bits[self.pairs_codes])
+        return classes_bits
+
+    def get_category_mask(self, category_sts: list[str]) -> "np.ndarray":
+        """Return whether each class is decorated with some stereotype of a single category.
+
+        :param category_sts: List of stereotype URIs.
+        :type category_sts: list[str]
+        :return: Boolean array, indexed by class id, selecting the classes with some stereotype of the category.
+        :rtype: np.ndarray
+        """
+        category_codes = [
+            self.stereotype_codes[class_st] for class_st in category_sts if class_st in self.stereotype_codes
+        ]
+        codes_mask = np.zeros(len(self.stereotype_codes), dtype=bool)
+        codes_mask[category_codes] = True
+
+        classes_mask = np.zeros(self.num_classes, dtype=bool)
+        classes_mask[self.pairs_classes[codes_mask[self.pairs_codes]]] = True
+        return classes_mask
+
+    def get_descendant_pairs(self, sources_mask: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+        """Return all pairs of a source class and one of its (direct or indirect) subclasses.
+
+        As in the ClassHierarchy, a class that is part of a cycle of generalizations is one of its own subclasses.
+
+        :param sources_mask: Boolean array, indexed by class id, selecting the source classes.
+        :type sources_mask: np.ndarray
+        :return: Arrays of the sources and of the descendants of the pairs, which are ordered by (source, descendant).
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        if not self.num_classes:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        # Pairs are encoded as source * num_classes + descendant, so that they are deduplicated and sorted at once
+        frontier_sources = np.flatnonzero(sources_mask)
+        frontier_classes = frontier_sources
+
+        # Visited pairs are kept in sorted runs of decreasing sizes. The new pairs of each level form a new run, merged
+        # with the previous ones while their sizes are similar, so each pair is copied a logarithmic number of times
+        # (instead of once per level) and keys are looked up in a logarithmic number of runs
+        visited_runs = []
+
+        while frontier_sources.size:
+            starts = self.children_starts[frontier_classes]
+            num_children = self.children_starts[frontier_classes + 1] - starts
+            total_children = int(num_children.sum())
+            if not total_children:
+                break
+
+            # Position of each child in the children of its parent, used to gather all children at once
+            offsets = np.arange(total_children) - np.repeat(np.cumsum(num_children) - num_children, num_children)
+            children = self.children_ids[np.repeat(starts, num_children) + offsets]
+            keys = np.sort(np.repeat(frontier_sources, num_children) * self.num_classes + children)
+            is_new = np.ones(keys.size, dtype=bool)
+            is_new[1:] = keys[1:] != keys[:-1]
+
+            # Pairs found in previous levels are discarded (e.g., reached through longer paths or through cycles)
+            for visited_run in visited_runs:
+                positions = np.minimum(np.searchsorted(visited_run, keys), visited_run.size - 1)
+                is_new &= visited_run[positions] != keys
+            new_keys = keys[is_new]
+            if not new_keys.size:
+                break
+
+            visited_runs.append(new_keys)
+            while len(visited_runs) > 1 and visited_runs[-2].size <= 2 * visited_runs[-1].size:
+                last_run = visited_runs.pop()
+                visited_runs[-1] = np.sort(np.concatenate([visited_runs[-1], last_run]))
+            frontier_sources, frontier_classes = np.divmod(new_keys, self.num_classes)
+
+        if not visited_runs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.divmod(np.sort(np.concatenate(visited_runs)), self.num_classes)
@@ -0,0 +1,599 @@
+"""Precomputed index of the contents of an OntoUML model represented as an RDF graph.
+
+The ModelIndex scans the graph once and stores the information used by the validation rules (classes, stereotypes,
+names, restrictedTo values, literals, attributes, isAbstract, order and isExtensional values and generalizations) in
+dictionaries and inverted indexes. Rules and functions from the vocab_lib receiving an index use hash lookups instead of
+querying the graph.
+
+The index can be restricted to the predicates read by the rules that will use it, so that the triples of other
+predicates are not visited. Properties and generalizations whose predicates are not indexed are left empty.
+
+An index can be updated with the triples added to and removed from its model, and rules can be restricted to a subset
+of the model's classes (its focus) through a focused copy of the index, which is used for incremental validation.
+
+Usage:
+    ```
+    model_index = ModelIndex(ontouml_model)
+    class_name = get_class_name(ontouml_model, class_id, model_index)
+    ```
+"""
+import copy
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from rdflib import Graph, RDF, URIRef
+
+from validator.vocab_lib.class_hierarchy import ClassHierarchy
+from validator.vocab_lib.hierarchy_arrays import HierarchyArrays
+from validator.vocab_lib.ontouml import ONTOUML
+
+
+class ModelIndex:
+    """A class to represent the precomputed lookup structures of an OntoUML model.
+
+    All identifiers (classes, stereotypes, restrictedTo values, literals, attributes and generalizations) are stored as
+    strings. Values of multivalued properties are stored in lists to preserve the information of models that assign
+    more than one value to a property expected to be single-valued (e.g., classes with more than one stereotype).
+    """
+
+    def __init__(self, ontouml_model: Graph | None, predicates: list[URIRef] | None = None):
+        """Initialize a ModelIndex object by scanning the received OntoUML model.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be indexed. If None,
+                              an empty index is created, to be filled in by a loader reading the model from another
+                              format through index_class and index_generalization.
+        :type ontouml_model: Graph | None
+        :param predicates: Optional list of the predicates to be indexed. If not provided, all predicates used by the
+                           validation rules are indexed. Classes (i.e., instances of ontouml:Class) are always indexed.
+        :type predicates: list[URIRef] | None
+        """
+        self.predicates = set(predicates) if predicates is not None else None
+
+        # List of all classes (i.e., instances of ontouml:Class) in the graph's order
+        self.classes: list[str] = []
+
+        # Increasing number of each class, which sorts the classes in the order of the list of classes
+        self.class_numbers: dict[str, int] = {}
+        self._next_class_number = 0
+
+        # Dictionaries mapping each class to the values of its properties
+        self.class_names: dict[str, list[str]] = {}
+        self.class_stereotypes: dict[str, list[str]] = {}
+        self.class_restricted_to: dict[str, list[str]] = {}
+        self.class_literals: dict[str, list[str]] = {}
+        self.class_attributes: dict[str, list[str]] = {}
+        self.class_is_abstract: dict[str, list[bool]] = {}
+        self.class_order: dict[str, list[int]] = {}
+        self.class_is_extensional: dict[str, list[bool]] = {}
+
+        # Inverted index mapping each stereotype to the classes decorated with it
+        self.classes_by_stereotype: dict[str, list[str]] = {}
+
+        # General and specific classes of each generalization, as declared in the graph
+        self.generalization_generals: dict[str, list[str]] = {}
+        self.generalization_specifics: dict[str, list[str]] = {}
+
+        # Inverted index mapping each class to the generalizations in which it is declared as a general class
+        self.generalizations_by_general: dict[str, list[str]] = {}
+
+        # Generalizations as (generalization, general, specific) tuples and the resulting direct hierarchy
+        self.generalizations: list[tuple[str, str, str]] = []
+        self.direct_superclasses: dict[str, list[str]] = {}
+        self.direct_subclasses: dict[str, list[str]] = {}
+
+        # Transitive closure of the hierarchy and its array encoding, only computed when first accessed
+        self._hierarchy: ClassHierarchy | None = None
+        self._hierarchy_arrays: HierarchyArrays | None = None
+
+        # Structures derived from the index by other modules (see get_derived), discarded whenever the index changes
+        self._derived: dict[str, Any] = {}
+
+        if ontouml_model is not None:
+            self._index_classes(ontouml_model)
+            self._index_generalizations(ontouml_model)
+
+        # Classes evaluated by the rules using the index (by default, all classes). Lookups always use the whole model
+        self.focus_classes: list[str] = self.classes
+        self.focus_classes_by_stereotype: dict[str, list[str]] = self.classes_by_stereotype
+        self._focus: set[str] | None = None
+
+        # Index from which a focused copy was created, which builds the lazily computed indexes shared by both
+        self._source_index: "ModelIndex | None" = None
+
+    def _get_property_dicts(self) -> list[tuple[URIRef, dict[str, list]]]:
+        """Return the indexed class properties and the dictionaries in which their values are stored.
+
+        :return: List of (property, property_dict) tuples, only including indexed properties.
+        :rtype: list[tuple[URIRef, dict[str, list]]]
+        """
+        property_dicts = [
+            (ONTOUML.name, self.class_names),
+            (ONTOUML.stereotype, self.class_stereotypes),
+            (ONTOUML.restrictedTo, self.class_restricted_to),
+            (ONTOUML.literal, self.class_literals),
+            (ONTOUML.attribute, self.class_attributes),
+            (ONTOUML.isAbstract, self.class_is_abstract),
+            (ONTOUML.order, self.class_order),
+            (ONTOUML.isExtensional, self.class_is_extensional),
+        ]
+        return [
+            (ontouml_property, property_dict)
+            for ontouml_property, property_dict in property_dicts
+            if self.is_indexed(ontouml_property)
+        ]
+
+    def _create_class(self, class_id: str) -> None:
+        """Add a class without property values to the ModelIndex.
+
+        :param class_id: The URI of the class.
+        :type class_id: str
+        """
+        self.class_numbers[class_id] = self._next_class_number
+        self._next_class_number += 1
+        self.classes.append(class_id)
+        self.class_names[class_id] = []
+        self.class_stereotypes[class_id] = []
+        self.class_restricted_to[class_id] = []
+        self.class_literals[class_id] = []
+        self.class_attributes[class_id] = []
+        self.class_is_abstract[class_id] = []
+        self.class_order[class_id] = []
+        self.class_is_extensional[class_id] = []
+
+    def _index_classes(self, ontouml_model: Graph) -> None:
+        """Populate the class-related dictionaries and inverted indexes of the ModelIndex.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be indexed.
+        :type ontouml_model: Graph
+        """
+        for model_class in ontouml_model.subjects(RDF.type, ONTOUML.Class):
+            class_id = model_class.toPython()
+            if class_id not in self.class_names:
+                self._create_class(class_id)
+
+        # Each property is retrieved with a single triple pattern, so only the relevant triples are visited
+        for ontouml_property, property_dict in self._get_property_dicts():
+            for subject, _, value in ontouml_model.triples((None, ontouml_property, None)):
+                values_list = property_dict.get(subject.toPython())
+                if values_list is not None:
+                    values_list.append(value.toPython())
+
+        for class_id in self.classes:
+            for class_st in self.class_stereotypes[class_id]:
+                self.classes_by_stereotype.setdefault(class_st, []).append(class_id)
+
+    def _index_generalizations(self, ontouml_model: Graph) -> None:
+        """Populate the generalization-related dictionaries of the ModelIndex.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary) to be indexed.
+        :type ontouml_model: Graph
+        """
+        if self.is_indexed(ONTOUML.general):
+            for gen, _, general in ontouml_model.triples((None, ONTOUML.general, None)):
+                self.generalization_generals.setdefault(gen.toPython(), []).append(general.toPython())
+                self.generalizations_by_general.setdefault(general.toPython(), []).append(gen.toPython())
+        if self.is_indexed(ONTOUML.specific):
+            for gen, _, specific in ontouml_model.triples((None, ONTOUML.specific, None)):
+                self.generalization_specifics.setdefault(gen.toPython(), []).append(specific.toPython())
+
+        for gen in self.generalization_generals:
+            for generalization in self._get_generalization_edges(gen):
+                self._add_generalization_edge(generalization)
+
+    def _get_generalization_edges(self, gen: str) -> list[tuple[str, str, str]]:
+        """Return the (generalization, general, specific) tuples declared by a generalization.
+
+        :param gen: The URI of the generalization.
+        :type gen: str
+        :return: List of the generalization's tuples.
+        :rtype: list[tuple[str, str, str]]
+        """
+        return [
+            (gen, general, specific)
+            for specific in self.generalization_specifics.get(gen, [])
+            for general in self.generalization_generals.get(gen, [])
+        ]
+
+    def _add_generalization_edge(self, generalization: tuple[str, str, str]) -> None:
+        """Add a (generalization, general, specific) tuple to the generalizations and to the direct hierarchy.
+
+        :param generalization: The tuple to be added.
+        :type generalization: tuple[str, str, str]
+        """
+        _, general, specific = generalization
+        self.generalizations.append(generalization)
+        self.direct_superclasses.setdefault(specific, []).append(general)
+        self.direct_subclasses.setdefault(general, []).append(specific)
+
+    def _remove_generalization_edge(self, generalization: tuple[str, str, str]) -> None:
+        """Remove a (generalization, general, specific) tuple from the generalizations and from the direct hierarchy.
+
+        :param generalization: The tuple to be removed.
+        :type generalization: tuple[str, str, str]
+        """
+        _, general, specific = generalization
+        self.generalizations.remove(generalization)
+        for hierarchy_dict, key, value in [
+            (self.direct_superclasses, specific, general),
+            (self.direct_subclasses, general, specific),
+        ]:
+            hierarchy_dict[key].remove(value)
+            if not hierarchy_dict[key]:
+                del hierarchy_dict[key]
+
+    def _remove_general_generalization(self, general: str, gen: str) -> None:
+        """Remove a generalization from the ones in which a class is declared as a general class.
+
+        :param general: The URI of the general class.
+        :type general: str
+        :param gen: The URI of the generalization.
+        :type gen: str
+        """
+        general_gens = self.generalizations_by_general[general]
+        general_gens.remove(gen)
+        if not general_gens:
+            del self.generalizations_by_general[general]
+
+    def is_indexed(self, predicate: URIRef) -> bool:
+        """Return whether the values of a predicate are stored in the ModelIndex.
+
+        :param predicate: The predicate to be checked.
+        :type predicate: URIRef
+        :return: True if the predicate is indexed, False otherwise.
+        :rtype: bool
+        """
+        return self.predicates is None or predicate in self.predicates
+
+    def update(
+        self,
+        ontouml_model: Graph,
+        added_triples: Iterable[tuple[URIRef, URIRef, URIRef]],
+        removed_triples: Iterable[tuple[URIRef, URIRef, URIRef]],
+    ) -> None:
+        """Update the ModelIndex with the triples added to and removed from its model.
+
+        The received graph must already contain the changes and the received triples must be effective changes (i.e.,
+        added triples were not in the graph and removed triples were in it). Removals are applied before additions.
+        Only the entries of the changed classes and generalizations are updated, except for the transitive closure of
+        the hierarchy, which is discarded (and recomputed on its next access) if the hierarchy changes, and for the
+        structures derived from the index, which are always discarded.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary), already changed.
+        :type ontouml_model: Graph
+        :param added_triples: Triples added to the model.
+        :type added_triples: Iterable[tuple[URIRef, URIRef, URIRef]]
+        :param removed_triples: Triples removed from the model.
+        :type removed_triples: Iterable[tuple[URIRef, URIRef, URIRef]]
+        """
+        added_triples = list(added_triples)
+        removed_triples = list(removed_triples)
+        property_dicts = dict(self._get_property_dicts())
+        generalization_dicts = {
+            ONTOUML.general: self.generalization_generals,
+            ONTOUML.specific: self.generalization_specifics,
+        }
+
+        # Tuples of the changed generalizations are replaced after all their generals and specifics are updated
+        changed_gens = {
+            subject.toPython()
+            for subject, predicate, _ in added_triples + removed_triples
+            if predicate in generalization_dicts and self.is_indexed(predicate)
+        }
+        for gen in changed_gens:
+            for generalization in self._get_generalization_edges(gen):
+                self._remove_generalization_edge(generalization)
+
+        classes_changed = False
+
+        for subject, predicate, value in removed_triples:
+            subject_id = subject.toPython()
+            if predicate == RDF.type:
+                if value == ONTOUML.Class and subject_id in self.class_names:
+                    self._remove_class(subject_id)
+                    classes_changed = True
+            elif predicate in generalization_dicts and self.is_indexed(predicate):
+                values_list = generalization_dicts[predicate][subject_id]
+                values_list.remove(value.toPython())
+                if not values_list:
+                    del generalization_dicts[predicate][subject_id]
+                if predicate == ONTOUML.general:
+                    self._remove_general_generalization(value.toPython(), subject_id)
+            elif predicate in property_dicts and subject_id in self.class_names:
+                property_dicts[predicate][subject_id].remove(value.toPython())
+                if predicate == ONTOUML.stereotype:
+                    self.classes_by_stereotype[value.toPython()].remove(subject_id)
+
+        # Properties of added classes are read from the graph, so their other added triples are not indexed again
+        added_classes = set()
+        for subject, predicate, value in added_triples:
+            subject_id = subject.toPython()
+            if predicate == RDF.type and value == ONTOUML.Class and subject_id not in self.class_names:
+                self._add_class(ontouml_model, subject)
+                added_classes.add(subject_id)
+                classes_changed = True
+
+        for subject, predicate, value in added_triples:
+            subject_id = subject.toPython()
+            if predicate == RDF.type:
+                continue
+            if predicate in generalization_dicts and self.is_indexed(predicate):
+                generalization_dicts[predicate].setdefault(subject_id, []).append(value.toPython())
+                if predicate == ONTOUML.general:
+                    self.generalizations_by_general.setdefault(value.toPython(), []).append(subject_id)
+            elif predicate in property_dicts and subject_id in self.class_names and subject_id not in added_classes:
+                property_dicts[predicate][subject_id].append(value.toPython())
+                if predicate == ONTOUML.stereotype:
+                    self.classes_by_stereotype.setdefault(value.toPython(), []).append(subject_id)
+
+        for gen in changed_gens:
+            for generalization in self._get_generalization_edges(gen):
+                self._add_generalization_edge(generalization)
+
+        if classes_changed or changed_gens:
+            self._hierarchy = None
+            self._hierarchy_arrays = None
+        elif any(predicate == ONTOUML.stereotype for _, predicate, _ in added_triples + removed_triples):
+            # The arrays of the hierarchy also encode the stereotypes of the classes
+            self._hierarchy_arrays = None
+        self._derived = {}
+
+    def _add_class(self, ontouml_model: Graph, model_class: URIRef) -> None:
+        """Add a class of the graph to the ModelIndex, reading the values of its indexed properties.
+
+        :param ontouml_model: The OntoUML model in graph format (using the ontouml-vocabulary).
+        :type ontouml_model: Graph
+        :param model_class: The class to be added.
+        :type model_class: URIRef
+        """
+        self.index_class(
+            model_class.toPython(),
+            {
+                ontouml_property: [value.toPython() for value in ontouml_model.objects(model_class, ontouml_property)]
+                for ontouml_property, _ in self._get_property_dicts()
+            },
+        )
+
+    def index_class(self, class_id: str, properties_values: dict[URIRef, list]) -> None:
+        """Add a class and the values of its properties to the ModelIndex.
+
+        Used to add classes read from the graph and by loaders that fill in an index without a graph. Values of
+        properties that are not indexed are ignored. A class that is already indexed is not added again.
+
+        :param class_id: The URI of the class.
+        :type class_id: str
+        :param properties_values: Dictionary mapping properties (e.g., ONTOUML.stereotype) to the class's values, as
+                                  stored in the index (URIs and names as strings and isAbstract values as booleans).
+        :type properties_values: dict[URIRef, list]
+        """
+        if class_id in self.class_names:
+            return
+        self._create_class(class_id)
+
+        for ontouml_property, property_dict in self._get_property_dicts():
+            property_dict[class_id].extend(properties_values.get(ontouml_property, []))
+
+        for class_st in self.class_stereotypes[class_id]:
+            self.classes_by_stereotype.setdefault(class_st, []).append(class_id)
+        self._hierarchy = None
+        self._hierarchy_arrays = None
+        self._derived = {}
+
+    def index_generalization(self, gen: str, generals: list[str], specifics: list[str]) -> None:
+        """Add a generalization, with its general and specific classes, to the ModelIndex.
+
+        Used by loaders that fill in an index without a graph. Each generalization must be added only once.
+
+        :param gen: The URI of the generalization.
+        :type gen: str
+        :param generals: The URIs of the generalization's general classes.
+        :type generals: list[str]
+        :param specifics: The URIs of the generalization's specific classes.
+        :type specifics: list[str]
+        """
+        if self.is_indexed(ONTOUML.general) and generals:
+            self.generalization_generals.setdefault(gen, []).extend(generals)
+            for general in generals:
+                self.generalizations_by_general.setdefault(general, []).append(gen)
+        if self.is_indexed(ONTOUML.specific) and specifics:
+            self.generalization_specifics.setdefault(gen, []).extend(specifics)
+
+        for generalization in self._get_generalization_edges(gen):
+            self._add_generalization_edge(generalization)
+        self._hierarchy = None
+        self._hierarchy_arrays = None
+        self._derived = {}
+
+    def _remove_class(self, class_id: str) -> None:
+        """Remove a class and the values of its properties from the ModelIndex.
+
+        :param class_id: The URI of the class to be removed.
+        :type class_id: str
+        """
+        for class_st in self.class_stereotypes[class_id]:
+            self.classes_by_stereotype[class_st].remove(class_id)
+
+        self.classes.remove(class_id)
+        for property_dict in [
+            self.class_numbers,
+            self.class_names,
+            self.class_stereotypes,
+            self.class_restricted_to,
+            self.class_literals,
+            self.class_attributes,
+            self.class_is_abstract,
+            self.class_order,
+            self.class_is_extensional,
+        ]:
+            del property_dict[class_id]
+
+    def get_focused_index(self, focus_classes: Iterable[str]) -> "ModelIndex":
+        """Return a copy of the ModelIndex whose focus is restricted to the received classes.
+
+        Rules using the returned index only evaluate the focus classes, while still looking up information about any
+        other class of the model. The copy shares all structures with this index, so it must be discarded if the index
+        is updated. The hierarchies built through the copy are also built in this index, so that they are shared by
+        later copies. Received elements that are not classes of the model are ignored.
+
+        :param focus_classes: The URIs of the classes to be evaluated.
+        :type focus_classes: Iterable[str]
+        :return: The focused copy of the ModelIndex.
+        :rtype: ModelIndex
+        """
+        focused_index = copy.copy(self)
+        focused_index.focus_classes = [
+            class_id
+            for class_id in dict.fromkeys(str(model_class) for model_class in focus_classes)
+            if class_id in self.class_names
+        ]
+        focused_index.focus_classes_by_stereotype = {}
+        for class_id in focused_index.focus_classes:
+            for class_st in self.class_stereotypes[class_id]:
+                focused_index.focus_classes_by_stereotype.setdefault(class_st, []).append(class_id)
+        focused_index._focus = set(focused_index.focus_classes)
+        focused_index._derived = {}
+        focused_index._source_index = self
+        return focused_index
+
+    def is_focus_class(self, ontouml_class: str) -> bool:
+        """Return whether a class is evaluated by the rules using the ModelIndex.
+
+        :param ontouml_class: The URI of the class.
+        :type ontouml_class: str
+        :return: True if the class is a class of the model in the focus of the index, False otherwise.
+        :rtype: bool
+        """
+        if self._focus is None:
+            return str(ontouml_class) in self.class_names
+        return str(ontouml_class) in self._focus
+
+    def is_focused(self) -> bool:
+        """Return whether the index is a focused copy, whose rules only evaluate some classes of the model.
+
+        :return: True if the index was created by get_focused_index, False otherwise.
+        :rtype: bool
+        """
+        return self._focus is not None
+
+    def get_superclasses(self, ontouml_class: str) -> list[str]:
+        """Return all (direct and indirect) superclasses of a class, traversing only its part of the direct hierarchy.
+
+        Unlike the ancestors in the hierarchy property, the transitive closure of the whole hierarchy is neither used
+        nor computed, so the cost only depends on the number of superclasses of the class. Classes that are part of a
+        generalization cycle are superclasses of themselves.
+
+        :param ontouml_class: The URI of the class.
+        :type ontouml_class: str
+        :return: List of the URIs of the superclasses, without duplicates, in breadth-first order.
+        :rtype: list[str]
+        """
+        superclasses = []
+        visited = set()
+        to_visit = self.direct_superclasses.get(str(ontouml_class), [])
+
+        while to_visit:
+            next_to_visit = []
+            for superclass in to_visit:
+                if superclass not in visited:
+                    visited.add(superclass)
+                    superclasses.append(superclass)
+                    next_to_visit.extend(self.direct_superclasses.get(superclass, []))
+            to_visit = next_to_visit
+
+        return superclasses
+
+    def get_focus_classes_of_types(self, stereotypes: list[str]) -> list[str]:
+        """Return the focus classes decorated with the received stereotypes, grouped by stereotype.
+
+        :param stereotypes: List of stereotype URIs.
+        :type stereotypes: list[str]
+        :return: List of the URIs of the focus classes with one of the stereotypes.
+        :rtype: list[str]
+        """
+        list_classes = []
+        for class_st in stereotypes:
+            list_classes.extend(self.focus_classes_by_stereotype.get(str(class_st), []))
+        return list_classes
+
+    @property
+    def hierarchy(self) -> ClassHierarchy:
+        """Return the transitive closure of the model's generalization hierarchy, computing it on first access.
+
+        :return: The ClassHierarchy of the indexed model.
+        :rtype: ClassHierarchy
+        """
+        self.build_indexes(["hierarchy"])
+        return self._hierarchy
+
+    @property
+    def hierarchy_arrays(self) -> HierarchyArrays:
+        """Return the array encoding of the model's hierarchy and stereotypes, computing it on first access.
+
+        Requires the optional NumPy dependency (see is_vectorization_available).
+
+        :return: The HierarchyArrays of the indexed model.
+        :rtype: HierarchyArrays
+        """
+        self.build_indexes(["hierarchy_arrays"])
+        return self._hierarchy_arrays
+
+    def build_indexes(self, indexes: Iterable[str]) -> None:
+        """Build the lazily computed indexes that are not built yet, instead of waiting for their first access.
+
+        Used to build the indexes shared by rules executed concurrently (or by successive incremental validations)
+        only once, before the rules start.
+
+        :param indexes: Names of the indexes required by the rules (see rules_registry.SHARED_INDEXES). Only
+                        'hierarchy' and 'hierarchy_arrays' are built lazily, the other names are ignored.
+        :type indexes: Iterable[str]
+        """
+        if self._source_index is not None:
+            self._source_index.build_indexes(indexes)
+            self._hierarchy = self._source_index._hierarchy
+            self._hierarchy_arrays = self._source_index._hierarchy_arrays
+            return
+
+        indexes = set(indexes)
+        if "hierarchy" in indexes and self._hierarchy is None:
+            self._hierarchy = ClassHierarchy(self.classes, self.direct_superclasses)
+        if "hierarchy_arrays" in indexes and self._hierarchy_arrays is None:
+            self._hierarchy_arrays = HierarchyArrays(self.classes, self.direct_superclasses, self.class_stereotypes)
+
+    def get_derived(self, key: str, build_function: Callable[["ModelIndex"], Any]) -> Any:
+        """Return a structure derived from the index by another module, building it on its first request.
+
+        Derived structures (e.g., the issues found in a sweep over all generalizations) are shared by all rules using
+        the index. They are discarded whenever the index changes and are not shared with focused copies of the index,
+        as they may depend on its focus classes.
+
+        :param key: The key identifying the derived structure.
+        :type key: str
+        :param build_function: Function building the structure from the index, called if it is not built yet.
+        :type build_function: Callable[[ModelIndex], Any]
+        :return: The derived structure.
+        :rtype: Any
+        """
+        if key not in self._derived:
+            self._derived[key] = build_function(self)
+        return self._derived[key]
+
+    def get_name(self, ontouml_class: str) -> str | None:
+        """Return the name of a class, or None if the class has no name.
+
+        :param ontouml_class: The URI of the OntoUML class for which to retrieve the name.
+        :type ontouml_class: str
+        :return: The name of the class or None if not found.
+        :rtype: str | None
+        """
+        class_names = self.class_names.get(str(ontouml_class))
+        return class_names[0] if class_names else None
+
+    def get_stereotype(self, ontouml_class: str) -> str | None:
+        """Return the stereotype of a class, or None if the class has no stereotype.
+
+        :param ontouml_class: The URI of the OntoUML class for which to retrieve the stereotype.
+        :type ontouml_class: str
+        :return: The stereotype of the class or None if not found.
+        :rtype: str | None
+        """
+        class_sts = self.class_stereotypes.get(str(ontouml_class))
+        return class_sts[0] if class_sts else None